@@ -1,9 +1,17 @@
+from urllib.parse import quote
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 
 from alembic import context
+from alembic.script import ScriptDirectory
+
+# registers every model on Base.metadata
+import app.modules  # noqa: F401
+from app.core.config import settings
+from app.db.dbDeclarative import Base
+from app.db.dbMigration import SCHEMA_HEAD
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -16,14 +24,31 @@ if config.config_file_name is not None:
 
 # add your model's MetaData object here
 # for 'autogenerate' support
-# from myapp import mymodel
-# target_metadata = mymodel.Base.metadata
-target_metadata = None
+target_metadata = Base.metadata
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
 # ... etc.
+if not config.get_main_option("sqlalchemy.url"):
+    config.set_main_option(
+        "sqlalchemy.url",
+        f"postgresql://{settings.DB_USER}:{quote(settings.DB_PASSWORD)}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_DATABASE}".replace(
+            "%", "%%"
+        ),
+    )
+
+
+def check_schema_head() -> None:
+    """The app compares the database's version row with SCHEMA_HEAD at startup,
+    so the constant has to follow the newest revision in alembic/versions."""
+    head = ScriptDirectory.from_config(config).get_current_head()
+
+    if head != SCHEMA_HEAD:
+        raise RuntimeError(
+            f"alembic head is {head} but app.db.dbMigration.SCHEMA_HEAD is {SCHEMA_HEAD}; "
+            "update SCHEMA_HEAD when adding a migration"
+        )
 
 
 def run_migrations_offline() -> None:
@@ -70,6 +95,8 @@ def run_migrations_online() -> None:
             context.run_migrations()
 
 
+check_schema_head()
+
 if context.is_offline_mode():
     run_migrations_offline()
 else:
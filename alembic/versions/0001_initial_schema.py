@@ -0,0 +1,1232 @@
+"""initial schema
+
+Baseline revision: the schema of the models as they were before migrations were
+tracked, written out as explicit DDL so every later revision applies to the same
+tables whatever the models look like now. Databases that were created by
+`metadata.create_all` before then only need `alembic stamp 0001_initial_schema`.
+
+Revision ID: 0001_initial_schema
+Revises:
+Create Date: 2024-10-21 00:00:00.000000
+
+"""
+
+from typing import Dict, List, Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001_initial_schema"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# frozen copies of the enum types, created once before the tables that share them
+ENUMS: Dict[str, List[str]] = {
+    "contracttypeenum": ["rent", "lease", "purchase", "sale"],
+    "mediatype": ["image", "video", "audio", "document", "other"],
+    "paymenttypeenum": [
+        "annually",
+        "monthly",
+        "weekly",
+        "one_time",
+        "quarterly",
+        "bi_annual",
+        "custom",
+    ],
+    "transactiontypeenum": [
+        "card",
+        "mobile_money",
+        "visa",
+        "paypal",
+        "refund",
+        "credit",
+        "debit",
+        "bank_transfer",
+        "cash",
+        "cryptocurrency",
+        "check",
+        "direct_debit",
+        "ewallet",
+        "prepaid_card",
+        "net_banking",
+        "wire_transfer",
+        "pos",
+        "google_pay",
+        "apple_pay",
+        "stripe",
+        "square",
+    ],
+    "genderenum": ["male", "female", "other"],
+    "calendarstatusenum": ["pending", "completed", "cancelled"],
+    "eventtypeenum": [
+        "other",
+        "holiday",
+        "meeting",
+        "birthday",
+        "inspection",
+        "maintenance_requests",
+    ],
+    "contractstatusenum": ["active", "inactive", "expired", "pending", "terminated"],
+    "accounttypeenum": ["savings", "billing", "debit", "credit", "general"],
+    "entitytypeenum": [
+        "property",
+        "units",
+        "utilities",
+        "contract",
+        "user",
+        "role",
+        "amenities",
+        "account",
+        "comapany",
+        "entityamenities",
+        "pastrentalhistory",
+        "maintenance_requests",
+    ],
+    "billabletypeenum": ["utilities", "maintenance_requests"],
+    "companytypeenum": ["agency", "sole_proprietor"],
+    "propertytype": ["residential", "commercial", "industrial"],
+    "propertystatus": ["sold", "rent", "lease", "bought", "available", "unavailable"],
+    "propertyassignmenttype": ["other", "handler", "landlord", "contractor"],
+    "tourtype": ["in_person", "video"],
+    "tourstatus": ["incoming", "completed", "cancelled"],
+    "paymentstatusenum": ["pending", "completed", "cancelled", "reversal"],
+    "invoicetypeenum": ["lease", "maintenance", "other", "general"],
+    "addresstypeenum": ["billing", "mailing"],
+}
+
+# (name, table, referred table, columns, referred columns) of the use_alter foreign
+# keys: transaction and invoice refer to each other, so these are added once both
+# tables exist (SQLite has no ALTER for constraints and creates them inline)
+ALTER_FOREIGN_KEYS = [
+    (
+        "fk_transaction_invoice_number",
+        "transaction",
+        "invoice",
+        ["invoice_number"],
+        ["invoice_number"],
+    ),
+    ("fk_invoice_issued_by", "invoice", "users", ["issued_by"], ["user_id"]),
+    ("fk_invoice_issued_to", "invoice", "users", ["issued_to"], ["user_id"]),
+]
+
+
+def enum(name: str) -> sa.types.TypeEngine:
+    return sa.Enum(*ENUMS[name], name=name).with_variant(
+        postgresql.ENUM(*ENUMS[name], name=name, create_type=False), "postgresql"
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        for name, values in ENUMS.items():
+            postgresql.ENUM(*values, name=name).create(bind)
+
+    op.create_table(
+        "accounts",
+        sa.Column("account_id", sa.UUID(), nullable=False),
+        sa.Column("bank_account_name", sa.String(length=80), nullable=False),
+        sa.Column("bank_account_number", sa.String(length=80), nullable=False),
+        sa.Column("account_branch_name", sa.String(length=80), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("account_id"),
+    )
+    op.create_table(
+        "amenities",
+        sa.Column("amenity_id", sa.UUID(), nullable=False),
+        sa.Column("amenity_name", sa.String(length=255), nullable=True),
+        sa.Column("amenity_short_name", sa.String(length=100), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("amenity_id"),
+    )
+    op.create_table(
+        "billable_assoc",
+        sa.Column("billable_assoc_id", sa.UUID(), nullable=False),
+        sa.Column("billing_type", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("billable_assoc_id"),
+    )
+    op.create_table(
+        "company",
+        sa.Column("company_id", sa.UUID(), nullable=False),
+        sa.Column("company_name", sa.String(length=80), nullable=False),
+        sa.Column("company_website", sa.String(length=80), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("company_id"),
+    )
+    op.create_table(
+        "contract_type",
+        sa.Column("contract_type_id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("contract_type_name", enum("contracttypeenum"), nullable=False),
+        sa.Column("fee_percentage", sa.Numeric(precision=5, scale=2), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("contract_type_id"),
+    )
+    op.create_index(
+        "ix_contract_type_contract_type_id",
+        "contract_type",
+        ["contract_type_id"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_contract_type_contract_type_name",
+        "contract_type",
+        ["contract_type_name"],
+        unique=True,
+    )
+    op.create_table(
+        "country",
+        sa.Column("country_id", sa.UUID(), nullable=False),
+        sa.Column("country_name", sa.String(length=128), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("country_id"),
+        sa.UniqueConstraint("country_name"),
+    )
+    op.create_table(
+        "media",
+        sa.Column("media_id", sa.UUID(), nullable=False),
+        sa.Column("media_name", sa.String(length=255), nullable=True),
+        sa.Column("media_type", enum("mediatype"), nullable=True),
+        sa.Column("content_url", sa.Text(), nullable=True),
+        sa.Column("is_thumbnail", sa.Boolean(), nullable=True),
+        sa.Column("caption", sa.String(length=255), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("media_id"),
+    )
+    op.create_table(
+        "payment_type",
+        sa.Column("payment_type_id", sa.Integer(), nullable=False),
+        sa.Column("payment_type_name", enum("paymenttypeenum"), nullable=False),
+        sa.Column("payment_type_description", sa.Text(), nullable=False),
+        sa.Column("payment_partitions", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("payment_type_id"),
+    )
+    op.create_index(
+        "ix_payment_type_payment_type_id",
+        "payment_type",
+        ["payment_type_id"],
+        unique=True,
+    )
+    op.create_table(
+        "permissions",
+        sa.Column("permission_id", sa.UUID(), nullable=False),
+        sa.Column("name", sa.String(length=80), nullable=False),
+        sa.Column("alias", sa.String(length=80), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("permission_id"),
+        sa.UniqueConstraint("name"),
+    )
+    op.create_index(
+        "ix_permissions_permission_id", "permissions", ["permission_id"], unique=True
+    )
+    op.create_table(
+        "property_type",
+        sa.Column("property_type_id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.String(length=128), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("property_type_id"),
+    )
+    op.create_table(
+        "property_unit_assoc",
+        sa.Column("property_unit_assoc_id", sa.UUID(), nullable=False),
+        sa.Column("property_unit_type", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("property_unit_assoc_id"),
+    )
+    op.create_table(
+        "reminder_frequency",
+        sa.Column(
+            "reminder_frequency_id", sa.Integer(), autoincrement=True, nullable=False
+        ),
+        sa.Column("title", sa.String(length=50), nullable=False),
+        sa.Column("frequency", sa.Integer(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("reminder_frequency_id"),
+    )
+    op.create_table(
+        "role",
+        sa.Column("role_id", sa.UUID(), nullable=False),
+        sa.Column("name", sa.String(length=80), nullable=False),
+        sa.Column("alias", sa.String(length=80), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("role_id"),
+        sa.UniqueConstraint("name"),
+    )
+    op.create_index("ix_role_role_id", "role", ["role_id"], unique=True)
+    op.create_table(
+        "transaction_type",
+        sa.Column("transaction_type_id", sa.Integer(), nullable=False),
+        sa.Column("transaction_type_name", enum("transactiontypeenum"), nullable=False),
+        sa.Column(
+            "transaction_type_description", sa.String(length=128), nullable=False
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("transaction_type_id"),
+    )
+    op.create_index(
+        "ix_transaction_type_transaction_type_id",
+        "transaction_type",
+        ["transaction_type_id"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_transaction_type_transaction_type_name",
+        "transaction_type",
+        ["transaction_type_name"],
+        unique=True,
+    )
+    op.create_table(
+        "unit_type",
+        sa.Column("unit_type_id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("unit_type_name", sa.String(length=128), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("unit_type_id"),
+    )
+    op.create_index(
+        "ix_unit_type_unit_type_id", "unit_type", ["unit_type_id"], unique=True
+    )
+    op.create_table(
+        "users",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("first_name", sa.String(length=128), nullable=False),
+        sa.Column("last_name", sa.String(length=128), nullable=False),
+        sa.Column("email", sa.String(length=80), nullable=False),
+        sa.Column("phone_number", sa.String(length=50), nullable=False),
+        sa.Column("password", sa.String(length=128), nullable=True),
+        sa.Column("identification_number", sa.String(length=80), nullable=False),
+        sa.Column("photo_url", sa.String(length=128), nullable=False),
+        sa.Column("gender", enum("genderenum"), nullable=False),
+        sa.Column("date_of_birth", sa.Date(), nullable=True),
+        sa.Column("login_provider", sa.String(length=128), nullable=True),
+        sa.Column("reset_token", sa.String(length=128), nullable=True),
+        sa.Column("verification_token", sa.String(length=128), nullable=True),
+        sa.Column("is_subscribed_token", sa.String(length=128), nullable=True),
+        sa.Column("is_disabled", sa.Boolean(), nullable=False),
+        sa.Column("is_verified", sa.Boolean(), nullable=False),
+        sa.Column("is_subscribed", sa.Boolean(), nullable=False),
+        sa.Column("current_login_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_login_time", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("employer_name", sa.String(length=128), nullable=True),
+        sa.Column("occupation_status", sa.String(length=128), nullable=True),
+        sa.Column("occupation_location", sa.String(length=128), nullable=True),
+        sa.Column("emergency_contact_name", sa.String(length=128), nullable=True),
+        sa.Column("emergency_contact_email", sa.String(length=128), nullable=True),
+        sa.Column("emergency_contact_relation", sa.String(length=128), nullable=True),
+        sa.Column("emergency_contact_number", sa.String(length=128), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.create_index("ix_users_user_id", "users", ["user_id"], unique=True)
+    op.create_table(
+        "calendar_events",
+        sa.Column("calendar_event_id", sa.UUID(), nullable=False),
+        sa.Column("event_id", sa.String(length=128), nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("status", enum("calendarstatusenum"), nullable=False),
+        sa.Column("event_type", enum("eventtypeenum"), nullable=True),
+        sa.Column("event_start_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("event_end_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("organizer_id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["organizer_id"],
+            ["users.user_id"],
+        ),
+        sa.PrimaryKeyConstraint("calendar_event_id"),
+        sa.UniqueConstraint("event_id"),
+    )
+    op.create_table(
+        "contract",
+        sa.Column("contract_id", sa.UUID(), nullable=False),
+        sa.Column("contract_number", sa.String(length=128), nullable=False),
+        sa.Column("contract_type_id", sa.Integer(), nullable=False),
+        sa.Column("payment_type_id", sa.Integer(), nullable=False),
+        sa.Column("contract_status", enum("contractstatusenum"), nullable=False),
+        sa.Column("contract_details", sa.Text(), nullable=False),
+        sa.Column("num_invoices", sa.Integer(), nullable=False),
+        sa.Column("payment_amount", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("fee_percentage", sa.Numeric(precision=5, scale=2), nullable=False),
+        sa.Column("fee_amount", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("date_signed", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("start_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("end_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["contract_type_id"],
+            ["contract_type.contract_type_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["payment_type_id"],
+            ["payment_type.payment_type_id"],
+        ),
+        sa.PrimaryKeyConstraint("contract_id"),
+        sa.UniqueConstraint("contract_number"),
+    )
+    op.create_index("ix_contract_contract_id", "contract", ["contract_id"], unique=True)
+    op.create_table(
+        "document",
+        sa.Column("document_number", sa.UUID(), nullable=False),
+        sa.Column("name", sa.String(length=128), nullable=False),
+        sa.Column("content_url", sa.String(length=128), nullable=False),
+        sa.Column("content_type", sa.String(length=128), nullable=False),
+        sa.Column("uploaded_by", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["uploaded_by"],
+            ["users.user_id"],
+        ),
+        sa.PrimaryKeyConstraint("document_number"),
+    )
+    op.create_table(
+        "entity_accounts",
+        sa.Column("entity_account_id", sa.UUID(), nullable=False),
+        sa.Column("account_id", sa.UUID(), nullable=False),
+        sa.Column("account_type", enum("accounttypeenum"), nullable=False),
+        sa.Column("entity_id", sa.UUID(), nullable=False),
+        sa.Column("entity_type", enum("entitytypeenum"), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.CheckConstraint(
+            "entity_type IN ('property', 'user')", name="check_entity_type_accounts"
+        ),
+        sa.ForeignKeyConstraint(
+            ["account_id"],
+            ["accounts.account_id"],
+        ),
+        sa.PrimaryKeyConstraint("entity_account_id"),
+    )
+    op.create_index(
+        "ix_entity_accounts_entity_account_id",
+        "entity_accounts",
+        ["entity_account_id"],
+        unique=True,
+    )
+    op.create_table(
+        "entity_amenities",
+        sa.Column("entity_amenities_id", sa.UUID(), nullable=False),
+        sa.Column("amenity_id", sa.UUID(), nullable=False),
+        sa.Column("entity_id", sa.UUID(), nullable=False),
+        sa.Column("entity_type", enum("entitytypeenum"), nullable=False),
+        sa.Column("apply_to_units", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.CheckConstraint(
+            "entity_type IN ('property', 'units')", name="check_entity_type_amenities"
+        ),
+        sa.ForeignKeyConstraint(
+            ["amenity_id"],
+            ["amenities.amenity_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["entity_id"],
+            ["property_unit_assoc.property_unit_assoc_id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("entity_amenities_id"),
+    )
+    op.create_index(
+        "ix_entity_amenities_entity_amenities_id",
+        "entity_amenities",
+        ["entity_amenities_id"],
+        unique=True,
+    )
+    op.create_table(
+        "entity_billable",
+        sa.Column("entity_billable_id", sa.UUID(), nullable=False),
+        sa.Column("entity_id", sa.UUID(), nullable=False),
+        sa.Column("entity_type", enum("entitytypeenum"), nullable=True),
+        sa.Column("billable_id", sa.UUID(), nullable=False),
+        sa.Column("billable_type", enum("billabletypeenum"), nullable=False),
+        sa.Column("billable_amount", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("apply_to_units", sa.Boolean(), nullable=False),
+        sa.Column("payment_type_id", sa.Integer(), nullable=True),
+        sa.Column("start_period", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("end_period", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.CheckConstraint(
+            "entity_type IN ('property', 'units', 'contract')",
+            name="check_entity_type_billables",
+        ),
+        sa.ForeignKeyConstraint(
+            ["billable_id"],
+            ["billable_assoc.billable_assoc_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["payment_type_id"],
+            ["payment_type.payment_type_id"],
+        ),
+        sa.PrimaryKeyConstraint("entity_billable_id"),
+    )
+    op.create_index(
+        "ix_entity_billable_entity_billable_id",
+        "entity_billable",
+        ["entity_billable_id"],
+        unique=True,
+    )
+    op.create_table(
+        "entity_company",
+        sa.Column("entity_company_id", sa.UUID(), nullable=False),
+        sa.Column("company_id", sa.UUID(), nullable=False),
+        sa.Column("company_type", enum("companytypeenum"), nullable=False),
+        sa.Column("entity_id", sa.UUID(), nullable=False),
+        sa.Column("entity_type", enum("entitytypeenum"), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.CheckConstraint(
+            "entity_type IN ('property', 'user')", name="check_entity_type_company"
+        ),
+        sa.ForeignKeyConstraint(
+            ["company_id"],
+            ["company.company_id"],
+        ),
+        sa.PrimaryKeyConstraint("entity_company_id"),
+    )
+    op.create_index(
+        "ix_entity_company_entity_company_id",
+        "entity_company",
+        ["entity_company_id"],
+        unique=True,
+    )
+    op.create_table(
+        "entity_media",
+        sa.Column("entity_media_id", sa.UUID(), nullable=False),
+        sa.Column("media_id", sa.UUID(), nullable=False),
+        sa.Column("entity_id", sa.UUID(), nullable=False),
+        sa.Column("entity_type", enum("entitytypeenum"), nullable=False),
+        sa.Column("media_type", enum("mediatype"), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.CheckConstraint(
+            "entity_type IN ('property', 'user', 'units', 'amenities', 'entityamenities', 'contract', 'maintenance_requests')",
+            name="check_entity_type_media",
+        ),
+        sa.ForeignKeyConstraint(
+            ["media_id"],
+            ["media.media_id"],
+        ),
+        sa.PrimaryKeyConstraint("entity_media_id"),
+    )
+    op.create_index(
+        "ix_entity_media_entity_media_id",
+        "entity_media",
+        ["entity_media_id"],
+        unique=True,
+    )
+    op.create_table(
+        "favorite_properties",
+        sa.Column("favorite_id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("property_unit_assoc_id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["property_unit_assoc_id"],
+            ["property_unit_assoc.property_unit_assoc_id"],
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.user_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("favorite_id", "user_id", "property_unit_assoc_id"),
+    )
+    op.create_index(
+        "ix_favorite_properties_favorite_id",
+        "favorite_properties",
+        ["favorite_id"],
+        unique=True,
+    )
+    op.create_table(
+        "message",
+        sa.Column("message_id", sa.UUID(), nullable=False),
+        sa.Column("subject", sa.String(length=128), nullable=True),
+        sa.Column("sender_id", sa.UUID(), nullable=True),
+        sa.Column("message_body", sa.Text(), nullable=True),
+        sa.Column("parent_message_id", sa.UUID(), nullable=True),
+        sa.Column("thread_id", sa.UUID(), nullable=True),
+        sa.Column("is_draft", sa.Boolean(), nullable=True),
+        sa.Column("is_notification", sa.Boolean(), nullable=True),
+        sa.Column("is_enquiry", sa.Boolean(), nullable=True),
+        sa.Column("is_reminder", sa.Boolean(), nullable=True),
+        sa.Column("is_scheduled", sa.Boolean(), nullable=True),
+        sa.Column("is_read", sa.Boolean(), nullable=True),
+        sa.Column("date_created", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("scheduled_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("next_remind_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("reminder_frequency_id", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["parent_message_id"],
+            ["message.message_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["reminder_frequency_id"],
+            ["reminder_frequency.reminder_frequency_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["sender_id"],
+            ["users.user_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["thread_id"],
+            ["message.message_id"],
+        ),
+        sa.PrimaryKeyConstraint("message_id"),
+    )
+    op.create_table(
+        "past_rental_history",
+        sa.Column("rental_history_id", sa.UUID(), nullable=False),
+        sa.Column("start_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("end_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("property_owner_name", sa.String(), nullable=False),
+        sa.Column("property_owner_email", sa.String(), nullable=False),
+        sa.Column("property_owner_mobile", sa.String(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.user_id"],
+        ),
+        sa.PrimaryKeyConstraint("rental_history_id"),
+    )
+    op.create_index(
+        "ix_past_rental_history_rental_history_id",
+        "past_rental_history",
+        ["rental_history_id"],
+        unique=True,
+    )
+    op.create_table(
+        "property",
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("property_unit_assoc_id", sa.UUID(), nullable=False),
+        sa.Column("property_type", enum("propertytype"), nullable=False),
+        sa.Column("amount", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column(
+            "security_deposit", sa.Numeric(precision=10, scale=2), nullable=False
+        ),
+        sa.Column("commission", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("floor_space", sa.Numeric(precision=8, scale=2), nullable=False),
+        sa.Column("num_units", sa.Integer(), nullable=False),
+        sa.Column("num_bathrooms", sa.Integer(), nullable=False),
+        sa.Column("num_garages", sa.Integer(), nullable=False),
+        sa.Column("has_balconies", sa.Boolean(), nullable=False),
+        sa.Column("has_parking_space", sa.Boolean(), nullable=False),
+        sa.Column("pets_allowed", sa.Boolean(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("property_status", enum("propertystatus"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["property_unit_assoc_id"],
+            ["property_unit_assoc.property_unit_assoc_id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("property_unit_assoc_id"),
+    )
+    op.create_table(
+        "property_assignment",
+        sa.Column("property_assignment_id", sa.UUID(), nullable=False),
+        sa.Column("property_unit_assoc_id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("assignment_type", enum("propertyassignmenttype"), nullable=False),
+        sa.Column("date_from", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("date_to", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("notes", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["property_unit_assoc_id"],
+            ["property_unit_assoc.property_unit_assoc_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.user_id"],
+        ),
+        sa.PrimaryKeyConstraint("property_assignment_id"),
+    )
+    op.create_index(
+        "ix_property_assignment_property_assignment_id",
+        "property_assignment",
+        ["property_assignment_id"],
+        unique=True,
+    )
+    op.create_table(
+        "region",
+        sa.Column("region_id", sa.UUID(), nullable=False),
+        sa.Column("country_id", sa.UUID(), nullable=False),
+        sa.Column("region_name", sa.String(length=128), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["country_id"],
+            ["country.country_id"],
+        ),
+        sa.PrimaryKeyConstraint("region_id"),
+    )
+    op.create_table(
+        "role_permissions",
+        sa.Column("role_id", sa.UUID(), nullable=False),
+        sa.Column("permission_id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["permission_id"],
+            ["permissions.permission_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["role_id"],
+            ["role.role_id"],
+        ),
+        sa.PrimaryKeyConstraint("role_id", "permission_id"),
+    )
+    op.create_table(
+        "tour",
+        sa.Column("tour_booking_id", sa.UUID(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("phone_number", sa.String(), nullable=False),
+        sa.Column("tour_type", enum("tourtype"), nullable=True),
+        sa.Column("status", enum("tourstatus"), nullable=True),
+        sa.Column("tour_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("property_unit_assoc_id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["property_unit_assoc_id"],
+            ["property_unit_assoc.property_unit_assoc_id"],
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.user_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("tour_booking_id"),
+    )
+    op.create_index(
+        "ix_tour_tour_booking_id", "tour", ["tour_booking_id"], unique=False
+    )
+    op.create_table(
+        "transaction",
+        sa.Column("transaction_id", sa.UUID(), nullable=False),
+        sa.Column("transaction_number", sa.String(length=128), nullable=False),
+        sa.Column("payment_type_id", sa.Integer(), nullable=False),
+        sa.Column("client_offered", sa.UUID(), nullable=False),
+        sa.Column("client_requested", sa.UUID(), nullable=False),
+        sa.Column("transaction_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("transaction_details", sa.Text(), nullable=False),
+        sa.Column("transaction_type", sa.Integer(), nullable=False),
+        sa.Column("transaction_status", enum("paymentstatusenum"), nullable=False),
+        sa.Column("invoice_number", sa.String(length=128), nullable=True),
+        sa.Column(
+            "transaction_amount", sa.Numeric(precision=10, scale=2), nullable=False
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["client_offered"],
+            ["users.user_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["client_requested"],
+            ["users.user_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["invoice_number"],
+            ["invoice.invoice_number"],
+            name="fk_transaction_invoice_number",
+            use_alter=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["payment_type_id"],
+            ["payment_type.payment_type_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["transaction_type"],
+            ["transaction_type.transaction_type_id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("transaction_id"),
+        sa.UniqueConstraint("transaction_number"),
+    )
+    op.create_index(
+        "ix_transaction_transaction_id", "transaction", ["transaction_id"], unique=True
+    )
+    op.create_table(
+        "user_interactions",
+        sa.Column("user_interaction_id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("employee_id", sa.UUID(), nullable=False),
+        sa.Column("property_unit_assoc_id", sa.UUID(), nullable=False),
+        sa.Column("contact_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("contact_details", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["employee_id"],
+            ["users.user_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["property_unit_assoc_id"],
+            ["property_unit_assoc.property_unit_assoc_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.user_id"],
+        ),
+        sa.PrimaryKeyConstraint("user_interaction_id"),
+    )
+    op.create_table(
+        "user_roles",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("role_id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["role_id"],
+            ["role.role_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.user_id"],
+        ),
+        sa.PrimaryKeyConstraint("user_id", "role_id"),
+    )
+    op.create_table(
+        "utilities",
+        sa.Column("utility_id", sa.UUID(), nullable=False),
+        sa.Column("name", sa.String(length=128), nullable=False),
+        sa.Column("description", sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["utility_id"],
+            ["billable_assoc.billable_assoc_id"],
+        ),
+        sa.PrimaryKeyConstraint("utility_id"),
+    )
+    op.create_table(
+        "city",
+        sa.Column("city_id", sa.UUID(), nullable=False),
+        sa.Column("region_id", sa.UUID(), nullable=False),
+        sa.Column("city_name", sa.String(length=128), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["region_id"],
+            ["region.region_id"],
+        ),
+        sa.PrimaryKeyConstraint("city_id"),
+    )
+    op.create_table(
+        "contract_document",
+        sa.Column("contract_document_id", sa.UUID(), nullable=False),
+        sa.Column("contract_id", sa.UUID(), nullable=False),
+        sa.Column("document_number", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["contract_id"],
+            ["contract.contract_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["document_number"],
+            ["document.document_number"],
+        ),
+        sa.PrimaryKeyConstraint("contract_document_id"),
+    )
+    op.create_index(
+        "ix_contract_document_contract_document_id",
+        "contract_document",
+        ["contract_document_id"],
+        unique=True,
+    )
+    op.create_table(
+        "invoice",
+        sa.Column("invoice_id", sa.UUID(), nullable=False),
+        sa.Column("invoice_number", sa.String(length=128), nullable=False),
+        sa.Column("issued_by", sa.UUID(), nullable=False),
+        sa.Column("issued_to", sa.UUID(), nullable=False),
+        sa.Column("invoice_details", sa.Text(), nullable=False),
+        sa.Column("invoice_amount", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("due_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("date_paid", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("invoice_type", enum("invoicetypeenum"), nullable=False),
+        sa.Column("status", enum("paymentstatusenum"), nullable=False),
+        sa.Column("transaction_number", sa.String(length=128), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["issued_by"],
+            ["users.user_id"],
+            name="fk_invoice_issued_by",
+            use_alter=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["issued_to"],
+            ["users.user_id"],
+            name="fk_invoice_issued_to",
+            use_alter=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["transaction_number"],
+            ["transaction.transaction_number"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("invoice_id"),
+        sa.UniqueConstraint("invoice_number"),
+    )
+    op.create_index("ix_invoice_invoice_id", "invoice", ["invoice_id"], unique=True)
+    op.create_table(
+        "maintenance_requests",
+        sa.Column("maintenance_request_id", sa.UUID(), nullable=False),
+        sa.Column("task_number", sa.String(length=128), nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("status", sa.String(), nullable=True),
+        sa.Column("priority", sa.String(), nullable=True),
+        sa.Column("requested_by", sa.UUID(), nullable=False),
+        sa.Column("property_unit_assoc_id", sa.UUID(), nullable=True),
+        sa.Column("scheduled_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("is_emergency", sa.Boolean(), nullable=False),
+        sa.Column("calendar_event_id", sa.UUID(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["calendar_event_id"],
+            ["calendar_events.calendar_event_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["property_unit_assoc_id"],
+            ["property_unit_assoc.property_unit_assoc_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["requested_by"],
+            ["users.user_id"],
+        ),
+        sa.PrimaryKeyConstraint("maintenance_request_id"),
+        sa.UniqueConstraint("task_number"),
+    )
+    op.create_table(
+        "message_recipient",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("recipient_id", sa.UUID(), nullable=False),
+        sa.Column("recipient_group_id", sa.UUID(), nullable=True),
+        sa.Column("message_id", sa.UUID(), nullable=True),
+        sa.Column("is_read", sa.Boolean(), nullable=True),
+        sa.Column("msg_send_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["message_id"],
+            ["message.message_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["recipient_group_id"],
+            ["property_unit_assoc.property_unit_assoc_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["recipient_id"],
+            ["users.user_id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "under_contract",
+        sa.Column("under_contract_id", sa.UUID(), nullable=False),
+        sa.Column("property_unit_assoc_id", sa.UUID(), nullable=False),
+        sa.Column("contract_status", enum("contractstatusenum"), nullable=False),
+        sa.Column("contract_number", sa.String(length=128), nullable=False),
+        sa.Column("client_id", sa.UUID(), nullable=True),
+        sa.Column("employee_id", sa.UUID(), nullable=True),
+        sa.Column("start_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("end_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("next_payment_due", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["client_id"],
+            ["users.user_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["contract_number"], ["contract.contract_number"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["employee_id"],
+            ["users.user_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["property_unit_assoc_id"],
+            ["property_unit_assoc.property_unit_assoc_id"],
+        ),
+        sa.PrimaryKeyConstraint("under_contract_id"),
+    )
+    op.create_index(
+        "ix_under_contract_under_contract_id",
+        "under_contract",
+        ["under_contract_id"],
+        unique=True,
+    )
+    op.create_table(
+        "units",
+        sa.Column("property_unit_assoc_id", sa.UUID(), nullable=False),
+        sa.Column("property_unit_code", sa.String(length=128), nullable=False),
+        sa.Column("property_unit_floor_space", sa.Integer(), nullable=False),
+        sa.Column(
+            "property_unit_amount", sa.Numeric(precision=10, scale=2), nullable=False
+        ),
+        sa.Column(
+            "property_unit_security_deposit",
+            sa.Numeric(precision=10, scale=2),
+            nullable=False,
+        ),
+        sa.Column(
+            "property_unit_commission",
+            sa.Numeric(precision=10, scale=2),
+            nullable=False,
+        ),
+        sa.Column("property_floor_id", sa.Integer(), nullable=False),
+        sa.Column("property_status", enum("propertystatus"), nullable=False),
+        sa.Column("property_unit_notes", sa.Text(), nullable=False),
+        sa.Column("has_amenities", sa.Boolean(), nullable=False),
+        sa.Column("property_id", sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["property_id"],
+            ["property.property_unit_assoc_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["property_unit_assoc_id"],
+            ["property_unit_assoc.property_unit_assoc_id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("property_unit_assoc_id"),
+    )
+    op.create_table(
+        "address",
+        sa.Column("address_id", sa.UUID(), nullable=False),
+        sa.Column("address_type", enum("addresstypeenum"), nullable=False),
+        sa.Column("primary", sa.Boolean(), nullable=False),
+        sa.Column("address_1", sa.String(length=80), nullable=False),
+        sa.Column("address_2", sa.String(length=80), nullable=True),
+        sa.Column("address_postalcode", sa.String(length=20), nullable=True),
+        sa.Column("city_id", sa.UUID(), nullable=False),
+        sa.Column("region_id", sa.UUID(), nullable=False),
+        sa.Column("country_id", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["city_id"],
+            ["city.city_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["country_id"],
+            ["country.country_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["region_id"],
+            ["region.region_id"],
+        ),
+        sa.PrimaryKeyConstraint("address_id"),
+    )
+    op.create_index("ix_address_address_id", "address", ["address_id"], unique=True)
+    op.create_table(
+        "contract_invoice",
+        sa.Column("contract_invoice_id", sa.UUID(), nullable=False),
+        sa.Column("contract_id", sa.UUID(), nullable=False),
+        sa.Column("invoice_number", sa.String(length=128), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["contract_id"],
+            ["contract.contract_id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["invoice_number"],
+            ["invoice.invoice_number"],
+        ),
+        sa.PrimaryKeyConstraint("contract_invoice_id"),
+    )
+    op.create_index(
+        "ix_contract_invoice_contract_invoice_id",
+        "contract_invoice",
+        ["contract_invoice_id"],
+        unique=True,
+    )
+    op.create_table(
+        "invoice_items",
+        sa.Column("invoice_item_id", sa.UUID(), nullable=False),
+        sa.Column("invoice_number", sa.String(length=128), nullable=False),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column("unit_price", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("total_price", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("description", sa.String(), nullable=True),
+        sa.Column("reference_id", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["invoice_number"],
+            ["invoice.invoice_number"],
+        ),
+        sa.PrimaryKeyConstraint("invoice_item_id"),
+    )
+    op.create_index(
+        "ix_invoice_items_invoice_item_id",
+        "invoice_items",
+        ["invoice_item_id"],
+        unique=True,
+    )
+    op.create_table(
+        "entity_address",
+        sa.Column("entity_address_id", sa.UUID(), nullable=False),
+        sa.Column("entity_id", sa.UUID(), nullable=False),
+        sa.Column("entity_type", enum("entitytypeenum"), nullable=False),
+        sa.Column("address_id", sa.UUID(), nullable=False),
+        sa.Column("emergency_address", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.CheckConstraint(
+            "entity_type IN ('property', 'user', 'pastrentalhistory', 'account', 'role')",
+            name="check_entity_type_address",
+        ),
+        sa.ForeignKeyConstraint(
+            ["address_id"],
+            ["address.address_id"],
+        ),
+        sa.PrimaryKeyConstraint("entity_address_id"),
+    )
+
+    if bind.dialect.name != "sqlite":
+        for name, table, referred, columns, referred_columns in ALTER_FOREIGN_KEYS:
+            op.create_foreign_key(name, table, referred, columns, referred_columns)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+
+    if bind.dialect.name != "sqlite":
+        for name, table, _, _, _ in reversed(ALTER_FOREIGN_KEYS):
+            op.drop_constraint(name, table, type_="foreignkey")
+
+    op.drop_table("entity_address")
+    op.drop_index("ix_invoice_items_invoice_item_id", table_name="invoice_items")
+    op.drop_table("invoice_items")
+    op.drop_index(
+        "ix_contract_invoice_contract_invoice_id", table_name="contract_invoice"
+    )
+    op.drop_table("contract_invoice")
+    op.drop_index("ix_address_address_id", table_name="address")
+    op.drop_table("address")
+    op.drop_table("units")
+    op.drop_index("ix_under_contract_under_contract_id", table_name="under_contract")
+    op.drop_table("under_contract")
+    op.drop_table("message_recipient")
+    op.drop_table("maintenance_requests")
+    op.drop_index("ix_invoice_invoice_id", table_name="invoice")
+    op.drop_table("invoice")
+    op.drop_index(
+        "ix_contract_document_contract_document_id", table_name="contract_document"
+    )
+    op.drop_table("contract_document")
+    op.drop_table("city")
+    op.drop_table("utilities")
+    op.drop_table("user_roles")
+    op.drop_table("user_interactions")
+    op.drop_index("ix_transaction_transaction_id", table_name="transaction")
+    op.drop_table("transaction")
+    op.drop_index("ix_tour_tour_booking_id", table_name="tour")
+    op.drop_table("tour")
+    op.drop_table("role_permissions")
+    op.drop_table("region")
+    op.drop_index(
+        "ix_property_assignment_property_assignment_id",
+        table_name="property_assignment",
+    )
+    op.drop_table("property_assignment")
+    op.drop_table("property")
+    op.drop_index(
+        "ix_past_rental_history_rental_history_id", table_name="past_rental_history"
+    )
+    op.drop_table("past_rental_history")
+    op.drop_table("message")
+    op.drop_index(
+        "ix_favorite_properties_favorite_id", table_name="favorite_properties"
+    )
+    op.drop_table("favorite_properties")
+    op.drop_index("ix_entity_media_entity_media_id", table_name="entity_media")
+    op.drop_table("entity_media")
+    op.drop_index("ix_entity_company_entity_company_id", table_name="entity_company")
+    op.drop_table("entity_company")
+    op.drop_index("ix_entity_billable_entity_billable_id", table_name="entity_billable")
+    op.drop_table("entity_billable")
+    op.drop_index(
+        "ix_entity_amenities_entity_amenities_id", table_name="entity_amenities"
+    )
+    op.drop_table("entity_amenities")
+    op.drop_index("ix_entity_accounts_entity_account_id", table_name="entity_accounts")
+    op.drop_table("entity_accounts")
+    op.drop_table("document")
+    op.drop_index("ix_contract_contract_id", table_name="contract")
+    op.drop_table("contract")
+    op.drop_table("calendar_events")
+    op.drop_index("ix_users_user_id", table_name="users")
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_table("users")
+    op.drop_index("ix_unit_type_unit_type_id", table_name="unit_type")
+    op.drop_table("unit_type")
+    op.drop_index(
+        "ix_transaction_type_transaction_type_name", table_name="transaction_type"
+    )
+    op.drop_index(
+        "ix_transaction_type_transaction_type_id", table_name="transaction_type"
+    )
+    op.drop_table("transaction_type")
+    op.drop_index("ix_role_role_id", table_name="role")
+    op.drop_table("role")
+    op.drop_table("reminder_frequency")
+    op.drop_table("property_unit_assoc")
+    op.drop_table("property_type")
+    op.drop_index("ix_permissions_permission_id", table_name="permissions")
+    op.drop_table("permissions")
+    op.drop_index("ix_payment_type_payment_type_id", table_name="payment_type")
+    op.drop_table("payment_type")
+    op.drop_table("media")
+    op.drop_table("country")
+    op.drop_index("ix_contract_type_contract_type_name", table_name="contract_type")
+    op.drop_index("ix_contract_type_contract_type_id", table_name="contract_type")
+    op.drop_table("contract_type")
+    op.drop_table("company")
+    op.drop_table("billable_assoc")
+    op.drop_table("amenities")
+    op.drop_table("accounts")
+
+    if bind.dialect.name == "postgresql":
+        for name in reversed(ENUMS):
+            postgresql.ENUM(name=name).drop(bind)
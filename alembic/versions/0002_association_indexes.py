@@ -0,0 +1,106 @@
+"""association and lookup indexes
+
+Composite indexes on the polymorphic (entity_id, entity_type) association tables, which
+are joined by the selectin relationships on Property, Units, Contract and User. The
+associated id is INCLUDEd so those secondary joins can be served by index-only scans.
+Also indexes the hot filter columns of message_recipient, invoice, transaction and
+under_contract.
+
+On Postgres the indexes are built with CREATE INDEX CONCURRENTLY, which cannot run inside
+a transaction block, so they are created in an autocommit block. If a concurrent build
+fails it leaves an INVALID index behind; drop it before re-running the upgrade.
+
+Revision ID: 0002_association_indexes
+Revises: 0001_initial_schema
+Create Date: 2024-10-22 00:00:00.000000
+
+"""
+
+from typing import List, Sequence, Tuple, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_association_indexes"
+down_revision: Union[str, None] = "0001_initial_schema"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns, included columns)
+INDEXES: List[Tuple[str, str, List[str], List[str]]] = [
+    (
+        "ix_entity_media_entity_id_entity_type",
+        "entity_media",
+        ["entity_id", "entity_type"],
+        ["media_id"],
+    ),
+    (
+        "ix_entity_amenities_entity_id_entity_type",
+        "entity_amenities",
+        ["entity_id", "entity_type"],
+        ["amenity_id"],
+    ),
+    (
+        "ix_entity_billable_entity_id_entity_type_billable_type",
+        "entity_billable",
+        ["entity_id", "entity_type", "billable_type"],
+        ["billable_id"],
+    ),
+    (
+        "ix_entity_address_entity_id_entity_type",
+        "entity_address",
+        ["entity_id", "entity_type"],
+        ["address_id"],
+    ),
+    (
+        "ix_entity_accounts_entity_id_entity_type",
+        "entity_accounts",
+        ["entity_id", "entity_type"],
+        ["account_id"],
+    ),
+    (
+        "ix_message_recipient_recipient_id",
+        "message_recipient",
+        ["recipient_id"],
+        [],
+    ),
+    (
+        "ix_message_recipient_recipient_group_id_msg_send_date",
+        "message_recipient",
+        ["recipient_group_id", "msg_send_date"],
+        [],
+    ),
+    ("ix_invoice_status_due_date", "invoice", ["status", "due_date"], []),
+    ("ix_transaction_transaction_date", "transaction", ["transaction_date"], []),
+    (
+        "ix_under_contract_property_unit_assoc_id_start_date_end_date",
+        "under_contract",
+        ["property_unit_assoc_id", "start_date", "end_date"],
+        [],
+    ),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, include in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+                postgresql_include=include,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,234 @@
+"""entity_type smallint codes
+
+Converts the entity_type discriminator of the association tables from the
+entitytypeenum string enum to the smallint codes of ENTITY_TYPE_CODES, rewrites
+the CHECK constraints to the codes and replaces the (entity_id, entity_type)
+composite indexes from 0002 with one partial index per entity type.
+
+Existing rows are converted through a temporary entity_type_new column, so the
+migration works on every backend (batch mode recreates the table on SQLite).
+
+Revision ID: 0003_entity_type_codes
+Revises: 0002_association_indexes
+Create Date: 2024-10-24 00:00:00.000000
+
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_entity_type_codes"
+down_revision: Union[str, None] = "0002_association_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# frozen copy of ENTITY_TYPE_CODES, the codes are persisted by this migration
+ENTITY_TYPE_CODES: Dict[str, int] = {
+    "property": 1,
+    "units": 2,
+    "utilities": 3,
+    "contract": 4,
+    "user": 5,
+    "role": 6,
+    "amenities": 7,
+    "account": 8,
+    "comapany": 9,
+    "entityamenities": 10,
+    "pastrentalhistory": 11,
+    "maintenance_requests": 12,
+}
+
+ENUM_NAME = "entitytypeenum"
+
+# table: (check constraint, entity types, partial index columns, included column,
+#         nullable, composite index from 0002)
+TABLES: Dict[str, Tuple[str, List[str], List[str], str, bool, Optional[str]]] = {
+    "entity_media": (
+        "check_entity_type_media",
+        [
+            "property",
+            "user",
+            "units",
+            "amenities",
+            "entityamenities",
+            "contract",
+            "maintenance_requests",
+        ],
+        ["entity_id"],
+        "media_id",
+        False,
+        "ix_entity_media_entity_id_entity_type",
+    ),
+    "entity_accounts": (
+        "check_entity_type_accounts",
+        ["property", "user"],
+        ["entity_id"],
+        "account_id",
+        False,
+        "ix_entity_accounts_entity_id_entity_type",
+    ),
+    "entity_address": (
+        "check_entity_type_address",
+        ["property", "user", "pastrentalhistory", "account", "role"],
+        ["entity_id"],
+        "address_id",
+        False,
+        "ix_entity_address_entity_id_entity_type",
+    ),
+    "entity_amenities": (
+        "check_entity_type_amenities",
+        ["property", "units"],
+        ["entity_id"],
+        "amenity_id",
+        False,
+        "ix_entity_amenities_entity_id_entity_type",
+    ),
+    "entity_billable": (
+        "check_entity_type_billables",
+        ["property", "units", "contract"],
+        ["entity_id", "billable_type"],
+        "billable_id",
+        True,
+        "ix_entity_billable_entity_id_entity_type_billable_type",
+    ),
+    "entity_company": (
+        "check_entity_type_company",
+        ["property", "user"],
+        ["entity_id"],
+        "company_id",
+        False,
+        None,
+    ),
+}
+
+
+def entity_type_enum() -> sa.types.TypeEngine:
+    names = list(ENTITY_TYPE_CODES)
+    return sa.Enum(*names, name=ENUM_NAME).with_variant(
+        postgresql.ENUM(*names, name=ENUM_NAME, create_type=False), "postgresql"
+    )
+
+
+def partial_indexes() -> List[Tuple[str, str, List[str], str, str]]:
+    """(index name, table, columns, included column, predicate) of every partial index."""
+    return [
+        (
+            f"ix_{table}_{entity_type}",
+            table,
+            columns,
+            include,
+            f"entity_type = {ENTITY_TYPE_CODES[entity_type]}",
+        )
+        for table, (_, entity_types, columns, include, _, _) in TABLES.items()
+        for entity_type in entity_types
+    ]
+
+
+def convert_column(
+    table: str,
+    new_type: sa.types.TypeEngine,
+    mapping: Dict[str, object],
+    check: str,
+    check_values: str,
+    nullable: bool,
+) -> None:
+    """Rewrites entity_type through a temporary column using the given value mapping."""
+    op.add_column(table, sa.Column("entity_type_new", new_type, nullable=True))
+
+    target = sa.table(
+        table, sa.column("entity_type"), sa.column("entity_type_new", new_type)
+    )
+    op.execute(
+        target.update().values(
+            entity_type_new=sa.cast(
+                sa.case(mapping, value=sa.cast(target.c.entity_type, sa.String)),
+                new_type,
+            )
+        )
+    )
+
+    with op.batch_alter_table(table) as batch_op:
+        batch_op.drop_constraint(check, type_="check")
+        batch_op.drop_column("entity_type")
+        batch_op.alter_column(
+            "entity_type_new",
+            new_column_name="entity_type",
+            existing_type=new_type,
+            nullable=nullable,
+        )
+        batch_op.create_check_constraint(check, f"entity_type IN ({check_values})")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    for table, (check, entity_types, _, _, nullable, composite) in TABLES.items():
+        if composite:
+            op.drop_index(composite, table_name=table)
+
+        convert_column(
+            table,
+            sa.SmallInteger(),
+            dict(ENTITY_TYPE_CODES),
+            check,
+            ", ".join(str(ENTITY_TYPE_CODES[name]) for name in entity_types),
+            nullable,
+        )
+
+    if bind.dialect.name == "postgresql":
+        op.execute(f"DROP TYPE IF EXISTS {ENUM_NAME}")
+
+    with op.get_context().autocommit_block():
+        for name, table, columns, include, predicate in partial_indexes():
+            op.create_index(
+                name,
+                table,
+                columns,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+                postgresql_include=[include],
+                postgresql_where=sa.text(predicate),
+                sqlite_where=sa.text(predicate),
+            )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+
+    with op.get_context().autocommit_block():
+        for name, table, _, _, _ in reversed(partial_indexes()):
+            op.drop_index(
+                name, table_name=table, if_exists=True, postgresql_concurrently=True
+            )
+
+    if bind.dialect.name == "postgresql":
+        postgresql.ENUM(*ENTITY_TYPE_CODES, name=ENUM_NAME).create(
+            bind, checkfirst=True
+        )
+
+    for table, (check, entity_types, _, include, nullable, composite) in TABLES.items():
+        convert_column(
+            table,
+            entity_type_enum(),
+            {str(code): name for name, code in ENTITY_TYPE_CODES.items()},
+            check,
+            ", ".join(f"'{name}'" for name in entity_types),
+            nullable,
+        )
+
+        if composite:
+            columns = ["entity_id", "entity_type"]
+            if table == "entity_billable":
+                columns.append("billable_type")
+            op.create_index(
+                composite,
+                table,
+                columns,
+                if_not_exists=True,
+                postgresql_include=[include],
+            )
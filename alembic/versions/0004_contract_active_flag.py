@@ -0,0 +1,87 @@
+"""materialized is_contract_active flag
+
+Adds property_unit_assoc.is_contract_active, which replaces the correlated
+EXISTS column_property on Property/Units. The flag is backfilled here and then
+maintained by OccupancyService on under_contract writes and at contract
+start/end boundaries.
+
+Revision ID: 0004_contract_active_flag
+Revises: 0003_entity_type_codes
+Create Date: 2024-10-25 00:00:00.000000
+
+"""
+
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_contract_active_flag"
+down_revision: Union[str, None] = "0003_entity_type_codes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_property_unit_assoc_is_contract_active"
+
+
+def upgrade() -> None:
+    op.add_column(
+        "property_unit_assoc",
+        sa.Column(
+            "is_contract_active",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.false(),
+        ),
+    )
+
+    assoc = sa.table(
+        "property_unit_assoc",
+        sa.column("property_unit_assoc_id"),
+        sa.column("is_contract_active", sa.Boolean),
+    )
+    under_contract = sa.table(
+        "under_contract",
+        sa.column("property_unit_assoc_id"),
+        sa.column("start_date", sa.DateTime(timezone=True)),
+        sa.column("end_date", sa.DateTime(timezone=True)),
+    )
+    now = datetime.now(timezone.utc)
+    op.execute(
+        assoc.update().values(
+            is_contract_active=sa.exists().where(
+                under_contract.c.property_unit_assoc_id
+                == assoc.c.property_unit_assoc_id,
+                under_contract.c.start_date <= now,
+                sa.or_(
+                    under_contract.c.end_date.is_(None),
+                    under_contract.c.end_date >= now,
+                ),
+            )
+        )
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX_NAME,
+            "property_unit_assoc",
+            ["is_contract_active"],
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME,
+            table_name="property_unit_assoc",
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
+
+    with op.batch_alter_table("property_unit_assoc") as batch_op:
+        batch_op.drop_column("is_contract_active")
@@ -0,0 +1,58 @@
+"""business number sequences
+
+Creates the sequences behind NumberSequence (app/db/dbSequence.py), which allocates
+invoice, transaction, contract, maintenance task and calendar event numbers in
+blocks (hi/lo). Each nextval() reserves BLOCK_SIZE numbers, hence INCREMENT BY.
+
+New numbers are the prefix plus a 10 digit counter, so they cannot collide with the
+14 digit timestamp numbers generated so far. Backends without sequences are skipped;
+NumberSequence continues from the stored numbers there.
+
+Revision ID: 0005_number_sequences
+Revises: 0004_contract_active_flag
+Create Date: 2024-10-26 00:00:00.000000
+
+"""
+
+from typing import List, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_number_sequences"
+down_revision: Union[str, None] = "0004_contract_active_flag"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# frozen copy of dbSequence.BLOCK_SIZE
+BLOCK_SIZE = 100
+
+SEQUENCES: List[str] = [
+    "invoice_number_seq",
+    "transaction_number_seq",
+    "contract_number_seq",
+    "maintenance_request_task_number_seq",
+    "calendar_event_id_seq",
+]
+
+
+def upgrade() -> None:
+    if not op.get_bind().dialect.supports_sequences:
+        return
+
+    for name in SEQUENCES:
+        op.execute(
+            sa.schema.CreateSequence(
+                sa.Sequence(name, start=1, increment=BLOCK_SIZE), if_not_exists=True
+            )
+        )
+
+
+def downgrade() -> None:
+    if not op.get_bind().dialect.supports_sequences:
+        return
+
+    for name in reversed(SEQUENCES):
+        op.execute(sa.schema.DropSequence(sa.Sequence(name), if_exists=True))
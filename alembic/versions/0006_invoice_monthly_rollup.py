@@ -0,0 +1,147 @@
+"""invoice monthly rollup
+
+Adds invoice_monthly_rollup (sum and count of invoices per due month, status and
+invoice type), which replaces the full-table aggregates of the invoice trends
+endpoint. The table is filled here and then maintained by InvoiceRollupService on
+every invoice write; `python -m app.commands.rebuild_invoice_rollups` refills it.
+
+The backfill only uses the tables as they are at this revision, never the models
+or services of the app.
+
+Revision ID: 0006_invoice_monthly_rollup
+Revises: 0005_number_sequences
+Create Date: 2024-10-27 00:00:00.000000
+
+"""
+
+import pytz
+from decimal import Decimal
+from collections import defaultdict
+from datetime import datetime
+from typing import List, Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from alembic import op
+
+from app.core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006_invoice_monthly_rollup"
+down_revision: Union[str, None] = "0005_number_sequences"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "invoice_monthly_rollup"
+
+# frozen copies of the enums, the types already exist for the invoice table
+PAYMENT_STATUSES = ["pending", "completed", "cancelled", "reversal"]
+INVOICE_TYPES = ["lease", "maintenance", "other", "general"]
+
+
+def existing_enum(name: str, values: List[str]) -> sa.types.TypeEngine:
+    return sa.Enum(*values, name=name).with_variant(
+        postgresql.ENUM(*values, name=name, create_type=False), "postgresql"
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    op.create_table(
+        TABLE,
+        sa.Column("month", sa.Date(), primary_key=True),
+        sa.Column(
+            "status",
+            existing_enum("paymentstatusenum", PAYMENT_STATUSES),
+            primary_key=True,
+        ),
+        sa.Column(
+            "invoice_type",
+            existing_enum("invoicetypeenum", INVOICE_TYPES),
+            primary_key=True,
+        ),
+        sa.Column("total_amount", sa.Numeric(14, 2), nullable=False),
+        sa.Column("total_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+    backfill(bind)
+
+
+def backfill(bind: sa.Connection) -> None:
+    """Sums the invoices per due month (in INVOICE_TRENDS_TIMEZONE), status and type."""
+    op.execute(sa.text(f"DELETE FROM {TABLE}"))
+
+    if bind.dialect.name == "postgresql":
+        op.execute(
+            sa.text(
+                f"""
+                INSERT INTO {TABLE}
+                    (month, status, invoice_type, total_amount, total_count,
+                     created_at, updated_at)
+                SELECT CAST(
+                           date_trunc('month', timezone(:timezone, due_date)) AS date
+                       ),
+                       status, invoice_type, COALESCE(SUM(invoice_amount), 0),
+                       COUNT(*), now(), now()
+                FROM invoice
+                WHERE due_date IS NOT NULL
+                  AND status IS NOT NULL
+                  AND invoice_type IS NOT NULL
+                GROUP BY 1, status, invoice_type
+                """
+            ).bindparams(timezone=settings.INVOICE_TRENDS_TIMEZONE)
+        )
+        return
+
+    # no timezone-aware date_trunc (SQLite dev databases), bucket in python
+    timezone = pytz.timezone(settings.INVOICE_TRENDS_TIMEZONE)
+    totals = defaultdict(lambda: [Decimal(0), 0])
+    invoices = bind.execute(
+        sa.text(
+            "SELECT due_date, status, invoice_type, invoice_amount FROM invoice "
+            "WHERE due_date IS NOT NULL AND status IS NOT NULL "
+            "AND invoice_type IS NOT NULL"
+        ).columns(due_date=sa.DateTime(timezone=True))
+    )
+    for due_date, status, invoice_type, amount in invoices:
+        if due_date.tzinfo is None:
+            due_date = pytz.utc.localize(due_date)
+        month = due_date.astimezone(timezone).date().replace(day=1)
+        totals[(month, status, invoice_type)][0] += Decimal(str(amount or 0))
+        totals[(month, status, invoice_type)][1] += 1
+
+    if totals:
+        now = datetime.now(pytz.utc)
+        rollup = sa.table(
+            TABLE,
+            sa.column("month", sa.Date),
+            sa.column("status"),
+            sa.column("invoice_type"),
+            sa.column("total_amount", sa.Numeric(14, 2)),
+            sa.column("total_count", sa.Integer),
+            sa.column("created_at", sa.DateTime(timezone=True)),
+            sa.column("updated_at", sa.DateTime(timezone=True)),
+        )
+        op.bulk_insert(
+            rollup,
+            [
+                {
+                    "month": month,
+                    "status": status,
+                    "invoice_type": invoice_type,
+                    "total_amount": amount,
+                    "total_count": count,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for (month, status, invoice_type), (amount, count) in totals.items()
+            ],
+        )
+
+
+def downgrade() -> None:
+    op.drop_table(TABLE)
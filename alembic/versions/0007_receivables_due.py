@@ -0,0 +1,98 @@
+"""receivables due
+
+Adds receivables_due (invoice, client and due date/status of every invoice billed
+to an active contract), which replaces the invoice → contract_invoice → contract →
+under_contract → contract_type join of the leases due endpoints. The table is filled
+here and then maintained by ReceivablesService on every write to those tables.
+
+The backfill only uses the tables as they are at this revision, never the models
+or services of the app.
+
+Revision ID: 0007_receivables_due
+Revises: 0006_invoice_monthly_rollup
+Create Date: 2024-10-28 00:00:00.000000
+
+"""
+
+from typing import List, Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007_receivables_due"
+down_revision: Union[str, None] = "0006_invoice_monthly_rollup"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "receivables_due"
+
+# frozen copy of the enum, the type already exists for the invoice table
+PAYMENT_STATUSES = ["pending", "completed", "cancelled", "reversal"]
+
+
+def existing_enum(name: str, values: List[str]) -> sa.types.TypeEngine:
+    return sa.Enum(*values, name=name).with_variant(
+        postgresql.ENUM(*values, name=name, create_type=False), "postgresql"
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        TABLE,
+        sa.Column("invoice_number", sa.String(128), primary_key=True),
+        sa.Column("under_contract_id", sa.UUID(), primary_key=True),
+        sa.Column("contract_number", sa.String(128), nullable=False),
+        sa.Column("contract_type_id", sa.Integer(), nullable=False),
+        sa.Column("client_id", sa.UUID(), nullable=True),
+        sa.Column("due_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "status",
+            existing_enum("paymentstatusenum", PAYMENT_STATUSES),
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_receivables_due_contract_number", TABLE, ["contract_number"])
+    op.create_index(
+        "ix_receivables_due_client_id_due_date_status",
+        TABLE,
+        ["client_id", "due_date", "status"],
+    )
+    op.create_index("ix_receivables_due_status_due_date", TABLE, ["status", "due_date"])
+
+    backfill()
+
+
+def backfill() -> None:
+    """Rows of every invoice billed to a contract that is active on both sides."""
+    op.execute(sa.text(f"DELETE FROM {TABLE}"))
+    op.execute(
+        sa.text(
+            f"""
+            INSERT INTO {TABLE}
+                (invoice_number, under_contract_id, contract_number,
+                 contract_type_id, client_id, due_date, status,
+                 created_at, updated_at)
+            SELECT DISTINCT invoice.invoice_number, under_contract.under_contract_id,
+                   contract.contract_number, contract.contract_type_id,
+                   under_contract.client_id, invoice.due_date, invoice.status,
+                   CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+            FROM invoice
+            JOIN contract_invoice
+              ON contract_invoice.invoice_number = invoice.invoice_number
+            JOIN contract ON contract.contract_id = contract_invoice.contract_id
+            JOIN under_contract
+              ON under_contract.contract_number = contract.contract_number
+            WHERE contract.contract_status = 'active'
+              AND under_contract.contract_status = 'active'
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_table(TABLE)
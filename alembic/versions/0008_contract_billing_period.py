@@ -0,0 +1,40 @@
+"""contract billing period
+
+Adds contract_billing_period, the (contract, period) claims written by the billing
+run (`python -m app.commands.run_billing`) together with each generated invoice, so
+a period is billed once per contract however often the run is repeated.
+
+Revision ID: 0008_contract_billing_period
+Revises: 0007_receivables_due
+Create Date: 2024-10-29 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008_contract_billing_period"
+down_revision: Union[str, None] = "0007_receivables_due"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "contract_billing_period"
+
+
+def upgrade() -> None:
+    op.create_table(
+        TABLE,
+        sa.Column("contract_id", sa.UUID(), primary_key=True),
+        sa.Column("period_start", sa.Date(), primary_key=True),
+        sa.Column("invoice_number", sa.String(128), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table(TABLE)
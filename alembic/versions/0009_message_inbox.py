@@ -0,0 +1,154 @@
+"""message inbox
+
+Adds message_inbox (one row per delivered message and reader, written when the
+message is sent) and message_inbox_fanout (recipient groups still being written by
+the background batches). The inbox is filled here from the existing recipients and
+then maintained by MessageInboxService; the inbox and notifications folders read
+it instead of joining message_recipient with the reader's contracts.
+
+message_recipient.recipient_id becomes nullable: group recipients only carry
+recipient_group_id and could not be stored before.
+
+The backfill only uses the tables as they are at this revision, never the models
+or services of the app.
+
+Revision ID: 0009_message_inbox
+Revises: 0008_contract_billing_period
+Create Date: 2024-10-30 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0009_message_inbox"
+down_revision: Union[str, None] = "0008_contract_billing_period"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INBOX = "message_inbox"
+FANOUT = "message_inbox_fanout"
+
+# sent messages: neither drafts, scheduled nor enquiries
+DELIVERABLE = """
+    message.is_draft = false
+    AND message.is_scheduled = false
+    AND message.is_enquiry = false
+"""
+FOLDER = """
+    CASE WHEN message.is_notification = true THEN 'notifications' ELSE 'inbox' END
+"""
+
+# SQLite reflects UUID columns without a type, keep them when the table is recreated
+RECIPIENT_UUID_COLUMNS = [
+    sa.Column("id", sa.UUID(), primary_key=True),
+    sa.Column("recipient_id", sa.UUID(), sa.ForeignKey("users.user_id")),
+    sa.Column(
+        "recipient_group_id",
+        sa.UUID(),
+        sa.ForeignKey("property_unit_assoc.property_unit_assoc_id"),
+    ),
+    sa.Column("message_id", sa.UUID(), sa.ForeignKey("message.message_id")),
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        INBOX,
+        sa.Column("user_id", sa.UUID(), primary_key=True),
+        sa.Column("message_id", sa.UUID(), primary_key=True),
+        sa.Column("folder", sa.String(16), nullable=False),
+        sa.Column("is_read", sa.Boolean(), nullable=False),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_message_inbox_user_id_folder_sent_at",
+        INBOX,
+        ["user_id", "folder", "sent_at", "message_id"],
+        postgresql_include=["is_read"],
+    )
+    op.create_index("ix_message_inbox_message_id", INBOX, ["message_id"])
+
+    op.create_table(
+        FANOUT,
+        sa.Column("message_id", sa.UUID(), primary_key=True),
+        sa.Column("recipient_group_id", sa.UUID(), primary_key=True),
+        sa.Column("msg_send_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("after_id", sa.UUID(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+    with op.batch_alter_table(
+        "message_recipient", reflect_args=RECIPIENT_UUID_COLUMNS
+    ) as batch_op:
+        batch_op.alter_column("recipient_id", existing_type=sa.UUID(), nullable=True)
+
+    backfill()
+
+
+def backfill() -> None:
+    """Inbox rows of the direct recipients, then of the recipient groups' clients."""
+    op.execute(sa.text(f"DELETE FROM {FANOUT}"))
+    op.execute(sa.text(f"DELETE FROM {INBOX}"))
+
+    columns = "user_id, message_id, folder, is_read, sent_at, created_at, updated_at"
+    op.execute(
+        sa.text(
+            f"""
+            INSERT INTO {INBOX} ({columns})
+            SELECT message_recipient.recipient_id, message.message_id, {FOLDER},
+                   MAX(CASE WHEN message_recipient.is_read = true THEN 1 ELSE 0 END)
+                   = 1,
+                   message.date_created, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+            FROM message_recipient
+            JOIN message ON message.message_id = message_recipient.message_id
+            WHERE {DELIVERABLE}
+              AND message_recipient.recipient_id IS NOT NULL
+            GROUP BY message_recipient.recipient_id, message.message_id,
+                     message.is_notification, message.date_created
+            """
+        )
+    )
+    # clients whose contract on the group covers the send date
+    op.execute(
+        sa.text(
+            f"""
+            INSERT INTO {INBOX} ({columns})
+            SELECT DISTINCT under_contract.client_id, message.message_id, {FOLDER},
+                   false, message.date_created, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+            FROM message_recipient
+            JOIN message ON message.message_id = message_recipient.message_id
+            JOIN under_contract
+              ON under_contract.property_unit_assoc_id
+                 = message_recipient.recipient_group_id
+             AND under_contract.start_date <= message_recipient.msg_send_date
+             AND under_contract.end_date >= message_recipient.msg_send_date
+             AND under_contract.client_id IS NOT NULL
+            WHERE {DELIVERABLE}
+              AND NOT EXISTS (
+                  SELECT 1 FROM {INBOX}
+                  WHERE {INBOX}.user_id = under_contract.client_id
+                    AND {INBOX}.message_id = message.message_id
+              )
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    # group rows have no recipient_id
+    op.execute(sa.text("DELETE FROM message_recipient WHERE recipient_id IS NULL"))
+    with op.batch_alter_table(
+        "message_recipient", reflect_args=RECIPIENT_UUID_COLUMNS
+    ) as batch_op:
+        batch_op.alter_column("recipient_id", existing_type=sa.UUID(), nullable=False)
+
+    op.drop_table(FANOUT)
+    op.drop_table(INBOX)
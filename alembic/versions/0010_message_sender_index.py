@@ -0,0 +1,44 @@
+"""message sender index
+
+Indexes message.sender_id, which the drafts / scheduled / outbox folders and the
+recount of the cached message counters filter on.
+
+On Postgres the index is built with CREATE INDEX CONCURRENTLY in an autocommit
+block (see 0002_association_indexes).
+
+Revision ID: 0010_message_sender_index
+Revises: 0009_message_inbox
+Create Date: 2024-10-31 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0010_message_sender_index"
+down_revision: Union[str, None] = "0009_message_inbox"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = "ix_message_sender_id"
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX,
+            "message",
+            ["sender_id"],
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX, table_name="message", if_exists=True, postgresql_concurrently=True
+        )
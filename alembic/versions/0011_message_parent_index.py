@@ -0,0 +1,44 @@
+"""message parent index
+
+Indexes message.parent_message_id, the join of each step of the recursive thread
+query (replies of the messages found so far).
+
+On Postgres the index is built with CREATE INDEX CONCURRENTLY in an autocommit
+block (see 0002_association_indexes).
+
+Revision ID: 0011_message_parent_index
+Revises: 0010_message_sender_index
+Create Date: 2024-11-04 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0011_message_parent_index"
+down_revision: Union[str, None] = "0010_message_sender_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = "ix_message_parent_message_id"
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX,
+            "message",
+            ["parent_message_id"],
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX, table_name="message", if_exists=True, postgresql_concurrently=True
+        )
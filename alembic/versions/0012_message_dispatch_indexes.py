@@ -0,0 +1,64 @@
+"""message dispatch indexes
+
+Partial indexes on message.scheduled_date (unsent scheduled messages) and
+message.next_remind_date (pending reminders of sent messages, not drafts or
+scheduled ones), which the dispatcher claims due rows from and loads its timer
+wheel with. Both only hold the waiting messages.
+
+On Postgres the indexes are built with CREATE INDEX CONCURRENTLY in an
+autocommit block (see 0002_association_indexes).
+
+Revision ID: 0012_message_dispatch_indexes
+Revises: 0011_message_parent_index
+Create Date: 2024-11-07 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0012_message_dispatch_indexes"
+down_revision: Union[str, None] = "0011_message_parent_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# name, column, predicate (as on the Message model)
+INDEXES = [
+    (
+        "ix_message_scheduled_date",
+        "scheduled_date",
+        "is_scheduled = true AND is_draft = false",
+    ),
+    (
+        "ix_message_next_remind_date",
+        "next_remind_date",
+        "is_reminder = true AND is_draft = false AND is_scheduled = false "
+        "AND next_remind_date IS NOT NULL",
+    ),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, column, predicate in INDEXES:
+            op.create_index(
+                name,
+                "message",
+                [column],
+                if_not_exists=True,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(predicate),
+                sqlite_where=sa.text(predicate),
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name="message", if_exists=True, postgresql_concurrently=True
+            )
@@ -0,0 +1,93 @@
+"""media content hash
+
+Adds media_content, one row per stored file (its SHA-256 and url), and
+media.content_hash pointing at it: an upload whose content is already stored
+reuses the file's url instead of storing it again, and still gets its own media
+row, so the name, caption, description and thumbnail flag stay per attachment.
+Existing media keep a NULL hash.
+
+entity_media.media_id becomes ON DELETE RESTRICT: media still linked to an
+entity is never deleted. SQLite doesn't alter constraints (nor enforce foreign
+keys by default), its dev databases only get the check of MediaDAO.delete.
+
+On Postgres the index is built with CREATE INDEX CONCURRENTLY in an autocommit
+block (see 0002_association_indexes).
+
+Revision ID: 0013_media_content_hash
+Revises: 0012_message_dispatch_indexes
+Create Date: 2024-11-12 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0013_media_content_hash"
+down_revision: Union[str, None] = "0012_message_dispatch_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "media_content"
+INDEX_NAME = "ix_media_content_hash"
+MEDIA_FK_NAME = "entity_media_media_id_fkey"
+
+
+def replace_media_fk(ondelete: Union[str, None]) -> None:
+    """Recreates the entity_media.media_id foreign key with `ondelete`."""
+    bind = op.get_bind()
+    if bind.dialect.name == "sqlite":
+        return
+
+    for foreign_key in sa.inspect(bind).get_foreign_keys("entity_media"):
+        if foreign_key["constrained_columns"] == ["media_id"] and foreign_key["name"]:
+            op.drop_constraint(foreign_key["name"], "entity_media", type_="foreignkey")
+
+    op.create_foreign_key(
+        MEDIA_FK_NAME,
+        "entity_media",
+        "media",
+        ["media_id"],
+        ["media_id"],
+        ondelete=ondelete,
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        TABLE,
+        sa.Column("content_hash", sa.String(64), primary_key=True),
+        sa.Column("content_url", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+    op.add_column("media", sa.Column("content_hash", sa.String(64), nullable=True))
+
+    replace_media_fk("RESTRICT")
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX_NAME,
+            "media",
+            ["content_hash"],
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            INDEX_NAME, table_name="media", if_exists=True, postgresql_concurrently=True
+        )
+
+    replace_media_fk(None)
+
+    with op.batch_alter_table("media") as batch_op:
+        batch_op.drop_column("content_hash")
+
+    op.drop_table(TABLE)
@@ -0,0 +1,42 @@
+"""message inbox fanout retry
+
+Adds message_inbox_fanout.attempts and next_attempt_at: a group whose batch fails
+is retried with a growing delay instead of being claimed again right away, so it
+no longer holds up the groups queued after it.
+
+Revision ID: 0014_message_inbox_fanout_retry
+Revises: 0013_media_content_hash
+Create Date: 2024-11-14 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0014_message_inbox_fanout_retry"
+down_revision: Union[str, None] = "0013_media_content_hash"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "message_inbox_fanout"
+
+
+def upgrade() -> None:
+    op.add_column(
+        TABLE,
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        TABLE,
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table(TABLE) as batch_op:
+        batch_op.drop_column("next_attempt_at")
+        batch_op.drop_column("attempts")
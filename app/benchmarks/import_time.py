@@ -0,0 +1,98 @@
+"""
+Benchmark: worker cold-start, measured with `python -X importtime`.
+
+Usage:
+    python -m app.benchmarks.import_time [--module main] [--repeat 3] [--top 15]
+
+Every run imports the module in a fresh interpreter, so nothing is shared with the
+caller. It reports the total import time, the slowest packages (cumulative) and
+whether any dev-only package (faker) was pulled in on the runtime import path.
+The usual settings still have to be present in the environment / .env.
+"""
+
+import re
+import sys
+import argparse
+import statistics
+import subprocess
+from typing import Dict, List, Tuple
+
+# packages that should only be imported when explicitly needed (e.g. OpenAPI examples)
+DEV_ONLY_PACKAGES = ("faker",)
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+def run_importtime(module: str) -> List[Tuple[str, int, int, int]]:
+    """Imports `module` in a fresh interpreter and returns (name, self_us, cumulative_us, depth) rows."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append(
+                (name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2)
+            )
+    return rows
+
+
+def summarize(rows: List[Tuple[str, int, int, int]]) -> Dict[str, object]:
+    total_us = sum(cumulative for _, _, cumulative, depth in rows if depth == 0)
+    dev_only = sorted(
+        {name.split(".")[0] for name, _, _, _ in rows} & set(DEV_ONLY_PACKAGES)
+    )
+    return {"total_us": total_us, "modules": len(rows), "dev_only": dev_only}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    runs = [run_importtime(args.module) for _ in range(args.repeat)]
+    summaries = [summarize(rows) for rows in runs]
+    totals = [summary["total_us"] / 1e6 for summary in summaries]
+
+    print(f"import {args.module}: {len(runs[-1])} modules")
+    print(
+        f"  total  median {statistics.median(totals):.3f}s"
+        f"  min {min(totals):.3f}s  max {max(totals):.3f}s"
+    )
+
+    # slowest top-level packages of the last run, by cumulative time
+    packages: Dict[str, int] = {}
+    for name, _, cumulative, _ in runs[-1]:
+        package = name.split(".")[0]
+        if name == package:
+            packages[package] = max(packages.get(package, 0), cumulative)
+    print(f"  slowest {args.top} packages (cumulative):")
+    slowest = sorted(packages.items(), key=lambda item: -item[1])[: args.top]
+    for package, cumulative in slowest:
+        print(f"    {cumulative / 1000:9.1f} ms  {package}")
+
+    # slowest application modules by self time
+    app_modules = [
+        row for row in runs[-1] if row[0].split(".")[0] in ("app", args.module)
+    ]
+    print(f"  slowest {args.top} application modules (self):")
+    for name, self_us, _, _ in sorted(app_modules, key=lambda row: -row[1])[: args.top]:
+        print(f"    {self_us / 1000:9.1f} ms  {name}")
+
+    dev_only = summaries[-1]["dev_only"]
+    print(
+        f"  dev-only packages imported: {', '.join(dev_only) if dev_only else 'none'}"
+    )
+
+
+if __name__ == "__main__":
+    main()
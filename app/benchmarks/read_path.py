@@ -0,0 +1,125 @@
+"""
+Benchmark: ORM list path vs. row-mapping read path on 10k-row pages.
+
+Usage:
+    python -m app.benchmarks.read_path [--rows 10000] [--repeat 3]
+
+Runs against an in-memory SQLite database so no external services are needed
+(the usual settings still have to be present in the environment / .env).
+"""
+
+import time
+import uuid
+import asyncio
+import argparse
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+# models
+import app.modules  # noqa: F401
+from app.db.dbDeclarative import Base
+from app.modules.resources.models.media import Media
+from app.modules.associations.models.entity_media import EntityMedia
+
+# dao
+from app.modules.resources.dao.media_dao import MediaDAO
+
+# schema
+from app.modules.resources.schema.media_schema import MediaResponse
+from app.modules.resources.enums.resource_enums import MediaType
+
+
+async def seed(session_factory: async_sessionmaker, rows: int) -> None:
+    async with session_factory() as session:
+        await session.execute(
+            Media.__table__.insert(),
+            [
+                {
+                    "media_id": uuid.uuid4(),
+                    "media_name": f"media_{idx}",
+                    "media_type": MediaType.image,
+                    "content_url": f"https://example.com/media/{idx}.png",
+                    "is_thumbnail": idx % 2 == 0,
+                    "caption": f"caption {idx}",
+                    "description": f"description {idx}",
+                }
+                for idx in range(rows)
+            ],
+        )
+        await session.commit()
+
+
+async def measure(
+    session_factory: async_sessionmaker,
+    read: Callable[[AsyncSession], Awaitable[Any]],
+    repeat: int,
+) -> Dict[str, float]:
+    wall, cpu, peak = [], [], []
+
+    for _ in range(repeat):
+        async with session_factory() as session:
+            tracemalloc.start()
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+
+            await read(session)
+
+            wall.append(time.perf_counter() - wall_start)
+            cpu.append(time.process_time() - cpu_start)
+            peak.append(tracemalloc.get_traced_memory()[1] / (1024 * 1024))
+            tracemalloc.stop()
+
+    return {"wall_s": min(wall), "cpu_s": min(cpu), "peak_mib": min(peak)}
+
+
+async def main(rows: int, repeat: int) -> None:
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    session_factory = async_sessionmaker(
+        bind=engine, expire_on_commit=False, class_=AsyncSession
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[Media.__table__, EntityMedia.__table__],
+        )
+
+    await seed(session_factory, rows)
+    dao = MediaDAO()
+
+    async def orm_path(session: AsyncSession):
+        items = await dao.get_all(db_session=session, offset=0, limit=rows)
+        return [MediaResponse.model_validate(item) for item in items]
+
+    async def row_path(session: AsyncSession):
+        return await dao.get_all_rows(
+            db_session=session, schema=MediaResponse, offset=0, limit=rows
+        )
+
+    results = {
+        "orm": await measure(session_factory, orm_path, repeat),
+        "rows": await measure(session_factory, row_path, repeat),
+    }
+
+    print(f"{'path':<6} {'wall (s)':>10} {'cpu (s)':>10} {'peak (MiB)':>12}")
+    for name, result in results.items():
+        print(
+            f"{name:<6} {result['wall_s']:>10.3f} {result['cpu_s']:>10.3f} "
+            f"{result['peak_mib']:>12.1f}"
+        )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.rows, args.repeat))
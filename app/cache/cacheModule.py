@@ -156,3 +156,27 @@ class CacheModule:
         if not self.redis:
             raise ConnectionError("CacheModule is not connected.")
         return await self.redis.ttl(key)
+
+    # Pub/sub
+
+    async def publish(self, channel: str, message: str) -> int:
+        if not self.redis:
+            raise ConnectionError("CacheModule is not connected.")
+        return await self.redis.publish(channel, message)
+
+    def pubsub(self):
+        if not self.redis:
+            raise ConnectionError("CacheModule is not connected.")
+        return self.redis.pubsub(ignore_subscribe_messages=True)
+
+    # Scripts / pipelines
+
+    def register_script(self, script: str):
+        if not self.redis:
+            raise ConnectionError("CacheModule is not connected.")
+        return self.redis.register_script(script)
+
+    def pipeline(self, transaction: bool = True):
+        if not self.redis:
+            raise ConnectionError("CacheModule is not connected.")
+        return self.redis.pipeline(transaction=transaction)
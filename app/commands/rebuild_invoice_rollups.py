@@ -0,0 +1,39 @@
+"""
+Command: rebuild invoice_monthly_rollup from the invoice table.
+
+Usage:
+    python -m app.commands.rebuild_invoice_rollups
+
+Needed after invoices were written with plain SQL (bypassing the ORM listeners) or
+after changing INVOICE_TRENDS_TIMEZONE. Runs in one transaction on the write engine,
+so the trends endpoint never sees a half-built table.
+"""
+
+import asyncio
+import argparse
+
+# models
+import app.modules  # noqa: F401
+from app.db.dbManager import DBManager
+
+# services
+from app.services.invoice_rollup_service import invoice_rollup_service
+
+
+async def main() -> None:
+    engine = DBManager().db_module.engine["write"]
+
+    try:
+        async with engine.begin() as conn:
+            rows = await conn.run_sync(invoice_rollup_service.rebuild)
+    finally:
+        await engine.dispose()
+
+    print(f"Rebuilt invoice_monthly_rollup: {rows} rows")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.parse_args()
+
+    asyncio.run(main())
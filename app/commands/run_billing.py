@@ -0,0 +1,60 @@
+"""
+Command: generate the invoices of a billing period for every active contract.
+
+Usage:
+    python -m app.commands.run_billing [--period 2024-11] [--issued-by USER_ID]
+        [--batch-size 1000] [--workers 4]
+
+The period is a calendar month (the current one by default). Contracts already
+billed for it are skipped, so the command can be rerun after a partial failure.
+--issued-by is the issuer of invoices whose contract has no employee representative.
+"""
+
+import uuid
+import asyncio
+import argparse
+from datetime import date
+
+# models
+import app.modules  # noqa: F401
+from app.db.dbManager import DBManager
+
+# services
+from app.services.billing_run_service import billing_run_service
+
+
+def month(value: str) -> date:
+    return date.fromisoformat(f"{value}-01")
+
+
+async def main(period: date, issued_by, batch_size: int, workers: int) -> None:
+    engine = DBManager().db_module.engine["write"]
+    period_end = date(period.year + period.month // 12, period.month % 12 + 1, 1)
+
+    try:
+        totals = await billing_run_service.run(
+            engine,
+            period,
+            period_end,
+            issued_by=issued_by,
+            batch_size=batch_size,
+            workers=workers,
+        )
+    finally:
+        await engine.dispose()
+
+    print(
+        f"Billed {period:%Y-%m}: {totals['invoices']} invoices for "
+        f"{totals['contracts']} contracts, {totals['failed_batches']} failed batches"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--period", type=month, default=date.today().replace(day=1))
+    parser.add_argument("--issued-by", type=uuid.UUID, default=None)
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.period, args.issued_by, args.batch_size, args.workers))
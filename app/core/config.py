@@ -1,5 +1,6 @@
 import os
 import cloudinary
+from typing import Literal
 from pydantic import ConfigDict
 from pydantic_settings import BaseSettings
 
@@ -16,6 +17,38 @@ class Settings(BaseSettings):
     DB_DATABASE: str
     DB_ENGINE: str
     DB_DATABASE_DEFAULT: str
+    # "auto": check the alembic version row and skip DDL when current,
+    # "check": same but never run DDL, "create": run create_all on every boot
+    DB_SCHEMA_MODE: str = "auto"
+    # upper bound (seconds) between is_contract_active refreshes; the job also
+    # wakes at every contract start/end boundary
+    OCCUPANCY_REFRESH_SECONDS: int = 3600
+    # full reload interval (seconds) of the in-process reference data, on top of
+    # the reloads published on every write
+    REFERENCE_DATA_REFRESH_SECONDS: int = 3600
+    # timezone of the invoice trend months; rebuild the rollups after changing it
+    # (python -m app.commands.rebuild_invoice_rollups)
+    INVOICE_TRENDS_TIMEZONE: str = "UTC"
+    # contracts per billing run transaction and concurrent batches per run
+    # (python -m app.commands.run_billing)
+    BILLING_RUN_BATCH_SIZE: int = 1000
+    BILLING_RUN_WORKERS: int = 4
+    # recipient groups up to INBOX_FANOUT_INLINE_LIMIT clients are written to the
+    # inbox with the message, larger ones by the background job in batches
+    INBOX_FANOUT_INLINE_LIMIT: int = 500
+    INBOX_FANOUT_BATCH_SIZE: int = 1000
+    # upper bound (seconds) before the job picks up groups queued by other workers
+    INBOX_FANOUT_POLL_SECONDS: int = 60
+    # first delay (seconds) before a failed fan-out batch is retried, doubled on
+    # every further failure of the group
+    INBOX_FANOUT_RETRY_SECONDS: int = 60
+    # lifetime (seconds) of the cached unread / drafts / scheduled counters, bounds
+    # the drift of counts updated while a counter was being rebuilt
+    MESSAGE_COUNTERS_TTL_SECONDS: int = 900
+    # scheduled messages / reminders claimed per dispatch transaction, and how far
+    # ahead (seconds) each worker loads their deadlines into its timer wheel
+    MESSAGE_DISPATCH_BATCH_SIZE: int = 500
+    MESSAGE_DISPATCH_HORIZON_SECONDS: int = 60
 
     GOOGLE_SIGNIN_CLIENT_ID: str
     GOOGLE_SIGNIN_CLIENT_SECRET: str
@@ -24,6 +57,15 @@ class Settings(BaseSettings):
     CLOUDINARY_CLOUD_NAME: str
     CLOUDINARY_API_KEY: str
     CLOUDINARY_API_SECRET: str
+    # where media is stored: "cloudinary", or "local" files under MEDIA_ROOT served
+    # from MEDIA_URL (the /media/files route); any other value fails at startup
+    MEDIA_STORAGE: Literal["cloudinary", "local"] = "cloudinary"
+    MEDIA_ROOT: str = "media"
+    MEDIA_URL: str = "/media/files"
+    # concurrent uploads (and storage threads) per worker, and the part size (bytes)
+    # files are streamed in, Cloudinary takes no less than 5 MB
+    MEDIA_UPLOAD_WORKERS: int = 8
+    MEDIA_UPLOAD_CHUNK_SIZE: int = 5 * 1024 * 1024
 
     JWT_ALGORITHM: str
     JWT_SECRET: str
@@ -33,6 +75,19 @@ class Settings(BaseSettings):
     EMAIL: str
     EMAIL_PASSWORD: str
     EMAIL_SERVER: str
+    EMAIL_PORT: int = 465
+    # plain SMTP when False, e.g. a local stand-in server
+    EMAIL_USE_SSL: bool = True
+    # persistent SMTP connections (and sending threads), queued messages before
+    # senders wait, and messages sent on a connection before it is renewed
+    EMAIL_POOL_SIZE: int = 4
+    EMAIL_QUEUE_SIZE: int = 1000
+    EMAIL_MESSAGES_PER_CONNECTION: int = 100
+    # retries of transient failures, the delay doubles from the backoff each time
+    EMAIL_MAX_RETRIES: int = 3
+    EMAIL_RETRY_BACKOFF_SECONDS: float = 2
+    # idle connections are closed after this many seconds
+    EMAIL_IDLE_SECONDS: int = 60
 
     ENCRYPT_KEY: str
     ACCESS_TOKEN_EXPIRE_MINUTES: str
@@ -82,6 +82,21 @@ class DatabaseCredentialException(CustomException):
         super().__init__(self.msg)
 
 
+class DatabaseSchemaException(CustomException):
+    status_code = 500  # Internal Server Error
+
+    def __init__(self, current_revision, expected_revision, msg=""):
+        self.msg = (
+            msg
+            if msg
+            else (
+                f"Database schema is at revision {current_revision}, expected {expected_revision}. "
+                "Run `alembic upgrade head` before starting the app."
+            )
+        )
+        super().__init__(self.msg)
+
+
 class RecordNotFoundException(CustomException):
     status_code = 404  # Not Found
 
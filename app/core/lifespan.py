@@ -9,6 +9,17 @@ from app.db.dbManager import DBManager
 # cache
 from app.cache.cacheManager import CacheManager
 
+# services
+from app.services.email_delivery_service import email_delivery
+from app.services.message_counter_service import message_counter_service
+from app.services.message_dispatch_service import message_dispatch_service
+from app.services.message_inbox_service import message_inbox_service
+from app.services.message_push_service import message_push_service
+from app.services.occupancy_service import occupancy_service
+from app.services.reference_data_service import reference_data
+from app.services.template_service import template_service
+from app.services.upload_service import media_upload_pool
+
 # TODO (DQ) Add factory information
 # Issue: https://github.com/compylertech/hskee-hsm-backend/issues/2
 # - from app.factory.dataSeeder
@@ -42,12 +53,45 @@ async def lifespan(app: FastAPI):
         logger = app_logger.get_logger()
 
     # instantiate db
-    await db_manager.db_module.create_all_tables()
+    schema_status = await db_manager.db_module.prepare_schema(settings.DB_SCHEMA_MODE)
+    logger.info(f"Database schema {schema_status} (mode: {settings.DB_SCHEMA_MODE})")
 
     # cache
     cache_manager.get_instance()
     await cache_manager._initialize_cache_module()
 
+    # keep is_contract_active in step with contract start/end dates
+    occupancy_service.start(db_manager.db_module.engine["write"])
+
+    # lookup tables kept in memory, reloaded on writes published by any worker
+    await reference_data.start(db_manager.db_module.engine["write"])
+
+    # recipient groups too large to fan out with the message
+    message_inbox_service.start(db_manager.db_module.engine["write"])
+
+    # cached message counters, adjusted after every committed write
+    message_counter_service.start()
+
+    # deliveries pushed to the readers' sockets on whichever worker holds them
+    message_push_service.start()
+
+    # scheduled messages and reminders, sent when they come due
+    message_dispatch_service.start(db_manager.db_module.engine["write"])
+
+    # pooled SMTP connections, emails are queued and sent in the background
+    email_delivery.start()
+
+    # email templates compiled once, not on the first send
+    template_service.precompile()
+
     yield
 
     logger.info("Shutting down")
+    await occupancy_service.stop()
+    await reference_data.stop()
+    await message_inbox_service.stop()
+    message_counter_service.stop()
+    await message_push_service.stop()
+    await message_dispatch_service.stop()
+    await email_delivery.stop()
+    media_upload_pool.stop()
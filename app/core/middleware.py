@@ -11,6 +11,13 @@ from app.core.lifespan import logger, get_db
 from app.core.response import DAOResponse
 from app.core.errors import CustomException
 
+# bodies of other content types (uploads, media files) are streamed, not logged
+LOGGED_CONTENT_TYPES = ("application/json", "text/")
+
+
+def is_logged(content_type: str) -> bool:
+    return (content_type or "").startswith(LOGGED_CONTENT_TYPES)
+
 
 class SessionMiddleware(BaseHTTPMiddleware):
     async def db_session_middleware(request: Request, call_next):
@@ -28,7 +35,11 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         start_time = time.time()
 
         # prepare request log
-        request_body = await request.body()
+        request_body = (
+            await request.body()
+            if is_logged(request.headers.get("content-type"))
+            else b""
+        )
         request_log = f"{request.method} {request.url.path}"
 
         if request.path_params:
@@ -42,6 +53,14 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         # process request
         response = await call_next(request)
         process_time = time.time() - start_time
+
+        if not is_logged(response.headers.get("content-type")):
+            logger.info(
+                f'Response: "{request.method} {request.url.path}" {response.status_code} '
+                f"{response.headers.get('content-type')} (took {process_time:.2f} secs)"
+            )
+            return response
+
         response_body = b"".join([section async for section in response.body_iterator])
 
         # prepare and log response
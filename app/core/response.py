@@ -1,3 +1,4 @@
+import json
 from typing import Any, Dict, Type, TypeVar, Generic, Optional
 from pydantic import BaseModel, ConfigDict, ValidationError, model_serializer
 from importlib import import_module
@@ -107,6 +108,23 @@ class DAOResponse(BaseModel, Generic[T]):
 
         return result
 
+    def json_with_data(self, data_json: bytes) -> bytes:
+        """
+        The JSON body of this response with `data_json`, an already serialized
+        document, as its data. The envelope keys are those of the usual JSON
+        serialization, so both bodies look the same to clients.
+        """
+        members = []
+        for key, value in self.model_dump(mode="json").items():
+            if key == "data":
+                encoded = data_json
+            else:
+                encoded = json.dumps(
+                    value, ensure_ascii=False, separators=(",", ":")
+                ).encode("utf-8")
+            members.append(json.dumps(key).encode("utf-8") + b":" + encoded)
+        return b"{" + b",".join(members) + b"}"
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "success": self.success,
@@ -1,3 +1,4 @@
+import time
 from fastapi import APIRouter, FastAPI
 
 # TODO (DQ) Add custom routes
@@ -33,10 +34,19 @@ from app.modules.resources.router.amenities_router import AmenityRouter
 from app.modules.communication.router.message_router import MessageRouter
 from app.modules.resources.router.media_router import MediaRouter
 
+# dao
+from app.modules.common.dao.base_dao import BaseDAO
+from app.modules.common.dao.dao_registry import dao_registry
+
+# core
+from app.core.lifespan import logger
+
 router = APIRouter()
 
 
 def configure_routes(app: FastAPI):
+    start_time = time.perf_counter()
+    daos_before = BaseDAO.instances_created
     app.include_router(router)
 
     # Router configuration list
@@ -75,4 +85,13 @@ def configure_routes(app: FastAPI):
     for router_cls, prefix, tags in router_configurations:
         app.include_router(router_cls(prefix=prefix, tags=tags).router)
 
+    # startup report
+    app.state.startup_report = {
+        "routers": len(router_configurations),
+        "dao_objects_created": BaseDAO.instances_created - daos_before,
+        "configure_routes_secs": round(time.perf_counter() - start_time, 4),
+        **dao_registry.report(),
+    }
+    logger.info(f"Startup report: {app.state.startup_report}")
+
     return app
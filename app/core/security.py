@@ -44,8 +44,11 @@ class SecureAccessTokens:
         payload = {key: payload[key] for key in payload if key in UserBase.model_fields}
         payload.update({"expires": time.time() + 1800})
 
-        # create the access token with the user's scopes as permissions
-        user_permissions = [p.name for r in user.roles for p in r.permissions]
+        # create the access token with the user's scopes as permissions, read from
+        # the roles loaded with the user (never from the reference data cache)
+        user_permissions = list(
+            dict.fromkeys(p.name for r in user.roles for p in r.permissions)
+        )
         payload.update({"scope": ",".join(user_permissions)})
         ###
 
@@ -55,7 +58,12 @@ class SecureAccessTokens:
             expire = datetime.now() + timedelta(
                 minutes=int(settings.ACCESS_TOKEN_EXPIRE_MINUTES)
             )
-        to_encode = {"exp": expire, "sub": str(payload), "type": "access"}
+        to_encode = {
+            "exp": expire,
+            "sub": str(payload),
+            "type": "access",
+            "user_id": str(user.user_id),
+        }
         # to_encode = {"exp": expire, "sub": str(subject), "type": "access"}
 
         token = jwt.encode(
@@ -1,13 +1,16 @@
 from uuid import UUID
+from functools import lru_cache
 from sqlalchemy.future import select
+from sqlalchemy.engine import Row, RowMapping
 from sqlalchemy import and_, func, inspect
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel as PydanticBaseModel
+from pydantic import BaseModel as PydanticBaseModel, TypeAdapter
 from sqlalchemy.orm import selectinload, InstrumentedAttribute
-from typing import List, Type, TypeVar, Dict, Any, Union, Optional
+from typing import List, Sequence, Type, TypeVar, Dict, Any, Union, Optional
 
 # core
 from app.core.errors import (
+    CustomException,
     IntegrityError,
     RecordNotFoundException,
     ForeignKeyError,
@@ -22,6 +25,18 @@ from app.modules.common.models.model_base import (
 )
 
 DBModelType = TypeVar("DBModelType")
+SchemaType = TypeVar("SchemaType", bound=PydanticBaseModel)
+
+
+@lru_cache(maxsize=128)
+def get_rows_adapter(schema: Type[SchemaType]) -> TypeAdapter:
+    """
+    Return a cached list validator for a response schema.
+
+    The adapter runs the schema's core validator directly, so hand-written
+    `model_validate` overrides (which expect ORM instances) are bypassed.
+    """
+    return TypeAdapter(List[schema])
 
 
 class BaseMixin:
@@ -381,6 +396,122 @@ class ReadMixin(BaseMixin):
 
         return result
 
+    def get_row_columns(
+        self,
+        columns: Optional[List[str]] = None,
+        schema: Optional[Type[SchemaType]] = None,
+    ) -> List[InstrumentedAttribute]:
+        """
+        Resolve the column attributes selected by the row read path.
+
+        Args:
+            columns (Optional[List[str]]): Explicit column names to select.
+            schema (Optional[Type[SchemaType]]): Response schema; when given and
+                `columns` is empty only the columns the schema declares are selected.
+
+        Returns:
+            List[InstrumentedAttribute]: The model column attributes to select.
+
+        Raises:
+            CustomException: If `columns` names a field the model doesn't have.
+        """
+        model_fields = self.get_model_fields()
+
+        if columns:
+            unknown = [name for name in columns if name not in model_fields]
+            if unknown:
+                raise CustomException(
+                    f"Unknown {self.model.__name__} column(s): {', '.join(unknown)}"
+                )
+            column_names = columns
+        elif schema is not None:
+            column_names = [
+                name for name in model_fields if name in schema.model_fields
+            ]
+        else:
+            column_names = model_fields
+
+        return [getattr(self.model, name) for name in column_names]
+
+    async def query_rows(
+        self,
+        db_session: AsyncSession,
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+        schema: Optional[Type[SchemaType]] = None,
+        order_by: Optional[List[InstrumentedAttribute]] = None,
+        offset: int = 0,
+        limit: int = 100,
+        as_tuples: bool = False,
+    ) -> Union[Sequence[RowMapping], Sequence[Row]]:
+        """
+        Read-only listing that selects plain columns instead of ORM entities.
+
+        Rows never enter the session identity map, so no instance state,
+        relationship loaders or load events are involved.
+        """
+        query = select(*self.get_row_columns(columns=columns, schema=schema))
+
+        if filters:
+            model_fields = self.get_model_fields()
+            unknown = [key for key in filters if key not in model_fields]
+            if unknown:
+                raise CustomException(
+                    f"Unknown {self.model.__name__} filter(s): {', '.join(unknown)}"
+                )
+
+            query = query.where(
+                and_(*[getattr(self.model, k) == v for k, v in filters.items()])
+            )
+
+        if order_by:
+            query = query.order_by(*order_by)
+
+        executed_query = await db_session.execute(query.offset(offset).limit(limit))
+
+        return executed_query.all() if as_tuples else executed_query.mappings().all()
+
+    async def get_all_rows(
+        self,
+        db_session: AsyncSession,
+        schema: Optional[Type[SchemaType]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+        order_by: Optional[List[InstrumentedAttribute]] = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> Union[List[SchemaType], Sequence[RowMapping]]:
+        """
+        Row-mapping counterpart of `get_all` for read-only list and report endpoints.
+
+        Args:
+            db_session (AsyncSession): The database session.
+            schema (Optional[Type[SchemaType]]): Response schema the rows are validated into.
+            filters (Optional[Dict[str, Any]]): Equality filters on model columns.
+            columns (Optional[List[str]]): Explicit column names to select.
+            order_by (Optional[List[InstrumentedAttribute]]): Ordering clauses.
+            offset (int): Number of rows to skip.
+            limit (int): Maximum number of rows to return.
+
+        Returns:
+            Union[List[SchemaType], Sequence[RowMapping]]: Validated schema instances,
+            or the raw row mappings when no schema is given.
+        """
+        rows = await self.query_rows(
+            db_session=db_session,
+            filters=filters,
+            columns=columns,
+            schema=schema,
+            order_by=order_by,
+            offset=offset,
+            limit=limit,
+        )
+
+        if schema is None:
+            return rows
+
+        return get_rows_adapter(schema).validate_python(rows)
+
     async def query_on_joins(
         self,
         db_session: AsyncSession,
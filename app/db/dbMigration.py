@@ -0,0 +1,15 @@
+from sqlalchemy import Column, MetaData, String, Table
+
+# Head revision of alembic/versions. Bump this together with every new migration;
+# alembic/env.py refuses to run when the two drift apart, and the startup schema
+# check compares the database's version row against it.
+SCHEMA_HEAD = "0014_message_inbox_fanout_retry"
+
+# Alembic's own bookkeeping table (kept off Base.metadata so autogenerate ignores it)
+VERSION_TABLE = "alembic_version"
+
+version_table = Table(
+    VERSION_TABLE,
+    MetaData(),
+    Column("version_num", String(32), primary_key=True),
+)
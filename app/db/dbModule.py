@@ -1,7 +1,12 @@
 from urllib.parse import quote
-from sqlalchemy import create_engine, text
-from sqlalchemy.exc import SQLAlchemyError
-from typing import Any, TypeVar, AsyncIterator
+from sqlalchemy import create_engine, delete, insert, inspect, select, text
+from sqlalchemy.exc import (
+    DBAPIError,
+    OperationalError,
+    ProgrammingError,
+    SQLAlchemyError,
+)
+from typing import Any, Optional, TypeVar, AsyncIterator
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     create_async_engine,
@@ -13,6 +18,7 @@ from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 from app.db.dbDeclarative import Base
+from app.db.dbMigration import SCHEMA_HEAD, version_table
 import app.core.errors as DBExceptions
 
 
@@ -38,22 +44,8 @@ class DBModule:
             class_=AsyncSession,
         )
 
-        # sync connection
-        user = self.credentials.get("user")
-        pswd = self.credentials.get("pswd", "")
-        host = self.credentials.get("host")
-        port = self.credentials.get("port", 3306)
-        db = self.credentials.get("db")
-
-        # create synchronous session
-        # TODO: review if this is necessary
-        self.SyncSessionLocal = sessionmaker(
-            autocommit=False,
-            autoflush=False,
-            bind=create_engine(
-                f"postgresql://{user}:{quote(pswd)}@{host}:{port}/{db}", echo=False
-            ),
-        )
+        # synchronous session, created on first use by get_sync_db
+        self.SyncSessionLocal = None
 
     @classmethod
     def get_declarative_base(self):
@@ -64,6 +56,21 @@ class DBModule:
             yield session
 
     def get_sync_db(self):
+        if self.SyncSessionLocal is None:
+            user = self.credentials.get("user")
+            pswd = self.credentials.get("pswd", "")
+            host = self.credentials.get("host")
+            port = self.credentials.get("port", 3306)
+            db = self.credentials.get("db")
+
+            # TODO: review if this is necessary
+            self.SyncSessionLocal = sessionmaker(
+                autocommit=False,
+                autoflush=False,
+                bind=create_engine(
+                    f"postgresql://{user}:{quote(pswd)}@{host}:{port}/{db}", echo=False
+                ),
+            )
         return self.SyncSessionLocal()
 
     def get_engine(self):
@@ -94,9 +101,6 @@ class DBModule:
         db = credentials.get("db")
         conn_string = f"postgresql+asyncpg://{user}:{quote(pswd)}@{host}:{port}/{db}"
 
-        # create database if it doesn't exist
-        cls.create_postgres_database_if_not_exist(conn_string)
-
         if not all([user, host, db]):
             raise DBExceptions.DatabaseCredentialException(
                 "DB, USER and HOST are required"
@@ -153,30 +157,99 @@ class DBModule:
             ),
         }
 
-    def create_postgres_database_if_not_exist(
+    async def create_postgres_database_if_not_exist(
         cls,
-        database_url: str,
-        default_database: str = f"postgresql://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOST}/{settings.DB_DATABASE_DEFAULT}",
+        db_name: str,
+        default_database: str = f"postgresql+asyncpg://{settings.DB_USER}:{quote(settings.DB_PASSWORD)}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_DATABASE_DEFAULT}",
     ):
-        engine = create_engine(default_database)
-        db_name = database_url.split("/")[-1]
-        conn = engine.connect()
+        engine = create_async_engine(default_database, isolation_level="AUTOCOMMIT")
 
         try:
-            conn.execute(text("commit"))
-            db_exists = conn.execute(
-                text(f"SELECT 1 FROM pg_database WHERE datname='{db_name}'")
-            ).scalar()
-
-            if not db_exists:
-                conn.execute(text(f"CREATE DATABASE {db_name}"))
-                print(f"Database {db_name} created successfully.")
-            else:
-                print(f"Database {db_name} already exists.")
+            async with engine.connect() as conn:
+                db_exists = (
+                    await conn.execute(
+                        text("SELECT 1 FROM pg_database WHERE datname = :db_name"),
+                        {"db_name": db_name},
+                    )
+                ).scalar()
+
+                if not db_exists:
+                    await conn.execute(text(f'CREATE DATABASE "{db_name}"'))
+                    print(f"Database {db_name} created successfully.")
+                else:
+                    print(f"Database {db_name} already exists.")
         except SQLAlchemyError as e:
             print(f"An error occurred: {e}")
         finally:
-            conn.close()
+            await engine.dispose()
+
+    async def get_schema_revision(self) -> Optional[str]:
+        """Returns the alembic revision stamped on the database, None if it is unversioned."""
+        engine: AsyncEngine = self.engine["write"]
+
+        async with engine.connect() as conn:
+            try:
+                result = await conn.execute(select(version_table.c.version_num))
+            except (OperationalError, ProgrammingError):
+                # no version table: empty database or one created before migrations
+                return None
+            return result.scalar()
+
+    async def prepare_schema(self, mode: str = "auto") -> str:
+        """
+        Makes sure the schema is usable at startup and returns what was done.
+
+        - "create": run metadata.create_all on every boot (previous behaviour).
+        - "auto": read the alembic version row and skip DDL when it is at SCHEMA_HEAD.
+          An unversioned, empty database is built from the models and stamped at
+          head; an unversioned one that already has tables (created before the
+          migrations) is refused, create_all would not alter its tables.
+        - "check": like "auto" but never runs DDL.
+
+        A database stamped at any other revision fails with DatabaseSchemaException
+        until `alembic upgrade head` has been run.
+        """
+        if mode == "create":
+            await self.create_all_tables()
+            return "created"
+
+        try:
+            revision = await self.get_schema_revision()
+        except DBAPIError as e:
+            # 3D000: invalid_catalog_name, the database itself is missing
+            if mode == "check" or getattr(e.orig, "sqlstate", None) != "3D000":
+                raise
+            await self.create_postgres_database_if_not_exist(self.credentials.get("db"))
+            revision = None
+
+        if revision == SCHEMA_HEAD:
+            return "current"
+
+        if mode == "check" or revision is not None:
+            raise DBExceptions.DatabaseSchemaException(revision, SCHEMA_HEAD)
+
+        engine: AsyncEngine = self.engine["write"]
+        async with engine.begin() as conn:
+            tables = await conn.run_sync(
+                lambda sync_conn: set(inspect(sync_conn).get_table_names())
+            )
+            if tables & set(self._base.metadata.tables):
+                raise DBExceptions.DatabaseSchemaException(
+                    revision,
+                    SCHEMA_HEAD,
+                    msg=(
+                        "Database has tables but no alembic version. Run "
+                        "`alembic stamp 0001_initial_schema && alembic upgrade head` "
+                        "before starting the app."
+                    ),
+                )
+
+            await conn.run_sync(self._base.metadata.create_all)
+            await conn.run_sync(version_table.create, checkfirst=True)
+            await conn.execute(delete(version_table))
+            await conn.execute(insert(version_table).values(version_num=SCHEMA_HEAD))
+
+        return "created"
 
     async def create_all_tables(self):
         engine: AsyncEngine = self.engine["write"]
@@ -0,0 +1,111 @@
+import threading
+from typing import List, Tuple
+from sqlalchemy import Connection, Sequence, column, func, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.dbDeclarative import Base
+
+# numbers reserved per sequence round trip; the sequences INCREMENT BY this value
+# (frozen in alembic/versions/0005_number_sequences.py)
+BLOCK_SIZE = 100
+
+# digits after the prefix, e.g. INV0000000101
+NUMBER_WIDTH = 10
+
+
+class NumberSequence:
+    """
+    Collision-free business numbers (invoice, contract, transaction ... numbers) as
+    `prefix + zero padded counter`, allocated with the hi/lo scheme.
+
+    Every nextval() of the backing sequence reserves a block of BLOCK_SIZE values
+    for this worker; numbers are then handed out from memory, so bulk inserts only
+    touch the sequence once per block. Blocks are never shared, so numbers stay
+    unique across workers (though not gap free or ordered between them).
+
+    Backends without sequences (SQLite dev databases) continue from the highest
+    number already stored in `column`, which is only safe for a single process.
+    """
+
+    def __init__(self, name: str, prefix: str, column: str):
+        self.name = name
+        self.prefix = prefix
+        self.column = column
+        self.sequence = Sequence(
+            name, start=1, increment=BLOCK_SIZE, metadata=Base.metadata
+        )
+
+        self._lock = threading.Lock()
+        self._next = 0
+        self._limit = 0
+        # next block start of the sequence-less fallback
+        self._reserved = 0
+
+    def format(self, value: int) -> str:
+        return f"{self.prefix}{value:0{NUMBER_WIDTH}d}"
+
+    def _reserve_block(self, connection: Connection) -> Tuple[int, int]:
+        """[start, stop) of a new block. Runs outside the lock, the query may yield."""
+        if connection.dialect.supports_sequences:
+            hi = connection.execute(select(self.sequence.next_value())).scalar_one()
+            return hi, hi + BLOCK_SIZE
+
+        # the first block continues from the stored numbers, later ones from memory
+        with self._lock:
+            start = self._reserved
+            if start:
+                self._reserved += BLOCK_SIZE
+                return start, start + BLOCK_SIZE
+
+        table_name, column_name = self.column.split(".")
+        number = column(column_name)
+        last = connection.execute(
+            select(func.max(number))
+            .select_from(table(table_name, number))
+            .where(
+                number.like(f"{self.prefix}%"),
+                func.length(number) == len(self.prefix) + NUMBER_WIDTH,
+            )
+        ).scalar()
+
+        with self._lock:
+            start = max(
+                self._reserved, int(last[len(self.prefix) :]) + 1 if last else 1
+            )
+            self._reserved = start + BLOCK_SIZE
+        return start, start + BLOCK_SIZE
+
+    def allocate(self, connection: Connection, count: int = 1) -> List[str]:
+        """Returns `count` new numbers, fetching blocks on `connection` as needed."""
+        numbers: List[str] = []
+        block = None
+        while True:
+            with self._lock:
+                if block is not None and self._next >= self._limit:
+                    self._next, self._limit = block
+                    block = None
+
+                taken = min(count - len(numbers), self._limit - self._next)
+                if taken > 0:
+                    numbers.extend(
+                        self.format(value)
+                        for value in range(self._next, self._next + taken)
+                    )
+                    self._next += taken
+                if len(numbers) == count:
+                    return numbers
+
+            # never hold the lock across the round trip: under the async engine it
+            # hands control to other tasks, which may allocate in the meantime
+            block = self._reserve_block(connection)
+
+    def next(self, connection: Connection) -> str:
+        return self.allocate(connection)[0]
+
+    async def allocate_async(
+        self, db_session: AsyncSession, count: int = 1
+    ) -> List[str]:
+        """allocate() for bulk inserts built outside the ORM flush (e.g. insert().values())."""
+        return await db_session.run_sync(
+            lambda session: self.allocate(session.connection(), count)
+        )
@@ -27,6 +27,7 @@ from app.modules.resources.models.amenities import Amenities  # noqa: F401
 
 # resources
 from app.modules.resources.models.media import Media  # noqa: F401
+from app.modules.resources.models.media_content import MediaContent  # noqa: F401
 from app.modules.resources.models.document import Document  # noqa: F401
 from app.modules.billing.models.billable import BillableAssoc  # noqa: F401
 from app.modules.billing.models.utility import Utilities  # noqa: F401
@@ -42,6 +43,13 @@ from app.modules.billing.models.payment_type import PaymentType  # noqa: F401
 from app.modules.billing.models.transaction import Transaction  # noqa: F401
 from app.modules.billing.models.invoice import Invoice  # noqa: F401
 from app.modules.billing.models.invoice_item import InvoiceItem  # noqa: F401
+from app.modules.billing.models.invoice_rollup import InvoiceMonthlyRollup  # noqa: F401
+from app.modules.billing.models.receivable_due import ReceivableDue  # noqa: F401
+from app.modules.billing.models.billing_period import ContractBillingPeriod  # noqa: F401
+from app.modules.communication.models.message_inbox import (  # noqa: F401
+    MessageInbox,
+    MessageInboxFanout,
+)
 
 from app.modules.auth.models.user_role import UserRoles  # noqa: F401
 from app.modules.auth.models.role_permissions import RolePermissions  # noqa: F401
@@ -10,6 +10,7 @@ from app.modules.address.models.address import Addresses as AddressModel
 
 # daos
 from app.modules.common.dao.base_dao import BaseDAO
+from app.modules.common.dao.dao_registry import dao_registry
 from app.modules.address.dao.addr_city_dao import CityDAO
 from app.modules.address.dao.addr_region_dao import RegionDAO
 from app.modules.address.dao.addr_country_dao import CountryDAO
@@ -27,10 +28,10 @@ class AddressDAO(BaseDAO[AddressModel]):
         self.detail_mappings = {}
 
         self.model = AddressModel
-        self.city_dao = CityDAO()
-        self.region_dao = RegionDAO()
-        self.country_dao = CountryDAO()
-        self.entity_address_dao = EntityAddressDAO()
+        self.city_dao = dao_registry.lazy(CityDAO)
+        self.region_dao = dao_registry.lazy(RegionDAO)
+        self.country_dao = dao_registry.lazy(CountryDAO)
+        self.entity_address_dao = dao_registry.lazy(EntityAddressDAO)
 
         super().__init__(self.model, excludes=excludes, primary_key="address_id")
 
@@ -17,3 +17,33 @@ class EntityTypeEnum(enum.Enum):
     pastrentalhistory = "pastrentalhistory"
     # maintenancerequests = "maintenancerequests"
     maintenance_requests = "maintenance_requests"
+
+
+# Stable smallint codes stored in the association tables' entity_type column.
+# Codes are persisted: never renumber or reuse one, give new entity types the next free code.
+ENTITY_TYPE_CODES = {
+    EntityTypeEnum.property: 1,
+    EntityTypeEnum.units: 2,
+    EntityTypeEnum.utilities: 3,
+    EntityTypeEnum.contract: 4,
+    EntityTypeEnum.user: 5,
+    EntityTypeEnum.role: 6,
+    EntityTypeEnum.amenities: 7,
+    EntityTypeEnum.account: 8,
+    EntityTypeEnum.comapany: 9,
+    EntityTypeEnum.entityamenities: 10,
+    EntityTypeEnum.pastrentalhistory: 11,
+    EntityTypeEnum.maintenance_requests: 12,
+}
+
+ENTITY_TYPES_BY_CODE = {code: member for member, code in ENTITY_TYPE_CODES.items()}
+
+
+def entity_type_code(value) -> int:
+    """Returns the stored code for an EntityTypeEnum member or its name."""
+    try:
+        if not isinstance(value, EntityTypeEnum):
+            value = EntityTypeEnum[str(value)]
+        return ENTITY_TYPE_CODES[value]
+    except KeyError:
+        raise ValueError(f"Invalid entity type: {value}")
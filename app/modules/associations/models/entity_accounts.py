@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Enum, UUID, ForeignKey, CheckConstraint
+from sqlalchemy import Enum, UUID, ForeignKey
 from sqlalchemy.orm import relationship, Mapped, mapped_column, validates
 
 # models
@@ -8,6 +8,16 @@ from app.modules.common.models.model_base import BaseModel as Base
 # enums
 from app.modules.billing.enums.billing_enums import AccountTypeEnum
 from app.modules.associations.enums.entity_type_enums import EntityTypeEnum
+from app.modules.associations.models.entity_type_column import (
+    EntityTypeCode,
+    entity_type_check,
+    entity_type_indexes,
+)
+
+ACCOUNTS_ENTITY_TYPES = (
+    EntityTypeEnum.property,
+    EntityTypeEnum.user,
+)
 
 
 class EntityAccount(Base):
@@ -25,11 +35,12 @@ class EntityAccount(Base):
     )
     account_type: Mapped[AccountTypeEnum] = mapped_column(Enum(AccountTypeEnum))
     entity_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True))
-    entity_type: Mapped[EntityTypeEnum] = mapped_column(Enum(EntityTypeEnum))
+    entity_type: Mapped[EntityTypeEnum] = mapped_column(EntityTypeCode())
 
     __table_args__ = (
-        CheckConstraint(
-            "entity_type IN ('property', 'user')", name="check_entity_type_accounts"
+        entity_type_check("check_entity_type_accounts", ACCOUNTS_ENTITY_TYPES),
+        *entity_type_indexes(
+            "entity_accounts", ACCOUNTS_ENTITY_TYPES, include=["account_id"]
         ),
     )
 
@@ -1,12 +1,25 @@
 import uuid
 from sqlalchemy.orm import Mapped, mapped_column, validates
-from sqlalchemy import Enum, UUID, Boolean, ForeignKey, CheckConstraint
+from sqlalchemy import UUID, Boolean, ForeignKey
 
 # models
 from app.modules.common.models.model_base import BaseModel as Base
 
 # enums
 from app.modules.associations.enums.entity_type_enums import EntityTypeEnum
+from app.modules.associations.models.entity_type_column import (
+    EntityTypeCode,
+    entity_type_check,
+    entity_type_indexes,
+)
+
+ADDRESS_ENTITY_TYPES = (
+    EntityTypeEnum.property,
+    EntityTypeEnum.user,
+    EntityTypeEnum.pastrentalhistory,
+    EntityTypeEnum.account,
+    EntityTypeEnum.role,
+)
 
 
 class EntityAddress(Base):
@@ -17,7 +30,7 @@ class EntityAddress(Base):
     )
 
     entity_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True))
-    entity_type: Mapped["EntityTypeEnum"] = mapped_column(Enum(EntityTypeEnum))
+    entity_type: Mapped["EntityTypeEnum"] = mapped_column(EntityTypeCode())
     address_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("address.address_id")
     )
@@ -26,9 +39,9 @@ class EntityAddress(Base):
     )
 
     __table_args__ = (
-        CheckConstraint(
-            "entity_type IN ('property', 'user', 'pastrentalhistory', 'account', 'role')",
-            name="check_entity_type_address",
+        entity_type_check("check_entity_type_address", ADDRESS_ENTITY_TYPES),
+        *entity_type_indexes(
+            "entity_address", ADDRESS_ENTITY_TYPES, include=["address_id"]
         ),
     )
 
@@ -1,6 +1,6 @@
 import uuid
 from typing import List
-from sqlalchemy import Boolean, Enum, UUID, ForeignKey, CheckConstraint
+from sqlalchemy import Boolean, UUID, ForeignKey
 from sqlalchemy.orm import relationship, Mapped, mapped_column, validates
 
 # models
@@ -8,6 +8,16 @@ from app.modules.common.models.model_base import BaseModel as Base
 
 # enums
 from app.modules.associations.enums.entity_type_enums import EntityTypeEnum
+from app.modules.associations.models.entity_type_column import (
+    EntityTypeCode,
+    entity_type_check,
+    entity_type_indexes,
+)
+
+AMENITIES_ENTITY_TYPES = (
+    EntityTypeEnum.property,
+    EntityTypeEnum.units,
+)
 
 
 class EntityAmenities(Base):
@@ -27,12 +37,13 @@ class EntityAmenities(Base):
         UUID(as_uuid=True),
         ForeignKey("property_unit_assoc.property_unit_assoc_id", ondelete="CASCADE"),
     )
-    entity_type: Mapped[EntityTypeEnum] = mapped_column(Enum(EntityTypeEnum))
+    entity_type: Mapped[EntityTypeEnum] = mapped_column(EntityTypeCode())
     apply_to_units: Mapped[bool] = mapped_column(Boolean, default=False)
 
     __table_args__ = (
-        CheckConstraint(
-            "entity_type IN ('property', 'units')", name="check_entity_type_amenities"
+        entity_type_check("check_entity_type_amenities", AMENITIES_ENTITY_TYPES),
+        *entity_type_indexes(
+            "entity_amenities", AMENITIES_ENTITY_TYPES, include=["amenity_id"]
         ),
     )
     # amenity
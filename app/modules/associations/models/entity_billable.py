@@ -6,7 +6,6 @@ from sqlalchemy import (
     Boolean,
     Integer,
     Enum,
-    CheckConstraint,
     Numeric,
     UUID,
     ForeignKey,
@@ -19,6 +18,17 @@ from app.modules.common.models.model_base import BaseModel as Base
 # enums
 from app.modules.billing.enums.billing_enums import BillableTypeEnum
 from app.modules.associations.enums.entity_type_enums import EntityTypeEnum
+from app.modules.associations.models.entity_type_column import (
+    EntityTypeCode,
+    entity_type_check,
+    entity_type_indexes,
+)
+
+BILLABLE_ENTITY_TYPES = (
+    EntityTypeEnum.property,
+    EntityTypeEnum.units,
+    EntityTypeEnum.contract,
+)
 
 
 class EntityBillable(Base):
@@ -32,9 +42,7 @@ class EntityBillable(Base):
         default=uuid.uuid4,
     )
     entity_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
-    entity_type: Mapped[EntityTypeEnum] = mapped_column(
-        Enum(EntityTypeEnum), nullable=True
-    )
+    entity_type: Mapped[EntityTypeEnum] = mapped_column(EntityTypeCode(), nullable=True)
 
     billable_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -59,15 +67,18 @@ class EntityBillable(Base):
     )
 
     __table_args__ = (
-        CheckConstraint(
-            "entity_type IN ('property', 'units', 'contract')",
-            name="check_entity_type_billables",
+        entity_type_check("check_entity_type_billables", BILLABLE_ENTITY_TYPES),
+        *entity_type_indexes(
+            "entity_billable",
+            BILLABLE_ENTITY_TYPES,
+            columns=["entity_id", "billable_type"],
+            include=["billable_id"],
         ),
     )
 
     # Relationships
     payment_type: Mapped[Optional["PaymentType"]] = relationship(
-        "PaymentType", back_populates="entity_billable", lazy="selectin"
+        "PaymentType", back_populates="entity_billable", lazy="select"
     )
 
     utility: Mapped[Optional["Utilities"]] = relationship(
@@ -1,6 +1,6 @@
 import uuid
 from sqlalchemy.orm import Mapped, mapped_column, validates
-from sqlalchemy import UUID, Enum, ForeignKey, CheckConstraint
+from sqlalchemy import UUID, Enum, ForeignKey
 
 # models
 from app.modules.common.models.model_base import BaseModel as Base
@@ -8,6 +8,16 @@ from app.modules.common.models.model_base import BaseModel as Base
 # enums
 from app.modules.billing.enums.billing_enums import CompanyTypeEnum
 from app.modules.associations.enums.entity_type_enums import EntityTypeEnum
+from app.modules.associations.models.entity_type_column import (
+    EntityTypeCode,
+    entity_type_check,
+    entity_type_indexes,
+)
+
+COMPANY_ENTITY_TYPES = (
+    EntityTypeEnum.property,
+    EntityTypeEnum.user,
+)
 
 
 # Remove primary key field
@@ -29,11 +39,12 @@ class EntityCompany(Base):
         Enum(CompanyTypeEnum), default=CompanyTypeEnum.agency
     )
     entity_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True))
-    entity_type: Mapped[EntityTypeEnum] = mapped_column(Enum(EntityTypeEnum))
+    entity_type: Mapped[EntityTypeEnum] = mapped_column(EntityTypeCode())
 
     __table_args__ = (
-        CheckConstraint(
-            "entity_type IN ('property', 'user')", name="check_entity_type_company"
+        entity_type_check("check_entity_type_company", COMPANY_ENTITY_TYPES),
+        *entity_type_indexes(
+            "entity_company", COMPANY_ENTITY_TYPES, include=["company_id"]
         ),
     )
 
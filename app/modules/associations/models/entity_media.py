@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Enum, CheckConstraint, UUID, ForeignKey
+from sqlalchemy import Enum, UUID, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, validates, relationship
 
 # Base model
@@ -8,6 +8,21 @@ from app.modules.common.models.model_base import BaseModel as Base
 # Enums
 from app.modules.resources.enums.resource_enums import MediaType
 from app.modules.associations.enums.entity_type_enums import EntityTypeEnum
+from app.modules.associations.models.entity_type_column import (
+    EntityTypeCode,
+    entity_type_check,
+    entity_type_indexes,
+)
+
+MEDIA_ENTITY_TYPES = (
+    EntityTypeEnum.property,
+    EntityTypeEnum.user,
+    EntityTypeEnum.units,
+    EntityTypeEnum.amenities,
+    EntityTypeEnum.entityamenities,
+    EntityTypeEnum.contract,
+    EntityTypeEnum.maintenance_requests,
+)
 
 
 class EntityMedia(Base):
@@ -21,19 +36,19 @@ class EntityMedia(Base):
         default=uuid.uuid4,
     )
     media_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("media.media_id"), nullable=False
+        UUID(as_uuid=True),
+        ForeignKey("media.media_id", ondelete="RESTRICT"),
+        nullable=False,
     )
     entity_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True))
-    entity_type: Mapped[EntityTypeEnum] = mapped_column(Enum(EntityTypeEnum))
+    entity_type: Mapped[EntityTypeEnum] = mapped_column(EntityTypeCode())
     media_type: Mapped[MediaType] = mapped_column(
         Enum(MediaType), default=MediaType.other
     )
 
     __table_args__ = (
-        CheckConstraint(
-            "entity_type IN ('property', 'user', 'units', 'amenities', 'entityamenities', 'contract', 'maintenance_requests')",
-            name="check_entity_type_media",
-        ),
+        entity_type_check("check_entity_type_media", MEDIA_ENTITY_TYPES),
+        *entity_type_indexes("entity_media", MEDIA_ENTITY_TYPES, include=["media_id"]),
     )
 
     __mapper_args__ = {"eager_defaults": True}
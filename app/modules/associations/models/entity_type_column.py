@@ -0,0 +1,86 @@
+from typing import Iterable, List, Optional
+from sqlalchemy.sql import operators
+from sqlalchemy import CheckConstraint, Index, SmallInteger, TypeDecorator
+from sqlalchemy import literal_column, text
+
+# Enums
+from app.modules.associations.enums.entity_type_enums import (
+    EntityTypeEnum,
+    ENTITY_TYPES_BY_CODE,
+    entity_type_code,
+)
+
+
+class EntityTypeCode(TypeDecorator):
+    """
+    entity_type discriminator of the polymorphic association tables, stored as the
+    smallint code from ENTITY_TYPE_CODES.
+
+    Binds accept EntityTypeEnum members or their names (the string literals used in
+    relationship joins) and rows come back as EntityTypeEnum members. Equality against
+    a constant renders the code inline instead of as a parameter, so the partial
+    per-entity-type indexes still match when the statement is prepared.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    # same attribute as sqlalchemy's Enum, read by the model registry
+    enums = [member.name for member in EntityTypeEnum]
+
+    class comparator_factory(TypeDecorator.Comparator):
+        def operate(self, op, *other, **kwargs):
+            if (
+                op in (operators.eq, operators.ne)
+                and len(other) == 1
+                and isinstance(other[0], (EntityTypeEnum, str))
+            ):
+                other = (literal_column(str(entity_type_code(other[0])), SmallInteger),)
+            return super().operate(op, *other, **kwargs)
+
+    @property
+    def python_type(self):
+        return EntityTypeEnum
+
+    def process_bind_param(self, value, dialect) -> Optional[int]:
+        return None if value is None else entity_type_code(value)
+
+    def process_literal_param(self, value, dialect) -> str:
+        return "NULL" if value is None else str(entity_type_code(value))
+
+    def process_result_value(self, value, dialect) -> Optional[EntityTypeEnum]:
+        return None if value is None else ENTITY_TYPES_BY_CODE[int(value)]
+
+
+def entity_type_check(name: str, entity_types: Iterable[EntityTypeEnum]):
+    """CHECK constraint limiting entity_type to the given entity types."""
+    codes = ", ".join(
+        str(entity_type_code(entity_type)) for entity_type in entity_types
+    )
+    return CheckConstraint(f"entity_type IN ({codes})", name=name)
+
+
+def entity_type_indexes(
+    table_name: str,
+    entity_types: Iterable[EntityTypeEnum],
+    columns: Iterable[str] = ("entity_id",),
+    include: Optional[List[str]] = None,
+) -> List[Index]:
+    """
+    One partial index per entity type, e.g. ix_entity_media_property on entity_id
+    WHERE entity_type = 1. Every row lives in exactly one of them, so lookups for a
+    type only walk that type's (narrower) index.
+    """
+    indexes = []
+    for entity_type in entity_types:
+        predicate = f"entity_type = {entity_type_code(entity_type)}"
+        indexes.append(
+            Index(
+                f"ix_{table_name}_{entity_type.name}",
+                *columns,
+                postgresql_where=text(predicate),
+                postgresql_include=include or [],
+                sqlite_where=text(predicate),
+            )
+        )
+    return indexes
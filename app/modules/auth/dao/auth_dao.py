@@ -11,6 +11,7 @@ from app.modules.auth.models.user import User
 # daos
 from app.modules.auth.dao.user_dao import UserDAO
 from app.modules.common.dao.base_dao import BaseDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # utils
 from app.core.security import Hash, SecureAccessTokens
@@ -30,7 +31,7 @@ google_sso = GoogleSSO(CLIENT_ID, CLIENT_SECRET, settings.GOOGLE_CALLBACK)
 class AuthDAO(BaseDAO[User]):
     def __init__(self):
         self.model = User
-        self.user_dao = UserDAO()
+        self.user_dao = dao_registry.lazy(UserDAO)
 
         super().__init__(self.model)
 
@@ -10,6 +10,7 @@ from app.modules.auth.models.role import Role
 
 # dao
 from app.modules.common.dao.base_dao import BaseDAO
+from app.modules.common.dao.dao_registry import dao_registry
 from app.modules.address.dao.address_dao import AddressDAO
 from app.modules.auth.dao.permission_dao import PermissionDAO
 
@@ -20,8 +21,8 @@ class RoleDAO(BaseDAO[Role]):
     def __init__(self, excludes: Optional[List[str]] = []):
         self.model = Role
 
-        self.address_dao = AddressDAO()
-        self.permission_dao = PermissionDAO()
+        self.address_dao = dao_registry.lazy(AddressDAO)
+        self.permission_dao = dao_registry.lazy(PermissionDAO)
         self.detail_mappings = {
             "permissions": self.permission_dao,
         }
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 # dao
 from app.modules.auth.dao.role_dao import RoleDAO
 from app.modules.common.dao.base_dao import BaseDAO
+from app.modules.common.dao.dao_registry import dao_registry
 from app.modules.billing.dao.account_dao import AccountDAO
 from app.modules.address.dao.address_dao import AddressDAO
 
@@ -19,16 +20,16 @@ class UserDAO(BaseDAO[User]):
     def __init__(self, excludes: Optional[List[str]] = []):
         self.model = User
 
-        self.role_dao = RoleDAO()
-        self.address_dao = AddressDAO()
-        self.account_dao = AccountDAO()
-        self.rental_history_dao = PastRentalHistoryDAO()
+        self.role_dao = dao_registry.lazy(RoleDAO)
+        self.address_dao = dao_registry.lazy(AddressDAO)
+        self.account_dao = dao_registry.lazy(AccountDAO)
+        self.rental_history_dao = dao_registry.lazy(PastRentalHistoryDAO)
         self.detail_mappings = {
             "address": self.address_dao,
             "roles": self.role_dao,
             "rental_history": self.rental_history_dao,
             "accounts": self.account_dao,
-            "property_assignment": PropertyAssignmentDAO(),
+            "property_assignment": dao_registry.lazy(PropertyAssignmentDAO),
         }
 
         super().__init__(
@@ -18,7 +18,7 @@ class Company(Base):
     users: Mapped[List["User"]] = relationship(
         "User",
         secondary="entity_company",
-        secondaryjoin="and_(Company.company_id==EntityCompany.company_id, EntityCompany.entity_type=='Users')",
+        secondaryjoin="and_(Company.company_id==EntityCompany.company_id, EntityCompany.entity_type=='user')",
         primaryjoin="and_(User.user_id==EntityCompany.entity_id)",
         back_populates="company",
     )
@@ -1,5 +1,4 @@
 import uuid
-import asyncio
 from typing import List, Union
 from fastapi import Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,6 +8,7 @@ from app.modules.auth.models.user import User
 
 # daos
 from app.modules.auth.dao.user_dao import UserDAO
+from app.modules.common.dao.dao_registry import dao_registry
 from app.modules.auth.dao.auth_dao import AuthDAO
 
 # services
@@ -29,8 +29,8 @@ UNSUBSCRIBE_LINK = (
 
 class AuthRouter(BaseCRUDRouter):
     def __init__(self, prefix: str = "", tags: List[str] = []):
-        self.dao: AuthDAO = AuthDAO()
-        self.user_dao: UserDAO = UserDAO()
+        self.dao: AuthDAO = dao_registry.get(AuthDAO)
+        self.user_dao: UserDAO = dao_registry.get(UserDAO)
         super().__init__(
             dao=self.dao,
             schemas=UserSchema,
@@ -93,15 +93,15 @@ class AuthRouter(BaseCRUDRouter):
                     db_session=db, obj=current_user
                 )
 
-                asyncio.create_task(
-                    email_service.send_reset_password_email(
-                        current_user.email,
-                        current_user.first_name + " " + current_user.last_name,
-                        RESET_LINK.format(current_user.reset_token),
-                        UNSUBSCRIBE_LINK.format(
-                            current_user.email, current_user.is_subscribed_token
-                        ),
-                    )
+                # queued, the delivery pipeline retries and logs failures
+                await email_service.send_reset_password_email(
+                    current_user.email,
+                    current_user.first_name + " " + current_user.last_name,
+                    RESET_LINK.format(current_user.reset_token),
+                    UNSUBSCRIBE_LINK.format(
+                        current_user.email, current_user.is_subscribed_token
+                    ),
+                    wait=False,
                 )
 
                 if response:
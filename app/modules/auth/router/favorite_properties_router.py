@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 # DAO
 from app.modules.auth.dao.favoriteProperties_dao import FavoritePropertiesDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # Router
 from app.modules.common.router.base_router import BaseCRUDRouter
@@ -23,7 +24,9 @@ from app.core.response import DAOResponse
 
 class FavoritePropertiesRouter(BaseCRUDRouter):
     def __init__(self, prefix: str = "", tags: List[str] = []):
-        self.dao: FavoritePropertiesDAO = FavoritePropertiesDAO(excludes=[])
+        self.dao: FavoritePropertiesDAO = dao_registry.get(
+            FavoritePropertiesDAO, excludes=[]
+        )
         FavoritePropertiesSchema["create_schema"] = FavoritePropertiesCreateSchema
         FavoritePropertiesSchema["update_schema"] = FavoritePropertiesUpdateSchema
 
@@ -2,6 +2,7 @@ from typing import List
 
 # dao
 from app.modules.auth.dao.permission_dao import PermissionDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # router
 from app.modules.common.router.base_router import BaseCRUDRouter
@@ -18,7 +19,7 @@ class PermissionRouter(BaseCRUDRouter):
     def __init__(self, prefix: str = "", tags: List[str] = []):
         PermissionsSchema["create_schema"] = PermissionCreateSchema
         PermissionsSchema["update_schema"] = PermissionUpdateSchema
-        self.dao: PermissionDAO = PermissionDAO(excludes=[""])
+        self.dao: PermissionDAO = dao_registry.get(PermissionDAO, excludes=[""])
 
         super().__init__(
             dao=self.dao, schemas=PermissionsSchema, prefix=prefix, tags=tags
@@ -4,6 +4,7 @@ from fastapi import Depends, Query, Request
 
 # dao
 from app.modules.auth.dao.role_dao import RoleDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # router
 from app.modules.common.router.base_router import BaseCRUDRouter
@@ -22,7 +23,7 @@ class RoleRouter(BaseCRUDRouter):
     def __init__(self, prefix: str = "", tags: List[str] = []):
         RoleSchema["create_schema"] = RoleCreateSchema
         RoleSchema["update_schema"] = RoleUpdateSchema
-        self.dao: RoleDAO = RoleDAO(excludes=["users"])
+        self.dao: RoleDAO = dao_registry.get(RoleDAO, excludes=["users"])
 
         super().__init__(
             dao=self.dao,
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 # DAO
 from app.modules.auth.dao.user_interactions_dao import UserInteractionsDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # Router
 from app.modules.common.router.base_router import BaseCRUDRouter
@@ -26,7 +27,9 @@ from app.core.response import DAOResponse
 
 class UserInteractionsRouter(BaseCRUDRouter):
     def __init__(self, prefix: str = "", tags: List[str] = []):
-        self.dao: UserInteractionsDAO = UserInteractionsDAO(excludes=[])
+        self.dao: UserInteractionsDAO = dao_registry.get(
+            UserInteractionsDAO, excludes=[]
+        )
         UserInteractionsSchema["create_schema"] = UserInteractionsCreateSchema
         UserInteractionsSchema["update_schema"] = UserInteractionsUpdateSchema
 
@@ -2,6 +2,7 @@ from typing import List
 
 # dao
 from app.modules.auth.dao.user_dao import UserDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # router
 from app.modules.common.router.base_router import BaseCRUDRouter
@@ -13,7 +14,7 @@ from app.modules.auth.schema.user_schema import UserCreateSchema, UserUpdateSche
 
 class UserRouter(BaseCRUDRouter):
     def __init__(self, prefix: str = "", tags: List[str] = []):
-        self.dao: UserDAO = UserDAO(excludes=[""])
+        self.dao: UserDAO = dao_registry.get(UserDAO, excludes=[""])
         UserSchema["create_schema"] = UserCreateSchema
         UserSchema["update_schema"] = UserUpdateSchema
 
@@ -6,6 +6,7 @@ from typing import Optional
 from app.modules.auth.models.favorite_properties import FavoriteProperties as FavoritePropertiesModel
 
 # Mixins
+from app.modules.common.schema.base_schema import lazy_example
 from app.modules.auth.schema.mixins.favorite_properties_mixin import FavoritePropertiesBase, FavoritePropertiesInfoMixin
 
 
@@ -14,7 +15,7 @@ class FavoritePropertiesCreateSchema(FavoritePropertiesBase, FavoritePropertiesI
     model_config = ConfigDict(
         from_attributes=True,
         arbitrary_types_allowed=True,
-        json_schema_extra={"example": FavoritePropertiesInfoMixin._favorite_properties_create_json},
+        json_schema_extra=lazy_example(FavoritePropertiesInfoMixin._examples, "_favorite_properties_create_json"),
     )
 
     @classmethod
@@ -29,7 +30,7 @@ class FavoritePropertiesUpdateSchema(FavoritePropertiesBase, FavoritePropertiesI
     model_config = ConfigDict(
         from_attributes=True,
         arbitrary_types_allowed=True,
-        json_schema_extra={"example": FavoritePropertiesInfoMixin._favorite_properties_update_json},
+        json_schema_extra=lazy_example(FavoritePropertiesInfoMixin._examples, "_favorite_properties_update_json"),
     )
 
     @classmethod
@@ -1,3 +1,4 @@
+from typing import Any, Dict
 from pydantic import BaseModel, UUID4
 
 # Base Faker for generating example data
@@ -20,18 +21,26 @@ class FavoriteProperties(FavoritePropertiesBase):
 
 
 class FavoritePropertiesInfoMixin:
-    _user_id = BaseFaker.uuid4()
-    _property_unit_assoc_id = BaseFaker.uuid4()
-
-    _favorite_properties_create_json = {
-        "user_id": _user_id,
-        "property_unit_assoc_id": _property_unit_assoc_id,
-    }
-
-    _favorite_properties_update_json = {
-        "user_id": _user_id,
-        "property_unit_assoc_id": _property_unit_assoc_id,
-    }
+    @staticmethod
+    def _examples() -> Dict[str, Any]:
+        """OpenAPI example payloads, built only when the schema is requested."""
+        _user_id = BaseFaker.uuid4()
+        _property_unit_assoc_id = BaseFaker.uuid4()
+
+        _favorite_properties_create_json = {
+            "user_id": _user_id,
+            "property_unit_assoc_id": _property_unit_assoc_id,
+        }
+
+        _favorite_properties_update_json = {
+            "user_id": _user_id,
+            "property_unit_assoc_id": _property_unit_assoc_id,
+        }
+
+        return {
+            "_favorite_properties_create_json": _favorite_properties_create_json,
+            "_favorite_properties_update_json": _favorite_properties_update_json,
+        }
 
     @classmethod
     def get_favorite_properties_info(cls, favorite: FavoritePropertiesModel) -> FavoriteProperties:
@@ -1,3 +1,4 @@
+from typing import Any, Dict
 from pydantic import BaseModel, UUID4
 from datetime import datetime
 
@@ -25,27 +26,35 @@ class UserInteractions(UserInteractionsBase):
 # Step 2: Add Schema Mixin with BaseFaker Examples
 
 class UserInteractionsInfoMixin:
-    _user_id = BaseFaker.uuid4()
-    _employee_id = BaseFaker.uuid4()
-    _property_unit_assoc_id = BaseFaker.uuid4()
-    _contact_time = BaseFaker.past_datetime()
-    _contact_details = BaseFaker.text(max_nb_chars=200)
-
-    _user_interactions_create_json = {
-        "user_id": _user_id,
-        "employee_id": _employee_id,
-        "property_unit_assoc_id": _property_unit_assoc_id,
-        "contact_time": _contact_time.isoformat(),
-        "contact_details": _contact_details,
-    }
-
-    _user_interactions_update_json = {
-        "user_id": _user_id,
-        "employee_id": _employee_id,
-        "property_unit_assoc_id": _property_unit_assoc_id,
-        "contact_time": _contact_time.isoformat(),
-        "contact_details": _contact_details,
-    }
+    @staticmethod
+    def _examples() -> Dict[str, Any]:
+        """OpenAPI example payloads, built only when the schema is requested."""
+        _user_id = BaseFaker.uuid4()
+        _employee_id = BaseFaker.uuid4()
+        _property_unit_assoc_id = BaseFaker.uuid4()
+        _contact_time = BaseFaker.past_datetime()
+        _contact_details = BaseFaker.text(max_nb_chars=200)
+
+        _user_interactions_create_json = {
+            "user_id": _user_id,
+            "employee_id": _employee_id,
+            "property_unit_assoc_id": _property_unit_assoc_id,
+            "contact_time": _contact_time.isoformat(),
+            "contact_details": _contact_details,
+        }
+
+        _user_interactions_update_json = {
+            "user_id": _user_id,
+            "employee_id": _employee_id,
+            "property_unit_assoc_id": _property_unit_assoc_id,
+            "contact_time": _contact_time.isoformat(),
+            "contact_details": _contact_details,
+        }
+
+        return {
+            "_user_interactions_create_json": _user_interactions_create_json,
+            "_user_interactions_update_json": _user_interactions_update_json,
+        }
 
     @classmethod
     def get_user_interactions_info(cls, interaction: UserInteractionsModel) -> UserInteractions:
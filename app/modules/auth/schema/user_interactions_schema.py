@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Optional
 
 # Mixins
+from app.modules.common.schema.base_schema import lazy_example
 from app.modules.auth.schema.mixins.user_interactions_mixin import UserInteractionsBase, UserInteractionsInfoMixin
 
 # Models
@@ -13,7 +14,7 @@ class UserInteractionsCreateSchema(UserInteractionsBase, UserInteractionsInfoMix
     model_config = ConfigDict(
         from_attributes=True,
         arbitrary_types_allowed=True,
-        json_schema_extra={"example": UserInteractionsInfoMixin._user_interactions_create_json},
+        json_schema_extra=lazy_example(UserInteractionsInfoMixin._examples, "_user_interactions_create_json"),
     )
 
     @classmethod
@@ -31,7 +32,7 @@ class UserInteractionsUpdateSchema(UserInteractionsBase, UserInteractionsInfoMix
     model_config = ConfigDict(
         from_attributes=True,
         arbitrary_types_allowed=True,
-        json_schema_extra={"example": UserInteractionsInfoMixin._user_interactions_update_json},
+        json_schema_extra=lazy_example(UserInteractionsInfoMixin._examples, "_user_interactions_update_json"),
     )
 
     @classmethod
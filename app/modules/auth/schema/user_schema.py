@@ -1,5 +1,5 @@
 from uuid import uuid4
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 from datetime import timedelta
 
 from pydantic import ConfigDict, Field, model_validator
@@ -8,7 +8,7 @@ from pydantic import ConfigDict, Field, model_validator
 from app.modules.auth.models.user import User as UserModel
 
 # schemas
-from app.modules.common.schema.base_schema import BaseFaker
+from app.modules.common.schema.base_schema import BaseFaker, lazy_example
 from app.modules.billing.schema.account_schema import AccountBase
 from app.modules.address.schema.address_mixin import AddressMixin
 from app.modules.auth.schema.mixins.user_auth_schema import UserAuthInfo
@@ -217,20 +217,8 @@ class UserResponse(UserHiddenFields, UserSchema):
         )
 
 
-class UserCreateSchema(UserHiddenFields, UserSchema):
-    user_auth_info: Optional[UserAuthInfo] = None
-    user_employer_info: Optional[UserEmployerInfo] = None
-    user_emergency_info: Optional[UserEmergencyInfo] = None
-    property_assignment_count: int = 0
-    property_assignment: Optional[
-        Union[
-            List[PropertyAssignment]
-            | List[PropertyAssignmentBase]
-            | PropertyAssignment
-            | PropertyAssignmentBase
-        ]
-    ] = []
-
+def _user_create_example() -> Dict[str, Any]:
+    """OpenAPI example for UserCreateSchema, built only when the schema is requested."""
     # Faker attrributes
     _start_date = BaseFaker.date_between(start_date="-2y", end_date="-1y")
     _date_of_birth = BaseFaker.date_between(start_date="-30y", end_date="-6y")
@@ -253,83 +241,57 @@ class UserCreateSchema(UserHiddenFields, UserSchema):
     _date_to = _date_from + timedelta(days=BaseFaker.random_int(min=30, max=365))
     _notes = BaseFaker.text(max_nb_chars=200)
 
-    for_insertion: bool = Field(default=True, exclude=True)
-
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True,
-        use_enum_values=True,
-        # json_encoders={
-        # date: lambda v: v.strftime("%Y-%m-%d") if v else None,
-        # datetime: lambda v: v.strftime("%Y-%m-%dT%H:%M:%S") if v else None,
-        # },
-        json_schema_extra={
-            "example": {
-                "first_name": BaseFaker.first_name(),
-                "last_name": BaseFaker.last_name(),
-                "email": BaseFaker.email(),
-                "phone_number": "+123456789",
-                "identification_number": "1234567890",
-                "gender": _gender[0],
-                "date_of_birth": _date_of_birth,
-                "roles": [{"name": _job, "alias": _job, "description": _job}],
-                "user_emergency_info": {
-                    "emergency_contact_name": BaseFaker.name(),
-                    "emergency_contact_email": BaseFaker.email(),
-                    "emergency_contact_relation": "Spouse",
-                    "emergency_contact_number": BaseFaker.phone_number(),
-                    "address": [
-                        {
-                            "address_1": "46304 Latoya Street Apt. 705",
-                            "address_2": "Unit 0871 Box 9668\nDPO AA 30695",
-                            "address_postalcode": "",
-                            "address_type": "billing",
-                            "city": "Pinedatown",
-                            "country": "Malta",
-                            "emergency_address": True,
-                            "primary": True,
-                            "region": "Mississippi",
-                        }
-                    ],
-                },
-                "user_auth_info": {
-                    "login_provider": "native",
-                    "reset_token": str(uuid4()),
-                    "verification_token": str(uuid4()),
-                    "is_disabled": False,
-                    "is_verified": True,
-                    "is_subscribed": True,
-                    "is_subscribed_token": str(uuid4()),
-                    "current_login_time": "2023-09-15T12:00:00",
-                    "last_login_time": "2023-09-10T12:00:00",
-                },
-                "user_employer_info": {
-                    "employer_name": BaseFaker.company(),
-                    "occupation_status": "Full-time",
-                    "occupation_location": BaseFaker.city(),
-                },
-                "rental_history": [
-                    {
-                        "start_date": _start_date,
-                        "end_date": _end_date,
-                        "property_owner_name": BaseFaker.name(),
-                        "property_owner_email": BaseFaker.email(),
-                        "property_owner_mobile": BaseFaker.phone_number(),
-                        "address": [
-                            {
-                                "address_type": "billing",
-                                "primary": True,
-                                "address_1": "lines 1",
-                                "address_2": "lines 2",
-                                "city": "Tema",
-                                "region": "Greater Accra",
-                                "country": "Ghana",
-                                "address_postalcode": "",
-                                "emergency_address": False,
-                            }
-                        ],
-                    }
-                ],
+    return {
+        "first_name": BaseFaker.first_name(),
+        "last_name": BaseFaker.last_name(),
+        "email": BaseFaker.email(),
+        "phone_number": "+123456789",
+        "identification_number": "1234567890",
+        "gender": _gender[0],
+        "date_of_birth": _date_of_birth,
+        "roles": [{"name": _job, "alias": _job, "description": _job}],
+        "user_emergency_info": {
+            "emergency_contact_name": BaseFaker.name(),
+            "emergency_contact_email": BaseFaker.email(),
+            "emergency_contact_relation": "Spouse",
+            "emergency_contact_number": BaseFaker.phone_number(),
+            "address": [
+                {
+                    "address_1": "46304 Latoya Street Apt. 705",
+                    "address_2": "Unit 0871 Box 9668\nDPO AA 30695",
+                    "address_postalcode": "",
+                    "address_type": "billing",
+                    "city": "Pinedatown",
+                    "country": "Malta",
+                    "emergency_address": True,
+                    "primary": True,
+                    "region": "Mississippi",
+                }
+            ],
+        },
+        "user_auth_info": {
+            "login_provider": "native",
+            "reset_token": str(uuid4()),
+            "verification_token": str(uuid4()),
+            "is_disabled": False,
+            "is_verified": True,
+            "is_subscribed": True,
+            "is_subscribed_token": str(uuid4()),
+            "current_login_time": "2023-09-15T12:00:00",
+            "last_login_time": "2023-09-10T12:00:00",
+        },
+        "user_employer_info": {
+            "employer_name": BaseFaker.company(),
+            "occupation_status": "Full-time",
+            "occupation_location": BaseFaker.city(),
+        },
+        "rental_history": [
+            {
+                "start_date": _start_date,
+                "end_date": _end_date,
+                "property_owner_name": BaseFaker.name(),
+                "property_owner_email": BaseFaker.email(),
+                "property_owner_mobile": BaseFaker.phone_number(),
                 "address": [
                     {
                         "address_type": "billing",
@@ -343,38 +305,79 @@ class UserCreateSchema(UserHiddenFields, UserSchema):
                         "emergency_address": False,
                     }
                 ],
-                "accounts": [
-                    {
-                        "account_branch_name": "Cruz PLC Branch",
-                        "account_type": "general",
-                        "address": [
-                            {
-                                "address_1": "46304 Latoya Street Apt. 705",
-                                "address_2": "Unit 0871 Box 9668\nDPO AA 30695",
-                                "address_postalcode": "",
-                                "address_type": "billing",
-                                "city": "Pinedatown",
-                                "country": "Malta",
-                                "emergency_address": False,
-                                "primary": True,
-                                "region": "Mississippi",
-                            }
-                        ],
-                        "bank_account_name": "Maxwell, Hall and White Bank",
-                        "bank_account_number": "GB38FYRR90680780656781",
-                    }
-                ],
-                "property_assignment": [
+            }
+        ],
+        "address": [
+            {
+                "address_type": "billing",
+                "primary": True,
+                "address_1": "lines 1",
+                "address_2": "lines 2",
+                "city": "Tema",
+                "region": "Greater Accra",
+                "country": "Ghana",
+                "address_postalcode": "",
+                "emergency_address": False,
+            }
+        ],
+        "accounts": [
+            {
+                "account_branch_name": "Cruz PLC Branch",
+                "account_type": "general",
+                "address": [
                     {
-                        "property_unit_assoc_id": "5afb1996-e135-470f-a267-8a937be11be8",
-                        "assignment_type": _assignment_type[0],
-                        "date_from": _date_from,
-                        "date_to": _date_to,
-                        "notes": _notes,
+                        "address_1": "46304 Latoya Street Apt. 705",
+                        "address_2": "Unit 0871 Box 9668\nDPO AA 30695",
+                        "address_postalcode": "",
+                        "address_type": "billing",
+                        "city": "Pinedatown",
+                        "country": "Malta",
+                        "emergency_address": False,
+                        "primary": True,
+                        "region": "Mississippi",
                     }
                 ],
+                "bank_account_name": "Maxwell, Hall and White Bank",
+                "bank_account_number": "GB38FYRR90680780656781",
             }
-        },
+        ],
+        "property_assignment": [
+            {
+                "property_unit_assoc_id": "5afb1996-e135-470f-a267-8a937be11be8",
+                "assignment_type": _assignment_type[0],
+                "date_from": _date_from,
+                "date_to": _date_to,
+                "notes": _notes,
+            }
+        ],
+    }
+
+
+class UserCreateSchema(UserHiddenFields, UserSchema):
+    user_auth_info: Optional[UserAuthInfo] = None
+    user_employer_info: Optional[UserEmployerInfo] = None
+    user_emergency_info: Optional[UserEmergencyInfo] = None
+    property_assignment_count: int = 0
+    property_assignment: Optional[
+        Union[
+            List[PropertyAssignment]
+            | List[PropertyAssignmentBase]
+            | PropertyAssignment
+            | PropertyAssignmentBase
+        ]
+    ] = []
+
+    for_insertion: bool = Field(default=True, exclude=True)
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        arbitrary_types_allowed=True,
+        use_enum_values=True,
+        # json_encoders={
+        # date: lambda v: v.strftime("%Y-%m-%d") if v else None,
+        # datetime: lambda v: v.strftime("%Y-%m-%dT%H:%M:%S") if v else None,
+        # },
+        json_schema_extra=lazy_example(_user_create_example),
     )
 
     @model_validator(mode="after")
@@ -471,11 +474,8 @@ class UserCreateSchema(UserHiddenFields, UserSchema):
         )
 
 
-class UserUpdateSchema(UserHiddenFields, UserSchema):
-    user_auth_info: Optional[UserAuthInfo] = None
-    user_employer_info: Optional[UserEmployerInfo] = None
-    user_emergency_info: Optional[UserEmergencyInfo] = None
-
+def _user_update_example() -> Dict[str, Any]:
+    """OpenAPI example for UserUpdateSchema, built only when the schema is requested."""
     _assignment_type = BaseFaker.random_choices(
         ["other", "handler", "landlord", "contractor"], length=1
     )
@@ -483,56 +483,60 @@ class UserUpdateSchema(UserHiddenFields, UserSchema):
     _date_to = _date_from + timedelta(days=BaseFaker.random_int(min=30, max=365))
     _notes = BaseFaker.text(max_nb_chars=200)
 
+    return {
+        "first_name": "John",
+        "last_name": "Doe",
+        "email": "john@example.com",
+        "phone_number": "+123456789",
+        "identification_number": "123456789",
+        "gender": "male",
+        "date_of_birth": "1985-05-20",
+        "roles": [{"name": "string", "alias": "string", "description": "string"}],
+        "user_emergency_info": {
+            "emergency_contact_name": "Jane Doe",
+            "emergency_contact_email": "jane@example.com",
+            "emergency_contact_relation": "Spouse",
+            "emergency_contact_number": "+987654321",
+        },
+        "user_auth_info": {
+            "login_provider": "native",
+            "reset_token": "reset_test_token",
+            "verification_token": "abc123",
+            "is_disabled": False,
+            "is_verified": True,
+            "is_subscribed": True,
+            "is_subscribed_token": "sub_test_token",
+            "current_login_time": "2023-09-15T12:00:00",
+            "last_login_time": "2023-09-10T12:00:00",
+        },
+        "user_employer_info": {
+            "employer_name": "TechCorp",
+            "occupation_status": "Full-time",
+            "occupation_location": "New York",
+        },
+        "property_assignment": [
+            {
+                "property_unit_assoc_id": "402c0deb-b978-40d6-a269-c690cbd99589",
+                "assignment_type": _assignment_type[0],
+                "date_from": _date_from,
+                "date_to": _date_to,
+                "notes": _notes,
+            }
+        ],
+    }
+
+
+class UserUpdateSchema(UserHiddenFields, UserSchema):
+    user_auth_info: Optional[UserAuthInfo] = None
+    user_employer_info: Optional[UserEmployerInfo] = None
+    user_emergency_info: Optional[UserEmergencyInfo] = None
+
     model_config = ConfigDict(
         from_attributes=True,
         arbitrary_types_allowed=True,
         use_enum_values=True,
         # json_encoders={date: lambda v: v.strftime("%Y-%m-%d") if v else None},
-        json_schema_extra={
-            "example": {
-                "first_name": "John",
-                "last_name": "Doe",
-                "email": "john@example.com",
-                "phone_number": "+123456789",
-                "identification_number": "123456789",
-                "gender": "male",
-                "date_of_birth": "1985-05-20",
-                "roles": [
-                    {"name": "string", "alias": "string", "description": "string"}
-                ],
-                "user_emergency_info": {
-                    "emergency_contact_name": "Jane Doe",
-                    "emergency_contact_email": "jane@example.com",
-                    "emergency_contact_relation": "Spouse",
-                    "emergency_contact_number": "+987654321",
-                },
-                "user_auth_info": {
-                    "login_provider": "native",
-                    "reset_token": "reset_test_token",
-                    "verification_token": "abc123",
-                    "is_disabled": False,
-                    "is_verified": True,
-                    "is_subscribed": True,
-                    "is_subscribed_token": "sub_test_token",
-                    "current_login_time": "2023-09-15T12:00:00",
-                    "last_login_time": "2023-09-10T12:00:00",
-                },
-                "user_employer_info": {
-                    "employer_name": "TechCorp",
-                    "occupation_status": "Full-time",
-                    "occupation_location": "New York",
-                },
-                "property_assignment": [
-                    {
-                        "property_unit_assoc_id": "402c0deb-b978-40d6-a269-c690cbd99589",
-                        "assignment_type": _assignment_type[0],
-                        "date_from": _date_from,
-                        "date_to": _date_to,
-                        "notes": _notes,
-                    }
-                ],
-            }
-        },
+        json_schema_extra=lazy_example(_user_update_example),
     )
 
     @model_validator(mode="after")
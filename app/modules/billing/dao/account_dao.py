@@ -5,6 +5,7 @@ from app.modules.billing.models.account import Account
 
 # dao
 from app.modules.common.dao.base_dao import BaseDAO
+from app.modules.common.dao.dao_registry import dao_registry
 from app.modules.address.dao.address_dao import AddressDAO
 
 
@@ -12,7 +13,7 @@ class AccountDAO(BaseDAO[Account]):
     def __init__(self, excludes: Optional[List[str]] = [""]):
         self.model = Account
 
-        self.address_dao = AddressDAO()
+        self.address_dao = dao_registry.lazy(AddressDAO)
         self.detail_mappings = {
             "address": self.address_dao,
         }
@@ -1,14 +1,16 @@
 from uuid import UUID
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional, List
 from collections import defaultdict
-from sqlalchemy.orm import joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import and_, select, func, extract
 
 from app.core.response import DAOResponse
 from app.modules.common.dao.base_dao import BaseDAO
+from app.modules.common.dao.dao_registry import dao_registry
 from app.modules.billing.models.invoice import Invoice
+from app.modules.billing.models.invoice_rollup import InvoiceMonthlyRollup
+from app.modules.billing.models.receivable_due import ReceivableDue
 
 # dao
 from app.modules.billing.dao.invoice_item_dao import InvoiceItemDAO
@@ -19,11 +21,7 @@ from app.modules.billing.dao.invoice_item_dao import InvoiceItemDAO
 from app.core.errors import CustomException, IntegrityError, RecordNotFoundException
 from app.modules.billing.enums.billing_enums import PaymentStatusEnum
 from app.modules.billing.schema.invoice_schema import InvoiceResponse
-from app.modules.contract.enums.contract_enums import ContractStatusEnum
-from app.modules.contract.models.contract import Contract
-from app.modules.contract.models.contract_invoice import ContractInvoice
 from app.modules.contract.models.contract_type import ContractType
-from app.modules.contract.models.under_contract import UnderContract
 
 CONTRACT_LEASE = "lease"
 
@@ -32,7 +30,7 @@ class InvoiceDAO(BaseDAO[Invoice]):
     def __init__(self, excludes: Optional[List[str]] = None):
         self.model = Invoice
 
-        self.invoice_item_dao = InvoiceItemDAO()
+        self.invoice_item_dao = dao_registry.lazy(InvoiceItemDAO)
 
         self.detail_mappings = {
             "invoice_items": self.invoice_item_dao,
@@ -53,40 +51,43 @@ class InvoiceDAO(BaseDAO[Invoice]):
         offset=0,
         limit=100,
     ):
-        filters = {
-            "status": PaymentStatusEnum.pending.name,
-            "ContractType.contract_type_name": contract_type_name,
-            "Contract.contract_status": str(ContractStatusEnum.active.name),
-            "UnderContract.contract_status": str(ContractStatusEnum.active.name),
-        }
-
-        join_conditions = [
-            (ContractInvoice, ContractInvoice.invoice_number == Invoice.invoice_number),
-            (Contract, Contract.contract_id == ContractInvoice.contract_id),
-            (UnderContract, UnderContract.contract_id == Contract.contract_id),
-            (ContractType, ContractType.contract_type_id == Contract.contract_type_id),
-        ]
+        receivables = ReceivableDue
+        query = (
+            select(receivables.invoice_number, receivables.due_date)
+            .where(
+                receivables.status == PaymentStatusEnum.pending,
+                receivables.contract_type_id.in_(
+                    select(ContractType.contract_type_id).where(
+                        ContractType.contract_type_name == contract_type_name
+                    )
+                ),
+            )
+            .distinct()
+            .order_by(receivables.due_date, receivables.invoice_number)
+            .offset(offset)
+            .limit(limit)
+        )
 
         if user_id:
-            filters["UnderContract.client_id"] = UUID(user_id)
+            query = query.where(receivables.client_id == UUID(user_id))
 
-        options = [
-            joinedload(Invoice.contracts),
-            joinedload(Invoice.transaction),
-            joinedload(Invoice.invoice_items),
-        ]
-        query_result = await self.query_on_joins(
-            db_session=db_session,
-            filters=filters,
-            join_conditions=join_conditions,
-            options=options,
-            skip=offset,
-            limit=limit,
-        )
+        invoice_numbers = (await db_session.execute(query)).scalars().all()
+
+        # page of invoice numbers first, so the loaded relationships can't multiply rows
+        invoices = {}
+        if invoice_numbers:
+            result = await db_session.execute(
+                select(Invoice).where(Invoice.invoice_number.in_(invoice_numbers))
+            )
+            invoices = {r.invoice_number: r for r in result.scalars().all()}
 
         return DAOResponse[List[InvoiceResponse]](
             success=True,
-            data=[InvoiceResponse.from_orm_model(r) for r in query_result],
+            data=[
+                InvoiceResponse.model_validate(invoices[number])
+                for number in invoice_numbers
+                if number in invoices
+            ],
         )
 
     async def get_invoice_trends(
@@ -97,19 +98,24 @@ class InvoiceDAO(BaseDAO[Invoice]):
     ) -> dict:
         try:
             trends_data = {}
+            rollup = InvoiceMonthlyRollup
             print(f"Fetching invoice trends for month: {month}, year: {year}")
 
             # If month or year is specified, filter by specific month/year
             if month or year:
                 print(f"Filtering by specific month/year: month={month}, year={year}")
                 query = select(
-                    func.sum(self.model.invoice_amount).label("total_amount"),
-                    func.count(self.model.invoice_id).label("total_count"),
+                    func.sum(rollup.total_amount).label("total_amount"),
+                    func.sum(rollup.total_count).label("total_count"),
                 )
-                if month:
-                    query = query.where(extract("month", self.model.due_date) == month)
-                if year:
-                    query = query.where(extract("year", self.model.due_date) == year)
+                if month and year:
+                    query = query.where(rollup.month == date(year, month, 1))
+                elif year:
+                    query = query.where(
+                        rollup.month.between(date(year, 1, 1), date(year, 12, 1))
+                    )
+                else:
+                    query = query.where(extract("month", rollup.month) == month)
 
                 specific_result = await db_session.execute(query)
                 specific_data = specific_result.fetchone()
@@ -122,65 +128,45 @@ class InvoiceDAO(BaseDAO[Invoice]):
                     "year": year,
                 }
             else:
-                # Get total amount and count since inception
-                print("Querying total amount and count since inception")
-                total_query = select(
-                    func.sum(self.model.invoice_amount).label("total_amount"),
-                    func.count(self.model.invoice_id).label("total_count"),
-                )
-                total_result = await db_session.execute(total_query)
-                total_data = total_result.fetchone()
-                trends_data["total_since_inception"] = {
-                    "total_amount": float(total_data.total_amount)
-                    if total_data.total_amount
-                    else 0,
-                    "total_count": total_data.total_count or 0,
-                }
-
-                # Get month-by-month trends
+                # month-by-month rollups, the totals and yearly trends are summed from them
                 print("Querying month-by-month trends")
                 month_query = (
                     select(
-                        extract("year", self.model.due_date).label("year"),
-                        extract("month", self.model.due_date).label("month"),
-                        func.sum(self.model.invoice_amount).label("total_amount"),
-                        func.count(self.model.invoice_id).label("total_count"),
+                        rollup.month,
+                        func.sum(rollup.total_amount).label("total_amount"),
+                        func.sum(rollup.total_count).label("total_count"),
                     )
-                    .group_by("year", "month")
-                    .order_by("year", "month")
+                    .group_by(rollup.month)
+                    .order_by(rollup.month)
                 )
                 month_result = await db_session.execute(month_query)
                 month_trends = defaultdict(
                     lambda: defaultdict(lambda: {"total_amount": 0, "total_count": 0})
                 )
-
-                for yr, mo, total_amount, total_count in month_result:
-                    month_trends[int(yr)][int(mo)] = {
-                        "total_amount": float(total_amount) if total_amount else 0,
-                        "total_count": total_count or 0,
+                year_trends = defaultdict(lambda: {"total_amount": 0, "total_count": 0})
+                total_amount_all, total_count_all = 0, 0
+
+                for bucket, total_amount, total_count in month_result:
+                    total_amount = float(total_amount) if total_amount else 0
+                    total_count = total_count or 0
+                    if not total_count:
+                        continue
+
+                    month_trends[bucket.year][bucket.month] = {
+                        "total_amount": total_amount,
+                        "total_count": total_count,
                     }
-                trends_data["month_by_month"] = month_trends
+                    year_trends[bucket.year]["total_amount"] += total_amount
+                    year_trends[bucket.year]["total_count"] += total_count
+                    total_amount_all += total_amount
+                    total_count_all += total_count
 
-                # Get year-by-year trends
-                print("Querying year-by-year trends")
-                year_query = (
-                    select(
-                        extract("year", self.model.due_date).label("year"),
-                        func.sum(self.model.invoice_amount).label("total_amount"),
-                        func.count(self.model.invoice_id).label("total_count"),
-                    )
-                    .group_by("year")
-                    .order_by("year")
-                )
-                year_result = await db_session.execute(year_query)
-                year_trends = {
-                    int(yr): {
-                        "total_amount": float(total_amount) if total_amount else 0,
-                        "total_count": total_count or 0,
-                    }
-                    for yr, total_amount, total_count in year_result
+                trends_data["total_since_inception"] = {
+                    "total_amount": total_amount_all,
+                    "total_count": total_count_all,
                 }
-                trends_data["year_by_year"] = year_trends
+                trends_data["month_by_month"] = month_trends
+                trends_data["year_by_year"] = dict(year_trends)
 
             print(f"Final trends data: {trends_data}")
             return DAOResponse(success=True, data=trends_data)
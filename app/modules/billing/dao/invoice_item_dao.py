@@ -1,8 +1,12 @@
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # dao
 from app.modules.common.dao.base_dao import BaseDAO
 
+# core
+from app.core.errors import IntegrityError, UniqueViolationError
+
 # models
 from app.modules.billing.models.invoice_item import InvoiceItem
 
@@ -19,3 +23,23 @@ class InvoiceItemDAO(BaseDAO[InvoiceItem]):
             excludes=excludes or [],
             primary_key="invoice_item_id",
         )
+
+    async def create_many(
+        self, db_session: AsyncSession, items: List[Dict[str, Any]]
+    ) -> List[InvoiceItem]:
+        """
+        Creates the items in a single flush, so every affected invoice total is
+        recomputed once instead of once per item.
+        """
+        try:
+            db_objs = [self.model(**self.filter_input_fields(item)) for item in items]
+            db_session.add_all(db_objs)
+            await db_session.commit()
+
+            return db_objs
+        except IntegrityError as e:
+            await db_session.rollback()
+            raise UniqueViolationError(e)
+        except Exception as e:
+            await db_session.rollback()
+            raise Exception(str(e))
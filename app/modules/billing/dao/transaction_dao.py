@@ -11,6 +11,7 @@ from app.core.response import DAOResponse
 from app.modules.billing.enums.billing_enums import PaymentStatusEnum
 from app.modules.billing.models.invoice import Invoice
 from app.modules.common.dao.base_dao import BaseDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # models
 from app.modules.billing.models.transaction import Transaction
@@ -29,10 +30,10 @@ class TransactionDAO(BaseDAO[Transaction]):
         self.invoice_model = Invoice
 
         # DAOs for related entities
-        self.invoice_dao = InvoiceDAO()
-        self.payment_type_dao = PaymentTypeDAO()
-        self.transaction_type_dao = TransactionTypeDAO()
-        self.user_dao = UserDAO()
+        self.invoice_dao = dao_registry.lazy(InvoiceDAO)
+        self.payment_type_dao = dao_registry.lazy(PaymentTypeDAO)
+        self.transaction_type_dao = dao_registry.lazy(TransactionTypeDAO)
+        self.user_dao = dao_registry.lazy(UserDAO)
 
         # Detail mappings for creating related entities
         self.detail_mappings = {
@@ -2,6 +2,7 @@ from typing import Optional, List
 
 # daos
 from app.modules.common.dao.base_dao import BaseDAO
+from app.modules.common.dao.dao_registry import dao_registry
 from app.modules.resources.dao.media_dao import MediaDAO
 
 # models
@@ -12,7 +13,7 @@ class UtilityDAO(BaseDAO[Utilities]):
     def __init__(self, excludes: Optional[List[str]] = []):
         self.model = Utilities
 
-        self.media_dao = MediaDAO()
+        self.media_dao = dao_registry.lazy(MediaDAO)
         self.detail_mappings = {"media": self.media_dao}
 
         super().__init__(
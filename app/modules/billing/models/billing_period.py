@@ -0,0 +1,22 @@
+import uuid
+from datetime import date
+from sqlalchemy import Date, String, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+# models
+from app.modules.common.models.model_base import BaseModel as Base
+
+
+class ContractBillingPeriod(Base):
+    """
+    Billing run claims: one row per contract and billed period, written in the same
+    transaction as the period's invoice, so a rerun (or a concurrent run) of the same
+    period skips the contract instead of billing it twice.
+    """
+
+    __tablename__ = "contract_billing_period"
+
+    contract_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    # first day of the billed period
+    period_start: Mapped[date] = mapped_column(Date, primary_key=True)
+    invoice_number: Mapped[str] = mapped_column(String(128))
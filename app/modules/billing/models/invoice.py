@@ -1,13 +1,14 @@
 import uuid
 import pytz
 from datetime import datetime
-from importlib import import_module
-from sqlalchemy.orm import relationship, Session, Mapped, mapped_column
+from typing import Optional
+from sqlalchemy.orm import relationship, object_session, Session, Mapped, mapped_column
 from sqlalchemy import (
     Numeric,
     ForeignKey,
     DateTime,
     Enum,
+    Index,
     String,
     Text,
     UUID,
@@ -16,7 +17,9 @@ from sqlalchemy import (
 )
 
 # models
+from app.db.dbSequence import NumberSequence
 from app.modules.common.models.model_base import BaseModel as Base
+from app.modules.billing.models.receivable_due import mark_receivables_due
 
 # enums
 from app.modules.billing.enums.billing_enums import PaymentStatusEnum, InvoiceTypeEnum
@@ -45,18 +48,21 @@ class Invoice(Base):
         ForeignKey("users.user_id", use_alter=True, name="fk_invoice_issued_to"),
     )
     invoice_details: Mapped[str] = mapped_column(Text)
-    invoice_amount: Mapped[float] = mapped_column(Numeric(10, 2))
+    # active_history: the monthly rollups need the previous value on updates
+    invoice_amount: Mapped[float] = mapped_column(Numeric(10, 2), active_history=True)
     due_date: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(pytz.utc)
+        DateTime(timezone=True),
+        default=lambda: datetime.now(pytz.utc),
+        active_history=True,
     )
     date_paid: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(pytz.utc)
     )
     invoice_type: Mapped[InvoiceTypeEnum] = mapped_column(
-        Enum(InvoiceTypeEnum), default=InvoiceTypeEnum.general
+        Enum(InvoiceTypeEnum), default=InvoiceTypeEnum.general, active_history=True
     )
     status: Mapped[PaymentStatusEnum] = mapped_column(
-        Enum(PaymentStatusEnum), default=PaymentStatusEnum.pending
+        Enum(PaymentStatusEnum), default=PaymentStatusEnum.pending, active_history=True
     )
     transaction_number: Mapped[str] = mapped_column(
         String(128),
@@ -64,6 +70,8 @@ class Invoice(Base):
         nullable=True,
     )
 
+    __table_args__ = (Index("ix_invoice_status_due_date", "status", "due_date"),)
+
     # contracts
     contracts: Mapped[list["Contract"]] = relationship(
         "Contract", secondary="contract_invoice", back_populates="invoices"
@@ -102,23 +110,23 @@ class Invoice(Base):
     )
 
 
+# collision-free numbers, allocated in blocks from a db sequence
+INVOICE_NUMBERS = NumberSequence(
+    "invoice_number_seq", Invoice.INVOICE_PREFIX, "invoice.invoice_number"
+)
+
+
 @event.listens_for(Invoice, "before_insert")
 def receive_before_insert(mapper, connection, target):
     if not target.invoice_number:
-        current_time_str = datetime.now().strftime("%Y%m%d%H%M%S")
-        target.invoice_number = f"{Invoice.INVOICE_PREFIX}{current_time_str}"
+        target.invoice_number = INVOICE_NUMBERS.next(connection)
 
 
-@event.listens_for(Invoice, "after_insert")
-def receive_after_insert(mapper, connection, target):
-    if not target.invoice_number:
-        current_time_str = datetime.now().strftime("%Y%m%d%H%M%S")
-        target.invoice_number = f"{Invoice.INVOICE_PREFIX}{current_time_str}"
-        connection.execute(
-            target.__table__.update()
-            .where(target.__table__.c.invoice_id == target.invoice_id)
-            .values(invoice_number=target.invoice_number)
-        )
+def mark_invoice_totals(session: Optional[Session], *invoice_numbers: str):
+    """Queues the invoices for the set-based total recompute at the end of the flush."""
+    if session is not None:
+        pending = session.info.setdefault("invoice_totals", set())
+        pending.update(number for number in invoice_numbers if number)
 
 
 @event.listens_for(Invoice, "after_insert")
@@ -127,33 +135,92 @@ def update_invoice_amount(mapper, connection, target):
     state = inspect(target)
 
     if state.attrs.invoice_amount.history.has_changes():
-        total_amount = sum(item.total_price for item in target.invoice_items)
-        connection.execute(
-            target.__table__.update()
-            .where(target.__table__.c.invoice_id == target.invoice_id)
-            .values(invoice_amount=total_amount)
-        )
+        mark_invoice_totals(object_session(target), target.invoice_number)
+
 
-        # update transaction model
-        models_module = import_module("app.modules.billing.models.transaction")
-        transaction_model = getattr(models_module, "Transaction")
+# columns of the monthly rollup buckets / sums
+ROLLUP_ATTRS = ("due_date", "status", "invoice_type", "invoice_amount")
 
-        session = Session(connection)
 
-        # Query the Transaction model to find the related invoice
-        transaction = (
-            session.query(transaction_model)
-            .filter_by(invoice_number=target.invoice_number)
-            .first()
+def invoice_rollup_state(target: Invoice, previous: bool = False) -> tuple:
+    """(due_date, status, invoice_type, invoice_amount), as loaded if `previous`."""
+    state = inspect(target)
+    values = []
+    for key in ROLLUP_ATTRS:
+        history = state.attrs[key].history
+        if previous and history.deleted:
+            values.append(history.deleted[0])
+        else:
+            values.append(getattr(target, key))
+    return tuple(values)
+
+
+def queue_invoice_rollup(target: Invoice, *changes: tuple):
+    """Queues (invoice state, +1/-1) changes for the rollup upsert at the end of the flush."""
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault("invoice_rollup", []).extend(changes)
+
+
+@event.listens_for(Invoice, "after_insert")
+def rollup_after_insert(mapper, connection, target):
+    queue_invoice_rollup(target, (invoice_rollup_state(target), 1))
+
+
+@event.listens_for(Invoice, "after_update")
+def rollup_after_update(mapper, connection, target):
+    state = inspect(target)
+
+    if any(state.attrs[key].history.has_changes() for key in ROLLUP_ATTRS):
+        queue_invoice_rollup(
+            target,
+            (invoice_rollup_state(target, previous=True), -1),
+            (invoice_rollup_state(target), 1),
         )
 
-        if transaction:
-            # Update the transaction_amount on the Transaction
-            transaction.transaction_amount = target.invoice_amount
 
-            # Commit the changes to the database
-            session.commit()
-        session.close()
+@event.listens_for(Invoice, "after_delete")
+def rollup_after_delete(mapper, connection, target):
+    queue_invoice_rollup(target, (invoice_rollup_state(target, previous=True), -1))
+
+
+@event.listens_for(Invoice, "after_insert")
+@event.listens_for(Invoice, "after_update")
+def sync_receivables_due(mapper, connection, target):
+    state = inspect(target)
+
+    if any(
+        state.attrs[key].history.has_changes()
+        for key in ("due_date", "status", "contracts")
+    ):
+        mark_receivables_due(object_session(target), [target.invoice_number])
+
+
+@event.listens_for(Invoice, "after_delete")
+def drop_receivables_due(mapper, connection, target):
+    mark_receivables_due(object_session(target), [target.invoice_number])
+
+
+@event.listens_for(Session, "after_flush")
+def recompute_invoice_totals(session: Session, flush_context):
+    """One recompute per flush for every invoice touched by it."""
+    invoice_numbers = session.info.pop("invoice_totals", None)
+
+    if invoice_numbers:
+        from app.services.invoice_totals_service import invoice_totals_service
+
+        invoice_totals_service.recompute(session.connection(), session, invoice_numbers)
+
+
+@event.listens_for(Session, "after_flush")
+def apply_invoice_rollups(session: Session, flush_context):
+    """One rollup upsert per flush for every invoice written by it."""
+    changes = session.info.pop("invoice_rollup", None)
+
+    if changes:
+        from app.services.invoice_rollup_service import invoice_rollup_service
+
+        invoice_rollup_service.apply(session.connection(), changes)
 
 
 def parse_dates(mapper, connection, target):
@@ -1,11 +1,11 @@
 import uuid
 from typing import Optional
-from importlib import import_module
-from sqlalchemy.orm import relationship, Session, Mapped, mapped_column
+from sqlalchemy.orm import relationship, object_session, Mapped, mapped_column
 from sqlalchemy import String, event, Integer, Numeric, ForeignKey, UUID, inspect
 
 # models
 from app.modules.common.models.model_base import BaseModel as Base
+from app.modules.billing.models.invoice import mark_invoice_totals
 
 
 class InvoiceItem(Base):
@@ -50,31 +50,12 @@ def calculate_total_price(mapper, connection, target: InvoiceItem):
 @event.listens_for(InvoiceItem, "after_update")
 @event.listens_for(InvoiceItem, "after_delete")
 def update_invoice_after_item_change(mapper, connection, target: InvoiceItem):
-    state = inspect(target)
-
-    if state.attrs.total_price.history.has_changes():
-        session = Session(connection)
-        target.total_price = target.unit_price * target.quantity
+    # a moved item also changes the total of its previous invoice
+    history = inspect(target).attrs.invoice_number.history
 
-        # update the invoice amount when an invoice item is added, updated, or deleted
-        models_module = import_module("app.modules.billing.models.invoice")
-        invoice_model = getattr(models_module, "Invoice")
-
-        invoice = (
-            session.query(invoice_model)
-            .filter_by(invoice_number=target.invoice_number)
-            .first()
-        )
-
-        if invoice:
-            total_amount = sum(item.total_price for item in invoice.invoice_items)
-            connection.execute(
-                invoice.__table__.update()
-                .where(invoice.__table__.c.invoice_number == invoice.invoice_number)
-                .values(invoice_amount=total_amount)
-            )
-            session.commit()
-        session.close()
+    mark_invoice_totals(
+        object_session(target), target.invoice_number, *(history.deleted or [])
+    )
 
 
 # register model
@@ -0,0 +1,29 @@
+from datetime import date
+from sqlalchemy import Date, Enum, Integer, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+
+# models
+from app.modules.common.models.model_base import BaseModel as Base
+
+# enums
+from app.modules.billing.enums.billing_enums import PaymentStatusEnum, InvoiceTypeEnum
+
+
+class InvoiceMonthlyRollup(Base):
+    """
+    Invoice totals per due month (in settings.INVOICE_TRENDS_TIMEZONE), status and
+    invoice type. Maintained by InvoiceRollupService on every invoice write.
+    """
+
+    __tablename__ = "invoice_monthly_rollup"
+
+    # first day of the due month
+    month: Mapped[date] = mapped_column(Date, primary_key=True)
+    status: Mapped[PaymentStatusEnum] = mapped_column(
+        Enum(PaymentStatusEnum), primary_key=True
+    )
+    invoice_type: Mapped[InvoiceTypeEnum] = mapped_column(
+        Enum(InvoiceTypeEnum), primary_key=True
+    )
+    total_amount: Mapped[float] = mapped_column(Numeric(14, 2), default=0)
+    total_count: Mapped[int] = mapped_column(Integer, default=0)
@@ -0,0 +1,69 @@
+import uuid
+from datetime import datetime
+from typing import Iterable, Optional
+from sqlalchemy import DateTime, Enum, Index, Integer, String, UUID, event
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+# models
+from app.modules.common.models.model_base import BaseModel as Base
+
+# enums
+from app.modules.billing.enums.billing_enums import PaymentStatusEnum
+
+
+class ReceivableDue(Base):
+    """
+    One row per invoice and client of an active contract (active contract and active
+    under_contract), with the invoice's due date and status copied in. Serves the
+    leases due endpoints with a single index scan; maintained by ReceivablesService
+    on invoice, contract, contract_invoice and under_contract writes.
+    """
+
+    __tablename__ = "receivables_due"
+
+    invoice_number: Mapped[str] = mapped_column(String(128), primary_key=True)
+    under_contract_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True
+    )
+    contract_number: Mapped[str] = mapped_column(String(128), index=True)
+    contract_type_id: Mapped[int] = mapped_column(Integer)
+    client_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=True)
+    due_date: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    status: Mapped[PaymentStatusEnum] = mapped_column(Enum(PaymentStatusEnum))
+
+    __table_args__ = (
+        # user_lease_due
+        Index(
+            "ix_receivables_due_client_id_due_date_status",
+            "client_id",
+            "due_date",
+            "status",
+        ),
+        # all_lease_due
+        Index("ix_receivables_due_status_due_date", "status", "due_date"),
+    )
+
+
+def mark_receivables_due(
+    session: Optional[Session],
+    invoice_numbers: Iterable[str] = (),
+    contract_numbers: Iterable[str] = (),
+):
+    """Queues invoices/contracts for the receivables refresh at the end of the flush."""
+    if session is not None:
+        pending = session.info.setdefault(
+            "receivables_due", {"invoice_numbers": set(), "contract_numbers": set()}
+        )
+        pending["invoice_numbers"].update(n for n in invoice_numbers if n)
+        pending["contract_numbers"].update(n for n in contract_numbers if n)
+
+
+@event.listens_for(Session, "after_flush")
+def refresh_receivables_due(session: Session, flush_context):
+    """One refresh per flush for every invoice/contract touched by it."""
+    pending = session.info.pop("receivables_due", None)
+
+    if pending:
+        from app.services.receivables_service import receivables_service
+
+        receivables_service.refresh(session.connection(), **pending)
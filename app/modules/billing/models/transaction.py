@@ -2,11 +2,12 @@ import uuid
 import pytz
 from datetime import datetime
 from importlib import import_module
-from sqlalchemy.orm import relationship, Session, Mapped, mapped_column
+from sqlalchemy.orm import relationship, object_session, Mapped, mapped_column
 from sqlalchemy import (
     ForeignKey,
     DateTime,
     Enum,
+    Index,
     Integer,
     Numeric,
     String,
@@ -20,6 +21,7 @@ from sqlalchemy import (
 from app.modules.billing.enums.billing_enums import PaymentStatusEnum
 
 # models
+from app.db.dbSequence import NumberSequence
 from app.modules.common.models.model_base import BaseModel as Base
 from app.modules.common.models.model_base_collection import BaseModelCollection
 
@@ -68,9 +70,11 @@ class Transaction(Base):
     )
     transaction_amount: Mapped[float] = mapped_column(Numeric(10, 2), default=0)
 
+    __table_args__ = (Index("ix_transaction_transaction_date", "transaction_date"),)
+
     # payment_type
     payment_type: Mapped["PaymentType"] = relationship(
-        "PaymentType", back_populates="transactions", lazy="selectin"
+        "PaymentType", back_populates="transactions", lazy="select"
     )
 
     # transaction_type
@@ -102,23 +106,16 @@ class Transaction(Base):
     )
 
 
-@event.listens_for(Transaction, "before_insert")
-def receive_before_insert(mapper, connection, target):
-    if not target.transaction_number:
-        current_time_str = datetime.now().strftime("%Y%m%d%H%M%S")
-        target.transaction_number = f"{Transaction.TRN_PREFIX}{current_time_str}"
+# collision-free numbers, allocated in blocks from a db sequence
+TRANSACTION_NUMBERS = NumberSequence(
+    "transaction_number_seq", Transaction.TRN_PREFIX, "transaction.transaction_number"
+)
 
 
-@event.listens_for(Transaction, "after_insert")
-def receive_after_insert(mapper, connection, target):
+@event.listens_for(Transaction, "before_insert")
+def receive_before_insert(mapper, connection, target):
     if not target.transaction_number:
-        current_time_str = datetime.now().strftime("%Y%m%d%H%M%S")
-        target.transaction_number = f"{Transaction.TRN_PREFIX}{current_time_str}"
-        connection.execute(
-            target.__table__.update()
-            .where(target.__table__.c.transaction_id == target.transaction_id)
-            .values(transaction_number=target.transaction_number)
-        )
+        target.transaction_number = TRANSACTION_NUMBERS.next(connection)
 
 
 @event.listens_for(Transaction, "after_update")
@@ -129,24 +126,19 @@ def update_transaction_number_on_invoice(mapper, connection, target):
     if state.attrs.invoice_number.history.has_changes():
         models_module = import_module("app.modules.billing.models.invoice")
         invoice_model = getattr(models_module, "Invoice")
+        invoice_table = invoice_model.__table__
 
-        # session = Session.object_session(target)  # Get the current session
-        session = Session(connection)
-        # Query the Invoice model to find the related invoice
-        invoice = (
-            session.query(invoice_model)
-            .filter_by(invoice_number=target.invoice_number)
-            .first()
+        # link the invoice back to the transaction
+        connection.execute(
+            invoice_table.update()
+            .where(invoice_table.c.invoice_number == target.invoice_number)
+            .values(transaction_number=target.transaction_number)
         )
 
-        if invoice:
-            # Update the transaction_number on the Invoice
-            invoice.transaction_number = target.transaction_number
-            target.transaction_amount = invoice.invoice_amount
-
-            # Commit the changes to the database
-            session.commit()
-        session.close()
+        # transaction_amount follows the invoice total, set at the end of the flush
+        models_module.mark_invoice_totals(
+            object_session(target), target.invoice_number
+        )
 
 
 # register model
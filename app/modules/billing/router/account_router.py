@@ -2,6 +2,7 @@ from typing import List
 
 # dao
 from app.modules.billing.dao.account_dao import AccountDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # router
 from app.modules.common.router.base_router import BaseCRUDRouter
@@ -18,7 +19,7 @@ class AccountRouter(BaseCRUDRouter):
     def __init__(self, prefix: str = "", tags: List[str] = []):
         AccountSchema["create_schema"] = AccountCreateSchema
         AccountSchema["update_schema"] = AccountUpdateSchema
-        self.dao: AccountDAO = AccountDAO(excludes=["users"])
+        self.dao: AccountDAO = dao_registry.get(AccountDAO, excludes=["users"])
 
         super().__init__(dao=self.dao, schemas=AccountSchema, prefix=prefix, tags=tags)
         self.register_routes()
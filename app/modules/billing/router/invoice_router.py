@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.response import DAOResponse
 from app.modules.common.router.base_router import BaseCRUDRouter
 from app.modules.billing.dao.invoice_dao import InvoiceDAO
+from app.modules.common.dao.dao_registry import dao_registry
 from app.modules.billing.schema.invoice_schema import (
     InvoiceCreateSchema,
     InvoiceUpdateSchema,
@@ -21,7 +22,7 @@ from app.core.lifespan import get_db
 
 class InvoiceRouter(BaseCRUDRouter):
     def __init__(self, prefix: str = "", tags: List[str] = []):
-        self.dao = InvoiceDAO()
+        self.dao = dao_registry.get(InvoiceDAO)
         InvoiceSchema["create_schema"] = InvoiceCreateSchema
         InvoiceSchema["update_schema"] = InvoiceUpdateSchema
 
@@ -2,6 +2,7 @@ from typing import List
 
 # DAO
 from app.modules.billing.dao.payment_type_dao import PaymentTypeDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # Router
 from app.modules.common.router.base_router import BaseCRUDRouter
@@ -19,7 +20,7 @@ class PaymentTypeRouter(BaseCRUDRouter):
         # Assign schemas for CRUD operations
         PaymentTypeSchema["create_schema"] = PaymentTypeCreateSchema
         PaymentTypeSchema["update_schema"] = PaymentTypeUpdateSchema
-        self.dao: PaymentTypeDAO = PaymentTypeDAO()
+        self.dao: PaymentTypeDAO = dao_registry.get(PaymentTypeDAO)
 
         # Call the base class constructor
         super().__init__(
@@ -9,6 +9,7 @@ from fastapi import Depends, Query
 # dao
 from app.core.response import DAOResponse
 from app.modules.billing.dao.transaction_dao import TransactionDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # router
 from app.modules.billing.enums.billing_enums import PaymentStatusEnum
@@ -28,7 +29,7 @@ from app.core.lifespan import get_db
 
 class TransactionRouter(BaseCRUDRouter):
     def __init__(self, prefix: str = "", tags: List[str] = []):
-        self.dao: TransactionDAO = TransactionDAO(excludes=[])
+        self.dao: TransactionDAO = dao_registry.get(TransactionDAO, excludes=[])
         TransactionSchema["create_schema"] = TransactionCreateSchema
         TransactionSchema["update_schema"] = TransactionUpdateSchema
         TransactionSchema["response_schema"] = TransactionResponse
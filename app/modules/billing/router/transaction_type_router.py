@@ -2,6 +2,7 @@ from typing import List
 
 # DAO
 from app.modules.billing.dao.transaction_type_dao import TransactionTypeDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # Router
 from app.modules.common.router.base_router import BaseCRUDRouter
@@ -19,7 +20,7 @@ class TransactionTypeRouter(BaseCRUDRouter):
         # Assign schemas for CRUD operations
         TransactionTypeSchema["create_schema"] = TransactionTypeCreateSchema
         TransactionTypeSchema["update_schema"] = TransactionTypeUpdateSchema
-        self.dao: TransactionTypeDAO = TransactionTypeDAO()
+        self.dao: TransactionTypeDAO = dao_registry.get(TransactionTypeDAO)
 
         # Call the base class constructor
         super().__init__(
@@ -2,6 +2,7 @@ from typing import List
 
 # dao
 from app.modules.billing.dao.utility_dao import UtilityDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # router
 from app.modules.common.router.base_router import BaseCRUDRouter
@@ -18,7 +19,7 @@ class UtilityRouter(BaseCRUDRouter):
     def __init__(self, prefix: str = "", tags: List[str] = []):
         UtilitiesSchema["create_schema"] = UtilityCreateSchema
         UtilitiesSchema["update_schema"] = UtilityUpdateSchema
-        self.dao: UtilityDAO = UtilityDAO(excludes=[])
+        self.dao: UtilityDAO = dao_registry.get(UtilityDAO, excludes=[])
 
         super().__init__(dao=self.dao, schemas=UtilitiesSchema, prefix=prefix, tags=tags)
         self.register_routes()
@@ -3,7 +3,7 @@ from typing import Optional
 from pydantic import ConfigDict
 
 # schemas
-from app.modules.common.schema.base_schema import BaseFaker
+from app.modules.common.schema.base_schema import BaseFaker, lazy_example
 from app.modules.billing.schema.mixins.billable_mixin import (
     BillableBase,
     EntityBillable,
@@ -19,16 +19,15 @@ class BillableCreateSchema(BillableBase):
     billable_assoc_id: Optional[UUID] = None
     billable_type: str
 
-    # Faker attributes
-    _billable_type = BaseFaker.random_element(["service", "product", "subscription"])
-
     model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
+        json_schema_extra=lazy_example(
+            lambda: {
                 "billable_assoc_id": str(BaseFaker.uuid4()),
-                "billable_type": _billable_type,
+                "billable_type": BaseFaker.random_element(
+                    ["service", "product", "subscription"]
+                ),
             }
-        }
+        )
     )
 
 
@@ -36,16 +35,15 @@ class BillableUpdateSchema(BillableBase):
     billable_assoc_id: Optional[UUID] = None
     billable_type: Optional[str]
 
-    # Faker attributes
-    _billable_type = BaseFaker.random_element(["service", "product", "subscription"])
-
     model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
+        json_schema_extra=lazy_example(
+            lambda: {
                 "billable_assoc_id": str(BaseFaker.uuid4()),
-                "billable_type": _billable_type,
+                "billable_type": BaseFaker.random_element(
+                    ["service", "product", "subscription"]
+                ),
             }
-        }
+        )
     )
 
 
@@ -53,42 +51,36 @@ class BillableResponseSchema(BillableBase):
     billable_assoc_id: Optional[UUID] = None
     billable_type: str
 
-    # Faker attributes
-    _billable_type = BaseFaker.random_element(["service", "product", "subscription"])
-
     model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
+        json_schema_extra=lazy_example(
+            lambda: {
                 "billable_assoc_id": str(BaseFaker.uuid4()),
-                "billable_type": _billable_type,
+                "billable_type": BaseFaker.random_element(
+                    ["service", "product", "subscription"]
+                ),
             }
-        }
+        )
     )
 
     class EntityBillableCreateSchema(EntityBillable):
-        # Faker attributes
-        _entity_type = BaseFaker.random_element(
-            ["company", "individual", "organization"]
-        )
-        _billable_type = BaseFaker.random_element(
-            ["service", "product", "subscription"]
-        )
-        _billable_amount = BaseFaker.random_int(min=100, max=10000)
-
         model_config = ConfigDict(
-            json_schema_extra={
-                "example": {
+            json_schema_extra=lazy_example(
+                lambda: {
                     "payment_type_id": BaseFaker.random_int(min=1, max=5),
                     "entity_id": str(BaseFaker.uuid4()),
-                    "entity_type": _entity_type,
+                    "entity_type": BaseFaker.random_element(
+                        ["company", "individual", "organization"]
+                    ),
                     "billable_id": str(BaseFaker.uuid4()),
-                    "billable_type": _billable_type,
-                    "billable_amount": _billable_amount,
+                    "billable_type": BaseFaker.random_element(
+                        ["service", "product", "subscription"]
+                    ),
+                    "billable_amount": BaseFaker.random_int(min=100, max=10000),
                     "apply_to_units": BaseFaker.boolean(),
                     "start_period": BaseFaker.date_this_year(),
                     "end_period": BaseFaker.future_date(),
                 }
-            }
+            )
         )
 
         @classmethod
@@ -106,24 +98,24 @@ class BillableResponseSchema(BillableBase):
 
 
 class EntityBillableUpdateSchema(EntityBillable):
-    _entity_type = BaseFaker.random_element(["company", "individual", "organization"])
-    _billable_type = BaseFaker.random_element(["service", "product", "subscription"])
-    _billable_amount = BaseFaker.random_int(min=100, max=10000)
-
     model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
+        json_schema_extra=lazy_example(
+            lambda: {
                 "payment_type_id": BaseFaker.random_int(min=1, max=5),
                 "entity_id": str(BaseFaker.uuid4()),
-                "entity_type": _entity_type,
+                "entity_type": BaseFaker.random_element(
+                    ["company", "individual", "organization"]
+                ),
                 "billable_id": str(BaseFaker.uuid4()),
-                "billable_type": _billable_type,
-                "billable_amount": _billable_amount,
+                "billable_type": BaseFaker.random_element(
+                    ["service", "product", "subscription"]
+                ),
+                "billable_amount": BaseFaker.random_int(min=100, max=10000),
                 "apply_to_units": BaseFaker.boolean(),
                 "start_period": BaseFaker.date_this_year(),
                 "end_period": BaseFaker.future_date(),
             }
-        }
+        )
     )
 
     @classmethod
@@ -141,24 +133,24 @@ class EntityBillableUpdateSchema(EntityBillable):
 
 
 class EntityBillableResponseSchema(EntityBillable):
-    _entity_type = BaseFaker.random_element(["company", "individual", "organization"])
-    _billable_type = BaseFaker.random_element(["service", "product", "subscription"])
-    _billable_amount = BaseFaker.random_int(min=100, max=10000)
-
     model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
+        json_schema_extra=lazy_example(
+            lambda: {
                 "payment_type_id": BaseFaker.random_int(min=1, max=5),
                 "entity_id": str(BaseFaker.uuid4()),
-                "entity_type": _entity_type,
+                "entity_type": BaseFaker.random_element(
+                    ["company", "individual", "organization"]
+                ),
                 "billable_id": str(BaseFaker.uuid4()),
-                "billable_type": _billable_type,
-                "billable_amount": _billable_amount,
+                "billable_type": BaseFaker.random_element(
+                    ["service", "product", "subscription"]
+                ),
+                "billable_amount": BaseFaker.random_int(min=100, max=10000),
                 "apply_to_units": BaseFaker.boolean(),
                 "start_period": BaseFaker.date_this_year(),
                 "end_period": BaseFaker.future_date(),
             }
-        }
+        )
     )
 
     @classmethod
@@ -3,6 +3,7 @@ from typing import Optional
 from pydantic import ConfigDict
 
 # schemas
+from app.modules.common.schema.base_schema import lazy_example
 from app.modules.billing.schema.mixins.invoice_item_mixin import (
     InvoiceItemBase,
     InvoiceItemMixin,
@@ -15,7 +16,9 @@ from app.modules.billing.models.invoice_item import InvoiceItem as InvoiceItemMo
 class InvoiceItemCreateSchema(InvoiceItemBase, InvoiceItemMixin):
     model_config = ConfigDict(
         from_attributes=True,
-        json_schema_extra={"example": InvoiceItemMixin._invoice_create_json},
+        json_schema_extra=lazy_example(
+            InvoiceItemMixin._examples, "_invoice_create_json"
+        ),
     )
 
 
@@ -29,7 +32,9 @@ class InvoiceItemUpdateSchema(InvoiceItemBase, InvoiceItemMixin):
 
     model_config = ConfigDict(
         from_attributes=True,
-        json_schema_extra={"example": InvoiceItemMixin._invoice_update_json},
+        json_schema_extra=lazy_example(
+            InvoiceItemMixin._examples, "_invoice_update_json"
+        ),
     )
 
 
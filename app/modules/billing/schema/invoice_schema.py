@@ -8,6 +8,7 @@ from app.modules.billing.enums.billing_enums import PaymentStatusEnum, InvoiceTy
 
 # schema
 from app.modules.auth.schema.mixins.user_mixin import UserBase, UserBaseMixin
+from app.modules.common.schema.base_schema import lazy_example
 from app.modules.billing.schema.mixins.invoice_mixin import (
     Invoice,
     InvoiceBase,
@@ -28,7 +29,7 @@ class InvoiceCreateSchema(Invoice, InvoiceInfoMixin, UserBaseMixin):
     invoice_items: Optional[List[InvoiceItemBase]] = []
 
     model_config = ConfigDict(
-        json_schema_extra={"example": InvoiceInfoMixin._invoice_create_json},
+        json_schema_extra=lazy_example(InvoiceInfoMixin._examples, "_invoice_create_json"),
     )
 
     @classmethod
@@ -64,7 +65,7 @@ class InvoiceUpdateSchema(Invoice, InvoiceInfoMixin, UserBaseMixin):
     invoice_number: Optional[str] = None
 
     model_config = ConfigDict(
-        json_schema_extra={"example": InvoiceInfoMixin._invoice_update_json},
+        json_schema_extra=lazy_example(InvoiceInfoMixin._examples, "_invoice_update_json"),
     )
 
     @classmethod
@@ -97,7 +98,7 @@ class InvoiceResponse(Invoice, InvoiceInfoMixin, UserBaseMixin):
     invoice_items: Optional[List[InvoiceItem]] = []
 
     model_config = ConfigDict(
-        json_schema_extra={"example": InvoiceInfoMixin._invoice_create_json},
+        json_schema_extra=lazy_example(InvoiceInfoMixin._examples, "_invoice_create_json"),
     )
 
     @classmethod
@@ -1,6 +1,6 @@
 from uuid import UUID
 from decimal import Decimal
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 # schema
 from app.modules.common.schema.base_schema import BaseFaker, BaseSchema
@@ -24,27 +24,35 @@ class InvoiceItem(InvoiceItemBase):
 
 
 class InvoiceItemMixin:
-    _quantity = BaseFaker.random_int(min=1, max=100)
-    _unit_price = round(BaseFaker.random_number(digits=5), 2)
-    _description = BaseFaker.text(max_nb_chars=200)
+    @staticmethod
+    def _examples() -> Dict[str, Any]:
+        """OpenAPI example payloads, built only when the schema is requested."""
+        _quantity = BaseFaker.random_int(min=1, max=100)
+        _unit_price = round(BaseFaker.random_number(digits=5), 2)
+        _description = BaseFaker.text(max_nb_chars=200)
 
-    _invoice_create_json = {
-        "invoice_number": f"INV{BaseFaker.random_number(digits=8)}",
-        "quantity": _quantity,
-        "unit_price": _unit_price,
-        "total_price": _quantity * _unit_price,
-        "description": _description,
-        "reference_id": str(BaseFaker.uuid4()),
-    }
+        _invoice_create_json = {
+            "invoice_number": f"INV{BaseFaker.random_number(digits=8)}",
+            "quantity": _quantity,
+            "unit_price": _unit_price,
+            "total_price": _quantity * _unit_price,
+            "description": _description,
+            "reference_id": str(BaseFaker.uuid4()),
+        }
 
-    _invoice_update_json = {
-        "invoice_number": f"INV{BaseFaker.random_number(digits=8)}",
-        "quantity": _quantity,
-        "unit_price": _unit_price,
-        "total_price": _quantity * _unit_price,
-        "description": _description,
-        "reference_id": str(BaseFaker.uuid4()),
-    }
+        _invoice_update_json = {
+            "invoice_number": f"INV{BaseFaker.random_number(digits=8)}",
+            "quantity": _quantity,
+            "unit_price": _unit_price,
+            "total_price": _quantity * _unit_price,
+            "description": _description,
+            "reference_id": str(BaseFaker.uuid4()),
+        }
+
+        return {
+            "_invoice_create_json": _invoice_create_json,
+            "_invoice_update_json": _invoice_update_json,
+        }
 
     @classmethod
     def get_invoice_item_info(
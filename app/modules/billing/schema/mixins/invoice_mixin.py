@@ -1,6 +1,6 @@
 from uuid import UUID
 from datetime import datetime
-from typing import Any, Optional, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 # enums
 from app.modules.billing.enums.billing_enums import PaymentStatusEnum, InvoiceTypeEnum
@@ -33,64 +33,75 @@ class Invoice(InvoiceBase):
 
 
 class InvoiceInfoMixin:
-    _issued_by = str(BaseFaker.uuid4())
-    _issued_to = str(BaseFaker.uuid4())
-    _invoice_details = BaseFaker.text(max_nb_chars=200)
-    _due_date = BaseFaker.future_datetime()
-    _invoice_type = BaseFaker.random_element([e.value for e in InvoiceTypeEnum])
-    _status = BaseFaker.random_element([e.value for e in PaymentStatusEnum])
-    _date_paid = BaseFaker.date_time_this_year()
+    @staticmethod
+    def _examples() -> Dict[str, Any]:
+        """OpenAPI example payloads, built only when the schema is requested."""
+        _issued_by = str(BaseFaker.uuid4())
+        _issued_to = str(BaseFaker.uuid4())
+        _invoice_details = BaseFaker.text(max_nb_chars=200)
+        _due_date = BaseFaker.future_datetime()
+        _invoice_type = BaseFaker.random_element([e.value for e in InvoiceTypeEnum])
+        _status = BaseFaker.random_element([e.value for e in PaymentStatusEnum])
+        _date_paid = BaseFaker.date_time_this_year()
 
-    _invoice_create_json = {
-        "issued_by": _issued_by,
-        "issued_to": _issued_to,
-        "invoice_details": _invoice_details,
-        "due_date": _due_date.isoformat(),
-        "date_paid": _due_date.isoformat(),
-        "invoice_type": _invoice_type,
-        "status": _status,
-        "invoice_items": [
-            {
-                "description": BaseFaker.sentence(),
-                "quantity": BaseFaker.random_int(min=1, max=10),
-                "unit_price": round(BaseFaker.random_number(digits=5), 2),
-                "reference_id": str(BaseFaker.uuid4()),
-            },
-        ],
-    }
+        _invoice_create_json = {
+            "issued_by": _issued_by,
+            "issued_to": _issued_to,
+            "invoice_details": _invoice_details,
+            "due_date": _due_date.isoformat(),
+            "date_paid": _due_date.isoformat(),
+            "invoice_type": _invoice_type,
+            "status": _status,
+            "invoice_items": [
+                {
+                    "description": BaseFaker.sentence(),
+                    "quantity": BaseFaker.random_int(min=1, max=10),
+                    "unit_price": round(BaseFaker.random_number(digits=5), 2),
+                    "reference_id": str(BaseFaker.uuid4()),
+                },
+            ],
+        }
+
+        _invoice_update_json = {
+            "issued_by": _issued_by,
+            "issued_to": _issued_to,
+            "invoice_details": _invoice_details,
+            "due_date": _due_date.isoformat(),
+            "date_paid": _date_paid.isoformat(),
+            "invoice_type": _invoice_type,
+            "status": _status,
+        }
 
-    _invoice_update_json = {
-        "issued_by": _issued_by,
-        "issued_to": _issued_to,
-        "invoice_details": _invoice_details,
-        "due_date": _due_date.isoformat(),
-        "date_paid": _date_paid.isoformat(),
-        "invoice_type": _invoice_type,
-        "status": _status,
-    }
+        _invoice_response_json = {
+            "invoice_id": str(BaseFaker.uuid4()),
+            "invoice_number": f"INV{BaseFaker.random_number(digits=8)}",
+            "issued_by": str(BaseFaker.uuid4()),
+            "issued_to": str(BaseFaker.uuid4()),
+            "invoice_details": BaseFaker.text(max_nb_chars=200),
+            "due_date": BaseFaker.future_datetime().isoformat(),
+            "date_paid": BaseFaker.date_time_this_year().isoformat(),
+            "invoice_type": BaseFaker.random_element(
+                [e.value for e in InvoiceTypeEnum]
+            ),
+            "status": BaseFaker.random_element([e.value for e in PaymentStatusEnum]),
+            "invoice_amount": round(BaseFaker.random_number(digits=5), 2),
+            "invoice_items": [
+                {
+                    "invoice_item_id": str(BaseFaker.uuid4()),
+                    "description": BaseFaker.sentence(),
+                    "quantity": BaseFaker.random_int(min=1, max=10),
+                    "unit_price": round(BaseFaker.random_number(digits=5), 2),
+                    "total_price": round(BaseFaker.random_number(digits=6), 2),
+                    "reference_id": str(BaseFaker.uuid4()),
+                },
+            ],
+        }
 
-    _invoice_response_json = {
-        "invoice_id": str(BaseFaker.uuid4()),
-        "invoice_number": f"INV{BaseFaker.random_number(digits=8)}",
-        "issued_by": str(BaseFaker.uuid4()),
-        "issued_to": str(BaseFaker.uuid4()),
-        "invoice_details": BaseFaker.text(max_nb_chars=200),
-        "due_date": BaseFaker.future_datetime().isoformat(),
-        "date_paid": BaseFaker.date_time_this_year().isoformat(),
-        "invoice_type": BaseFaker.random_element([e.value for e in InvoiceTypeEnum]),
-        "status": BaseFaker.random_element([e.value for e in PaymentStatusEnum]),
-        "invoice_amount": round(BaseFaker.random_number(digits=5), 2),
-        "invoice_items": [
-            {
-                "invoice_item_id": str(BaseFaker.uuid4()),
-                "description": BaseFaker.sentence(),
-                "quantity": BaseFaker.random_int(min=1, max=10),
-                "unit_price": round(BaseFaker.random_number(digits=5), 2),
-                "total_price": round(BaseFaker.random_number(digits=6), 2),
-                "reference_id": str(BaseFaker.uuid4()),
-            },
-        ],
-    }
+        return {
+            "_invoice_create_json": _invoice_create_json,
+            "_invoice_update_json": _invoice_update_json,
+            "_invoice_response_json": _invoice_response_json,
+        }
 
     @classmethod
     def get_invoice_info(cls, invoices: Union[InvoiceModel | List[InvoiceModel] | Any]):
@@ -1,4 +1,4 @@
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 # schema
 from app.modules.common.schema.base_schema import BaseFaker, BaseSchema
@@ -25,30 +25,41 @@ class PaymentType(PaymentTypeBase):
 
 
 class PaymentTypeInfoMixin:
-    # base attributes
-    _payment_type_id = BaseFaker.random_int(min=1, max=100)
-    _payment_type_name = BaseFaker.random_element([e.value for e in PaymentTypeEnum])
-    _payment_partitions = BaseFaker.random_int(min=1, max=12)
-    _payment_type_description = BaseFaker.sentence()
+    @staticmethod
+    def _examples() -> Dict[str, Any]:
+        """OpenAPI example payloads, built only when the schema is requested."""
+        # base attributes
+        _payment_type_id = BaseFaker.random_int(min=1, max=100)
+        _payment_type_name = BaseFaker.random_element(
+            [e.value for e in PaymentTypeEnum]
+        )
+        _payment_partitions = BaseFaker.random_int(min=1, max=12)
+        _payment_type_description = BaseFaker.sentence()
+
+        _payment_create_json = {
+            "payment_type_name": _payment_type_name,
+            "payment_type_description": _payment_type_description,
+            "payment_partitions": _payment_partitions,
+        }
 
-    _payment_create_json = {
-        "payment_type_name": _payment_type_name,
-        "payment_type_description": _payment_type_description,
-        "payment_partitions": _payment_partitions,
-    }
+        _payment_update_json = {
+            "payment_type_name": _payment_type_name,
+            "payment_type_description": _payment_type_description,
+            "payment_partitions": _payment_partitions,
+        }
 
-    _payment_update_json = {
-        "payment_type_name": _payment_type_name,
-        "payment_type_description": _payment_type_description,
-        "payment_partitions": _payment_partitions,
-    }
+        _payment_response_json = {
+            "payment_type_id": _payment_type_id,
+            "payment_type_name": _payment_type_name,
+            "payment_type_description": _payment_type_description,
+            "payment_partitions": _payment_partitions,
+        }
 
-    _payment_response_json = {
-        "payment_type_id": _payment_type_id,
-        "payment_type_name": _payment_type_name,
-        "payment_type_description": _payment_type_description,
-        "payment_partitions": _payment_partitions,
-    }
+        return {
+            "_payment_create_json": _payment_create_json,
+            "_payment_update_json": _payment_update_json,
+            "_payment_response_json": _payment_response_json,
+        }
 
     @classmethod
     def get_payment_type_info(
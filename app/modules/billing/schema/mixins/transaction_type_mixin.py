@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Any, Dict, List, Optional
 
 # enums
 from app.modules.billing.enums.billing_enums import TransactionTypeEnum
@@ -21,27 +21,36 @@ class TransactionTypeBase(BaseSchema):
 
 
 class TransactionTypeInfoMixin:
-    _transaction_type_name = BaseFaker.random_element(
-        [e.value for e in TransactionTypeEnum]
-    )
-    _transaction_type_description = BaseFaker.sentence()
-    _transaction_type_id = BaseFaker.random_int(min=1, max=100)
+    @staticmethod
+    def _examples() -> Dict[str, Any]:
+        """OpenAPI example payloads, built only when the schema is requested."""
+        _transaction_type_name = BaseFaker.random_element(
+            [e.value for e in TransactionTypeEnum]
+        )
+        _transaction_type_description = BaseFaker.sentence()
+        _transaction_type_id = BaseFaker.random_int(min=1, max=100)
+
+        _transaction_create_json = {
+            "transaction_type_name": _transaction_type_name,
+            "transaction_type_description": _transaction_type_description,
+        }
 
-    _transaction_create_json = {
-        "transaction_type_name": _transaction_type_name,
-        "transaction_type_description": _transaction_type_description,
-    }
+        _transaction_update_json = {
+            "transaction_type_name": _transaction_type_name,
+            "transaction_type_description": _transaction_type_description,
+        }
 
-    _transaction_update_json = {
-        "transaction_type_name": _transaction_type_name,
-        "transaction_type_description": _transaction_type_description,
-    }
+        _transaction_response_json = {
+            "transaction_type_id": _transaction_type_id,
+            "transaction_type_name": _transaction_type_name,
+            "transaction_type_description": _transaction_type_description,
+        }
 
-    _transaction_response_json = {
-        "transaction_type_id": _transaction_type_id,
-        "transaction_type_name": _transaction_type_name,
-        "transaction_type_description": _transaction_type_description,
-    }
+        return {
+            "_transaction_create_json": _transaction_create_json,
+            "_transaction_update_json": _transaction_update_json,
+            "_transaction_response_json": _transaction_response_json,
+        }
 
     @classmethod
     def get_transaction_type_info(
@@ -1,6 +1,6 @@
 from uuid import UUID
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 
 # schemas
@@ -9,7 +9,6 @@ from app.modules.billing.schema.mixins.billable_mixin import EntityBillable
 
 # models
 from app.modules.billing.models.utility import Utilities as UtilitiesModel
-from app.modules.billing.models.payment_type import PaymentType as PaymentTypeModel
 from app.modules.associations.models.entity_billable import (
     EntityBillable as EntityBillableModel,
 )
@@ -17,6 +16,9 @@ from app.modules.associations.models.entity_billable import (
 # Enums
 from app.modules.billing.enums.billing_enums import BillableTypeEnum
 
+# services
+from app.services.reference_data_service import reference_data
+
 
 class UtilityBase(BaseSchema):
     utility_id: Optional[UUID] = None
@@ -46,18 +48,26 @@ class UtilityInfo(BaseSchema):
 
 
 class UtilitiesMixin:
-    _name = BaseFaker.word()
-    _description = BaseFaker.sentence()
-
-    _utility_create_json = {
-        "name": _name,
-        "description": _description,
-    }
-
-    _utility_update_json = {
-        "name": _name,
-        "description": _description,
-    }
+    @staticmethod
+    def _examples() -> Dict[str, Any]:
+        """OpenAPI example payloads, built only when the schema is requested."""
+        _name = BaseFaker.word()
+        _description = BaseFaker.sentence()
+
+        _utility_create_json = {
+            "name": _name,
+            "description": _description,
+        }
+
+        _utility_update_json = {
+            "name": _name,
+            "description": _description,
+        }
+
+        return {
+            "_utility_create_json": _utility_create_json,
+            "_utility_update_json": _utility_update_json,
+        }
 
     @classmethod
     def get_utilities_info(cls, utilities: List[EntityBillable]):
@@ -74,14 +84,15 @@ class UtilitiesMixin:
 
         for entity_utility in utilities:
             entity_utility: EntityBillableModel = entity_utility
-            payment_type: PaymentTypeModel = entity_utility.payment_type
             utility: UtilitiesModel = entity_utility.utility
 
             result.append(
                 UtilityInfo(
                     utility_id=utility.utility_id,
                     utility=utility.name,
-                    frequency=payment_type.payment_type_name,
+                    frequency=reference_data.payment_type_name(
+                        entity_utility.payment_type_id
+                    ),
                     billable_amount=entity_utility.billable_amount,
                     apply_to_units=entity_utility.apply_to_units,
                     entity_billable_id=entity_utility.entity_billable_id,
@@ -5,6 +5,7 @@ from pydantic import ConfigDict
 from app.modules.billing.enums.billing_enums import PaymentTypeEnum
 
 # schemas
+from app.modules.common.schema.base_schema import lazy_example
 from app.modules.billing.schema.mixins.payment_type_mixin import (
     PaymentTypeBase,
     PaymentTypeInfoMixin,
@@ -16,7 +17,9 @@ from app.modules.billing.models.payment_type import PaymentType as PaymentTypeMo
 
 class PaymentTypeCreateSchema(PaymentTypeBase, PaymentTypeInfoMixin):
     model_config = ConfigDict(
-        json_schema_extra={"example": PaymentTypeInfoMixin._payment_create_json}
+        json_schema_extra=lazy_example(
+            PaymentTypeInfoMixin._examples, "_payment_create_json"
+        )
     )
 
     @classmethod
@@ -35,7 +38,9 @@ class PaymentTypeUpdateSchema(PaymentTypeBase, PaymentTypeInfoMixin):
     payment_type_name: Optional[PaymentTypeEnum] = None  # Enum used here
 
     model_config = ConfigDict(
-        json_schema_extra={"example": PaymentTypeInfoMixin._payment_update_json}
+        json_schema_extra=lazy_example(
+            PaymentTypeInfoMixin._examples, "_payment_update_json"
+        )
     )
 
     @classmethod
@@ -51,7 +56,9 @@ class PaymentTypeResponse(PaymentTypeBase):
     payment_type_id: int
 
     model_config = ConfigDict(
-        json_schema_extra={"example": PaymentTypeInfoMixin._payment_response_json},
+        json_schema_extra=lazy_example(
+            PaymentTypeInfoMixin._examples, "_payment_response_json"
+        ),
         from_attributes=True,
     )
 
@@ -8,6 +8,7 @@ from app.modules.billing.enums.billing_enums import PaymentStatusEnum
 
 # mixins
 from app.modules.billing.schema.mixins.invoice_mixin import InvoiceBase
+from app.modules.common.schema.base_schema import lazy_example
 from app.modules.billing.schema.mixins.transaction_mixin import (
     Transaction,
     TransactionBase,
@@ -21,7 +22,7 @@ from app.modules.billing.models.transaction import Transaction as TransactionMod
 class TransactionCreateSchema(Transaction, TransactionInfoMixin):
     invoice: Optional[InvoiceBase] = None
     model_config = ConfigDict(
-        json_schema_extra={"example": TransactionInfoMixin._transaction_create_json},
+        json_schema_extra=lazy_example(TransactionInfoMixin._examples, "_transaction_create_json"),
     )
 
     @classmethod
@@ -60,7 +61,7 @@ class TransactionUpdateSchema(Transaction):
     invoice_number: Optional[str] = None
 
     model_config = ConfigDict(
-        json_schema_extra={"example": TransactionInfoMixin._transaction_update_json},
+        json_schema_extra=lazy_example(TransactionInfoMixin._examples, "_transaction_update_json"),
     )
 
 
@@ -5,6 +5,7 @@ from pydantic import BaseModel, ConfigDict
 from app.modules.billing.enums.billing_enums import TransactionTypeEnum
 
 # schemas
+from app.modules.common.schema.base_schema import lazy_example
 from app.modules.billing.schema.mixins.transaction_type_mixin import (
     TransactionTypeInfoMixin,
 )
@@ -23,7 +24,9 @@ class TransactionTypeBase(BaseModel):
 
 class TransactionTypeCreateSchema(TransactionTypeBase, TransactionTypeInfoMixin):
     model_config = ConfigDict(
-        json_schema_extra={"example": TransactionTypeInfoMixin._transaction_create_json}
+        json_schema_extra=lazy_example(
+            TransactionTypeInfoMixin._examples, "_transaction_create_json"
+        )
     )
 
     @classmethod
@@ -40,7 +43,9 @@ class TransactionTypeUpdateSchema(TransactionTypeBase, TransactionTypeInfoMixin)
     transaction_type_name: Optional[TransactionTypeEnum] = None  # Enum used here
 
     model_config = ConfigDict(
-        json_schema_extra={"example": TransactionTypeInfoMixin._transaction_update_json}
+        json_schema_extra=lazy_example(
+            TransactionTypeInfoMixin._examples, "_transaction_update_json"
+        )
     )
 
     @classmethod
@@ -56,9 +61,9 @@ class TransactionTypeResponse(TransactionTypeBase, TransactionTypeInfoMixin):
     transaction_type_id: int
 
     model_config = ConfigDict(
-        json_schema_extra={
-            "example": TransactionTypeInfoMixin._transaction_response_json
-        },
+        json_schema_extra=lazy_example(
+            TransactionTypeInfoMixin._examples, "_transaction_response_json"
+        ),
         from_attributes=True,
     )
 
@@ -2,6 +2,7 @@ from typing import Optional
 from uuid import UUID
 from pydantic import ConfigDict
 
+from app.modules.common.schema.base_schema import lazy_example
 from app.modules.billing.schema.mixins.utility_mixin import UtilitiesMixin, UtilityBase
 
 
@@ -11,7 +12,7 @@ class UtilityCreateSchema(UtilityBase, UtilitiesMixin):
     description: Optional[str] = None
 
     model_config = ConfigDict(
-        json_schema_extra={"example": UtilitiesMixin._utility_create_json}
+        json_schema_extra=lazy_example(UtilitiesMixin._examples, "_utility_create_json")
     )
 
 
@@ -21,7 +22,7 @@ class UtilityUpdateSchema(UtilityBase, UtilitiesMixin):
     description: Optional[str] = None
 
     model_config = ConfigDict(
-        json_schema_extra={"example": UtilitiesMixin._utility_update_json}
+        json_schema_extra=lazy_example(UtilitiesMixin._examples, "_utility_update_json")
     )
 
 
@@ -17,6 +17,9 @@ DBModelType = TypeVar("DBModelType")
 
 
 class BaseDAO(DBOperations, Generic[DBModelType]):
+    # number of DAO objects constructed in this process (startup report)
+    instances_created: int = 0
+
     def __init__(
         self,
         model: Type[DBModelType],
@@ -39,6 +42,7 @@ class BaseDAO(DBOperations, Generic[DBModelType]):
             **kwargs,
         )
         self.primary_key = kwargs.get("primary_key")
+        BaseDAO.instances_created += 1
 
     def extract_model_data(
         self, data: dict, schema: Type[BaseModel], nested_key: Optional[str] = None
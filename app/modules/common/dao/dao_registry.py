@@ -0,0 +1,105 @@
+import threading
+from typing import Any, Dict, Hashable, Tuple, Type, TypeVar
+
+DAOType = TypeVar("DAOType")
+
+
+class LazyDAO:
+    """
+    Placeholder for a registry DAO that is only built on first attribute access.
+
+    Used for nested DAOs (detail mappings, helper DAOs) so that constructing a
+    DAO does not eagerly construct its whole dependency graph.
+    """
+
+    __slots__ = ("_registry", "_dao_class", "_kwargs")
+
+    def __init__(self, registry: "DAORegistry", dao_class: Type[DAOType], **kwargs):
+        object.__setattr__(self, "_registry", registry)
+        object.__setattr__(self, "_dao_class", dao_class)
+        object.__setattr__(self, "_kwargs", kwargs)
+
+    def resolve(self) -> DAOType:
+        return self._registry.get(self._dao_class, **self._kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.resolve(), name)
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(self.resolve(), name, value)
+
+    def __repr__(self) -> str:
+        return f"<LazyDAO {self._dao_class.__name__}>"
+
+
+class DAORegistry:
+    """
+    Process-wide registry handing out one shared DAO instance per DAO class.
+
+    DAOs are stateless apart from their configuration, so routers and other
+    DAOs can share instances. Instances are keyed by class and constructor
+    keyword arguments and are built on first request.
+    """
+
+    _instance = None
+    _lock = threading.RLock()
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls, *args, **kwargs)
+                    cls._instance._daos = {}
+                    cls._instance._created = 0
+        return cls._instance
+
+    @staticmethod
+    def _freeze(value: Any) -> Hashable:
+        if isinstance(value, (list, tuple, set)):
+            return tuple(DAORegistry._freeze(item) for item in value if item != "")
+        if isinstance(value, dict):
+            return tuple(sorted((k, DAORegistry._freeze(v)) for k, v in value.items()))
+        return value
+
+    def _key(self, dao_class: Type[DAOType], kwargs: Dict[str, Any]) -> Tuple:
+        # None, [] and [""] are all used for "no excludes" across the routers
+        frozen = tuple(
+            (key, self._freeze(value))
+            for key, value in sorted(kwargs.items())
+            if self._freeze(value) not in (None, ())
+        )
+        return (dao_class, frozen)
+
+    def get(self, dao_class: Type[DAOType], **kwargs) -> DAOType:
+        """Return the shared instance of `dao_class`, building it if needed."""
+        key = self._key(dao_class, kwargs)
+        dao = self._daos.get(key)
+
+        if dao is None:
+            with self._lock:
+                dao = self._daos.get(key)
+                if dao is None:
+                    dao = dao_class(**kwargs)
+                    self._daos[key] = dao
+                    self._created += 1
+
+        return dao
+
+    def lazy(self, dao_class: Type[DAOType], **kwargs) -> DAOType:
+        """Return a placeholder that resolves to the shared instance on first use."""
+        return LazyDAO(self, dao_class, **kwargs)
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "dao_instances": self._created,
+            "dao_classes": sorted({dao_class.__name__ for dao_class, _ in self._daos}),
+        }
+
+    def clear(self):
+        with self._lock:
+            self._daos = {}
+            self._created = 0
+
+
+# create dao registry
+dao_registry = DAORegistry()
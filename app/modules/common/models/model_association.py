@@ -1,9 +1,7 @@
-import enum
 from sqlalchemy.future import select
 from typing import Dict, Any, List, Union
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import (
-    Enum,
     inspect,
     and_,
 )
@@ -44,9 +42,6 @@ class AssociationProcessor:
             )
 
             if existing_association:
-                # convert model enums
-                self._convert_model_enums(existing_association)
-
                 # update the existing association
                 await self._update_existing_association(
                     session,
@@ -139,14 +134,6 @@ class AssociationProcessor:
 
         return foreign_keys
 
-    def _convert_model_enums(self, existing_association: "BaseModel"):
-        """Convert enum types on model to internal string representation"""
-        for key in existing_association.__dict__.keys():
-            field_column = getattr(existing_association, key, None)
-
-            if isinstance(field_column, enum.Enum) or isinstance(field_column, Enum):
-                setattr(existing_association, key, str(field_column.name))
-
     async def _update_existing_association(
         self,
         session: AsyncSession,
@@ -157,13 +144,11 @@ class AssociationProcessor:
         """Update fields of an existing association."""
         try:
             for key, value in association_data.items():
+                # the column types coerce enums / enum names themselves, so values are
+                # assigned as is and unchanged ones are skipped to keep them out of the UPDATE
                 if key not in exclude_fields and hasattr(existing_association, key):
-                    if isinstance(value, enum.Enum):
-                        setattr(existing_association, key, str(value.name))
-                    elif isinstance(value, bool):
-                        setattr(existing_association, key, bool(value))
-                    else:
-                        setattr(existing_association, key, str(value))
+                    if getattr(existing_association, key) != value:
+                        setattr(existing_association, key, value)
 
             session.add(existing_association)
             await session.commit()
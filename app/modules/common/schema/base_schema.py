@@ -1,13 +1,53 @@
-from faker import Faker
 from sqlalchemy import inspect
-from typing import List, Optional, Type, Dict
+from typing import Any, Callable, List, Optional, Type, Dict
 from sqlalchemy.ext.declarative import DeclarativeMeta
 from pydantic import BaseModel, ConfigDict, create_model
 
-BaseFaker = Faker()
 SchemasDictType = Dict[str, Type[BaseModel]]
 
 
+class LazyFaker:
+    """
+    Stand-in for a shared Faker instance.
+
+    faker (and its locale providers) is only imported the first time an attribute is
+    accessed, which happens when the OpenAPI examples are built, not when a worker
+    imports the schema modules.
+    """
+
+    def __init__(self):
+        self._faker = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._faker is None:
+            from faker import Faker
+
+            self._faker = Faker()
+        return getattr(self._faker, name)
+
+
+BaseFaker = LazyFaker()
+
+
+def lazy_example(
+    builder: Callable[[], Dict[str, Any]], key: Optional[str] = None
+) -> Callable[[Dict[str, Any]], None]:
+    """
+    Returns a `json_schema_extra` hook that sets the schema example from `builder`.
+
+    Pydantic only calls the hook while generating the JSON schema (i.e. when /docs or
+    /openapi.json is requested), so example payloads are no longer generated at import.
+    When `key` is given, the example is looked up in the dict returned by `builder`,
+    e.g. `lazy_example(MediaInfoMixin._examples, "_media_create_json")`.
+    """
+
+    def json_schema_extra(schema: Dict[str, Any]) -> None:
+        example = builder()
+        schema["example"] = example[key] if key else example
+
+    return json_schema_extra
+
+
 class BaseSchema(BaseModel):
     model_config = ConfigDict(
         from_attributes=True,
@@ -13,6 +13,7 @@ from app.core.response import DAOResponse
 from app.modules.associations.enums.entity_type_enums import EntityTypeEnum
 from app.modules.associations.models.entity_media import EntityMedia
 from app.modules.common.dao.base_dao import BaseDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # DAO
 from app.modules.communication.dao.calendar_event_dao import CalendarEventDAO
@@ -21,7 +22,6 @@ from app.modules.resources.dao.media_dao import MediaDAO
 # Models
 from app.modules.communication.models.maintenance_request import MaintenanceRequest
 from app.modules.resources.enums.resource_enums import MediaType
-from app.services.upload_service import MediaUploaderService
 
 # Core
 from app.core.errors import CustomException, IntegrityError
@@ -32,10 +32,10 @@ class MaintenanceRequestDAO(BaseDAO[MaintenanceRequest]):
         self.model = MaintenanceRequest
 
         # DAO for calendar event
-        self.calendar_event_dao = CalendarEventDAO()
+        self.calendar_event_dao = dao_registry.lazy(CalendarEventDAO)
 
         # DAOs for Media
-        self.media_dao = MediaDAO()
+        self.media_dao = dao_registry.lazy(MediaDAO)
 
         # Detail mappings for creating related entities
         self.detail_mappings = {
@@ -127,24 +127,19 @@ class MaintenanceRequestDAO(BaseDAO[MaintenanceRequest]):
         if not maintenance_requests:
             raise RecordNotFoundException(model="MaintenanceRequest", id=request_id)
 
-        for idx, file in enumerate(files):
-            content = await file.read()
-            base64_data = f"data:{file.content_type};base64,{content.decode('latin1')}"
-            file_name = file.filename
-            media_type = MediaType.image  # Adjust based on the type of media
-
-            # Use MediaUploaderService
-            uploader = MediaUploaderService(base64_data, file_name, media_type)
-            response = uploader.upload()
-
-            if not response.success:
-                raise Exception(f"Upload failed: {response.error}")
+        # content already stored is not uploaded again
+        stored = await self.media_dao.upload_files(
+            db_session, files, "maintenance_request"
+        )
+        media_type = MediaType.image  # Adjust based on the type of media
 
+        for idx, (file, upload) in enumerate(zip(files, stored)):
             # Save media record and association
             media_data = {
-                "media_name": file_name,
+                "media_name": file.filename,
                 "media_type": media_type,
-                "content_url": response.data["content_url"],
+                "content_url": upload["content_url"],
+                "content_hash": upload["content_hash"],
                 "is_thumbnail": False,
                 "caption": captions[idx] if captions and idx < len(captions) else None,
                 "description": descriptions[idx]
@@ -163,7 +158,7 @@ class MaintenanceRequestDAO(BaseDAO[MaintenanceRequest]):
         request_id: str,
         media_data: dict,
     ):
-        # Create Media instance
+        # Create Media instance, its file may be shared with other media
         media = self.media_dao.model(**media_data)
         db_session.add(media)
         await db_session.flush()
@@ -1,8 +1,10 @@
 # message_dao.py
 
+import base64
 from uuid import UUID
-from typing import List, Optional
-from sqlalchemy import func, select, and_, or_, desc
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import func, literal_column, select, desc, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlalchemy.exc import IntegrityError
@@ -13,9 +15,14 @@ from app.modules.common.dao.base_dao import BaseDAO
 
 # Models
 from app.modules.communication.models.message import Message
+from app.modules.communication.models.message_inbox import MessageInbox
 from app.modules.communication.models.message_recipient import MessageRecipient
-from app.modules.contract.models.under_contract import UnderContract
-from app.modules.properties.models.property_unit_association import PropertyUnitAssoc
+
+# Services
+from app.services.message_counter_service import (
+    counter_changes,
+    message_counter_service,
+)
 
 # Schemas
 from app.modules.communication.schema.message_schema import (
@@ -27,6 +34,22 @@ from app.modules.communication.schema.message_schema import (
 # Core
 from app.core.errors import CustomException, RecordNotFoundException
 
+
+def encode_thread_cursor(message: Message) -> str:
+    """Opaque position of a message in its thread (date_created, message_id)."""
+    key = f"{message.date_created.isoformat()}|{message.message_id}"
+    return base64.urlsafe_b64encode(key.encode()).decode()
+
+
+def decode_thread_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        date_created, message_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        )
+        return datetime.fromisoformat(date_created), UUID(message_id)
+    except ValueError:
+        raise CustomException(f"Invalid thread cursor: {cursor}")
+
 class MessageDAO(BaseDAO[Message]):
     def __init__(self, excludes: Optional[List[str]] = None):
         self.model = Message
@@ -49,8 +72,8 @@ class MessageDAO(BaseDAO[Message]):
     ) -> DAOResponse:
         try:
             message_data = obj_in.dict(exclude_unset=True)
-            recipient_ids = message_data.pop("recipient_ids", [])
-            recipient_groups = message_data.pop("recipient_groups", [])
+            recipient_ids = message_data.pop("recipient_ids", None) or []
+            recipient_groups = message_data.pop("recipient_groups", None) or []
 
             new_message = Message(**message_data)
             db_session.add(new_message)
@@ -107,16 +130,13 @@ class MessageDAO(BaseDAO[Message]):
         self, db_session: AsyncSession, message: MessageReplySchema
     ) -> DAOResponse:
         try:
-            # Fetching the parent message
+            # Fetching the parent message (only what the reply inherits)
             parent_message_result = await db_session.execute(
-                select(self.model)
-                .options(
-                    selectinload(Message.sender),
-                    selectinload(Message.recipients).selectinload(MessageRecipient.recipient),
-                )
-                .where(self.model.message_id == message.parent_message_id)
+                select(
+                    self.model.message_id, self.model.subject, self.model.thread_id
+                ).where(self.model.message_id == message.parent_message_id)
             )
-            parent_message = parent_message_result.scalar_one_or_none()
+            parent_message = parent_message_result.one_or_none()
             if not parent_message:
                 raise RecordNotFoundException(
                     model="Message", id=str(message.parent_message_id)
@@ -124,11 +144,11 @@ class MessageDAO(BaseDAO[Message]):
 
             # Creating new message
             new_message_data = {
-                "subject": parent_message.subject,
+                "subject": parent_message.subject or "",
                 "message_body": message.message_body,
                 "sender_id": message.sender_id,
                 "parent_message_id": message.parent_message_id,
-                "thread_id": parent_message.thread_id,
+                "thread_id": parent_message.thread_id or parent_message.message_id,
                 "recipient_ids": message.recipient_ids,
                 "recipient_groups": message.recipient_groups,
                 "is_draft": False,
@@ -137,7 +157,8 @@ class MessageDAO(BaseDAO[Message]):
                 "is_enquiry": False,
             }
             print("Message Before:", new_message_data)
-            new_message_schema = MessageReplySchema(**new_message_data)
+            # the create schema keeps thread_id / parent_message_id
+            new_message_schema = MessageCreateSchema(**new_message_data)
             result = await self.create(db_session=db_session, obj_in=new_message_schema)
             print("Message After:", result)
             return result
@@ -145,6 +166,170 @@ class MessageDAO(BaseDAO[Message]):
             await db_session.rollback()
             raise CustomException(str(e))
 
+    async def get_thread(
+        self,
+        db_session: AsyncSession,
+        thread_id: UUID,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> DAOResponse:
+        """
+        Conversation of a thread, oldest first: the root message and every reply
+        below it, found by one recursive query over parent_message_id. Each message
+        carries its depth (and parent_message_id) to be nested by the client; a page
+        continues after the `next_cursor` of the previous one.
+        """
+        message = Message.__table__
+        reply = message.alias("reply")
+
+        tree = (
+            select(message.c.message_id, literal_column("0").label("depth"))
+            .where(message.c.message_id == thread_id)
+            .cte("thread", recursive=True)
+        )
+        tree = tree.union_all(
+            select(reply.c.message_id, tree.c.depth + 1).where(
+                reply.c.parent_message_id == tree.c.message_id,
+                # a root message is its own parent
+                reply.c.message_id != tree.c.message_id,
+            )
+        )
+
+        query = (
+            select(self.model, tree.c.depth)
+            .join(tree, tree.c.message_id == self.model.message_id)
+            .where(self.model.is_draft.isnot(True), self.model.is_scheduled.isnot(True))
+        )
+        if cursor is not None:
+            query = query.where(
+                tuple_(self.model.date_created, self.model.message_id)
+                > tuple_(*decode_thread_cursor(cursor))
+            )
+
+        result = await db_session.execute(
+            query.order_by(self.model.date_created, self.model.message_id)
+            .limit(limit + 1)
+            .options(
+                selectinload(self.model.sender),
+                selectinload(self.model.recipients).selectinload(MessageRecipient.recipient),
+            )
+        )
+        rows = result.all()
+        if not rows and cursor is None:
+            raise RecordNotFoundException(model="Thread", id=str(thread_id))
+
+        data = []
+        for thread_message, depth in rows[:limit]:
+            response = MessageResponse.model_validate(thread_message)
+            response["depth"] = depth
+            data.append(response)
+
+        next_cursor = (
+            encode_thread_cursor(rows[limit - 1][0]) if len(rows) > limit else None
+        )
+        return DAOResponse(
+            success=True,
+            data=data,
+            meta={"limit": limit, "next_cursor": next_cursor},
+        )
+
+    async def get_inbox_messages(
+        self,
+        db_session: AsyncSession,
+        user_id: UUID,
+        folder: str,
+        limit: int = 10,
+        offset: int = 0,
+    ) -> DAOResponse:
+        """
+        Inbox / notifications folder of a user, read from the fanned out
+        message_inbox rows (one range scan of the user/folder/sent_at index).
+        """
+        filters = (MessageInbox.user_id == user_id, MessageInbox.folder == folder)
+
+        page = await db_session.execute(
+            select(MessageInbox.message_id, MessageInbox.is_read)
+            .where(*filters)
+            .order_by(desc(MessageInbox.sent_at), desc(MessageInbox.message_id))
+            .limit(limit)
+            .offset(offset)
+        )
+        read_state = dict(page.all())
+
+        total_count = (
+            await db_session.execute(
+                select(func.count()).select_from(MessageInbox).where(*filters)
+            )
+        ).scalar()
+
+        result = await db_session.execute(
+            select(self.model)
+            .where(self.model.message_id.in_(read_state))
+            .options(
+                selectinload(self.model.sender),
+                selectinload(self.model.recipients).selectinload(MessageRecipient.recipient),
+            )
+        )
+        messages = {m.message_id: m for m in result.scalars().all()}
+
+        data = []
+        for message_id, is_read in read_state.items():
+            if message_id in messages:
+                response = MessageResponse.model_validate(messages[message_id])
+                # read state of this reader, not of the message
+                response["is_read"] = is_read
+                data.append(response)
+
+        return DAOResponse(
+            success=True,
+            data=data,
+            meta={"total_items": total_count, "limit": limit, "offset": offset},
+        )
+
+    async def mark_read(
+        self, db_session: AsyncSession, user_id: UUID, message_id: UUID
+    ) -> DAOResponse:
+        """Marks a delivered message read for the user (moves the unread counter)."""
+        try:
+            result = await db_session.execute(
+                update(MessageInbox)
+                .where(
+                    MessageInbox.user_id == user_id,
+                    MessageInbox.message_id == message_id,
+                    MessageInbox.is_read.is_(False),
+                )
+                .values(is_read=True)
+                .returning(MessageInbox.folder)
+            )
+            folder = result.scalar_one_or_none()
+
+            if folder is not None:
+                # direct recipient row, kept for inbox rebuilds
+                await db_session.execute(
+                    update(MessageRecipient)
+                    .where(
+                        MessageRecipient.recipient_id == user_id,
+                        MessageRecipient.message_id == message_id,
+                    )
+                    .values(is_read=True)
+                )
+                counter_changes(db_session.sync_session).add(user_id, folder, -1)
+            await db_session.commit()
+
+            return DAOResponse(
+                success=True, data={"message_id": message_id, "is_read": True}
+            )
+        except Exception as e:
+            await db_session.rollback()
+            raise CustomException(str(e))
+
+    async def get_user_counters(
+        self, db_session: AsyncSession, user_id: UUID
+    ) -> DAOResponse:
+        """Unread inbox / notifications and drafts / scheduled counts of the user."""
+        counts = await message_counter_service.get(db_session, user_id)
+        return DAOResponse(success=True, data=counts)
+
     async def get_user_messages(
         self,
         db_session: AsyncSession,
@@ -179,58 +364,12 @@ class MessageDAO(BaseDAO[Message]):
                     self.model.is_enquiry == False,
                 ).order_by(desc(self.model.date_created))
             elif folder in ["inbox", "notifications"]:
-                is_notification = folder == "notifications"
-
-                # Fetch user's contracts
-                user_contracts_stmt = (
-                    select(UnderContract)
-                    .join(
-                        PropertyUnitAssoc,
-                        PropertyUnitAssoc.property_unit_assoc_id
-                        == UnderContract.property_unit_assoc_id,
-                    )
-                    .where(UnderContract.client_id == user_id)
-                )
-                contracts_result = await db_session.execute(user_contracts_stmt)
-                contracts = contracts_result.scalars().all()
-                contract_periods = [
-                    (
-                        contract.property_unit_assoc_id,
-                        contract.start_date,
-                        contract.end_date,
-                    )
-                    for contract in contracts
-                ]
-
-                # Preparing filters
-                contract_ids = [cp[0] for cp in contract_periods]
-                date_filters = [
-                    and_(
-                        MessageRecipient.msg_send_date >= cp[1],
-                        MessageRecipient.msg_send_date <= cp[2],
-                    )
-                    for cp in contract_periods
-                ]
-                query = (
-                    select(self.model)
-                    .join(
-                        MessageRecipient,
-                        self.model.message_id == MessageRecipient.message_id,
-                    )
-                    .where(
-                        self.model.is_draft == False,
-                        self.model.is_scheduled == False,
-                        self.model.is_enquiry == False,
-                        self.model.is_notification == is_notification,
-                        or_(
-                            MessageRecipient.recipient_id == user_id,
-                            and_(
-                                MessageRecipient.recipient_group_id.in_(contract_ids),
-                                or_(*date_filters) if date_filters else True,
-                            ),
-                        ),
-                    )
-                    .order_by(desc(self.model.date_created))
+                return await self.get_inbox_messages(
+                    db_session=db_session,
+                    user_id=user_id,
+                    folder=folder,
+                    limit=limit,
+                    offset=offset,
                 )
             else:
                 raise CustomException(f"Unknown folder type: {folder}")
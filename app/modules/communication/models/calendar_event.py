@@ -6,6 +6,7 @@ from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy import event, ForeignKey, DateTime, Enum, UUID, String, Text
 
 # models
+from app.db.dbSequence import NumberSequence
 from app.modules.common.models.model_base import BaseModel as Base
 
 # enums
@@ -61,23 +62,16 @@ class CalendarEvent(Base):
     )
 
 
-@event.listens_for(CalendarEvent, "before_insert")
-def receive_before_insert(mapper, connection, target: CalendarEvent):
-    if not target.event_id:
-        current_time_str = datetime.now().strftime("%Y%m%d%H%M%S")
-        target.event_id = f"{CalendarEvent.CAL_EVENT_PREFIX}{current_time_str}"
+# collision-free numbers, allocated in blocks from a db sequence
+EVENT_NUMBERS = NumberSequence(
+    "calendar_event_id_seq", CalendarEvent.CAL_EVENT_PREFIX, "calendar_events.event_id"
+)
 
 
-@event.listens_for(CalendarEvent, "after_insert")
-def receive_after_insert(mapper, connection, target: CalendarEvent):
+@event.listens_for(CalendarEvent, "before_insert")
+def receive_before_insert(mapper, connection, target: CalendarEvent):
     if not target.event_id:
-        current_time_str = datetime.now().strftime("%Y%m%d%H%M%S")
-        target.event_id = f"{CalendarEvent.CAL_EVENT_PREFIX}{current_time_str}"
-        connection.execute(
-            target.__table__.update()
-            .where(target.__table__.c.id == target.id)
-            .values(event_id=target.event_id)
-        )
+        target.event_id = EVENT_NUMBERS.next(connection)
 
 
 def parse_dates(mapper, connection, target):
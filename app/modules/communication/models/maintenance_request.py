@@ -6,6 +6,7 @@ from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy import event, ForeignKey, DateTime, UUID, String, Text, Boolean
 
 # models
+from app.db.dbSequence import NumberSequence
 from app.modules.common.models.model_base import BaseModel as Base
 
 # enums
@@ -118,23 +119,18 @@ class MaintenanceRequest(Base):
     )
 
 
-@event.listens_for(MaintenanceRequest, "before_insert")
-def receive_before_insert(mapper, connection, target: MaintenanceRequest):
-    if not target.task_number:
-        current_time_str = datetime.now().strftime("%Y%m%d%H%M%S")
-        target.task_number = f"{MaintenanceRequest.MNT_REQ_PREFIX}{current_time_str}"
+# collision-free numbers, allocated in blocks from a db sequence
+TASK_NUMBERS = NumberSequence(
+    "maintenance_request_task_number_seq",
+    MaintenanceRequest.MNT_REQ_PREFIX,
+    "maintenance_requests.task_number",
+)
 
 
-@event.listens_for(MaintenanceRequest, "after_insert")
-def receive_after_insert(mapper, connection, target: MaintenanceRequest):
+@event.listens_for(MaintenanceRequest, "before_insert")
+def receive_before_insert(mapper, connection, target: MaintenanceRequest):
     if not target.task_number:
-        current_time_str = datetime.now().strftime("%Y%m%d%H%M%S")
-        target.task_number = f"{MaintenanceRequest.MNT_REQ_PREFIX}{current_time_str}"
-        connection.execute(
-            target.__table__.update()
-            .where(target.__table__.c.id == target.id)
-            .values(task_number=target.task_number)
-        )
+        target.task_number = TASK_NUMBERS.next(connection)
 
 
 def parse_dates(mapper, connection, target):
@@ -2,10 +2,36 @@ import uuid
 import pytz
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy.orm import relationship, backref, Mapped, mapped_column
-from sqlalchemy import Boolean, DateTime, Integer, String, Text, UUID, ForeignKey
+from sqlalchemy.orm import (
+    relationship,
+    backref,
+    Mapped,
+    mapped_column,
+    object_session,
+)
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    UUID,
+    ForeignKey,
+    event,
+    inspect,
+    text,
+)
 
 from app.modules.common.models.model_base import BaseModel as Base
+from app.modules.communication.models.message_inbox import mark_message_inbox
+
+# messages waiting for the dispatcher (MessageDispatchService)
+SCHEDULED_PREDICATE = "is_scheduled = true AND is_draft = false"
+REMINDER_PREDICATE = (
+    "is_reminder = true AND is_draft = false AND is_scheduled = false "
+    "AND next_remind_date IS NOT NULL"
+)
 
 
 class Message(Base):
@@ -16,11 +42,11 @@ class Message(Base):
     )
     subject: Mapped[Optional[str]] = mapped_column(String(128))
     sender_id: Mapped[Optional[uuid.UUID]] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.user_id")
+        UUID(as_uuid=True), ForeignKey("users.user_id"), index=True
     )
     message_body: Mapped[Optional[str]] = mapped_column(Text)
     parent_message_id: Mapped[Optional[uuid.UUID]] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("message.message_id"), nullable=True
+        UUID(as_uuid=True), ForeignKey("message.message_id"), nullable=True, index=True
     )
     thread_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True), ForeignKey("message.message_id"), nullable=True
@@ -56,6 +82,21 @@ class Message(Base):
         Integer, ForeignKey("reminder_frequency.reminder_frequency_id")
     )
 
+    __table_args__ = (
+        Index(
+            "ix_message_scheduled_date",
+            "scheduled_date",
+            postgresql_where=text(SCHEDULED_PREDICATE),
+            sqlite_where=text(SCHEDULED_PREDICATE),
+        ),
+        Index(
+            "ix_message_next_remind_date",
+            "next_remind_date",
+            postgresql_where=text(REMINDER_PREDICATE),
+            sqlite_where=text(REMINDER_PREDICATE),
+        ),
+    )
+
     # reminders
     reminder_frequency: Mapped["ReminderFrequency"] = relationship(
         "ReminderFrequency", back_populates="messages"
@@ -85,3 +126,129 @@ class Message(Base):
         foreign_keys=[thread_id],
         cascade="save-update, merge",
     )
+
+
+# columns deciding whether and where a message is delivered
+INBOX_ATTRS = (
+    "is_draft",
+    "is_scheduled",
+    "is_enquiry",
+    "is_notification",
+    "date_created",
+)
+
+
+def sync_message_inbox(mapper, connection, target):
+    """Redelivers messages sent, unsent or moved between folders."""
+    state = inspect(target)
+    if any(state.attrs[attr].history.has_changes() for attr in INBOX_ATTRS):
+        mark_message_inbox(object_session(target), [target.message_id])
+
+
+def drop_message_inbox(mapper, connection, target):
+    mark_message_inbox(object_session(target), [target.message_id])
+
+
+event.listen(Message, "after_update", sync_message_inbox)
+event.listen(Message, "after_delete", drop_message_inbox)
+
+
+# columns deciding the sender's drafts / scheduled folder
+SENDER_ATTRS = (
+    "sender_id",
+    "is_draft",
+    "is_scheduled",
+    "is_notification",
+    "is_enquiry",
+)
+
+UNKNOWN = object()
+
+
+def sender_folder_of(target, committed: bool = False):
+    """(sender_id, drafts / scheduled folder) of the message, as of the last flush
+    when `committed`; None if a value isn't loaded."""
+    from app.services.message_counter_service import sender_folder
+
+    state = inspect(target)
+    values = []
+    for attr in SENDER_ATTRS:
+        history = state.attrs[attr].history
+        if committed and history.deleted:
+            values.append(history.deleted[0])
+        elif committed and history.added:
+            # replaced without being loaded
+            values.append(UNKNOWN)
+        else:
+            # no loads, the row may be gone
+            values.append(state.dict.get(attr, UNKNOWN))
+
+    if UNKNOWN in values:
+        return None
+    return values[0], sender_folder(*values[1:])
+
+
+def move_sender_folder(target, before, after):
+    """Moves the sender's drafts / scheduled counts, applied once the write commits."""
+    from app.services.message_counter_service import counter_changes
+
+    session = object_session(target)
+    if session is None or before == after:
+        return
+
+    changes = counter_changes(session)
+    for folder, delta in ((before, -1), (after, 1)):
+        if folder is None:
+            # unknown sender or folder, recount the current sender
+            changes.invalidate([inspect(target).dict.get("sender_id")])
+        elif folder is not False:
+            changes.add(*folder, delta)
+
+
+def count_sender_folder(mapper, connection, target):
+    move_sender_folder(target, False, sender_folder_of(target))
+
+
+def recount_sender_folder(mapper, connection, target):
+    move_sender_folder(
+        target, sender_folder_of(target, committed=True), sender_folder_of(target)
+    )
+
+
+def uncount_sender_folder(mapper, connection, target):
+    move_sender_folder(target, sender_folder_of(target, committed=True), False)
+
+
+event.listen(Message, "after_insert", count_sender_folder)
+event.listen(Message, "after_update", recount_sender_folder)
+event.listen(Message, "after_delete", uncount_sender_folder)
+
+
+# columns deciding when the dispatcher sends a message or fires its reminder
+DISPATCH_ATTRS = (
+    "is_scheduled",
+    "is_draft",
+    "scheduled_date",
+    "is_reminder",
+    "next_remind_date",
+)
+
+
+def track_message_dispatch(mapper, connection, target):
+    """Hands new deadlines to this worker's dispatcher once the write commits."""
+    from app.services.message_dispatch_service import mark_message_dispatch
+
+    state = inspect(target)
+    if not any(state.attrs[attr].history.has_changes() for attr in DISPATCH_ATTRS):
+        return
+
+    deadlines = []
+    if state.dict.get("is_scheduled") is True and state.dict.get("is_draft") is False:
+        deadlines.append(state.dict.get("scheduled_date"))
+    if state.dict.get("is_reminder") is True:
+        deadlines.append(state.dict.get("next_remind_date"))
+    mark_message_dispatch(object_session(target), deadlines)
+
+
+event.listen(Message, "after_insert", track_message_dispatch)
+event.listen(Message, "after_update", track_message_dispatch)
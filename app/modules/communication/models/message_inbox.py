@@ -0,0 +1,104 @@
+import uuid
+from datetime import datetime
+from typing import Iterable, Optional
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, UUID, event
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+# models
+from app.modules.common.models.model_base import BaseModel as Base
+
+
+class MessageInbox(Base):
+    """
+    One row per delivered message and reader: direct recipients, and the clients
+    whose contract on a recipient group (property/unit) covered the send date.
+    Written when the message is sent (MessageInboxService), so the inbox and
+    notifications folders are a single range scan of the covering index.
+    """
+
+    __tablename__ = "message_inbox"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    message_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    # "inbox" | "notifications"
+    folder: Mapped[str] = mapped_column(String(16))
+    is_read: Mapped[bool] = mapped_column(Boolean, default=False)
+    # message.date_created
+    sent_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+    __table_args__ = (
+        Index(
+            "ix_message_inbox_user_id_folder_sent_at",
+            "user_id",
+            "folder",
+            "sent_at",
+            "message_id",
+            postgresql_include=["is_read"],
+        ),
+        Index("ix_message_inbox_message_id", "message_id"),
+    )
+
+
+class MessageInboxFanout(Base):
+    """
+    Group deliveries still being written: the message, the recipient group and the
+    last under_contract row fanned out. Rows are deleted once the group's clients
+    all have their inbox row; a failing batch is retried from next_attempt_at.
+    """
+
+    __tablename__ = "message_inbox_fanout"
+
+    message_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    recipient_group_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True
+    )
+    msg_send_date: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    after_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), nullable=True
+    )
+    # failed batches in a row, the job skips the group until next_attempt_at
+    attempts: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    next_attempt_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+
+def mark_message_inbox(session: Optional[Session], message_ids: Iterable[uuid.UUID]):
+    """Queues messages for inbox delivery at the end of the flush."""
+    if session is not None:
+        session.info.setdefault("message_inbox", set()).update(
+            message_id for message_id in message_ids if message_id
+        )
+
+
+@event.listens_for(Session, "after_flush")
+def deliver_message_inbox(session: Session, flush_context):
+    """One delivery per flush for every message sent, changed or deleted by it."""
+    message_ids = session.info.pop("message_inbox", None)
+
+    if message_ids:
+        from app.services.message_counter_service import counter_changes
+        from app.services.message_inbox_service import message_inbox_service
+        from app.services.message_push_service import message_events
+
+        if message_inbox_service.deliver(
+            session.connection(),
+            message_ids,
+            counter_changes(session),
+            message_events(session),
+        ):
+            session.info["message_inbox_fanout"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def notify_message_inbox(session: Session):
+    if session.info.pop("message_inbox_fanout", None):
+        from app.services.message_inbox_service import message_inbox_service
+
+        # large groups left to the background batches
+        message_inbox_service.notify()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_message_inbox(session: Session, previous_transaction):
+    session.info.pop("message_inbox_fanout", None)
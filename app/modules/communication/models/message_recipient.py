@@ -2,12 +2,13 @@ import uuid
 import pytz
 from typing import Optional
 from datetime import datetime
-from sqlalchemy import DateTime, ForeignKey, Boolean, UUID
+from sqlalchemy import DateTime, ForeignKey, Boolean, Index, UUID, event, inspect
 
-from sqlalchemy.orm import relationship, Mapped, mapped_column
+from sqlalchemy.orm import relationship, Mapped, mapped_column, object_session
 
 # models
 from app.modules.common.models.model_base import BaseModel as Base
+from app.modules.communication.models.message_inbox import mark_message_inbox
 
 
 class MessageRecipient(Base):
@@ -16,8 +17,9 @@ class MessageRecipient(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
-    recipient_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.user_id")
+    # None on group rows (recipient_group_id)
+    recipient_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.user_id"), nullable=True
     )
     recipient_group_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -33,6 +35,15 @@ class MessageRecipient(Base):
         DateTime(timezone=True), default=lambda: datetime.now(pytz.utc)
     )
 
+    __table_args__ = (
+        Index("ix_message_recipient_recipient_id", "recipient_id"),
+        Index(
+            "ix_message_recipient_recipient_group_id_msg_send_date",
+            "recipient_group_id",
+            "msg_send_date",
+        ),
+    )
+
     # users
     recipient: Mapped["User"] = relationship(
         "User", back_populates="received_messages", lazy="selectin"
@@ -47,3 +58,16 @@ class MessageRecipient(Base):
     message_group: Mapped["PropertyUnitAssoc"] = relationship(
         "PropertyUnitAssoc", back_populates="messages_recipients", lazy="selectin"
     )
+
+
+def sync_message_inbox(mapper, connection, target):
+    """Delivers the message to added recipients, drops it for removed ones."""
+    history = inspect(target).attrs.message_id.history
+    mark_message_inbox(
+        object_session(target), [target.message_id, *(history.deleted or [])]
+    )
+
+
+event.listen(MessageRecipient, "after_insert", sync_message_inbox)
+event.listen(MessageRecipient, "after_update", sync_message_inbox)
+event.listen(MessageRecipient, "after_delete", sync_message_inbox)
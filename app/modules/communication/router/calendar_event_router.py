@@ -2,6 +2,7 @@ from typing import List
 
 # DAO
 from app.modules.communication.dao.calendar_event_dao import CalendarEventDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # Base CRUD Router
 from app.modules.common.router.base_router import BaseCRUDRouter
@@ -19,7 +20,7 @@ from app.modules.communication.schema.calendar_event_schema import (
 
 class CalendarEventRouter(BaseCRUDRouter):
     def __init__(self, prefix: str = "", tags: List[str] = []):
-        self.dao: CalendarEventDAO = CalendarEventDAO(excludes=[])
+        self.dao: CalendarEventDAO = dao_registry.get(CalendarEventDAO, excludes=[])
         CalendarEventSchema["create_schema"] = CalendarEventCreateSchema
         CalendarEventSchema["update_schema"] = CalendarEventUpdateSchema
         CalendarEventSchema["response_schema"] = CalendarEventResponse
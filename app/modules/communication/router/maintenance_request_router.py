@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.response import DAOResponse
 from app.modules.common.enums.common_enums import PriorityEnum
 from app.modules.communication.dao.maintenance_request_dao import MaintenanceRequestDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # Base CRUD Router
 from app.modules.common.router.base_router import BaseCRUDRouter
@@ -30,7 +31,9 @@ from app.core.errors import CustomException
 
 class MaintenanceRequestRouter(BaseCRUDRouter):
     def __init__(self, prefix: str = "", tags: List[str] = []):
-        self.dao: MaintenanceRequestDAO = MaintenanceRequestDAO(excludes=[])
+        self.dao: MaintenanceRequestDAO = dao_registry.get(
+            MaintenanceRequestDAO, excludes=[]
+        )
         MaintenanceRequestSchema["create_schema"] = MaintenanceRequestCreateSchema
         MaintenanceRequestSchema["update_schema"] = MaintenanceRequestUpdateSchema
         MaintenanceRequestSchema["response_schema"] = MaintenanceRequestResponse
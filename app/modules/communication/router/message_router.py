@@ -40,11 +40,13 @@
 
 from typing import List, Optional
 from pydantic import UUID4
-from fastapi import Depends, HTTPException, Query
+import jwt
+from fastapi import Depends, HTTPException, Query, WebSocket, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # DAO
 from app.modules.communication.dao.message_dao import MessageDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # Router
 from app.modules.common.router.base_router import BaseCRUDRouter
@@ -58,13 +60,17 @@ from app.modules.communication.schema.message_schema import (
 )
 
 
+# Services
+from app.services.message_push_service import message_push_service
+
 # Core
 from app.core.lifespan import get_db
 from app.core.response import DAOResponse
+from app.core.security import SecureAccessTokens
 
 class MessageRouter(BaseCRUDRouter):
     def __init__(self, prefix: str = "", tags: List[str] = []):
-        self.dao: MessageDAO = MessageDAO(excludes=[])
+        self.dao: MessageDAO = dao_registry.get(MessageDAO, excludes=[])
         MessageSchema["create_schema"] = MessageCreateSchema
         # Message["update_schema"] = MessageUpdateSchema
 
@@ -86,6 +92,49 @@ class MessageRouter(BaseCRUDRouter):
                 raise HTTPException(status_code=400, detail=result.error)
             return result
 
+        @self.router.get("/threads/{thread_id}")
+        async def get_thread(
+            thread_id: UUID4,
+            limit: int = Query(default=50, ge=1, le=200),
+            cursor: Optional[str] = None,
+            db_session: AsyncSession = Depends(get_db),
+        ):
+            return await self.dao.get_thread(
+                db_session=db_session, thread_id=thread_id, limit=limit, cursor=cursor
+            )
+
+        @self.router.get("/users/{user_id}/counters")
+        async def get_user_counters(
+            user_id: UUID4, db_session: AsyncSession = Depends(get_db)
+        ):
+            return await self.dao.get_user_counters(
+                db_session=db_session, user_id=user_id
+            )
+
+        @self.router.put("/users/{user_id}/messages/{message_id}/read")
+        async def mark_message_read(
+            user_id: UUID4,
+            message_id: UUID4,
+            db_session: AsyncSession = Depends(get_db),
+        ):
+            return await self.dao.mark_read(
+                db_session=db_session, user_id=user_id, message_id=message_id
+            )
+
+        @self.router.websocket("/users/{user_id}/events")
+        async def message_events(websocket: WebSocket, user_id: UUID4, token: str):
+            # browsers can't set headers on a socket, the access token comes in the query
+            try:
+                claims = SecureAccessTokens.decode_token(token)
+            except jwt.PyJWTError:
+                claims = {}
+            if claims.get("type") != "access" or claims.get("user_id") != str(user_id):
+                await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+                return
+
+            await websocket.accept()
+            await message_push_service.stream(websocket, user_id)
+
         @self.router.get("/users/{user_id}/drafts")
         async def get_user_drafts(
             user_id: UUID4,
@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 # DAO
 from app.modules.communication.dao.tour_bookings_dao import TourDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # Router
 from app.modules.common.router.base_router import BaseCRUDRouter
@@ -27,7 +28,7 @@ from app.core.response import DAOResponse
 
 class TourRouter(BaseCRUDRouter):
     def __init__(self, prefix: str = "", tags: List[str] = []):
-        self.dao: TourDAO = TourDAO(excludes=[])
+        self.dao: TourDAO = dao_registry.get(TourDAO, excludes=[])
         TourBookingsSchema["create_schema"] = TourCreateSchema
         TourBookingsSchema["update_schema"] = TourUpdateSchema
 
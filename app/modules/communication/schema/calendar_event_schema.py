@@ -10,6 +10,7 @@ from app.modules.communication.enums.communication_enums import (
 
 # Mixins
 from app.modules.communication.models.calendar_event import CalendarEvent
+from app.modules.common.schema.base_schema import lazy_example
 from app.modules.communication.schema.mixins.calendar_event_mixin import (
     CalendarEventBase,
     CalendarEventInfoMixin,
@@ -18,9 +19,9 @@ from app.modules.communication.schema.mixins.calendar_event_mixin import (
 
 class CalendarEventCreateSchema(CalendarEventBase, CalendarEventInfoMixin):
     model_config = ConfigDict(
-        json_schema_extra={
-            "example": CalendarEventInfoMixin._calendar_event_create_json
-        },
+        json_schema_extra=lazy_example(
+            CalendarEventInfoMixin._examples, "_calendar_event_create_json"
+        ),
     )
 
 
@@ -34,9 +35,9 @@ class CalendarEventUpdateSchema(CalendarEventBase, CalendarEventInfoMixin):
     completed_date: Optional[datetime] = None
 
     model_config = ConfigDict(
-        json_schema_extra={
-            "example": CalendarEventInfoMixin._calendar_event_update_json
-        },
+        json_schema_extra=lazy_example(
+            CalendarEventInfoMixin._examples, "_calendar_event_update_json"
+        ),
     )
 
 
@@ -9,6 +9,7 @@ from app.modules.communication.enums.communication_enums import MaintenanceStatu
 from app.modules.common.enums.common_enums import PriorityEnum
 
 # Mixins
+from app.modules.common.schema.base_schema import lazy_example
 from app.modules.communication.schema.mixins.maintenance_request_mixin import (
     MaintenanceRequestBase,
     MaintenanceRequestInfoMixin,
@@ -25,9 +26,9 @@ class MaintenanceRequestCreateSchema(
     MaintenanceRequestBase, MaintenanceRequestInfoMixin
 ):
     model_config = ConfigDict(
-        json_schema_extra={
-            "example": MaintenanceRequestInfoMixin._maintenance_request_create_json
-        },
+        json_schema_extra=lazy_example(
+            MaintenanceRequestInfoMixin._examples, "_maintenance_request_create_json"
+        ),
     )
 
 
@@ -41,9 +42,9 @@ class MaintenanceRequestUpdateSchema(
     media: Optional[List[MediaCreateSchema]] = None
 
     model_config = ConfigDict(
-        json_schema_extra={
-            "example": MaintenanceRequestInfoMixin._maintenance_request_update_json
-        },
+        json_schema_extra=lazy_example(
+            MaintenanceRequestInfoMixin._examples, "_maintenance_request_update_json"
+        ),
     )
 
 
@@ -133,10 +133,11 @@ class MessageResponse(BaseSchema, UserBaseMixin):
             MessageResponseModel: Message response object.
         """
 
-        # get message recipients
+        # get message recipients (group rows have no user)
         message_recipients = [
             cls.get_user_info(message_recipients.recipient)
             for message_recipients in message.recipients
+            if message_recipients.recipient is not None
         ]
 
         return cls(
@@ -1,5 +1,5 @@
 from uuid import UUID
-from typing import Optional
+from typing import Any, Dict, Optional
 from datetime import datetime
 
 # Enums
@@ -32,36 +32,44 @@ class CalendarEventBase(BaseSchema):
 
 
 class CalendarEventInfoMixin(UserBaseMixin):
-    # Faker attributes
-    _title = BaseFaker.sentence()
-    _description = BaseFaker.text(max_nb_chars=200)
-    _status = BaseFaker.random_element([e.value for e in CalendarStatusEnum])
-    _event_type = BaseFaker.random_element([e.value for e in EventTypeEnum])
-    _event_start_date = BaseFaker.future_datetime()
-    _event_end_date = BaseFaker.future_datetime()
-    _completed_date = BaseFaker.future_datetime()
-    _organizer_id = str(BaseFaker.uuid4())
+    @staticmethod
+    def _examples() -> Dict[str, Any]:
+        """OpenAPI example payloads, built only when the schema is requested."""
+        # Faker attributes
+        _title = BaseFaker.sentence()
+        _description = BaseFaker.text(max_nb_chars=200)
+        _status = BaseFaker.random_element([e.value for e in CalendarStatusEnum])
+        _event_type = BaseFaker.random_element([e.value for e in EventTypeEnum])
+        _event_start_date = BaseFaker.future_datetime()
+        _event_end_date = BaseFaker.future_datetime()
+        _completed_date = BaseFaker.future_datetime()
+        _organizer_id = str(BaseFaker.uuid4())
 
-    _calendar_event_create_json = {
-        "title": _title,
-        "description": _description,
-        "status": _status,
-        "event_type": _event_type,
-        "event_start_date": _event_start_date.isoformat(),
-        "event_end_date": _event_end_date.isoformat(),
-        "completed_date": _completed_date.isoformat(),
-        "organizer_id": _organizer_id,
-    }
+        _calendar_event_create_json = {
+            "title": _title,
+            "description": _description,
+            "status": _status,
+            "event_type": _event_type,
+            "event_start_date": _event_start_date.isoformat(),
+            "event_end_date": _event_end_date.isoformat(),
+            "completed_date": _completed_date.isoformat(),
+            "organizer_id": _organizer_id,
+        }
 
-    _calendar_event_update_json = {
-        "title": _title,
-        "description": _description,
-        "status": _status,
-        "event_type": _event_type,
-        "event_start_date": _event_start_date.isoformat(),
-        "event_end_date": _event_end_date.isoformat(),
-        "completed_date": _completed_date.isoformat(),
-    }
+        _calendar_event_update_json = {
+            "title": _title,
+            "description": _description,
+            "status": _status,
+            "event_type": _event_type,
+            "event_start_date": _event_start_date.isoformat(),
+            "event_end_date": _event_end_date.isoformat(),
+            "completed_date": _completed_date.isoformat(),
+        }
+
+        return {
+            "_calendar_event_create_json": _calendar_event_create_json,
+            "_calendar_event_update_json": _calendar_event_update_json,
+        }
 
     @classmethod
     def model_validate(cls, calendar_event: CalendarEventModel):
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, UUID4
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
 # Enums
 from app.modules.communication.enums.communication_enums import TourType, TourStatus
@@ -34,37 +34,45 @@ class TourBookings(TourBase):
 # 2. Add Schema Mixin with BaseFaker Examples
 
 class TourInfoMixin:
-    # BaseFaker attributes for generating example data
-    _name = BaseFaker.name()
-    _email = BaseFaker.email()
-    _phone_number = BaseFaker.phone_number()
-    _tour_type = BaseFaker.random_choices(['in_person', 'video_chat'], length=1)
-    _status = BaseFaker.random_choices(['incoming', 'cancelled', 'completed'], length=1)
-    _tour_date = BaseFaker.future_datetime()
-    _property_unit_assoc_id = BaseFaker.uuid4()
-    _user_id = BaseFaker.uuid4()
+    @staticmethod
+    def _examples() -> Dict[str, Any]:
+        """OpenAPI example payloads, built only when the schema is requested."""
+        # BaseFaker attributes for generating example data
+        _name = BaseFaker.name()
+        _email = BaseFaker.email()
+        _phone_number = BaseFaker.phone_number()
+        _tour_type = BaseFaker.random_choices(['in_person', 'video_chat'], length=1)
+        _status = BaseFaker.random_choices(['incoming', 'cancelled', 'completed'], length=1)
+        _tour_date = BaseFaker.future_datetime()
+        _property_unit_assoc_id = BaseFaker.uuid4()
+        _user_id = BaseFaker.uuid4()
 
-    _tour_create_json = {
-        "name": _name,
-        "email": _email,
-        "phone_number": _phone_number,
-        "tour_type": _tour_type[0],
-        "status": _status[0],
-        "tour_date": _tour_date.isoformat(),
-        "property_unit_assoc_id": _property_unit_assoc_id,
-        "user_id": _user_id,
-    }
+        _tour_create_json = {
+            "name": _name,
+            "email": _email,
+            "phone_number": _phone_number,
+            "tour_type": _tour_type[0],
+            "status": _status[0],
+            "tour_date": _tour_date.isoformat(),
+            "property_unit_assoc_id": _property_unit_assoc_id,
+            "user_id": _user_id,
+        }
 
-    _tour_update_json = {
-        "name": _name,
-        "email": _email,
-        "phone_number": _phone_number,
-        "tour_type": _tour_type[0],
-        "status": _status[0],
-        "tour_date": _tour_date.isoformat(),
-        "property_unit_assoc_id": _property_unit_assoc_id,
-        "user_id": _user_id,
-    }
+        _tour_update_json = {
+            "name": _name,
+            "email": _email,
+            "phone_number": _phone_number,
+            "tour_type": _tour_type[0],
+            "status": _status[0],
+            "tour_date": _tour_date.isoformat(),
+            "property_unit_assoc_id": _property_unit_assoc_id,
+            "user_id": _user_id,
+        }
+
+        return {
+            "_tour_create_json": _tour_create_json,
+            "_tour_update_json": _tour_update_json,
+        }
 
     @classmethod
     def get_tour_info(cls, tour: TourModel) -> TourBookings:
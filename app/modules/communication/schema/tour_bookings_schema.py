@@ -7,6 +7,7 @@ from app.modules.communication.enums.communication_enums import TourType, TourSt
 
 # Models
 from app.modules.communication.models.tour_bookings import TourBookings as TourModel
+from app.modules.common.schema.base_schema import lazy_example
 from app.modules.communication.schema.mixins.tour_bookings_mixin import TourInfoMixin
 from app.modules.communication.schema.tour_schema import TourBase
 
@@ -16,7 +17,7 @@ class TourCreateSchema(TourBase, TourInfoMixin):
         from_attributes=True,
         arbitrary_types_allowed=True,
         use_enum_values=True,
-        json_schema_extra={"example": TourInfoMixin._tour_create_json},
+        json_schema_extra=lazy_example(TourInfoMixin._examples, "_tour_create_json"),
     )
 
     @classmethod
@@ -38,7 +39,7 @@ class TourUpdateSchema(TourBase, TourInfoMixin):
         from_attributes=True,
         arbitrary_types_allowed=True,
         use_enum_values=True,
-        json_schema_extra={"example": TourInfoMixin._tour_update_json},
+        json_schema_extra=lazy_example(TourInfoMixin._examples, "_tour_update_json"),
     )
 
     @classmethod
@@ -6,6 +6,7 @@ from datetime import datetime
 
 # DAOs
 from app.modules.common.dao.base_dao import BaseDAO
+from app.modules.common.dao.dao_registry import dao_registry
 from app.modules.contract.dao.under_contract_dao import UnderContractDAO
 from app.modules.resources.dao.media_dao import MediaDAO
 from app.modules.billing.dao.utility_dao import UtilityDAO
@@ -27,7 +28,6 @@ from app.core.errors import CustomException, RecordNotFoundException
 
 # Services
 from fastapi import UploadFile
-from app.services.upload_service import MediaUploaderService
 
 
 class ContractDAO(BaseDAO[Contract]):
@@ -35,10 +35,10 @@ class ContractDAO(BaseDAO[Contract]):
         self.model = Contract
 
         # DAOs for related entities
-        self.under_contract_dao = UnderContractDAO()
-        self.media_dao = MediaDAO()
-        self.utility_dao = UtilityDAO()
-        self.invoice_dao = InvoiceDAO()
+        self.under_contract_dao = dao_registry.lazy(UnderContractDAO)
+        self.media_dao = dao_registry.lazy(MediaDAO)
+        self.utility_dao = dao_registry.lazy(UtilityDAO)
+        self.invoice_dao = dao_registry.lazy(InvoiceDAO)
 
         self.detail_mappings = {
             "media": self.media_dao,
@@ -158,19 +158,10 @@ class ContractDAO(BaseDAO[Contract]):
         if not contract:
             raise RecordNotFoundException(model="Contract", id=contract_id)
 
-        for idx, file in enumerate(files):
-            content = await file.read()
-            base64_content = f"data:{file.content_type};base64,{content.decode('latin1')}"
-            file_name = file.filename
-            media_type_str = "contract"
-
-            # Use MediaUploaderService
-            uploader = MediaUploaderService(base64_content, file_name, media_type_str)
-            response = uploader.upload()
-
-            if not response.success:
-                raise Exception(f"Upload failed: {response.error}")
+        # content already stored is not uploaded again
+        stored = await self.media_dao.upload_files(db_session, files, "contract")
 
+        for idx, (file, upload) in enumerate(zip(files, stored)):
             # Determine media type based on file content type
             content_type = file.content_type
             if "image" in content_type:
@@ -186,9 +177,10 @@ class ContractDAO(BaseDAO[Contract]):
 
             # Create Media instance
             media_data = {
-                "media_name": file_name,
+                "media_name": file.filename,
                 "media_type": media_type,
-                "content_url": response.data["content_url"],
+                "content_url": upload["content_url"],
+                "content_hash": upload["content_hash"],
                 "is_thumbnail": False,
                 "caption": captions[idx] if captions and idx < len(captions) else None,
                 "description": descriptions[idx]
@@ -207,7 +199,7 @@ class ContractDAO(BaseDAO[Contract]):
         contract_id: str,
         media_data: dict,
     ):
-        # Create Media instance
+        # Create Media instance, its file may be shared with other media
         media = Media(**media_data)
         db_session.add(media)
         await db_session.flush()
@@ -2,7 +2,7 @@ import uuid
 import pytz
 from typing import List
 from datetime import datetime
-from sqlalchemy.orm import relationship, Mapped, mapped_column, column_property
+from sqlalchemy.orm import relationship, object_session, Mapped, mapped_column
 from sqlalchemy import (
     Numeric,
     String,
@@ -13,14 +13,19 @@ from sqlalchemy import (
     Integer,
     Text,
     UUID,
-    select,
+    inspect,
 )
 
 # models
+from app.db.dbSequence import NumberSequence
 from app.modules.common.models.model_base import BaseModel as Base
 from app.modules.common.models.model_base_collection import BaseModelCollection
 from app.modules.contract.models.contract_type import ContractType
 from app.modules.billing.models.payment_type import PaymentType
+from app.modules.billing.models.receivable_due import mark_receivables_due
+
+# services
+from app.services.reference_data_service import reference_data
 
 # enums
 from app.modules.contract.enums.contract_enums import ContractStatusEnum
@@ -28,6 +33,7 @@ from app.modules.contract.enums.contract_enums import ContractStatusEnum
 
 class Contract(Base):
     __tablename__ = "contract"
+    CONTRACT_PREFIX: str = "CTR"
 
     contract_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -144,28 +150,22 @@ class Contract(Base):
 
     # contract_type
     contract_type: Mapped["ContractType"] = relationship(
-        "ContractType", back_populates="contracts", lazy="selectin"
+        "ContractType", back_populates="contracts", lazy="select"
     )
 
     # payment_type
     payment_type: Mapped["PaymentType"] = relationship(
-        "PaymentType", back_populates="contracts", lazy="selectin"
+        "PaymentType", back_populates="contracts", lazy="select"
     )
 
-    # generate dynamic column property
-    contract_type_value = column_property(
-        select(ContractType.contract_type_name)
-        .where(ContractType.contract_type_id == contract_type_id)
-        .correlate_except(ContractType)
-        .scalar_subquery()
-    )
+    # names resolved from the in-process reference data
+    @property
+    def contract_type_value(self):
+        return reference_data.contract_type_name(self.contract_type_id)
 
-    payment_type_value = column_property(
-        select(PaymentType.payment_type_name)
-        .where(PaymentType.payment_type_id == payment_type_id)
-        .correlate_except(PaymentType)
-        .scalar_subquery()
-    )
+    @property
+    def payment_type_value(self):
+        return reference_data.payment_type_name(self.payment_type_id)
 
     def to_dict(self, exclude=[]):
         if exclude is None:
@@ -176,10 +176,10 @@ class Contract(Base):
             if not key.startswith("_") and key not in exclude:
                 value = getattr(self, key)
                 if key == "contract_type_id":
-                    data["contract_type_value"] = str(self.contract_type)
+                    data["contract_type_value"] = self.contract_type_value
                     continue
                 if key == "payment_type_id":
-                    data["payment_type_value"] = str(self.payment_type)
+                    data["payment_type_value"] = self.payment_type_value
                     continue
                 if isinstance(value, uuid.UUID):
                     value = str(value)
@@ -188,24 +188,38 @@ class Contract(Base):
         return data
 
 
+# collision-free numbers, allocated in blocks from a db sequence
+CONTRACT_NUMBERS = NumberSequence(
+    "contract_number_seq", Contract.CONTRACT_PREFIX, "contract.contract_number"
+)
+
+
 @event.listens_for(Contract, "before_insert")
 def receive_before_insert(mapper, connection, target):
     if not target.contract_number:
-        current_time_str = datetime.now().strftime("%Y%m%d%H%M%S")
-        target.contract_number = f"CTR{current_time_str}"
+        target.contract_number = CONTRACT_NUMBERS.next(connection)
 
 
 @event.listens_for(Contract, "after_insert")
-def receive_after_insert(mapper, connection, target):
-    if not target.contract_number:
-        current_time_str = datetime.now().strftime("%Y%m%d%H%M%S")
-        target.contract_number = f"CTR{current_time_str}"
-        connection.execute(
-            target.__table__.update()
-            .where(target.__table__.c.contract_id == target.contract_id)
-            .values(contract_number=target.contract_number)
+@event.listens_for(Contract, "after_update")
+def sync_receivables_due(mapper, connection, target):
+    state = inspect(target)
+    keys = ("contract_number", "contract_status", "contract_type_id", "invoices")
+
+    if any(state.attrs[key].history.has_changes() for key in keys):
+        history = state.attrs.contract_number.history
+        mark_receivables_due(
+            object_session(target),
+            contract_numbers=[target.contract_number, *(history.deleted or [])],
         )
 
 
+@event.listens_for(Contract, "after_delete")
+def drop_receivables_due(mapper, connection, target):
+    mark_receivables_due(
+        object_session(target), contract_numbers=[target.contract_number]
+    )
+
+
 # Register model outside the class definition
 Base.setup_model_dynamic_listener("contract", Contract)
@@ -1,9 +1,10 @@
 import uuid
-from sqlalchemy import ForeignKey, String, UUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import ForeignKey, String, UUID, event, inspect
+from sqlalchemy.orm import Mapped, mapped_column, object_session
 
 # models
 from app.modules.common.models.model_base import BaseModel as Base
+from app.modules.billing.models.receivable_due import mark_receivables_due
 
 
 # Remove primary key field
@@ -24,3 +25,18 @@ class ContractInvoice(Base):
     invoice_number: Mapped[str] = mapped_column(
         String(128), ForeignKey("invoice.invoice_number")
     )
+
+
+def sync_receivables_due(mapper, connection, target):
+    """Listener for links written through the model (Contract.invoices writes are
+    picked up by the Contract/Invoice listeners)."""
+    history = inspect(target).attrs.invoice_number.history
+    mark_receivables_due(
+        object_session(target),
+        invoice_numbers=[target.invoice_number, *(history.deleted or [])],
+    )
+
+
+event.listen(ContractInvoice, "after_insert", sync_receivables_due)
+event.listen(ContractInvoice, "after_update", sync_receivables_due)
+event.listen(ContractInvoice, "after_delete", sync_receivables_due)
@@ -1,11 +1,12 @@
 from typing import List
 import uuid
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import DateTime, ForeignKey, Enum, UUID, String, event
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship, object_session
+from sqlalchemy import DateTime, ForeignKey, Enum, Index, UUID, String, event, inspect
 from datetime import datetime
 
 # models
 from app.modules.common.models.model_base import BaseModel as Base
+from app.modules.billing.models.receivable_due import mark_receivables_due
 
 # enums
 from app.modules.contract.enums.contract_enums import ContractStatusEnum
@@ -44,6 +45,15 @@ class UnderContract(Base):
     end_date: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     next_payment_due: Mapped[datetime] = mapped_column(DateTime(timezone=True))
 
+    __table_args__ = (
+        Index(
+            "ix_under_contract_property_unit_assoc_id_start_date_end_date",
+            "property_unit_assoc_id",
+            "start_date",
+            "end_date",
+        ),
+    )
+
     # properties
     properties: Mapped["PropertyUnitAssoc"] = relationship(
         "PropertyUnitAssoc",
@@ -133,3 +143,47 @@ def parse_dates(mapper, connection, target):
 
 event.listen(UnderContract, "before_insert", parse_dates)
 event.listen(UnderContract, "before_update", parse_dates)
+
+
+def sync_contract_active(mapper, connection, target):
+    """Listener to refresh the is_contract_active flag of the affected properties/units."""
+    from app.services.occupancy_service import occupancy_service
+
+    # a re-assigned contract also changes the flag of its previous property/unit
+    history = inspect(target).attrs.property_unit_assoc_id.history
+    ids = [target.property_unit_assoc_id, *(history.deleted or [])]
+
+    occupancy_service.sync_contract_flags(connection, object_session(target), ids)
+
+
+event.listen(UnderContract, "after_insert", sync_contract_active)
+event.listen(UnderContract, "after_update", sync_contract_active)
+event.listen(UnderContract, "after_delete", sync_contract_active)
+
+
+@event.listens_for(Session, "after_commit")
+def notify_occupancy_refresh(session: Session):
+    if session.info.pop("occupancy_refresh", None):
+        from app.services.occupancy_service import occupancy_service
+
+        # the job re-reads the next boundary once the contract is visible
+        occupancy_service.notify()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_occupancy_refresh(session: Session, previous_transaction):
+    session.info.pop("occupancy_refresh", None)
+
+
+def sync_receivables_due(mapper, connection, target):
+    """Listener to refresh the receivables of the (previous) contract of the row."""
+    history = inspect(target).attrs.contract_number.history
+    mark_receivables_due(
+        object_session(target),
+        contract_numbers=[target.contract_number, *(history.deleted or [])],
+    )
+
+
+event.listen(UnderContract, "after_insert", sync_receivables_due)
+event.listen(UnderContract, "after_update", sync_receivables_due)
+event.listen(UnderContract, "after_delete", sync_receivables_due)
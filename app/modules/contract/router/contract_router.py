@@ -6,6 +6,7 @@ from datetime import datetime
 
 # DAO
 from app.modules.contract.dao.contract_dao import ContractDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # Base CRUD Router
 from app.modules.common.router.base_router import BaseCRUDRouter
@@ -29,7 +30,7 @@ from app.core.errors import CustomException
 
 class ContractRouter(BaseCRUDRouter):
     def __init__(self, prefix: str = "", tags: List[str] = []):
-        self.dao: ContractDAO = ContractDAO(excludes=[])
+        self.dao: ContractDAO = dao_registry.get(ContractDAO, excludes=[])
         ContractSchema["create_schema"] = ContractCreateSchema
         ContractSchema["update_schema"] = ContractUpdateSchema
         # ContractSchema["response_schema"] = ContractResponse
@@ -2,6 +2,7 @@ from typing import List
 
 # DAO
 from app.modules.contract.dao.contract_type_dao import ContractTypeDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # Router
 from app.modules.common.router.base_router import BaseCRUDRouter
@@ -24,7 +25,7 @@ class ContractTypeRouter(BaseCRUDRouter):
         # ContractTypeSchema["response_schema"] = ContractTypeResponse
 
         # Initialize the DAO for ContractType
-        self.dao: ContractTypeDAO = ContractTypeDAO()
+        self.dao: ContractTypeDAO = dao_registry.get(ContractTypeDAO)
 
         # Call the base class constructor
         super().__init__(
@@ -3,6 +3,7 @@
 from typing import List
 from app.modules.common.router.base_router import BaseCRUDRouter
 from app.modules.contract.dao.under_contract_dao import UnderContractDAO
+from app.modules.common.dao.dao_registry import dao_registry
 from app.modules.contract.schema.under_contract_schema import (
     UnderContractCreateSchema,
     UnderContractUpdateSchema,
@@ -13,7 +14,7 @@ from app.modules.common.schema.schemas import UnderContractSchema
 class UnderContractRouter(BaseCRUDRouter):
     def __init__(self, prefix: str = "", tags: List[str] = []):
         # Initialize the DAO for UnderContract
-        self.dao = UnderContractDAO()
+        self.dao = dao_registry.get(UnderContractDAO)
 
         # Define the schemas for create and update operations
         UnderContractSchema["create_schema"] = UnderContractCreateSchema
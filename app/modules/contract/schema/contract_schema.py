@@ -9,6 +9,7 @@ from app.modules.contract.enums.contract_enums import ContractStatusEnum
 
 # Schema
 from app.modules.billing.schema.mixins.utility_mixin import UtilitiesMixin
+from app.modules.common.schema.base_schema import lazy_example
 from app.modules.contract.schema.mixins.contract_mixin import (
     Contract,
     ContractBase,
@@ -24,7 +25,7 @@ class ContractCreateSchema(ContractBase, ContractInfoMixin, UtilitiesMixin):
     contract_id: Optional[UUID] = None
 
     model_config = ConfigDict(
-        json_schema_extra={"example": ContractInfoMixin._contract_create_json},
+        json_schema_extra=lazy_example(ContractInfoMixin._examples, "_contract_create_json"),
     )
 
     @classmethod
@@ -64,7 +65,7 @@ class ContractUpdateSchema(ContractBase, ContractInfoMixin, UtilitiesMixin):
     end_date: Optional[datetime] = None
 
     model_config = ConfigDict(
-        json_schema_extra={"example": ContractInfoMixin._contract_update_json},
+        json_schema_extra=lazy_example(ContractInfoMixin._examples, "_contract_update_json"),
     )
 
     @classmethod
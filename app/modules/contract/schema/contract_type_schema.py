@@ -6,6 +6,7 @@ from pydantic import ConfigDict
 from app.modules.contract.enums.contract_enums import ContractTypeEnum
 
 # schemas
+from app.modules.common.schema.base_schema import lazy_example
 from app.modules.contract.schema.mixins.contract_type_mixin import (
     ContractTypeBase,
     ContractTypeInfoMixin,
@@ -19,7 +20,9 @@ class ContractTypeCreateSchema(ContractTypeBase, ContractTypeInfoMixin):
     contract_type_id: Optional[int] = None
 
     model_config = ConfigDict(
-        json_schema_extra={"example": ContractTypeInfoMixin._contract_type_create_json}
+        json_schema_extra=lazy_example(
+            ContractTypeInfoMixin._examples, "_contract_type_create_json"
+        )
     )
 
     @classmethod
@@ -38,7 +41,9 @@ class ContractTypeUpdateSchema(ContractTypeBase, ContractTypeInfoMixin):
     contract_type_name: Optional[ContractTypeEnum] = None
 
     model_config = ConfigDict(
-        json_schema_extra={"example": ContractTypeInfoMixin._contract_type_update_json}
+        json_schema_extra=lazy_example(
+            ContractTypeInfoMixin._examples, "_contract_type_update_json"
+        )
     )
 
     @classmethod
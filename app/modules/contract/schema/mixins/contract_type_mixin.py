@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 # enums
 from app.modules.contract.enums.contract_enums import ContractTypeEnum
@@ -23,18 +23,28 @@ class ContractType(BaseSchema):
 
 
 class ContractTypeInfoMixin:
-    _contract_type_name = BaseFaker.random_element([e.value for e in ContractTypeEnum])
-    _fee_percentage = round(BaseFaker.random_number(digits=3), 2)
-
-    _contract_type_create_json = {
-        "contract_type_name": _contract_type_name,
-        "fee_percentage": _fee_percentage,
-    }
-
-    _contract_type_update_json = {
-        "contract_type_name": _contract_type_name,
-        "fee_percentage": _fee_percentage,
-    }
+    @staticmethod
+    def _examples() -> Dict[str, Any]:
+        """OpenAPI example payloads, built only when the schema is requested."""
+        _contract_type_name = BaseFaker.random_element(
+            [e.value for e in ContractTypeEnum]
+        )
+        _fee_percentage = round(BaseFaker.random_number(digits=3), 2)
+
+        _contract_type_create_json = {
+            "contract_type_name": _contract_type_name,
+            "fee_percentage": _fee_percentage,
+        }
+
+        _contract_type_update_json = {
+            "contract_type_name": _contract_type_name,
+            "fee_percentage": _fee_percentage,
+        }
+
+        return {
+            "_contract_type_create_json": _contract_type_create_json,
+            "_contract_type_update_json": _contract_type_update_json,
+        }
 
     @classmethod
     def get_contract_type_info(
@@ -1,6 +1,6 @@
 from uuid import UUID
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from pydantic import Field
 
@@ -35,31 +35,41 @@ class UnderContract(UnderContractBase):
 
 
 class UnderContractInfoMixin:
-    # base attributes
-    _contract_status = BaseFaker.random_element([e.value for e in ContractStatusEnum])
-    _contract_number = f"CTR-{BaseFaker.bothify(text='#####')}"
-    _start_date = BaseFaker.date_this_year()
-    _end_date = BaseFaker.future_date()
-    _next_payment_due = BaseFaker.future_datetime()
+    @staticmethod
+    def _examples() -> Dict[str, Any]:
+        """OpenAPI example payloads, built only when the schema is requested."""
+        # base attributes
+        _contract_status = BaseFaker.random_element(
+            [e.value for e in ContractStatusEnum]
+        )
+        _contract_number = f"CTR-{BaseFaker.bothify(text='#####')}"
+        _start_date = BaseFaker.date_this_year()
+        _end_date = BaseFaker.future_date()
+        _next_payment_due = BaseFaker.future_datetime()
 
-    _under_contract_create_json = {
-        "property_unit_assoc_id": str(BaseFaker.uuid4()),
-        "contract_status": _contract_status,
-        "contract_number": _contract_number,
-        "client_id": str(BaseFaker.uuid4()),
-        "employee_id": str(BaseFaker.uuid4()),
-        "start_date": _start_date.isoformat(),
-        "end_date": _end_date.isoformat(),
-        "next_payment_due": _next_payment_due.isoformat(),
-    }
+        _under_contract_create_json = {
+            "property_unit_assoc_id": str(BaseFaker.uuid4()),
+            "contract_status": _contract_status,
+            "contract_number": _contract_number,
+            "client_id": str(BaseFaker.uuid4()),
+            "employee_id": str(BaseFaker.uuid4()),
+            "start_date": _start_date.isoformat(),
+            "end_date": _end_date.isoformat(),
+            "next_payment_due": _next_payment_due.isoformat(),
+        }
 
-    _under_contract_update_json = {
-        "property_unit_assoc_id": str(BaseFaker.uuid4()),
-        "contract_status": _contract_status,
-        "contract_number": _contract_number,
-        "client_id": str(BaseFaker.uuid4()),
-        "employee_id": str(BaseFaker.uuid4()),
-        "start_date": _start_date.isoformat(),
-        "end_date": _end_date.isoformat(),
-        "next_payment_due": _next_payment_due.isoformat(),
-    }
+        _under_contract_update_json = {
+            "property_unit_assoc_id": str(BaseFaker.uuid4()),
+            "contract_status": _contract_status,
+            "contract_number": _contract_number,
+            "client_id": str(BaseFaker.uuid4()),
+            "employee_id": str(BaseFaker.uuid4()),
+            "start_date": _start_date.isoformat(),
+            "end_date": _end_date.isoformat(),
+            "next_payment_due": _next_payment_due.isoformat(),
+        }
+
+        return {
+            "_under_contract_create_json": _under_contract_create_json,
+            "_under_contract_update_json": _under_contract_update_json,
+        }
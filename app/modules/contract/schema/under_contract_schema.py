@@ -10,6 +10,7 @@ from app.modules.contract.enums.contract_enums import ContractStatusEnum
 from app.modules.auth.schema.user_schema import UserBase
 from app.modules.properties.schema.property_schema import PropertyBase
 from app.modules.contract.schema.mixins.contract_mixin import ContractBase
+from app.modules.common.schema.base_schema import lazy_example
 from app.modules.contract.schema.mixins.under_contract_mixin import (
     UnderContract,
     UnderContractBase,
@@ -33,9 +34,9 @@ class UnderContractCreateSchema(UnderContract, UnderContractInfoMixin):
     next_payment_due: datetime
 
     model_config = ConfigDict(
-        json_schema_extra={
-            "example": UnderContractInfoMixin._under_contract_create_json
-        }
+        json_schema_extra=lazy_example(
+            UnderContractInfoMixin._examples, "_under_contract_create_json"
+        )
     )
 
 
@@ -50,9 +51,9 @@ class UnderContractUpdateSchema(UnderContract):
     next_payment_due: Optional[datetime] = None
 
     model_config = ConfigDict(
-        json_schema_extra={
-            "example": UnderContractInfoMixin._under_contract_update_json
-        }
+        json_schema_extra=lazy_example(
+            UnderContractInfoMixin._examples, "_under_contract_update_json"
+        )
     )
 
 
@@ -1,6 +1,7 @@
-from typing import Optional, List
+from typing import Optional, List, Union
 from uuid import UUID
-from sqlalchemy import func, select, and_
+from sqlalchemy import func, select, and_, cast, literal_column, Text
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # Models
@@ -8,9 +9,20 @@ from app.core.response import DAOResponse
 from app.modules.properties.models.property import Property
 from app.modules.properties.enums.property_enums import PropertyType, PropertyStatus
 from app.modules.contract.models.under_contract import UnderContract
+from app.modules.properties.models.unit import Units
+from app.modules.address.models.city import City
+from app.modules.address.models.region import Region
+from app.modules.address.models.country import Country
+from app.modules.address.models.address import Addresses
+from app.modules.resources.models.amenities import Amenities
+from app.modules.billing.models.utility import Utilities
+from app.modules.associations.models.entity_address import EntityAddress
+from app.modules.associations.models.entity_billable import EntityBillable
+from app.modules.associations.models.entity_amenities import EntityAmenities
 
 # DAOs
 from app.modules.common.dao.base_dao import BaseDAO
+from app.modules.common.dao.dao_registry import dao_registry
 from app.modules.properties.dao.unit_dao import UnitDAO
 from app.modules.resources.dao.media_dao import MediaDAO
 from app.modules.billing.dao.utility_dao import UtilityDAO
@@ -22,22 +34,36 @@ from app.core.errors import CustomException, RecordNotFoundException
 
 # Services
 from fastapi import UploadFile
-from app.services.upload_service import MediaUploaderService
 from app.modules.associations.models.entity_media import EntityMedia
 from app.modules.resources.models.media import Media
 from app.modules.resources.enums.resource_enums import MediaType
 from app.modules.associations.enums.entity_type_enums import EntityTypeEnum
+from app.modules.billing.enums.billing_enums import BillableTypeEnum
+
+
+def json_object(**fields: ColumnElement) -> ColumnElement:
+    """Build a `json_build_object` call from keyword -> column pairs."""
+    args = []
+    for key, value in fields.items():
+        args.extend([literal_column(f"'{key}'"), value])
+
+    return func.json_build_object(*args)
+
+
+def json_array(element: ColumnElement) -> ColumnElement:
+    """Aggregate rows into a JSON array, yielding `[]` instead of NULL for no rows."""
+    return func.coalesce(func.json_agg(element), literal_column("'[]'::json"))
 
 
 class PropertyDAO(BaseDAO[Property]):
     def __init__(self, excludes: Optional[List[str]] = None):
         self.model = Property
 
-        self.unit_dao = UnitDAO()
-        self.media_dao = MediaDAO()
-        self.address_dao = AddressDAO()
-        self.amenity_dao = AmenityDAO()
-        self.utility_dao = UtilityDAO()
+        self.unit_dao = dao_registry.lazy(UnitDAO)
+        self.media_dao = dao_registry.lazy(MediaDAO)
+        self.address_dao = dao_registry.lazy(AddressDAO)
+        self.amenity_dao = dao_registry.lazy(AmenityDAO)
+        self.utility_dao = dao_registry.lazy(UtilityDAO)
 
         self.detail_mappings = {
             "address": self.address_dao,
@@ -148,6 +174,233 @@ class PropertyDAO(BaseDAO[Property]):
         except Exception as e:
             raise CustomException(str(e))
 
+    def _media_document(self, entity_id: ColumnElement, entity_type: EntityTypeEnum):
+        media = Media.__table__
+        entity_media = EntityMedia.__table__
+
+        return (
+            select(
+                json_array(
+                    json_object(
+                        media_id=media.c.media_id,
+                        media_name=media.c.media_name,
+                        media_type=media.c.media_type,
+                        content_url=media.c.content_url,
+                        is_thumbnail=media.c.is_thumbnail,
+                        caption=media.c.caption,
+                        description=media.c.description,
+                    )
+                )
+            )
+            .select_from(
+                entity_media.join(media, entity_media.c.media_id == media.c.media_id)
+            )
+            .where(
+                entity_media.c.entity_id == entity_id,
+                entity_media.c.entity_type == entity_type.name,
+            )
+            .scalar_subquery()
+        )
+
+    def _amenities_document(
+        self, entity_id: ColumnElement, entity_type: EntityTypeEnum
+    ):
+        amenities = Amenities.__table__
+        entity_amenities = EntityAmenities.__table__
+
+        return (
+            select(
+                json_array(
+                    json_object(
+                        amenity_id=amenities.c.amenity_id,
+                        amenity_name=amenities.c.amenity_name,
+                        amenity_short_name=amenities.c.amenity_short_name,
+                        description=amenities.c.description,
+                    )
+                )
+            )
+            .select_from(
+                entity_amenities.join(
+                    amenities, entity_amenities.c.amenity_id == amenities.c.amenity_id
+                )
+            )
+            .where(
+                entity_amenities.c.entity_id == entity_id,
+                entity_amenities.c.entity_type == entity_type.name,
+            )
+            .scalar_subquery()
+        )
+
+    def _utilities_document(
+        self, entity_id: ColumnElement, entity_type: EntityTypeEnum
+    ):
+        # mirrors PropertyUnitInfoMixin.get_utilities_info: the entity_billable
+        # row with the name/description of its utility
+        entity_billable = EntityBillable.__table__
+        utilities = Utilities.__table__
+
+        return (
+            select(
+                json_array(
+                    json_object(
+                        utility_id=utilities.c.utility_id,
+                        name=utilities.c.name,
+                        description=utilities.c.description,
+                        billable_type=entity_billable.c.billable_type,
+                        billable_amount=entity_billable.c.billable_amount,
+                        apply_to_units=entity_billable.c.apply_to_units,
+                        payment_type_id=entity_billable.c.payment_type_id,
+                        start_period=entity_billable.c.start_period,
+                        end_period=entity_billable.c.end_period,
+                        billable_id=entity_billable.c.billable_id,
+                    )
+                )
+            )
+            .select_from(
+                entity_billable.outerjoin(
+                    utilities, entity_billable.c.billable_id == utilities.c.utility_id
+                )
+            )
+            .where(
+                entity_billable.c.entity_id == entity_id,
+                entity_billable.c.entity_type == entity_type.name,
+                entity_billable.c.billable_type == BillableTypeEnum.utilities.name,
+            )
+            .scalar_subquery()
+        )
+
+    def _address_document(self, entity_id: ColumnElement):
+        address = Addresses.__table__
+        entity_address = EntityAddress.__table__
+
+        return (
+            select(
+                json_array(
+                    json_object(
+                        address_type=address.c.address_type,
+                        primary=address.c.primary,
+                        address_1=address.c.address_1,
+                        address_2=address.c.address_2,
+                        city=City.__table__.c.city_name,
+                        region=Region.__table__.c.region_name,
+                        country=Country.__table__.c.country_name,
+                        address_postalcode=address.c.address_postalcode,
+                        address_id=address.c.address_id,
+                    )
+                )
+            )
+            .select_from(
+                entity_address.join(
+                    address, entity_address.c.address_id == address.c.address_id
+                )
+                .join(City.__table__, address.c.city_id == City.__table__.c.city_id)
+                .join(
+                    Region.__table__,
+                    address.c.region_id == Region.__table__.c.region_id,
+                )
+                .join(
+                    Country.__table__,
+                    address.c.country_id == Country.__table__.c.country_id,
+                )
+            )
+            .where(
+                entity_address.c.entity_id == entity_id,
+                entity_address.c.entity_type == EntityTypeEnum.property.name,
+            )
+            .scalar_subquery()
+        )
+
+    def _units_document(self, property_id: ColumnElement):
+        units = Units.__table__
+        unit_id = units.c.property_unit_assoc_id
+
+        return (
+            select(
+                json_array(
+                    json_object(
+                        property_unit_assoc_id=unit_id,
+                        property_id=units.c.property_id,
+                        property_unit_code=units.c.property_unit_code,
+                        property_unit_floor_space=units.c.property_unit_floor_space,
+                        property_unit_amount=units.c.property_unit_amount,
+                        property_floor_id=units.c.property_floor_id,
+                        property_status=units.c.property_status,
+                        property_unit_notes=units.c.property_unit_notes,
+                        property_unit_security_deposit=units.c.property_unit_security_deposit,
+                        property_unit_commission=units.c.property_unit_commission,
+                        has_amenities=units.c.has_amenities,
+                        amenities=self._amenities_document(
+                            unit_id, EntityTypeEnum.units
+                        ),
+                        media=self._media_document(unit_id, EntityTypeEnum.units),
+                        utilities=self._utilities_document(
+                            unit_id, EntityTypeEnum.units
+                        ),
+                    )
+                )
+            )
+            .where(units.c.property_id == property_id)
+            .scalar_subquery()
+        )
+
+    async def get_property_document(
+        self, db_session: AsyncSession, property_id: Union[UUID | str]
+    ) -> Optional[bytes]:
+        """
+        Build the `GET /property/{id}` response document in a single statement.
+
+        The nested units, media, amenities, utilities and address collections
+        are assembled with `json_build_object`/`json_agg` subqueries so the
+        database returns the serialized JSON directly.
+
+        Args:
+            db_session (AsyncSession): The database session.
+            property_id (Union[UUID, str]): The property identifier.
+
+        Returns:
+            Optional[bytes]: The UTF-8 encoded JSON document, or None when the
+            database does not support JSON aggregation (callers should fall back
+            to `get`).
+        """
+        if db_session.bind.dialect.name != "postgresql":
+            return None
+
+        prop = Property.__table__
+        prop_id = prop.c.property_unit_assoc_id
+
+        document = json_object(
+            property_unit_assoc_id=prop_id,
+            name=prop.c.name,
+            property_type=prop.c.property_type,
+            amount=prop.c.amount,
+            security_deposit=prop.c.security_deposit,
+            commission=prop.c.commission,
+            floor_space=prop.c.floor_space,
+            num_units=prop.c.num_units,
+            num_bathrooms=prop.c.num_bathrooms,
+            num_garages=prop.c.num_garages,
+            has_balconies=prop.c.has_balconies,
+            has_parking_space=prop.c.has_parking_space,
+            pets_allowed=prop.c.pets_allowed,
+            description=prop.c.description,
+            property_status=prop.c.property_status,
+            address=self._address_document(prop_id),
+            units=self._units_document(prop_id),
+            amenities=self._amenities_document(prop_id, EntityTypeEnum.property),
+            media=self._media_document(prop_id, EntityTypeEnum.property),
+            utilities=self._utilities_document(prop_id, EntityTypeEnum.property),
+        )
+
+        query = select(cast(document, Text)).where(
+            prop_id == self.validate_primary_key(str(property_id))
+        )
+        result = (await db_session.execute(query)).scalar_one_or_none()
+
+        if result is None:
+            raise RecordNotFoundException(model="Property", id=property_id)
+
+        return result.encode("utf-8")
+
     async def upload_media(
         self,
         property_id: str,
@@ -162,19 +415,10 @@ class PropertyDAO(BaseDAO[Property]):
         if not property:
             raise RecordNotFoundException(model="Property", id=property_id)
 
-        for idx, file in enumerate(files):
-            content = await file.read()
-            base64_image = f"data:{file.content_type};base64,{content.decode('latin1')}"
-            file_name = file.filename
-            media_type_str = "property"
-
-            # Use MediaUploaderService
-            uploader = MediaUploaderService(base64_image, file_name, media_type_str)
-            response = uploader.upload()
-
-            if not response.success:
-                raise Exception(f"Upload failed: {response.error}")
+        # content already stored is not uploaded again
+        stored = await self.media_dao.upload_files(db_session, files, "property")
 
+        for idx, (file, upload) in enumerate(zip(files, stored)):
             # Determine media type based on file content type
             content_type = file.content_type
             if "image" in content_type:
@@ -190,9 +434,10 @@ class PropertyDAO(BaseDAO[Property]):
 
             # Create Media instance
             media_data = {
-                "media_name": file_name,
+                "media_name": file.filename,
                 "media_type": media_type,
-                "content_url": response.data["content_url"],
+                "content_url": upload["content_url"],
+                "content_hash": upload["content_hash"],
                 "is_thumbnail": is_thumbnails[idx]
                 if is_thumbnails and idx < len(is_thumbnails)
                 else False,
@@ -213,7 +458,7 @@ class PropertyDAO(BaseDAO[Property]):
         property_id: str,
         media_data: dict,
     ):
-        # Create Media instance
+        # Create Media instance, its file may be shared with other media
         media = Media(**media_data)
         db_session.add(media)
         await db_session.flush()
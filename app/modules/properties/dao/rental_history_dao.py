@@ -5,13 +5,14 @@ from app.modules.properties.models.rental_history import PastRentalHistory
 
 # dao
 from app.modules.common.dao.base_dao import BaseDAO
+from app.modules.common.dao.dao_registry import dao_registry
 from app.modules.address.dao.address_dao import AddressDAO
 
 
 class PastRentalHistoryDAO(BaseDAO[PastRentalHistory]):
     def __init__(self, excludes: Optional[List[str]] = None):
         self.model = PastRentalHistory
-        self.address_dao = AddressDAO()
+        self.address_dao = dao_registry.lazy(AddressDAO)
 
         self.detail_mappings = {
             "address": self.address_dao,
@@ -5,6 +5,7 @@ from app.modules.properties.models.unit import Units
 
 # dao
 from app.modules.common.dao.base_dao import BaseDAO
+from app.modules.common.dao.dao_registry import dao_registry
 from app.modules.resources.dao.media_dao import MediaDAO
 from app.modules.address.dao.address_dao import AddressDAO
 from app.modules.billing.dao.utility_dao import UtilityDAO
@@ -15,10 +16,10 @@ class UnitDAO(BaseDAO[Units]):
     def __init__(self, excludes: Optional[List[str]] = []):
         self.model = Units
         self.detail_mappings = {}
-        self.media_dao = MediaDAO()
-        self.address_dao = AddressDAO()
-        self.utility_dao = UtilityDAO()
-        self.amenity_dao = AmenityDAO()
+        self.media_dao = dao_registry.lazy(MediaDAO)
+        self.address_dao = dao_registry.lazy(AddressDAO)
+        self.utility_dao = dao_registry.lazy(UtilityDAO)
+        self.amenity_dao = dao_registry.lazy(AmenityDAO)
 
         self.detail_mappings = {
             "media": self.media_dao,
@@ -1,7 +1,6 @@
-from datetime import datetime
 from typing import List, Optional
 import uuid
-from sqlalchemy.orm import relationship, column_property, Mapped, mapped_column
+from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy import (
     Numeric,
     String,
@@ -11,14 +10,10 @@ from sqlalchemy import (
     Boolean,
     UUID,
     ForeignKey,
-    select,
-    and_,
-    or_,
 )
 
 
 # models
-from app.modules.contract.models.under_contract import UnderContract
 from app.modules.properties.models.property_unit_association import PropertyUnitAssoc
 
 # enums
@@ -57,22 +52,6 @@ class Property(PropertyUnitAssoc):
         == PropertyUnitAssoc.property_unit_assoc_id,
     }
 
-    # Computed Property
-    is_contract_active: Mapped[bool] = column_property(
-        select(UnderContract.contract_number)
-        .where(
-            and_(
-                UnderContract.property_unit_assoc_id == property_unit_assoc_id,
-                UnderContract.start_date <= datetime.now(),
-                or_(
-                    UnderContract.end_date.is_(None),
-                    UnderContract.end_date >= datetime.now(),
-                ),
-            )
-        )
-        .exists()
-    )
-
     # maintenance_requests
     maintenance_requests: Mapped[List["MaintenanceRequest"]] = relationship(
         "MaintenanceRequest",
@@ -126,7 +105,7 @@ class Property(PropertyUnitAssoc):
     # entity_amenities
     entity_amenities: Mapped[List["EntityAmenities"]] = relationship(
         "EntityAmenities",
-        primaryjoin="Property.property_unit_assoc_id == EntityAmenities.entity_id",
+        primaryjoin="and_(Property.property_unit_assoc_id == EntityAmenities.entity_id, EntityAmenities.entity_type == 'property')",
         foreign_keys="[EntityAmenities.entity_id]",
         lazy="selectin",
         viewonly=True,
@@ -137,7 +116,7 @@ class Property(PropertyUnitAssoc):
     amenities: Mapped[List["Amenities"]] = relationship(
         "Amenities",
         secondary="entity_amenities",
-        primaryjoin="Property.property_unit_assoc_id == EntityAmenities.entity_id",
+        primaryjoin="and_(Property.property_unit_assoc_id == EntityAmenities.entity_id, EntityAmenities.entity_type == 'property')",
         secondaryjoin="EntityAmenities.amenity_id == Amenities.amenity_id",
         lazy="selectin",
         viewonly=True,
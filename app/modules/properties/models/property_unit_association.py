@@ -1,6 +1,6 @@
 import uuid
 from typing import List
-from sqlalchemy import String, UUID
+from sqlalchemy import Boolean, String, UUID, false
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 # models
@@ -14,6 +14,11 @@ class PropertyUnitAssoc(Base):
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
     property_unit_type: Mapped[str] = mapped_column(String)
+    # materialized occupancy flag, kept current by OccupancyService
+    # (on under_contract writes and at contract start/end boundaries)
+    is_contract_active: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default=false(), index=True
+    )
 
     __mapper_args__ = {
         "polymorphic_on": property_unit_type,
@@ -1,7 +1,6 @@
 import uuid
 from typing import List
-from datetime import datetime
-from sqlalchemy.orm import relationship, column_property, Mapped, mapped_column
+from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy import (
     Numeric,
     String,
@@ -10,14 +9,10 @@ from sqlalchemy import (
     Text,
     Boolean,
     UUID,
-    select,
-    and_,
-    or_,
     ForeignKey,
 )
 
 # models
-from app.modules.contract.models.under_contract import UnderContract
 from app.modules.properties.models.property_unit_association import PropertyUnitAssoc
 
 # enums
@@ -55,21 +50,6 @@ class Units(PropertyUnitAssoc):
         == PropertyUnitAssoc.property_unit_assoc_id,
     }
 
-    is_contract_active: Mapped[bool] = column_property(
-        select(UnderContract.contract_number)
-        .where(
-            and_(
-                UnderContract.property_unit_assoc_id == property_unit_assoc_id,
-                UnderContract.start_date <= datetime.now(),
-                or_(
-                    UnderContract.end_date.is_(None),
-                    UnderContract.end_date >= datetime.now(),
-                ),
-            )
-        )
-        .exists()
-    )
-
     # maintenance_requests
     maintenance_requests: Mapped[List["MaintenanceRequest"]] = relationship(
         "MaintenanceRequest",
@@ -126,7 +106,7 @@ class Units(PropertyUnitAssoc):
     # entity_amenities
     entity_amenities: Mapped[List["EntityAmenities"]] = relationship(
         "EntityAmenities",
-        primaryjoin="Units.property_unit_assoc_id == EntityAmenities.entity_id",
+        primaryjoin="and_(Units.property_unit_assoc_id == EntityAmenities.entity_id, EntityAmenities.entity_type == 'units')",
         foreign_keys="[EntityAmenities.entity_id]",
         lazy="selectin",
         viewonly=True,
@@ -136,7 +116,7 @@ class Units(PropertyUnitAssoc):
     amenities: Mapped[List["Amenities"]] = relationship(
         "Amenities",
         secondary="entity_amenities",
-        primaryjoin="Units.property_unit_assoc_id == EntityAmenities.entity_id",
+        primaryjoin="and_(Units.property_unit_assoc_id == EntityAmenities.entity_id, EntityAmenities.entity_type == 'units')",
         secondaryjoin="EntityAmenities.amenity_id == Amenities.amenity_id",
         lazy="selectin",
         viewonly=True,
@@ -2,6 +2,7 @@ from typing import List
 
 # dao
 from app.modules.properties.dao.property_assignment_dao import PropertyAssignmentDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # router
 from app.modules.common.router.base_router import BaseCRUDRouter
@@ -18,7 +19,9 @@ class PropertyAssignmentRouter(BaseCRUDRouter):
     def __init__(self, prefix: str = "", tags: List[str] = []):
         PropertyAssignmentSchema["create_schema"] = PropertyAssignmentCreate
         PropertyAssignmentSchema["update_schema"] = PropertyAssignmentUpdate
-        self.dao: PropertyAssignmentDAO = PropertyAssignmentDAO(excludes=[])
+        self.dao: PropertyAssignmentDAO = dao_registry.get(
+            PropertyAssignmentDAO, excludes=[]
+        )
 
         super().__init__(
             dao=self.dao, schemas=PropertyAssignmentSchema, prefix=prefix, tags=tags
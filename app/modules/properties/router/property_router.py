@@ -1,11 +1,12 @@
 from typing import List, Optional
 from pydantic import UUID4
-from fastapi import Depends, Query, UploadFile, File, Form, status
+from fastapi import Depends, Query, Response, UploadFile, File, Form, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
 # DAO
 from app.modules.properties.dao.property_dao import PropertyDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # Router
 from app.modules.common.router.base_router import BaseCRUDRouter
@@ -24,12 +25,12 @@ from app.modules.properties.enums.property_enums import PropertyType, PropertySt
 # Core
 from app.core.lifespan import get_db
 from app.core.response import DAOResponse
-from app.core.errors import CustomException
+from app.core.errors import CustomException, RecordNotFoundException
 
 
 class PropertyRouter(BaseCRUDRouter):
     def __init__(self, prefix: str = "", tags: List[str] = []):
-        self.dao: PropertyDAO = PropertyDAO(excludes=[])
+        self.dao: PropertyDAO = dao_registry.get(PropertyDAO, excludes=[])
         PropertySchema["create_schema"] = PropertyCreateSchema
         PropertySchema["update_schema"] = PropertyUpdateSchema
         PropertySchema["response_schema"] = PropertyResponse
@@ -39,7 +40,7 @@ class PropertyRouter(BaseCRUDRouter):
             schemas=PropertySchema,
             prefix=prefix,
             tags=tags,
-            route_overrides=["get_all"],
+            route_overrides=["get_all", "get"],
         )
         self.register_routes()
 
@@ -84,6 +85,31 @@ class PropertyRouter(BaseCRUDRouter):
                 offset=offset,
             )
 
+        @self.router.get("/{id}")
+        async def get_property(
+            id: UUID4, db_session: AsyncSession = Depends(get_db)
+        ) -> DAOResponse:
+            try:
+                # single-statement JSON document (postgres only)
+                document = await self.dao.get_property_document(
+                    db_session=db_session, property_id=id
+                )
+
+                if document is not None:
+                    return Response(
+                        content=DAOResponse(success=True).json_with_data(document),
+                        media_type="application/json",
+                    )
+
+                # fallback: multi-query ORM load
+                item = await self.dao.get(db_session=db_session, id=id)
+
+                return DAOResponse(success=True, data=item)
+            except RecordNotFoundException as e:
+                raise e
+            except Exception as e:
+                raise CustomException(e)
+
         @self.router.post(
             "/{property_id}/upload-media", status_code=status.HTTP_201_CREATED
         )
@@ -2,6 +2,7 @@ from typing import List
 
 # dao
 from app.modules.properties.dao.unit_dao import UnitDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # router
 from app.modules.common.router.base_router import BaseCRUDRouter
@@ -18,7 +19,7 @@ class UnitRouter(BaseCRUDRouter):
     def __init__(self, prefix: str = "", tags: List[str] = []):
         PropertySchema["create_schema"] = UnitCreateSchema
         PropertySchema["update_schema"] = UnitUpdateSchema
-        self.dao: UnitDAO = UnitDAO(excludes=[])
+        self.dao: UnitDAO = dao_registry.get(UnitDAO, excludes=[])
 
         super().__init__(dao=self.dao, schemas=PropertySchema, prefix=prefix, tags=tags)
         self.register_routes()
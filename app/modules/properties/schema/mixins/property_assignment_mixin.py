@@ -1,7 +1,7 @@
 from enum import Enum
 from uuid import UUID
 from datetime import datetime, timedelta
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 from pydantic import ConfigDict, model_validator
 
 # schemas
@@ -53,30 +53,38 @@ class PropertyAssignment(PropertyAssignmentBase):
 
 
 class PropertyAssignmentMixin:
-    _date_from = BaseFaker.date_time_between(start_date="-2y", end_date="now")
-    _date_to = _date_from + timedelta(days=BaseFaker.random_int(min=30, max=365))
-    _notes = BaseFaker.text(max_nb_chars=200)
-    _assignment_type = BaseFaker.random_choices(
-        ["other", "handler", "landlord", "contractor"], length=1
-    )
-
-    _property_assignment_create_json = {
-        "property_unit_assoc_id": str(BaseFaker.uuid4()),
-        "user_id": "e390775e-8c0d-45fd-ac4d-c7d1e75dfeff",
-        "assignment_type": _assignment_type[0],
-        "date_from": _date_from,
-        "date_to": _date_to,
-        "notes": _notes,
-    }
-
-    _property_assignment_update_json = {
-        "property_unit_assoc_id": str(BaseFaker.uuid4()),
-        "user_id": "e390775e-8c0d-45fd-ac4d-c7d1e75dfeff",
-        "assignment_type": _assignment_type[0],
-        "date_from": _date_from,
-        "date_to": _date_to,
-        "notes": _notes,
-    }
+    @staticmethod
+    def _examples() -> Dict[str, Any]:
+        """OpenAPI example payloads, built only when the schema is requested."""
+        _date_from = BaseFaker.date_time_between(start_date="-2y", end_date="now")
+        _date_to = _date_from + timedelta(days=BaseFaker.random_int(min=30, max=365))
+        _notes = BaseFaker.text(max_nb_chars=200)
+        _assignment_type = BaseFaker.random_choices(
+            ["other", "handler", "landlord", "contractor"], length=1
+        )
+
+        _property_assignment_create_json = {
+            "property_unit_assoc_id": str(BaseFaker.uuid4()),
+            "user_id": "e390775e-8c0d-45fd-ac4d-c7d1e75dfeff",
+            "assignment_type": _assignment_type[0],
+            "date_from": _date_from,
+            "date_to": _date_to,
+            "notes": _notes,
+        }
+
+        _property_assignment_update_json = {
+            "property_unit_assoc_id": str(BaseFaker.uuid4()),
+            "user_id": "e390775e-8c0d-45fd-ac4d-c7d1e75dfeff",
+            "assignment_type": _assignment_type[0],
+            "date_from": _date_from,
+            "date_to": _date_to,
+            "notes": _notes,
+        }
+
+        return {
+            "_property_assignment_create_json": _property_assignment_create_json,
+            "_property_assignment_update_json": _property_assignment_update_json,
+        }
 
     @classmethod
     def get_property_assignment_info(
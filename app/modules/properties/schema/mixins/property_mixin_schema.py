@@ -1,6 +1,6 @@
 from uuid import UUID
 from pydantic import UUID4
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 # enums
 from app.modules.properties.enums.property_enums import PropertyStatus, PropertyType
@@ -47,105 +47,113 @@ class PropertyUnit(PropertyUnitBase):
 
 
 class PropertyUnitInfoMixin:
-    _property_type = BaseFaker.random_choices(
-        ["residential", "commercial", "industrial"], length=1
-    )
-    _property_status = BaseFaker.random_choices(
-        ["sold", "rent", "lease", "bought", "available", "unavailable"], length=1
-    )
-    _property_unit_status = BaseFaker.random_choices(
-        ["sold", "rent", "lease", "bought", "available", "unavailable"], length=1
-    )
-    _amount = round(BaseFaker.random_number(digits=5), 2)
-    _security_deposit = round(BaseFaker.random_number(digits=4), 2)
-    _commission = round(BaseFaker.random_number(digits=3), 2)
-    _floor_space = BaseFaker.random_number(digits=3)
-    _address_type = BaseFaker.random_choices(["billing", "mailing"], length=1)
-
-    # utilities
-    _utility_name = BaseFaker.word()
-    _utility_description = BaseFaker.text(max_nb_chars=100)
-    _billable_amount = round(BaseFaker.random_number(digits=4), 2)
-    _apply_to_units = BaseFaker.boolean()
-    _start_date = BaseFaker.date_this_year()
-    _end_date = BaseFaker.future_date()
-    _payment_type_id = BaseFaker.random_int(min=1, max=1)
-
-    _unit_create_json = {
-        "property_id": "402c0deb-b978-40d6-a269-c690cbd99589",
-        "property_unit_code": f"Unit {BaseFaker.random_letter().upper()}{BaseFaker.random_digit()}",
-        "property_unit_floor_space": BaseFaker.random_int(min=50, max=150),
-        "property_unit_amount": BaseFaker.random_number(digits=4),
-        "property_floor_id": BaseFaker.random_int(min=1, max=5),
-        "property_status": _property_unit_status[0],
-        "property_unit_notes": BaseFaker.sentence(),
-        "property_unit_security_deposit": BaseFaker.random_number(digits=3),
-        "property_unit_commission": BaseFaker.random_number(digits=2),
-        "has_amenities": BaseFaker.boolean(),
-        "media": [
-            {
-                "media_name": BaseFaker.word(),
-                "media_type": BaseFaker.random_choices(
-                    ["image", "video", "audio", "document"]
-                )[0],
-                "content_url": BaseFaker.url(),
-                "is_thumbnail": BaseFaker.boolean(),
-                "caption": BaseFaker.sentence(),
-                "description": BaseFaker.text(max_nb_chars=200),
-            }
-        ],
-        "amenities": [
-            {
-                "amenity_name": BaseFaker.word(),
-                "amenity_short_name": BaseFaker.word(),
-                "amenity_description": BaseFaker.sentence(),
-            },
-        ],
-        "utilities": [
-            {
-                "name": _utility_name,
-                "description": _utility_description,
-                "billable_type": "utilities",
-                "billable_amount": _billable_amount,
-                "apply_to_units": _apply_to_units,
-                "payment_type_id": _payment_type_id,
-                "start_period": _start_date.isoformat(),
-                "end_period": _end_date.isoformat(),
-            }
-        ],
-    }
-
-    _unit_update_json = {
-        "property_id": "402c0deb-b978-40d6-a269-c690cbd99589",
-        "property_unit_code": f"Unit {BaseFaker.random_letter().upper()}{BaseFaker.random_digit()}",
-        "property_unit_floor_space": BaseFaker.random_int(min=50, max=150),
-        "property_unit_amount": BaseFaker.random_number(digits=4),
-        "property_floor_id": BaseFaker.random_int(min=1, max=5),
-        "property_status": _property_unit_status[0],
-        "property_unit_notes": BaseFaker.sentence(),
-        "property_unit_security_deposit": BaseFaker.random_number(digits=3),
-        "property_unit_commission": BaseFaker.random_number(digits=2),
-        "has_amenities": BaseFaker.boolean(),
-        "media": [
-            {
-                "media_name": BaseFaker.word(),
-                "media_type": BaseFaker.random_choices(
-                    ["image", "video", "audio", "document"]
-                )[0],
-                "content_url": BaseFaker.url(),
-                "is_thumbnail": BaseFaker.boolean(),
-                "caption": BaseFaker.sentence(),
-                "description": BaseFaker.text(max_nb_chars=200),
-            }
-        ],
-        "amenities": [
-            {
-                "amenity_name": BaseFaker.word(),
-                "amenity_short_name": BaseFaker.word(),
-                "amenity_description": BaseFaker.sentence(),
-            },
-        ],
-    }
+    @staticmethod
+    def _examples() -> Dict[str, Any]:
+        """OpenAPI example payloads, built only when the schema is requested."""
+        _property_type = BaseFaker.random_choices(
+            ["residential", "commercial", "industrial"], length=1
+        )
+        _property_status = BaseFaker.random_choices(
+            ["sold", "rent", "lease", "bought", "available", "unavailable"], length=1
+        )
+        _property_unit_status = BaseFaker.random_choices(
+            ["sold", "rent", "lease", "bought", "available", "unavailable"], length=1
+        )
+        _amount = round(BaseFaker.random_number(digits=5), 2)
+        _security_deposit = round(BaseFaker.random_number(digits=4), 2)
+        _commission = round(BaseFaker.random_number(digits=3), 2)
+        _floor_space = BaseFaker.random_number(digits=3)
+        _address_type = BaseFaker.random_choices(["billing", "mailing"], length=1)
+
+        # utilities
+        _utility_name = BaseFaker.word()
+        _utility_description = BaseFaker.text(max_nb_chars=100)
+        _billable_amount = round(BaseFaker.random_number(digits=4), 2)
+        _apply_to_units = BaseFaker.boolean()
+        _start_date = BaseFaker.date_this_year()
+        _end_date = BaseFaker.future_date()
+        _payment_type_id = BaseFaker.random_int(min=1, max=1)
+
+        _unit_create_json = {
+            "property_id": "402c0deb-b978-40d6-a269-c690cbd99589",
+            "property_unit_code": f"Unit {BaseFaker.random_letter().upper()}{BaseFaker.random_digit()}",
+            "property_unit_floor_space": BaseFaker.random_int(min=50, max=150),
+            "property_unit_amount": BaseFaker.random_number(digits=4),
+            "property_floor_id": BaseFaker.random_int(min=1, max=5),
+            "property_status": _property_unit_status[0],
+            "property_unit_notes": BaseFaker.sentence(),
+            "property_unit_security_deposit": BaseFaker.random_number(digits=3),
+            "property_unit_commission": BaseFaker.random_number(digits=2),
+            "has_amenities": BaseFaker.boolean(),
+            "media": [
+                {
+                    "media_name": BaseFaker.word(),
+                    "media_type": BaseFaker.random_choices(
+                        ["image", "video", "audio", "document"]
+                    )[0],
+                    "content_url": BaseFaker.url(),
+                    "is_thumbnail": BaseFaker.boolean(),
+                    "caption": BaseFaker.sentence(),
+                    "description": BaseFaker.text(max_nb_chars=200),
+                }
+            ],
+            "amenities": [
+                {
+                    "amenity_name": BaseFaker.word(),
+                    "amenity_short_name": BaseFaker.word(),
+                    "amenity_description": BaseFaker.sentence(),
+                },
+            ],
+            "utilities": [
+                {
+                    "name": _utility_name,
+                    "description": _utility_description,
+                    "billable_type": "utilities",
+                    "billable_amount": _billable_amount,
+                    "apply_to_units": _apply_to_units,
+                    "payment_type_id": _payment_type_id,
+                    "start_period": _start_date.isoformat(),
+                    "end_period": _end_date.isoformat(),
+                }
+            ],
+        }
+
+        _unit_update_json = {
+            "property_id": "402c0deb-b978-40d6-a269-c690cbd99589",
+            "property_unit_code": f"Unit {BaseFaker.random_letter().upper()}{BaseFaker.random_digit()}",
+            "property_unit_floor_space": BaseFaker.random_int(min=50, max=150),
+            "property_unit_amount": BaseFaker.random_number(digits=4),
+            "property_floor_id": BaseFaker.random_int(min=1, max=5),
+            "property_status": _property_unit_status[0],
+            "property_unit_notes": BaseFaker.sentence(),
+            "property_unit_security_deposit": BaseFaker.random_number(digits=3),
+            "property_unit_commission": BaseFaker.random_number(digits=2),
+            "has_amenities": BaseFaker.boolean(),
+            "media": [
+                {
+                    "media_name": BaseFaker.word(),
+                    "media_type": BaseFaker.random_choices(
+                        ["image", "video", "audio", "document"]
+                    )[0],
+                    "content_url": BaseFaker.url(),
+                    "is_thumbnail": BaseFaker.boolean(),
+                    "caption": BaseFaker.sentence(),
+                    "description": BaseFaker.text(max_nb_chars=200),
+                }
+            ],
+            "amenities": [
+                {
+                    "amenity_name": BaseFaker.word(),
+                    "amenity_short_name": BaseFaker.word(),
+                    "amenity_description": BaseFaker.sentence(),
+                },
+            ],
+        }
+
+        return {
+            "_unit_create_json": _unit_create_json,
+            "_unit_update_json": _unit_update_json,
+        }
 
     @classmethod
     def get_utilities_info(cls, entity_utilities: List[EntityBillableModel]):
@@ -153,7 +161,14 @@ class PropertyUnitInfoMixin:
         return (
             [
                 UtilitiesResponse.model_validate(
-                    {**entity_utility.to_dict()}
+                    {
+                        **entity_utility.to_dict(),
+                        "utility_id": getattr(entity_utility.utility, "utility_id", None),
+                        "name": getattr(entity_utility.utility, "name", None),
+                        "description": getattr(
+                            entity_utility.utility, "description", None
+                        ),
+                    }
                 )
                 for entity_utility in entity_utilities
             ]
@@ -239,179 +254,187 @@ class PropertyUnitAssocBase(BaseSchema):
 
 
 class PropertyInfoMixin(AddressMixin, PropertyUnitInfoMixin):
-    _property_type = BaseFaker.random_choices(
-        ["residential", "commercial", "industrial"], length=1
-    )
-    _property_status = BaseFaker.random_choices(
-        ["sold", "rent", "lease", "bought", "available", "unavailable"], length=1
-    )
-    _property_unit_status = BaseFaker.random_choices(
-        ["sold", "rent", "lease", "bought", "available", "unavailable"], length=1
-    )
-    _amount = round(BaseFaker.random_number(digits=5), 2)
-    _security_deposit = round(BaseFaker.random_number(digits=4), 2)
-    _commission = round(BaseFaker.random_number(digits=3), 2)
-    _floor_space = BaseFaker.random_number(digits=3)
-    _address_type = BaseFaker.random_choices(["billing", "mailing"], length=1)
-
-    # media faker attributes
-    _media_name = BaseFaker.word()
-    _media_type = BaseFaker.random_choices(
-        ["image", "video", "audio", "document"], length=1
-    )
-    _content_url = BaseFaker.url()
-    _is_thumbnail = BaseFaker.boolean()
-    _caption = BaseFaker.sentence()
-    _description = BaseFaker.text(max_nb_chars=200)
-
-    # amenitites faker attributes
-    _amenity_name = BaseFaker.word()
-    _amenity_short_name = BaseFaker.word()
-    _description = BaseFaker.sentence()
-
-    # utilities
-    _utility_name = BaseFaker.word()
-    _utility_description = BaseFaker.text(max_nb_chars=100)
-    _billable_amount = round(BaseFaker.random_number(digits=4), 2)
-    _apply_to_units = BaseFaker.boolean()
-    _start_date = BaseFaker.date_this_year()
-    _end_date = BaseFaker.future_date()
-    _payment_type_id = BaseFaker.random_int(min=1, max=1)
-
-    _property_create_json = {
-        "name": BaseFaker.company(),
-        "property_type": _property_type[0],
-        "amount": _amount,
-        "security_deposit": _security_deposit,
-        "commission": _commission,
-        "floor_space": _floor_space,
-        "num_units": BaseFaker.random_int(min=1, max=10),
-        "num_bathrooms": BaseFaker.random_int(min=1, max=4),
-        "num_garages": BaseFaker.random_int(min=0, max=2),
-        "has_balconies": BaseFaker.boolean(),
-        "has_parking_space": BaseFaker.boolean(),
-        "pets_allowed": BaseFaker.boolean(),
-        "description": BaseFaker.text(max_nb_chars=200),
-        "property_status": _property_status[0],
-        "address": [
-            {
-                "address_1": BaseFaker.address(),
-                "address_2": BaseFaker.street_address(),
-                "address_postalcode": "",
-                "address_type": _address_type[0],
-                "city": BaseFaker.city(),
-                "country": BaseFaker.country(),
-                "primary": True,
-                "emergency_address": False,
-                "region": BaseFaker.state(),
-            }
-        ],
-        "units": [
-            {
-                "property_unit_code": f"Unit {BaseFaker.random_letter().upper()}{BaseFaker.random_digit()}",
-                "property_unit_floor_space": BaseFaker.random_int(min=50, max=150),
-                "property_unit_amount": BaseFaker.random_number(digits=4),
-                "property_floor_id": BaseFaker.random_int(min=1, max=5),
-                "property_status": _property_unit_status[0],
-                "property_unit_notes": BaseFaker.sentence(),
-                "property_unit_security_deposit": BaseFaker.random_number(digits=3),
-                "property_unit_commission": BaseFaker.random_number(digits=2),
-                "has_amenities": BaseFaker.boolean(),
-            },
-        ],
-        "media": [
-            {
-                "media_name": BaseFaker.word(),
-                "media_type": BaseFaker.random_choices(
-                    ["image", "video", "audio", "document"]
-                )[0],
-                "content_url": BaseFaker.url(),
-                "is_thumbnail": BaseFaker.boolean(),
-                "caption": BaseFaker.sentence(),
-                "description": BaseFaker.text(max_nb_chars=200),
-            }
-        ],
-        "amenities": [
-            {
-                "amenity_name": BaseFaker.word(),
-                "amenity_short_name": BaseFaker.word(),
-                "amenity_description": BaseFaker.sentence(),
-            },
-        ],
-        "utilities": [
-            {
-                "name": _utility_name,
-                "description": _utility_description,
-                "billable_type": "utilities",
-                "billable_amount": _billable_amount,
-                "apply_to_units": _apply_to_units,
-                "payment_type_id": _payment_type_id,
-                "start_period": _start_date.isoformat(),
-                "end_period": _end_date.isoformat(),
-            }
-        ],
-    }
-
-    _property_update_json = {
-        "name": BaseFaker.company(),
-        "property_type": _property_type[0],
-        "amount": _amount,
-        "security_deposit": _security_deposit,
-        "commission": _commission,
-        "floor_space": _floor_space,
-        "num_units": BaseFaker.random_int(min=1, max=10),
-        "num_bathrooms": BaseFaker.random_int(min=1, max=4),
-        "num_garages": BaseFaker.random_int(min=0, max=2),
-        "has_balconies": BaseFaker.boolean(),
-        "has_parking_space": BaseFaker.boolean(),
-        "pets_allowed": BaseFaker.boolean(),
-        "description": BaseFaker.text(max_nb_chars=200),
-        "property_status": _property_status[0],
-        "address": [
-            {
-                "address_1": BaseFaker.address(),
-                "address_2": BaseFaker.street_address(),
-                "address_postalcode": "",
-                "address_type": _address_type[0],
-                "city": BaseFaker.city(),
-                "country": BaseFaker.country(),
-                "primary": True,
-                "emergency_address": False,
-                "region": BaseFaker.state(),
-            }
-        ],
-        "units": [
-            {
-                "property_unit_code": f"Unit {BaseFaker.random_letter().upper()}{BaseFaker.random_digit()}",
-                "property_unit_floor_space": BaseFaker.random_int(min=50, max=150),
-                "property_unit_amount": BaseFaker.random_number(digits=4),
-                "property_floor_id": BaseFaker.random_int(min=1, max=5),
-                "property_status": _property_unit_status[0],
-                "property_unit_notes": BaseFaker.sentence(),
-                "property_unit_security_deposit": BaseFaker.random_number(digits=3),
-                "property_unit_commission": BaseFaker.random_number(digits=2),
-                "has_amenities": BaseFaker.boolean(),
-                "property_unit_assoc_id": "06ff99dd-d3a7-454d-98ff-39dd8894f92f",
-            },
-        ],
-        "media": [
-            {
-                "media_name": _media_name,
-                "media_type": _media_type[0],
-                "content_url": _content_url,
-                "is_thumbnail": _is_thumbnail,
-                "caption": _caption,
-                "description": _description,
-            }
-        ],
-        "amenities": [
-            {
-                "amenity_name": _amenity_name,
-                "amenity_short_name": _amenity_short_name,
-                "description": _description,
-            }
-        ],
-    }
+    @staticmethod
+    def _examples() -> Dict[str, Any]:
+        """OpenAPI example payloads, built only when the schema is requested."""
+        _property_type = BaseFaker.random_choices(
+            ["residential", "commercial", "industrial"], length=1
+        )
+        _property_status = BaseFaker.random_choices(
+            ["sold", "rent", "lease", "bought", "available", "unavailable"], length=1
+        )
+        _property_unit_status = BaseFaker.random_choices(
+            ["sold", "rent", "lease", "bought", "available", "unavailable"], length=1
+        )
+        _amount = round(BaseFaker.random_number(digits=5), 2)
+        _security_deposit = round(BaseFaker.random_number(digits=4), 2)
+        _commission = round(BaseFaker.random_number(digits=3), 2)
+        _floor_space = BaseFaker.random_number(digits=3)
+        _address_type = BaseFaker.random_choices(["billing", "mailing"], length=1)
+
+        # media faker attributes
+        _media_name = BaseFaker.word()
+        _media_type = BaseFaker.random_choices(
+            ["image", "video", "audio", "document"], length=1
+        )
+        _content_url = BaseFaker.url()
+        _is_thumbnail = BaseFaker.boolean()
+        _caption = BaseFaker.sentence()
+        _description = BaseFaker.text(max_nb_chars=200)
+
+        # amenitites faker attributes
+        _amenity_name = BaseFaker.word()
+        _amenity_short_name = BaseFaker.word()
+        _description = BaseFaker.sentence()
+
+        # utilities
+        _utility_name = BaseFaker.word()
+        _utility_description = BaseFaker.text(max_nb_chars=100)
+        _billable_amount = round(BaseFaker.random_number(digits=4), 2)
+        _apply_to_units = BaseFaker.boolean()
+        _start_date = BaseFaker.date_this_year()
+        _end_date = BaseFaker.future_date()
+        _payment_type_id = BaseFaker.random_int(min=1, max=1)
+
+        _property_create_json = {
+            "name": BaseFaker.company(),
+            "property_type": _property_type[0],
+            "amount": _amount,
+            "security_deposit": _security_deposit,
+            "commission": _commission,
+            "floor_space": _floor_space,
+            "num_units": BaseFaker.random_int(min=1, max=10),
+            "num_bathrooms": BaseFaker.random_int(min=1, max=4),
+            "num_garages": BaseFaker.random_int(min=0, max=2),
+            "has_balconies": BaseFaker.boolean(),
+            "has_parking_space": BaseFaker.boolean(),
+            "pets_allowed": BaseFaker.boolean(),
+            "description": BaseFaker.text(max_nb_chars=200),
+            "property_status": _property_status[0],
+            "address": [
+                {
+                    "address_1": BaseFaker.address(),
+                    "address_2": BaseFaker.street_address(),
+                    "address_postalcode": "",
+                    "address_type": _address_type[0],
+                    "city": BaseFaker.city(),
+                    "country": BaseFaker.country(),
+                    "primary": True,
+                    "emergency_address": False,
+                    "region": BaseFaker.state(),
+                }
+            ],
+            "units": [
+                {
+                    "property_unit_code": f"Unit {BaseFaker.random_letter().upper()}{BaseFaker.random_digit()}",
+                    "property_unit_floor_space": BaseFaker.random_int(min=50, max=150),
+                    "property_unit_amount": BaseFaker.random_number(digits=4),
+                    "property_floor_id": BaseFaker.random_int(min=1, max=5),
+                    "property_status": _property_unit_status[0],
+                    "property_unit_notes": BaseFaker.sentence(),
+                    "property_unit_security_deposit": BaseFaker.random_number(digits=3),
+                    "property_unit_commission": BaseFaker.random_number(digits=2),
+                    "has_amenities": BaseFaker.boolean(),
+                },
+            ],
+            "media": [
+                {
+                    "media_name": BaseFaker.word(),
+                    "media_type": BaseFaker.random_choices(
+                        ["image", "video", "audio", "document"]
+                    )[0],
+                    "content_url": BaseFaker.url(),
+                    "is_thumbnail": BaseFaker.boolean(),
+                    "caption": BaseFaker.sentence(),
+                    "description": BaseFaker.text(max_nb_chars=200),
+                }
+            ],
+            "amenities": [
+                {
+                    "amenity_name": BaseFaker.word(),
+                    "amenity_short_name": BaseFaker.word(),
+                    "amenity_description": BaseFaker.sentence(),
+                },
+            ],
+            "utilities": [
+                {
+                    "name": _utility_name,
+                    "description": _utility_description,
+                    "billable_type": "utilities",
+                    "billable_amount": _billable_amount,
+                    "apply_to_units": _apply_to_units,
+                    "payment_type_id": _payment_type_id,
+                    "start_period": _start_date.isoformat(),
+                    "end_period": _end_date.isoformat(),
+                }
+            ],
+        }
+
+        _property_update_json = {
+            "name": BaseFaker.company(),
+            "property_type": _property_type[0],
+            "amount": _amount,
+            "security_deposit": _security_deposit,
+            "commission": _commission,
+            "floor_space": _floor_space,
+            "num_units": BaseFaker.random_int(min=1, max=10),
+            "num_bathrooms": BaseFaker.random_int(min=1, max=4),
+            "num_garages": BaseFaker.random_int(min=0, max=2),
+            "has_balconies": BaseFaker.boolean(),
+            "has_parking_space": BaseFaker.boolean(),
+            "pets_allowed": BaseFaker.boolean(),
+            "description": BaseFaker.text(max_nb_chars=200),
+            "property_status": _property_status[0],
+            "address": [
+                {
+                    "address_1": BaseFaker.address(),
+                    "address_2": BaseFaker.street_address(),
+                    "address_postalcode": "",
+                    "address_type": _address_type[0],
+                    "city": BaseFaker.city(),
+                    "country": BaseFaker.country(),
+                    "primary": True,
+                    "emergency_address": False,
+                    "region": BaseFaker.state(),
+                }
+            ],
+            "units": [
+                {
+                    "property_unit_code": f"Unit {BaseFaker.random_letter().upper()}{BaseFaker.random_digit()}",
+                    "property_unit_floor_space": BaseFaker.random_int(min=50, max=150),
+                    "property_unit_amount": BaseFaker.random_number(digits=4),
+                    "property_floor_id": BaseFaker.random_int(min=1, max=5),
+                    "property_status": _property_unit_status[0],
+                    "property_unit_notes": BaseFaker.sentence(),
+                    "property_unit_security_deposit": BaseFaker.random_number(digits=3),
+                    "property_unit_commission": BaseFaker.random_number(digits=2),
+                    "has_amenities": BaseFaker.boolean(),
+                    "property_unit_assoc_id": "06ff99dd-d3a7-454d-98ff-39dd8894f92f",
+                },
+            ],
+            "media": [
+                {
+                    "media_name": _media_name,
+                    "media_type": _media_type[0],
+                    "content_url": _content_url,
+                    "is_thumbnail": _is_thumbnail,
+                    "caption": _caption,
+                    "description": _description,
+                }
+            ],
+            "amenities": [
+                {
+                    "amenity_name": _amenity_name,
+                    "amenity_short_name": _amenity_short_name,
+                    "description": _description,
+                }
+            ],
+        }
+
+        return {
+            "_property_create_json": _property_create_json,
+            "_property_update_json": _property_update_json,
+        }
 
     @classmethod
     def get_property_info(cls, property: Property) -> Property:
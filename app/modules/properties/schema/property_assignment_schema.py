@@ -6,6 +6,7 @@ from uuid import UUID
 from app.modules.properties.schema.mixins.property_mixin_schema import (
     PropertyDetailsMixin,
 )
+from app.modules.common.schema.base_schema import lazy_example
 from app.modules.properties.schema.mixins.property_assignment_mixin import (
     PropertyAssignment,
     PropertyAssignmentBase,
@@ -26,9 +27,7 @@ class PropertyAssignmentCreate(PropertyAssignment):
         # date: lambda v: v.strftime("%Y-%m-%d") if v else None,
         # datetime: lambda v: v.strftime("%Y-%m-%dT%H:%M:%S") if v else None,
         # },
-        json_schema_extra={
-            "example": PropertyAssignmentMixin._property_assignment_create_json
-        },
+        json_schema_extra=lazy_example(PropertyAssignmentMixin._examples, "_property_assignment_create_json"),
     )
 
     @classmethod
@@ -53,9 +52,7 @@ class PropertyAssignmentUpdate(PropertyAssignment):
         # date: lambda v: v.strftime("%Y-%m-%d") if v else None,
         # datetime: lambda v: v.strftime("%Y-%m-%dT%H:%M:%S") if v else None,
         # },
-        json_schema_extra={
-            "example": PropertyAssignmentMixin._property_assignment_update_json
-        },
+        json_schema_extra=lazy_example(PropertyAssignmentMixin._examples, "_property_assignment_update_json"),
     )
 
     @classmethod
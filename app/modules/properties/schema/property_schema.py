@@ -3,6 +3,7 @@ from typing import Any, Optional, Union
 
 # schema
 from app.modules.address.schema.address_mixin import AddressMixin
+from app.modules.common.schema.base_schema import lazy_example
 from app.modules.properties.schema.mixins.property_mixin_schema import (
     PropertyInfoMixin,
     PropertyBase,
@@ -24,7 +25,9 @@ class PropertyCreateSchema(PropertyBase, PropertyInfoMixin, AddressMixin):
         arbitrary_types_allowed=True,
         use_enum_values=True,
         # json_encoders={date: lambda v: v.strftime("%Y-%m-%d") if v else None},
-        json_schema_extra={"example": PropertyInfoMixin._property_create_json},
+        json_schema_extra=lazy_example(
+            PropertyInfoMixin._examples, "_property_create_json"
+        ),
     )
 
     @classmethod
@@ -53,7 +56,9 @@ class PropertyUpdateSchema(PropertyBase, PropertyInfoMixin, AddressMixin):
         arbitrary_types_allowed=True,
         use_enum_values=True,
         # json_encoders={date: lambda v: v.strftime("%Y-%m-%d") if v else None},
-        json_schema_extra={"example": PropertyInfoMixin._property_update_json},
+        json_schema_extra=lazy_example(
+            PropertyInfoMixin._examples, "_property_update_json"
+        ),
     )
 
     @classmethod
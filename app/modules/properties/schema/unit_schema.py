@@ -2,6 +2,7 @@ from pydantic import ConfigDict
 
 # schema
 from app.modules.address.schema.address_mixin import AddressMixin
+from app.modules.common.schema.base_schema import lazy_example
 from app.modules.properties.schema.mixins.property_mixin_schema import (
     PropertyUnitBase,
     PropertyUnitInfoMixin,
@@ -23,7 +24,9 @@ class UnitCreateSchema(PropertyUnitBase, PropertyUnitInfoMixin, AddressMixin):
         arbitrary_types_allowed=True,
         use_enum_values=True,
         # json_encoders={date: lambda v: v.strftime("%Y-%m-%d") if v else None},
-        json_schema_extra={"example": PropertyUnitInfoMixin._unit_create_json},
+        json_schema_extra=lazy_example(
+            PropertyUnitInfoMixin._examples, "_unit_create_json"
+        ),
     )
 
     @classmethod
@@ -37,7 +40,9 @@ class UnitUpdateSchema(PropertyUnitBase, PropertyUnitInfoMixin, AddressMixin):
         arbitrary_types_allowed=True,
         use_enum_values=True,
         # json_encoders={date: lambda v: v.strftime("%Y-%m-%d") if v else None},
-        json_schema_extra={"example": PropertyUnitInfoMixin._unit_update_json},
+        json_schema_extra=lazy_example(
+            PropertyUnitInfoMixin._examples, "_unit_update_json"
+        ),
     )
 
     @classmethod
@@ -1,19 +1,25 @@
+from fastapi import UploadFile
 from pydantic import ValidationError
 from typing_extensions import override
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Any, Dict, List, Optional, Union
 
 # core
+from app.core.errors import CustomException, IntegrityError
 from app.core.response import DAOResponse
 
 # models
 from app.modules.resources.models.media import Media
+from app.modules.resources.models.media_content import MediaContent
+from app.modules.associations.models.entity_media import EntityMedia
 
 # dao
 from app.modules.common.dao.base_dao import BaseDAO
 
 # services
-from app.services.upload_service import MediaUploaderService
+from app.services.upload_service import MediaUploaderService, media_upload_pool
 
 # schemas
 from app.modules.resources.schema.mixins.media_mixin import MediaBase
@@ -49,7 +55,7 @@ class MediaDAO(BaseDAO[Media]):
 
             # process media information
             media_info = await self.upload_and_process_media(
-                obj_in.model_dump(), media_store
+                obj_in.model_dump(), media_store, db_session=db_session
             )
 
             # create new media
@@ -80,9 +86,13 @@ class MediaDAO(BaseDAO[Media]):
 
             if "content_url" in media_info:
                 media_info = await self.upload_and_process_media(
-                    media_info, media_store
+                    media_info, media_store, db_session=db_session
                 )
 
+            # the row now points at other content
+            if "content_hash" in media_info:
+                db_obj.content_hash = media_info.pop("content_hash")
+
             # update media info
             existing_media: Media = await super().update(
                 db_session=db_session, db_obj=db_obj, obj_in=MediaBase(**media_info)
@@ -99,8 +109,125 @@ class MediaDAO(BaseDAO[Media]):
             await db_session.rollback()
             return DAOResponse[MediaResponse](success=False, error=f"{str(e)}")
 
+    @override
+    async def delete(self, db_session: AsyncSession, db_obj: Media):
+        """Deletes the media, unless an entity still links it."""
+        links = (
+            await db_session.execute(
+                select(func.count())
+                .select_from(EntityMedia)
+                .where(EntityMedia.media_id == db_obj.media_id)
+            )
+        ).scalar()
+        if links:
+            raise IntegrityError(
+                f"Media {db_obj.media_id} is still linked to {links} entities"
+            )
+
+        # the stored file stays, other media may share its content
+        return await super().delete(db_session=db_session, db_obj=db_obj)
+
+    async def get_by_content_hashes(
+        self, db_session: AsyncSession, hashes: List[str]
+    ) -> Dict[str, str]:
+        """Urls of the files already stored with any of the content hashes, by hash."""
+        if not hashes:
+            return {}
+
+        result = await db_session.execute(
+            select(MediaContent.content_hash, MediaContent.content_url).where(
+                MediaContent.content_hash.in_(set(hashes))
+            )
+        )
+        return dict(result.all())
+
+    async def add_contents(self, db_session: AsyncSession, contents: Dict[str, str]):
+        """
+        Records stored files (url by content hash); a content recorded meanwhile by
+        a concurrent upload keeps its url.
+        """
+        if not contents:
+            return
+
+        table = MediaContent.__table__
+        rows = [
+            {"content_hash": content_hash, "content_url": content_url}
+            for content_hash, content_url in contents.items()
+        ]
+
+        connection = await db_session.connection()
+        dialect = {"postgresql": postgresql, "sqlite": sqlite}.get(
+            connection.dialect.name
+        )
+        if dialect is not None:
+            await db_session.execute(
+                dialect.insert(table).on_conflict_do_nothing(
+                    index_elements=[table.c.content_hash]
+                ),
+                rows,
+            )
+            return
+
+        # no ON CONFLICT, skip the contents that already exist
+        existing = await self.get_by_content_hashes(db_session, list(contents))
+        rows = [row for row in rows if row["content_hash"] not in existing]
+        if rows:
+            await db_session.execute(insert(table), rows)
+
+    async def upload_files(
+        self, db_session: AsyncSession, files: List[UploadFile], media_store: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Uploads the files whose content is not stored yet, each distinct content
+        once; a file already stored is not uploaded again and reuses its url.
+
+        Returns the `content_url` and `content_hash` of each file, in the order of
+        `files`. The session's transaction is ended before the uploads, no
+        connection is held while they run; the new contents are recorded in the
+        next one, committed with the caller's media. When an upload fails, the
+        files that were stored are committed before CustomException is raised.
+        """
+        digests = await media_upload_pool.digest_files(files)
+        stored = await self.get_by_content_hashes(db_session, digests)
+        await db_session.commit()
+
+        pending = {}
+        for file, digest in zip(files, digests):
+            if digest not in stored:
+                pending.setdefault(digest, file)
+
+        if pending:
+            responses = await media_upload_pool.upload_files(
+                list(pending.values()), media_store.lower(), digests=list(pending)
+            )
+            uploaded = {
+                digest: response.data["content_url"]
+                for digest, response in zip(pending, responses)
+                if response.success
+            }
+            failed = [
+                f"{file.filename}: {response.error}"
+                for file, response in zip(pending.values(), responses)
+                if not response.success
+            ]
+            await self.add_contents(db_session, uploaded)
+
+            if failed:
+                # the files stored meanwhile are kept, a retry reuses them
+                await db_session.commit()
+                raise CustomException(f"Upload failed: {'; '.join(failed)}")
+            stored.update(uploaded)
+
+        return [
+            {"content_url": stored[digest], "content_hash": digest}
+            for digest in digests
+        ]
+
     async def upload_and_process_media(
-        self, media_info: Dict[str, Any], media_store: str
+        self,
+        media_info: Dict[str, Any],
+        media_store: str,
+        db_session: Optional[AsyncSession] = None,
     ) -> Dict[str, Any]:
         base64_data = media_info.get("content_url")
 
@@ -110,12 +237,39 @@ class MediaDAO(BaseDAO[Media]):
             media_type=media_store.lower(),
         )
 
-        upload_response = uploader_service.upload()
+        # a data uri is hashed first, content already stored is not uploaded again
+        source = uploader_service.source() if base64_data else None
+        file_io = None if source is None or isinstance(source, str) else source
+        content_hash = None
+        if file_io is not None:
+            content_hash = await media_upload_pool.digest(file_io)
 
-        if not upload_response.success:
-            raise Exception(str(upload_response.error))
+        existing = {}
+        if content_hash and db_session is not None:
+            existing = await self.get_by_content_hashes(db_session, [content_hash])
 
-        media_info["content_url"] = upload_response.data["content_url"]
+        if content_hash in existing:
+            # this row shares the stored file
+            media_info["content_url"] = existing[content_hash]
+            media_info["content_hash"] = content_hash
+        else:
+            upload_response = await media_upload_pool.upload(
+                base64_data,
+                media_info.get("media_name"),
+                media_store.lower(),
+                file_io=file_io,
+                sha256=content_hash,
+            )
+
+            if not upload_response.success:
+                raise Exception(str(upload_response.error))
+
+            media_info["content_url"] = upload_response.data["content_url"]
+            media_info["content_hash"] = content_hash
+            if content_hash and db_session is not None:
+                await self.add_contents(
+                    db_session, {content_hash: media_info["content_url"]}
+                )
 
         media_type = uploader_service.get_image_type()
         user_provided_media_type = media_info.get("media_type")
@@ -1,6 +1,6 @@
 import uuid
 from typing import Optional, List
-from sqlalchemy import Enum, String, UUID, Boolean, Text
+from sqlalchemy import Enum, Index, String, UUID, Boolean, Text
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 # Base model
@@ -24,6 +24,11 @@ class Media(Base):
     is_thumbnail: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
     caption: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # SHA-256 (hex) of the stored file (media_content), shared by every media
+    # row of the same content
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+
+    __table_args__ = (Index("ix_media_content_hash", "content_hash"),)
 
     # Relationships
     entity_media: Mapped[List["EntityMedia"]] = relationship(
@@ -31,6 +36,8 @@ class Media(Base):
         back_populates="media",
         overlaps="media",
         lazy="selectin",
+        # linked media is never deleted (MediaDAO.delete, ondelete RESTRICT)
+        passive_deletes="all",
     )
 
 
@@ -0,0 +1,20 @@
+from sqlalchemy import String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+# Base model
+from app.modules.common.models.model_base import BaseModel as Base
+
+
+class MediaContent(Base):
+    """
+    Stored media files, one row per content: an upload whose SHA-256 is already
+    here reuses the stored file's url instead of storing it again. Media rows (the
+    attachments, with their own name, caption, description and thumbnail flag)
+    point at it with media.content_hash.
+    """
+
+    __tablename__ = "media_content"
+
+    # SHA-256 (hex) of the stored file
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    content_url: Mapped[str] = mapped_column(Text)
@@ -1,6 +1,7 @@
 from typing import List
 from app.modules.common.router.base_router import BaseCRUDRouter
 from app.modules.resources.dao.amenity_dao import AmenityDAO
+from app.modules.common.dao.dao_registry import dao_registry
 from app.modules.resources.schema.amenities_schema import (
     AmenityCreateSchema,
     AmenityUpdateSchema,
@@ -11,7 +12,7 @@ from app.modules.common.schema.schemas import AmenitiesSchema
 
 class AmenityRouter(BaseCRUDRouter):
     def __init__(self, prefix: str = "", tags: List[str] = []):
-        self.dao = AmenityDAO()
+        self.dao = dao_registry.get(AmenityDAO)
         AmenitiesSchema["create_schema"] = AmenityCreateSchema
         AmenitiesSchema["update_schema"] = AmenityUpdateSchema
 
@@ -1,11 +1,19 @@
 from typing import List
+from fastapi.responses import FileResponse
+
+# core
+from app.core.errors import RecordNotFoundException
 
 # dao
 from app.modules.resources.dao.media_dao import MediaDAO
+from app.modules.common.dao.dao_registry import dao_registry
 
 # router
 from app.modules.common.router.base_router import BaseCRUDRouter
 
+# services
+from app.services.storage_service import LocalStorage, media_storage
+
 # schemas
 from app.modules.common.schema.schemas import MediaSchema
 from app.modules.resources.schema.media_schema import (
@@ -18,10 +26,25 @@ class MediaRouter(BaseCRUDRouter):
     def __init__(self, prefix: str = "", tags: List[str] = []):
         MediaSchema["create_schema"] = MediaCreateSchema
         MediaSchema["update_schema"] = MediaUpdateSchema
-        self.dao: MediaDAO = MediaDAO(excludes=[])
+        self.dao: MediaDAO = dao_registry.get(MediaDAO, excludes=[])
 
         super().__init__(dao=self.dao, schemas=MediaSchema, prefix=prefix, tags=tags)
         self.register_routes()
 
     def register_routes(self):
-        pass
+        @self.router.get("/files/{key:path}")
+        async def get_media_file(key: str):
+            # Cloudinary media is served by its own cdn
+            stored = (
+                media_storage.stat(key)
+                if isinstance(media_storage, LocalStorage)
+                else None
+            )
+            if stored is None:
+                raise RecordNotFoundException(model="Media file", id=key)
+
+            # content-addressed, a key never changes content
+            return FileResponse(
+                media_storage.path(key),
+                headers={"Cache-Control": "public, max-age=31536000, immutable"},
+            )
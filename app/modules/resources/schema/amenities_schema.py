@@ -1,6 +1,7 @@
 from pydantic import ConfigDict
 
 # schemas
+from app.modules.common.schema.base_schema import lazy_example
 from app.modules.resources.schema.mixins.amenities_mixin import (
     AmenityBase,
     AmenityInfoMixin,
@@ -15,7 +16,9 @@ class AmenityCreateSchema(AmenityBase, AmenityInfoMixin):
         from_attributes=True,
         arbitrary_types_allowed=True,
         # json_encoders={date: lambda v: v.strftime("%Y-%m-%d") if v else None},
-        json_schema_extra={"example": AmenityInfoMixin._amenity_create_json},
+        json_schema_extra=lazy_example(
+            AmenityInfoMixin._examples, "_amenity_create_json"
+        ),
     )
 
 
@@ -24,7 +27,9 @@ class AmenityUpdateSchema(AmenityBase):
         from_attributes=True,
         arbitrary_types_allowed=True,
         # json_encoders={date: lambda v: v.strftime("%Y-%m-%d") if v else None},
-        json_schema_extra={"example": AmenityInfoMixin._amenity_update_json},
+        json_schema_extra=lazy_example(
+            AmenityInfoMixin._examples, "_amenity_update_json"
+        ),
     )
 
 
@@ -3,7 +3,7 @@ from typing import Annotated, Optional
 from pydantic import ConfigDict, constr
 
 # schema mixin
-from app.modules.common.schema.base_schema import BaseSchema
+from app.modules.common.schema.base_schema import BaseSchema, lazy_example
 from app.modules.resources.schema.mixins.media_mixin import (
     Media,
     MediaInfoMixin,
@@ -19,7 +19,7 @@ class MediaCreateSchema(Media, MediaInfoMixin):
         arbitrary_types_allowed=True,
         use_enum_values=True,
         # json_encoders={date: lambda v: v.strftime("%Y-%m-%d") if v else None},
-        json_schema_extra={"example": MediaInfoMixin._media_create_json},
+        json_schema_extra=lazy_example(MediaInfoMixin._examples, "_media_create_json"),
     )
 
     @classmethod
@@ -41,7 +41,7 @@ class MediaUpdateSchema(Media):
         arbitrary_types_allowed=True,
         use_enum_values=True,
         # json_encoders={date: lambda v: v.strftime("%Y-%m-%d") if v else None},
-        json_schema_extra={"example": MediaInfoMixin._media_update_json},
+        json_schema_extra=lazy_example(MediaInfoMixin._examples, "_media_update_json"),
     )
 
     @classmethod
@@ -1,5 +1,5 @@
 from uuid import UUID
-from typing import Optional
+from typing import Any, Dict, Optional
 
 # schema
 from app.modules.common.schema.base_schema import BaseFaker
@@ -18,18 +18,26 @@ class Amenity(AmenityBase):
 
 
 class AmenityInfoMixin:
-    _amenity_name = BaseFaker.word()
-    _amenity_short_name = BaseFaker.word()
-    _description = BaseFaker.sentence()
-
-    _amenity_create_json = {
-        "amenity_name": _amenity_name,
-        "amenity_short_name": _amenity_short_name,
-        "description": _description,
-    }
-
-    _amenity_update_json = {
-        "amenity_name": _amenity_name,
-        "amenity_short_name": _amenity_short_name,
-        "description": _description,
-    }
+    @staticmethod
+    def _examples() -> Dict[str, Any]:
+        """OpenAPI example payloads, built only when the schema is requested."""
+        _amenity_name = BaseFaker.word()
+        _amenity_short_name = BaseFaker.word()
+        _description = BaseFaker.sentence()
+
+        _amenity_create_json = {
+            "amenity_name": _amenity_name,
+            "amenity_short_name": _amenity_short_name,
+            "description": _description,
+        }
+
+        _amenity_update_json = {
+            "amenity_name": _amenity_name,
+            "amenity_short_name": _amenity_short_name,
+            "description": _description,
+        }
+
+        return {
+            "_amenity_create_json": _amenity_create_json,
+            "_amenity_update_json": _amenity_update_json,
+        }
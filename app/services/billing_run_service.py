@@ -0,0 +1,605 @@
+import uuid
+import pytz
+import asyncio
+import threading
+from calendar import monthrange
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Set
+from sqlalchemy import Connection, and_, exists, insert, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.logger import AppLogger
+
+# services
+from app.services.invoice_rollup_service import invoice_rollup_service, as_enum
+from app.services.receivables_service import receivables_service
+
+# models
+from app.modules.associations.models.entity_billable import EntityBillable
+from app.modules.billing.models.billing_period import ContractBillingPeriod
+from app.modules.billing.models.invoice import Invoice, INVOICE_NUMBERS
+from app.modules.billing.models.invoice_item import InvoiceItem
+from app.modules.billing.models.payment_type import PaymentType
+from app.modules.billing.models.utility import Utilities
+from app.modules.contract.models.contract import Contract
+from app.modules.contract.models.contract_invoice import ContractInvoice
+from app.modules.contract.models.under_contract import UnderContract
+from app.modules.properties.models.unit import Units
+
+# enums
+from app.modules.associations.enums.entity_type_enums import EntityTypeEnum
+from app.modules.billing.enums.billing_enums import (
+    BillableTypeEnum,
+    InvoiceTypeEnum,
+    PaymentStatusEnum,
+    PaymentTypeEnum,
+)
+from app.modules.contract.enums.contract_enums import ContractStatusEnum
+
+logger = AppLogger().get_logger()
+
+# payment type: (months, days) between two due dates
+FREQUENCIES = {
+    PaymentTypeEnum.weekly: (0, 7),
+    PaymentTypeEnum.monthly: (1, 0),
+    PaymentTypeEnum.quarterly: (3, 0),
+    PaymentTypeEnum.bi_annual: (6, 0),
+    PaymentTypeEnum.annually: (12, 0),
+}
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    """`value` moved by `months`, clamped to the end of shorter months."""
+    year, month = divmod(value.month - 1 + months, 12)
+    year, month = value.year + year, month + 1
+    return value.replace(
+        year=year, month=month, day=min(value.day, monthrange(year, month)[1])
+    )
+
+
+def as_utc(value) -> Optional[datetime]:
+    """Aware UTC datetime (naive datetimes are UTC, dates are midnight UTC)."""
+    if value is None:
+        return None
+    if not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is None:
+        return pytz.utc.localize(value)
+    return value.astimezone(pytz.utc)
+
+
+def installments(
+    start: Optional[datetime],
+    end: Optional[datetime],
+    payment_type,
+    partitions: Optional[int],
+    limit: Optional[int],
+    period_start: datetime,
+    period_end: datetime,
+) -> List[datetime]:
+    """
+    Due dates of a payment schedule that fall in [period_start, period_end).
+
+    Dates are `start + k * step` for the payment type's step, before `end` and for at
+    most `limit` installments. `custom` splits start..end into `partitions` equal
+    steps; one_time (and anything unknown) is a single payment on `start`.
+    """
+    if start is None:
+        return []
+    start, end = as_utc(start), as_utc(end)
+    payment_type = as_enum(PaymentTypeEnum, payment_type)
+
+    # due_date(k) is the k-th installment, `elapsed` the steps from start to the period
+    if payment_type in FREQUENCIES:
+        months, days = FREQUENCIES[payment_type]
+        if months:
+            elapsed = (
+                (period_start.year - start.year) * 12 + period_start.month - start.month
+            ) // months
+
+            def due_date(k):
+                # from `start` every time, so the day of month doesn't drift
+                return add_months(start, k * months)
+        else:
+            elapsed = (period_start - start).days // days
+
+            def due_date(k):
+                return start + timedelta(days=k * days)
+    elif payment_type == PaymentTypeEnum.custom and partitions and end and end > start:
+        step = (end - start) / partitions
+        elapsed = int((period_start - start) / step)
+        limit = min(limit or partitions, partitions)
+
+        def due_date(k):
+            return start + step * k
+    else:
+        due_date = None
+
+    if due_date is None:
+        candidates = [start]
+    else:
+        k = max(elapsed - 1, 0)
+        candidates = []
+        while limit is None or k < limit:
+            due = due_date(k)
+            if due >= period_end or (end is not None and due >= end):
+                break
+            candidates.append(due)
+            k += 1
+
+    return [
+        due
+        for due in candidates
+        if period_start <= due < period_end and (end is None or due < end)
+    ]
+
+
+class BillingRunService:
+    """
+    Generates the invoices of a billing period for every active contract.
+
+    Candidate contracts are split into batches and billed by concurrent worker
+    tasks, one transaction per batch. A batch loads its contracts, their active
+    under_contract rows and the applicable utilities with a few set-based selects,
+    computes the due installments in memory and bulk-inserts the invoices, items and
+    contract links (the invoice totals, monthly rollups and receivables are written
+    alongside, the ORM listeners don't see Core inserts).
+
+    Every billed contract is claimed in contract_billing_period within the batch's
+    transaction, so a period can be rerun after a failure, or run concurrently, and
+    each contract is still billed once.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls, *args, **kwargs)
+        return cls._instance
+
+    def candidates(self, period_start: date, period_end: date):
+        """Active contracts overlapping the period that haven't been billed for it."""
+        contract = Contract.__table__
+        claims = ContractBillingPeriod.__table__
+
+        return (
+            select(contract.c.contract_id)
+            .where(
+                contract.c.contract_status == ContractStatusEnum.active,
+                contract.c.start_date < as_utc(period_end),
+                or_(
+                    contract.c.end_date.is_(None),
+                    contract.c.end_date >= as_utc(period_start),
+                ),
+                ~exists().where(
+                    claims.c.contract_id == contract.c.contract_id,
+                    claims.c.period_start == period_start,
+                ),
+            )
+            .order_by(contract.c.contract_id)
+        )
+
+    async def run(
+        self,
+        engine: AsyncEngine,
+        period_start: date,
+        period_end: date,
+        issued_by: Optional[uuid.UUID] = None,
+        batch_size: Optional[int] = None,
+        workers: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """
+        Bills [period_start, period_end) with `workers` concurrent batches of
+        `batch_size` contracts. `issued_by` is used for contracts without an employee
+        representative. Returns the run's counters.
+        """
+        batch_size = batch_size or settings.BILLING_RUN_BATCH_SIZE
+        workers = workers or settings.BILLING_RUN_WORKERS
+        if engine.dialect.name == "sqlite":
+            # a single writer, concurrent batches would only wait on the file lock
+            workers = 1
+
+        async with engine.connect() as conn:
+            contract_ids = (
+                (await conn.execute(self.candidates(period_start, period_end)))
+                .scalars()
+                .all()
+            )
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for start in range(0, len(contract_ids), batch_size):
+            queue.put_nowait(contract_ids[start : start + batch_size])
+
+        totals = {"contracts": len(contract_ids), "invoices": 0, "failed_batches": 0}
+
+        async def work():
+            while not queue.empty():
+                batch = queue.get_nowait()
+                try:
+                    async with engine.begin() as conn:
+                        totals["invoices"] += await conn.run_sync(
+                            self.bill_batch, batch, period_start, period_end, issued_by
+                        )
+                except Exception as e:
+                    # the batch rolled back, its contracts are billed by the next run
+                    totals["failed_batches"] += 1
+                    logger.error(f"Billing run batch failed: {e}")
+
+        await asyncio.gather(*(work() for _ in range(workers)))
+
+        logger.info(
+            f"Billing run {period_start}..{period_end}: {totals['invoices']} invoices "
+            f"for {totals['contracts']} contracts, {totals['failed_batches']} failed batches"
+        )
+        return totals
+
+    def bill_batch(
+        self,
+        connection: Connection,
+        contract_ids: List[uuid.UUID],
+        period_start: date,
+        period_end: date,
+        issued_by: Optional[uuid.UUID] = None,
+    ) -> int:
+        """Bills the given contracts for the period, returns the number of invoices."""
+        start, end = as_utc(period_start), as_utc(period_end)
+        contracts = self._load_contracts(connection, contract_ids)
+        tenants = self._load_tenants(connection, [c.contract_number for c in contracts])
+        utilities = self._load_utilities(connection, contracts, tenants)
+
+        invoices, items = [], {}
+        for contract in contracts:
+            tenant = tenants.get(contract.contract_number)
+            if tenant is None:
+                continue
+            issuer = tenant.employee_id or issued_by
+            if issuer is None or tenant.client_id is None:
+                logger.warning(
+                    f"Billing run: no issuer/client for contract {contract.contract_number}"
+                )
+                continue
+
+            contract_items, due_dates = [], []
+
+            dates = installments(
+                contract.start_date,
+                contract.end_date,
+                contract.payment_type_name,
+                contract.payment_partitions,
+                contract.num_invoices or None,
+                start,
+                end,
+            )
+            if dates and contract.payment_amount:
+                contract_items.append(
+                    self._item(
+                        "Lease payment",
+                        len(dates),
+                        contract.payment_amount,
+                        contract.contract_number,
+                    )
+                )
+                due_dates.extend(dates)
+
+            for utility in utilities.get(contract.contract_id, []):
+                dates = installments(
+                    utility.start_period or contract.start_date,
+                    utility.end_period or contract.end_date,
+                    utility.payment_type_name or contract.payment_type_name,
+                    utility.payment_partitions or contract.payment_partitions,
+                    None,
+                    start,
+                    end,
+                )
+                if dates and utility.billable_amount:
+                    contract_items.append(
+                        self._item(
+                            utility.name or BillableTypeEnum.utilities.value,
+                            len(dates),
+                            utility.billable_amount,
+                            str(utility.billable_id),
+                        )
+                    )
+                    due_dates.extend(dates)
+
+            if not contract_items:
+                continue
+
+            invoices.append(
+                {
+                    "contract_id": contract.contract_id,
+                    "contract_number": contract.contract_number,
+                    "issued_by": issuer,
+                    "issued_to": tenant.client_id,
+                    "invoice_amount": sum(
+                        item["total_price"] for item in contract_items
+                    ),
+                    "due_date": min(due_dates),
+                }
+            )
+            items[contract.contract_id] = contract_items
+
+        if not invoices:
+            return 0
+
+        numbers = INVOICE_NUMBERS.allocate(connection, len(invoices))
+        for invoice, number in zip(invoices, numbers):
+            invoice["invoice_number"] = number
+
+        claimed = self._claim(connection, invoices, period_start)
+        invoices = [
+            invoice for invoice in invoices if invoice["contract_id"] in claimed
+        ]
+        if not invoices:
+            return 0
+
+        self._insert(connection, invoices, items, period_start, period_end)
+        return len(invoices)
+
+    def _item(self, description: str, quantity: int, unit_price, reference_id: str):
+        return {
+            "description": description,
+            "quantity": quantity,
+            "unit_price": unit_price,
+            "total_price": unit_price * quantity,
+            "reference_id": reference_id,
+        }
+
+    def _load_contracts(self, connection: Connection, contract_ids: List[uuid.UUID]):
+        contract = Contract.__table__
+        payment_type = PaymentType.__table__
+
+        return connection.execute(
+            select(
+                contract.c.contract_id,
+                contract.c.contract_number,
+                contract.c.payment_amount,
+                contract.c.num_invoices,
+                contract.c.start_date,
+                contract.c.end_date,
+                payment_type.c.payment_type_name,
+                payment_type.c.payment_partitions,
+            )
+            .select_from(
+                contract.outerjoin(
+                    payment_type,
+                    payment_type.c.payment_type_id == contract.c.payment_type_id,
+                )
+            )
+            .where(contract.c.contract_id.in_(contract_ids))
+        ).all()
+
+    def _load_tenants(self, connection: Connection, contract_numbers: List[str]):
+        """Active under_contract row per contract (the earliest, if several)."""
+        under_contract = UnderContract.__table__
+        units = Units.__table__
+
+        rows = connection.execute(
+            select(
+                under_contract.c.contract_number,
+                under_contract.c.client_id,
+                under_contract.c.employee_id,
+                under_contract.c.property_unit_assoc_id,
+                units.c.property_id,
+            )
+            .select_from(
+                under_contract.outerjoin(
+                    units,
+                    units.c.property_unit_assoc_id
+                    == under_contract.c.property_unit_assoc_id,
+                )
+            )
+            .where(
+                under_contract.c.contract_number.in_(contract_numbers),
+                under_contract.c.contract_status == ContractStatusEnum.active,
+            )
+            .order_by(under_contract.c.start_date)
+        ).all()
+
+        tenants = {}
+        for row in rows:
+            tenants.setdefault(row.contract_number, row)
+        return tenants
+
+    def _load_utilities(self, connection: Connection, contracts, tenants) -> Dict:
+        """
+        Utilities billed with each contract: the contract's own, the leased unit's /
+        property's, and the parent property's when they apply to its units.
+        """
+        entity_billable = EntityBillable.__table__
+        payment_type = PaymentType.__table__
+        utility = Utilities.__table__
+
+        contract_ids = [contract.contract_id for contract in contracts]
+        leased: Dict[uuid.UUID, Set] = {}
+        parents: Dict[uuid.UUID, Set] = {}
+        for contract in contracts:
+            tenant = tenants.get(contract.contract_number)
+            if tenant is not None:
+                leased.setdefault(tenant.property_unit_assoc_id, set()).add(
+                    contract.contract_id
+                )
+                if tenant.property_id is not None:
+                    parents.setdefault(tenant.property_id, set()).add(
+                        contract.contract_id
+                    )
+
+        conditions = [
+            and_(
+                entity_billable.c.entity_type == EntityTypeEnum.contract,
+                entity_billable.c.entity_id.in_(contract_ids),
+            )
+        ]
+        if leased:
+            conditions.extend(
+                and_(
+                    entity_billable.c.entity_type == entity_type,
+                    entity_billable.c.entity_id.in_(list(leased)),
+                )
+                for entity_type in (EntityTypeEnum.units, EntityTypeEnum.property)
+            )
+        if parents:
+            conditions.append(
+                and_(
+                    entity_billable.c.entity_type == EntityTypeEnum.property,
+                    entity_billable.c.apply_to_units.is_(True),
+                    entity_billable.c.entity_id.in_(list(parents)),
+                )
+            )
+
+        rows = connection.execute(
+            select(
+                entity_billable.c.entity_billable_id,
+                entity_billable.c.entity_id,
+                entity_billable.c.entity_type,
+                entity_billable.c.billable_id,
+                entity_billable.c.billable_amount,
+                entity_billable.c.apply_to_units,
+                entity_billable.c.start_period,
+                entity_billable.c.end_period,
+                payment_type.c.payment_type_name,
+                payment_type.c.payment_partitions,
+                utility.c.name,
+            )
+            .select_from(
+                entity_billable.outerjoin(
+                    payment_type,
+                    payment_type.c.payment_type_id == entity_billable.c.payment_type_id,
+                ).outerjoin(
+                    utility, utility.c.utility_id == entity_billable.c.billable_id
+                )
+            )
+            .where(
+                entity_billable.c.billable_type == BillableTypeEnum.utilities,
+                or_(*conditions),
+            )
+        ).all()
+
+        utilities: Dict[uuid.UUID, List] = {}
+        for row in rows:
+            if row.entity_type == EntityTypeEnum.contract:
+                owners = {row.entity_id}
+            else:
+                owners = set(leased.get(row.entity_id, ()))
+                if row.entity_type == EntityTypeEnum.property and row.apply_to_units:
+                    owners |= parents.get(row.entity_id, set())
+
+            for contract_id in owners:
+                utilities.setdefault(contract_id, []).append(row)
+        return utilities
+
+    def _claim(
+        self, connection: Connection, invoices: List[Dict], period_start: date
+    ) -> Set[uuid.UUID]:
+        """Claims (contract, period) for the invoices, returns the contracts won."""
+        claims = ContractBillingPeriod.__table__
+        rows = [
+            {
+                "contract_id": invoice["contract_id"],
+                "period_start": period_start,
+                "invoice_number": invoice["invoice_number"],
+            }
+            for invoice in invoices
+        ]
+
+        dialect = {"postgresql": postgresql, "sqlite": sqlite}.get(
+            connection.dialect.name
+        )
+        if dialect is not None:
+            stmt = (
+                dialect.insert(claims)
+                .on_conflict_do_nothing(
+                    index_elements=[claims.c.contract_id, claims.c.period_start]
+                )
+                .returning(claims.c.contract_id)
+            )
+            return set(connection.execute(stmt, rows).scalars().all())
+
+        # no ON CONFLICT, skip the claims that already exist
+        existing = set(
+            connection.execute(
+                select(claims.c.contract_id).where(
+                    claims.c.period_start == period_start,
+                    claims.c.contract_id.in_([row["contract_id"] for row in rows]),
+                )
+            )
+            .scalars()
+            .all()
+        )
+        rows = [row for row in rows if row["contract_id"] not in existing]
+        if rows:
+            connection.execute(insert(claims), rows)
+        return {row["contract_id"] for row in rows}
+
+    def _insert(
+        self,
+        connection: Connection,
+        invoices: List[Dict],
+        items: Dict[uuid.UUID, List[Dict]],
+        period_start: date,
+        period_end: date,
+    ):
+        connection.execute(
+            insert(Invoice.__table__),
+            [
+                {
+                    "invoice_number": invoice["invoice_number"],
+                    "issued_by": invoice["issued_by"],
+                    "issued_to": invoice["issued_to"],
+                    "invoice_details": f"Contract {invoice['contract_number']}, "
+                    f"billing period {period_start} to {period_end}",
+                    "invoice_amount": invoice["invoice_amount"],
+                    "due_date": invoice["due_date"],
+                    "invoice_type": InvoiceTypeEnum.lease,
+                    "status": PaymentStatusEnum.pending,
+                }
+                for invoice in invoices
+            ],
+        )
+        connection.execute(
+            insert(InvoiceItem.__table__),
+            [
+                {"invoice_number": invoice["invoice_number"], **item}
+                for invoice in invoices
+                for item in items[invoice["contract_id"]]
+            ],
+        )
+        connection.execute(
+            insert(ContractInvoice.__table__),
+            [
+                {
+                    "contract_id": invoice["contract_id"],
+                    "invoice_number": invoice["invoice_number"],
+                }
+                for invoice in invoices
+            ],
+        )
+
+        # what the ORM listeners would have done for these rows
+        invoice_rollup_service.apply(
+            connection,
+            [
+                (
+                    (
+                        invoice["due_date"],
+                        PaymentStatusEnum.pending,
+                        InvoiceTypeEnum.lease,
+                        invoice["invoice_amount"],
+                    ),
+                    1,
+                )
+                for invoice in invoices
+            ],
+        )
+        receivables_service.refresh(
+            connection,
+            invoice_numbers=[invoice["invoice_number"] for invoice in invoices],
+        )
+
+
+billing_run_service = BillingRunService()
@@ -0,0 +1,275 @@
+import time
+import asyncio
+import smtplib
+import threading
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.core.logger import AppLogger
+
+logger = AppLogger().get_logger()
+
+# messages a worker takes off the queue per round trip to its thread
+BATCH_SIZE = 20
+
+# worth retrying on a fresh connection, anything else (5xx, auth) is final
+TRANSIENT_ERRORS = (
+    smtplib.SMTPServerDisconnected,
+    smtplib.SMTPConnectError,
+    smtplib.SMTPHeloError,
+    OSError,
+)
+
+# a refused message (a 4xx/5xx reply) leaves the connection usable; smtplib's
+# exceptions are all OSErrors, so these are told apart from dropped connections
+REPLY_ERRORS = (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused)
+
+
+class EmailDeliveryError(Exception):
+    pass
+
+
+@dataclass
+class EmailJob:
+    to: str
+    message: str
+    future: Optional[asyncio.Future] = None
+    attempts: int = 0
+    queued_at: float = field(default_factory=time.monotonic)
+
+
+def is_transient(error: Exception) -> bool:
+    if isinstance(error, smtplib.SMTPResponseException):
+        # 4xx: try again later
+        return 400 <= error.smtp_code < 500
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(400 <= code < 500 for code, _ in error.recipients.values())
+    return isinstance(error, TRANSIENT_ERRORS)
+
+
+class EmailDeliveryService:
+    """
+    Sends emails through a pool of persistent SMTP connections.
+
+    Messages go through a bounded queue (EMAIL_QUEUE_SIZE, senders wait when it is
+    full) to EMAIL_POOL_SIZE workers. Each worker owns one connection, logged in
+    once and reused for up to EMAIL_MESSAGES_PER_CONNECTION messages, and sends
+    batches of queued messages on its own thread so the event loop never blocks on
+    smtplib. Transient failures (dropped connection, 4xx) are retried with
+    exponential backoff up to EMAIL_MAX_RETRIES times; counts are kept in
+    `metrics`.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls, *args, **kwargs)
+                    cls._instance._queue = None
+                    cls._instance._workers = []
+                    cls._instance._retries = set()
+                    cls._instance._executor = None
+                    cls._instance.metrics = dict.fromkeys(
+                        (
+                            "queued",
+                            "sent",
+                            "retried",
+                            "failed",
+                            "connections",
+                            "batches",
+                        ),
+                        0,
+                    )
+                    cls._instance.metrics["latency_ms"] = 0.0
+        return cls._instance
+
+    # submitting
+
+    async def submit(self, to: str, message: str) -> asyncio.Future:
+        """Queues a message, the returned future resolves once it is delivered."""
+        if self._queue is None:
+            self.start()
+
+        job = EmailJob(to=to, message=message)
+        job.future = asyncio.get_running_loop().create_future()
+        # failures are logged by the worker, nobody has to await the future
+        job.future.add_done_callback(
+            lambda future: future.cancelled() or future.exception()
+        )
+        await self._queue.put(job)
+        self.metrics["queued"] += 1
+        return job.future
+
+    async def send(self, to: str, message: str):
+        """Queues a message and waits for its delivery."""
+        await asyncio.shield(await self.submit(to, message))
+
+    # delivery
+
+    def connect(self):
+        if settings.EMAIL_USE_SSL:
+            server = smtplib.SMTP_SSL(
+                settings.EMAIL_SERVER, settings.EMAIL_PORT, timeout=30
+            )
+        else:
+            server = smtplib.SMTP(
+                settings.EMAIL_SERVER, settings.EMAIL_PORT, timeout=30
+            )
+        server.ehlo()
+        if server.has_extn("auth"):
+            server.login(settings.EMAIL, settings.EMAIL_PASSWORD)
+        return server
+
+    def close(self, server):
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    def deliver(
+        self, connection: Dict, jobs: List[EmailJob]
+    ) -> List[Optional[Exception]]:
+        """Sends the batch on the worker's connection (runs on its thread)."""
+        results = []
+        for index, job in enumerate(jobs):
+            if connection.get("server") is None:
+                try:
+                    connection["server"] = self.connect()
+                except Exception as e:
+                    # no server to send the rest on either, they share the error
+                    results.extend([e] * (len(jobs) - index))
+                    break
+                connection["sent"] = 0
+                connection["opened"] = connection.get("opened", 0) + 1
+
+            try:
+                connection["server"].sendmail(settings.EMAIL, job.to, job.message)
+                connection["sent"] += 1
+                results.append(None)
+
+                if connection["sent"] >= settings.EMAIL_MESSAGES_PER_CONNECTION:
+                    self.close(connection.pop("server"))
+            except Exception as e:
+                results.append(e)
+                dropped = isinstance(e, TRANSIENT_ERRORS) and not isinstance(
+                    e, REPLY_ERRORS
+                )
+                if dropped and connection.get("server"):
+                    # the next message gets a fresh connection
+                    connection.pop("server").close()
+        return results
+
+    async def retry(self, job: EmailJob):
+        await asyncio.sleep(
+            settings.EMAIL_RETRY_BACKOFF_SECONDS * 2 ** (job.attempts - 1)
+        )
+        await self._queue.put(job)
+
+    def finish(self, job: EmailJob, error: Optional[Exception]):
+        if error is None:
+            self.metrics["sent"] += 1
+            latency = (time.monotonic() - job.queued_at) * 1000
+            # moving average of queue-to-delivery time
+            self.metrics["latency_ms"] += (latency - self.metrics["latency_ms"]) / 20
+            if not job.future.done():
+                job.future.set_result(True)
+            return
+
+        job.attempts += 1
+        if is_transient(error) and job.attempts <= settings.EMAIL_MAX_RETRIES:
+            self.metrics["retried"] += 1
+            task = asyncio.create_task(self.retry(job))
+            self._retries.add(task)
+            task.add_done_callback(self._retries.discard)
+            return
+
+        self.metrics["failed"] += 1
+        logger.error(f"Email to {job.to} failed after {job.attempts} attempts: {error}")
+        if not job.future.done():
+            job.future.set_exception(EmailDeliveryError(str(error)))
+
+    async def work(self):
+        loop = asyncio.get_running_loop()
+        connection: Dict = {}
+        try:
+            while True:
+                try:
+                    jobs = [
+                        await asyncio.wait_for(
+                            self._queue.get(), timeout=settings.EMAIL_IDLE_SECONDS
+                        )
+                    ]
+                except asyncio.TimeoutError:
+                    # servers drop idle connections anyway
+                    if connection.get("server"):
+                        await loop.run_in_executor(
+                            self._executor, self.close, connection.pop("server")
+                        )
+                    continue
+
+                while len(jobs) < BATCH_SIZE and not self._queue.empty():
+                    jobs.append(self._queue.get_nowait())
+
+                results = await loop.run_in_executor(
+                    self._executor, self.deliver, connection, jobs
+                )
+                self.metrics["batches"] += 1
+                self.metrics["connections"] += connection.pop("opened", 0)
+                for job, error in zip(jobs, results):
+                    self.finish(job, error)
+                    self._queue.task_done()
+        finally:
+            if connection.get("server"):
+                await loop.run_in_executor(
+                    self._executor, self.close, connection.pop("server")
+                )
+
+    def start(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=settings.EMAIL_QUEUE_SIZE)
+            self._executor = ThreadPoolExecutor(
+                max_workers=settings.EMAIL_POOL_SIZE, thread_name_prefix="smtp"
+            )
+            self._workers = [
+                asyncio.create_task(self.work())
+                for _ in range(settings.EMAIL_POOL_SIZE)
+            ]
+
+    async def stop(self, timeout: float = 10):
+        """Waits up to `timeout` seconds for the queued messages, then closes the pool."""
+        if self._queue is None:
+            return
+
+        async def drain():
+            # retries waiting out their backoff are not in the queue yet
+            while True:
+                await self._queue.join()
+                if not self._retries:
+                    return
+                await asyncio.wait(set(self._retries))
+
+        try:
+            await asyncio.wait_for(drain(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.error(
+                f"Email queue closed with {self._queue.qsize()} messages unsent"
+            )
+
+        for task in [*self._workers, *self._retries]:
+            task.cancel()
+        await asyncio.gather(*self._workers, *self._retries, return_exceptions=True)
+        self._executor.shutdown(wait=False)
+        logger.info(f"Email delivery stopped: {self.metrics}")
+
+        self._queue = None
+        self._workers = []
+        self._retries = set()
+        self._executor = None
+
+
+email_delivery = EmailDeliveryService()
@@ -1,12 +1,14 @@
+import asyncio
+from typing import Any, Dict, Iterable, Tuple
 from fastapi import status
 from email.mime.text import MIMEText
 from fastapi.exceptions import HTTPException
 from email.mime.multipart import MIMEMultipart
-from jinja2 import Environment, FileSystemLoader
-from smtplib import SMTP_SSL, SMTPAuthenticationError
 
 from app.core.config import template_path, settings
 from app.modules.auth.schema.auth_schema import EmailBody
+from app.services.email_delivery_service import EmailDeliveryError, email_delivery
+from app.services.template_service import template_service
 
 
 class EmailSendException(HTTPException):
@@ -24,51 +26,102 @@ class EmailService:
         self.EMAIL_PASSWORD = settings.EMAIL_PASSWORD
         self.SERVER = settings.EMAIL_SERVER
         self.template_path = template_path
-        self.env = Environment(loader=FileSystemLoader(template_path))
-
-    async def send_email(self, body: EmailBody):
+        # shared, templates are compiled once per process
+        self.env = template_service.env
+
+    def build_message(self, body: EmailBody) -> str:
+        msg = MIMEMultipart()
+        msg["Subject"] = body.subject
+        msg["From"] = f"{settings.APP_NAME} <{self.EMAIL}>"
+        msg["To"] = body.to
+        msg.attach(MIMEText(body.message, "html"))
+
+        return msg.as_string()
+
+    async def send_email(self, body: EmailBody, wait: bool = True):
+        """
+        Sends through the pooled delivery pipeline. With `wait=False` the email is
+        only queued; delivery failures are then retried and logged by the pipeline.
+        """
         try:
-            msg = MIMEMultipart()
-            msg["Subject"] = body.subject
-            msg["From"] = f"{settings.APP_NAME} <{self.EMAIL}>"
-            msg["To"] = body.to
-            msg.attach(MIMEText(body.message, "html"))
-
-            port = 465  # 587 for TLS , 465 For SSL
-
-            # Connect to the email server
-            with SMTP_SSL(self.SERVER, port) as server:
-                server.ehlo()
-                server.login(self.EMAIL, self.EMAIL_PASSWORD)
-                server.sendmail(self.EMAIL, body.to, msg.as_string())
+            if not wait:
+                await email_delivery.submit(body.to, self.build_message(body))
+                return {"message": "Email queued"}
 
+            await email_delivery.send(body.to, self.build_message(body))
             return {"message": "Email sent successfully"}
-        except SMTPAuthenticationError as e:
+        except EmailDeliveryError as e:
             raise EmailSendException(detail=str(e))
 
-    def render_template(self, template_name: str, **context):
-        template = self.env.get_template(template_name)
+    async def send_bulk_email(self, bodies: Iterable[EmailBody]) -> Dict[str, int]:
+        """Queues every email (waiting whenever the queue is full), then waits for all."""
+        deliveries = [
+            await email_delivery.submit(body.to, self.build_message(body))
+            for body in bodies
+        ]
+        results = await asyncio.gather(*deliveries, return_exceptions=True)
 
-        return template.render(context)
+        failed = sum(1 for result in results if isinstance(result, Exception))
+        return {"sent": len(results) - failed, "failed": failed}
+
+    def render_template(self, template_name: str, **context):
+        return template_service.render(template_name, **context)
 
     async def send_template_email(
-        self, to: str, subject: str, template_name: str, **context
+        self, to: str, subject: str, template_name: str, wait: bool = True, **context
     ):
         html_content = self.render_template(template_name, **context)
         body = EmailBody(to=to, subject=subject, message=html_content)
 
         try:
-            await self.send_email(body)
+            await self.send_email(body, wait=wait)
         except EmailSendException as e:
             error_message = f"Error sending email: {e.detail}"
             raise HTTPException(status_code=500, detail=error_message)
 
+    async def send_bulk_template_email(
+        self,
+        subject: str,
+        template_name: str,
+        recipients: Iterable[Tuple[str, Dict[str, Any]]],
+        render_in_thread: bool = True,
+    ) -> Dict[str, int]:
+        """
+        Renders `template_name` for every (to, context) pair and sends them through
+        send_bulk_email(); renders run on the thread pool unless `render_in_thread`
+        is False.
+        """
+        recipients = list(recipients)
+        if render_in_thread:
+            contents = await asyncio.gather(
+                *(
+                    template_service.render_async(template_name, **context)
+                    for _, context in recipients
+                )
+            )
+        else:
+            contents = [
+                template_service.render(template_name, **context)
+                for _, context in recipients
+            ]
+
+        return await self.send_bulk_email(
+            EmailBody(to=to, subject=subject, message=content)
+            for (to, _), content in zip(recipients, contents)
+        )
+
     async def send_user_email(
-        self, user_email: str, user_name: str, verify_link: str, subscription_link: str
+        self,
+        user_email: str,
+        user_name: str,
+        verify_link: str,
+        subscription_link: str,
+        wait: bool = True,
     ):
         return await self.send_template_email(
             to=user_email,
             subject="New Account Created",
+            wait=wait,
             template_name="confirmEmail.html",
             first_name=user_name,
             user_email=user_email,
@@ -77,11 +130,17 @@ class EmailService:
         )
 
     async def send_welcome_email(
-        self, user_email: str, username: str, link: str, subscription_link: str
+        self,
+        user_email: str,
+        username: str,
+        link: str,
+        subscription_link: str,
+        wait: bool = True,
     ):
         return await self.send_template_email(
             to=user_email,
             subject=f"Welcome to {settings.APP_NAME}",
+            wait=wait,
             template_name="welcome.html",
             first_name=username,
             user_email=user_email,
@@ -90,11 +149,17 @@ class EmailService:
         )
 
     async def send_reset_password_email(
-        self, email: str, username: str, reset_link: str, subscription_link: str
+        self,
+        email: str,
+        username: str,
+        reset_link: str,
+        subscription_link: str,
+        wait: bool = True,
     ):
         return await self.send_template_email(
             to=email,
             subject="Reset Password Request",
+            wait=wait,
             template_name="passwordReset.html",
             first_name=username,
             user_email=email,
@@ -0,0 +1,198 @@
+import pytz
+import threading
+from decimal import Decimal
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import Connection, Date, cast, delete, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.core.config import settings
+
+# models
+from app.modules.billing.models.invoice import Invoice
+from app.modules.billing.models.invoice_rollup import InvoiceMonthlyRollup
+
+# enums
+from app.modules.billing.enums.billing_enums import PaymentStatusEnum, InvoiceTypeEnum
+
+# (month, status, invoice_type)
+Bucket = Tuple[date, PaymentStatusEnum, InvoiceTypeEnum]
+
+# invoice state as recorded by the listeners: (due_date, status, invoice_type, amount)
+InvoiceState = Tuple[Optional[datetime], object, object, object]
+
+
+def month_bucket(due_date: Optional[datetime]) -> Optional[date]:
+    """First day of the due month in INVOICE_TRENDS_TIMEZONE (naive dates are UTC)."""
+    if due_date is None:
+        return None
+    if due_date.tzinfo is None:
+        due_date = pytz.utc.localize(due_date)
+
+    timezone = pytz.timezone(settings.INVOICE_TRENDS_TIMEZONE)
+    return due_date.astimezone(timezone).date().replace(day=1)
+
+
+def as_enum(enum_class, value):
+    return enum_class[value] if isinstance(value, str) else value
+
+
+class InvoiceRollupService:
+    """
+    Maintains the invoice_monthly_rollup table read by the invoice trends endpoint.
+
+    Invoice writes are turned into (+/- amount, +/- count) deltas per month, status
+    and invoice type and upserted at the end of the flush, so the table follows the
+    invoices without ever re-aggregating them. rebuild() recomputes it from scratch
+    (after bulk SQL writes or a change of INVOICE_TRENDS_TIMEZONE).
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls, *args, **kwargs)
+        return cls._instance
+
+    def deltas(self, changes: Iterable[Tuple[InvoiceState, int]]) -> Dict[Bucket, List]:
+        """
+        Sums (invoice state, +1/-1) pairs into [amount, count] per bucket. Amounts
+        are summed as Decimal: stored states come back from the Numeric column as
+        Decimal, updates may carry the float of the request schema.
+        """
+        deltas: Dict[Bucket, List] = defaultdict(lambda: [Decimal(0), 0])
+        for (due_date, status, invoice_type, amount), sign in changes:
+            month = month_bucket(due_date)
+            if month is None or status is None or invoice_type is None:
+                continue
+
+            bucket = (
+                month,
+                as_enum(PaymentStatusEnum, status),
+                as_enum(InvoiceTypeEnum, invoice_type),
+            )
+            deltas[bucket][0] += sign * Decimal(str(amount or 0))
+            deltas[bucket][1] += sign
+        return deltas
+
+    def apply(
+        self, connection: Connection, changes: Iterable[Tuple[InvoiceState, int]]
+    ):
+        """Adds the changes to the rollup rows in one upsert."""
+        rows = [
+            {
+                "month": month,
+                "status": status,
+                "invoice_type": invoice_type,
+                "total_amount": amount,
+                "total_count": count,
+            }
+            for (month, status, invoice_type), (amount, count) in self.deltas(
+                changes
+            ).items()
+            if amount or count
+        ]
+        if not rows:
+            return
+        # same lock order for concurrent writers of the same buckets
+        rows.sort(
+            key=lambda row: (row["month"], row["status"].name, row["invoice_type"].name)
+        )
+
+        rollup = InvoiceMonthlyRollup.__table__
+        dialect = {"postgresql": postgresql, "sqlite": sqlite}.get(
+            connection.dialect.name
+        )
+
+        if dialect is None:
+            # no upsert, rows of new buckets are inserted after a missed update
+            for row in rows:
+                result = connection.execute(
+                    update(rollup)
+                    .where(
+                        rollup.c.month == row["month"],
+                        rollup.c.status == row["status"],
+                        rollup.c.invoice_type == row["invoice_type"],
+                    )
+                    .values(
+                        total_amount=rollup.c.total_amount + row["total_amount"],
+                        total_count=rollup.c.total_count + row["total_count"],
+                    )
+                )
+                if not result.rowcount:
+                    connection.execute(insert(rollup).values(**row))
+            return
+
+        stmt = dialect.insert(rollup)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[rollup.c.month, rollup.c.status, rollup.c.invoice_type],
+            set_={
+                "total_amount": rollup.c.total_amount + stmt.excluded.total_amount,
+                "total_count": rollup.c.total_count + stmt.excluded.total_count,
+                "updated_at": func.now(),
+            },
+        )
+        connection.execute(stmt, rows)
+
+    def rebuild(self, connection: Connection) -> int:
+        """Recomputes every rollup row from the invoice table, returns the row count."""
+        rollup = InvoiceMonthlyRollup.__table__
+        invoice = Invoice.__table__
+        connection.execute(delete(rollup))
+
+        if connection.dialect.name == "postgresql":
+            month = cast(
+                func.date_trunc(
+                    "month",
+                    func.timezone(settings.INVOICE_TRENDS_TIMEZONE, invoice.c.due_date),
+                ),
+                Date,
+            )
+            connection.execute(
+                insert(rollup).from_select(
+                    [
+                        "month",
+                        "status",
+                        "invoice_type",
+                        "total_amount",
+                        "total_count",
+                        "created_at",
+                        "updated_at",
+                    ],
+                    select(
+                        month,
+                        invoice.c.status,
+                        invoice.c.invoice_type,
+                        func.coalesce(func.sum(invoice.c.invoice_amount), 0),
+                        func.count(),
+                        func.now(),
+                        func.now(),
+                    )
+                    .where(
+                        invoice.c.due_date.is_not(None),
+                        invoice.c.status.is_not(None),
+                        invoice.c.invoice_type.is_not(None),
+                    )
+                    .group_by(month, invoice.c.status, invoice.c.invoice_type),
+                )
+            )
+        else:
+            # no timezone-aware date_trunc (SQLite dev databases), bucket in python
+            result = connection.execute(
+                select(
+                    invoice.c.due_date,
+                    invoice.c.status,
+                    invoice.c.invoice_type,
+                    invoice.c.invoice_amount,
+                )
+            )
+            self.apply(connection, ((tuple(row), 1) for row in result))
+
+        return connection.execute(select(func.count()).select_from(rollup)).scalar()
+
+
+invoice_rollup_service = InvoiceRollupService()
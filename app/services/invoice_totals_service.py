@@ -0,0 +1,167 @@
+import threading
+from typing import Iterable, List, Optional
+from sqlalchemy import Connection, func, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+# services
+from app.services.invoice_rollup_service import invoice_rollup_service
+
+# models
+from app.modules.billing.models.invoice import Invoice
+from app.modules.billing.models.invoice_item import InvoiceItem
+from app.modules.billing.models.transaction import Transaction
+
+# invoice numbers per statement, keeps the IN lists within driver limits
+CHUNK_SIZE = 1000
+
+
+def invoice_totals_clause(invoice_numbers: Optional[List[str]] = None):
+    """sum(total_price) per invoice (0 for invoices without items)."""
+    invoice = Invoice.__table__.alias("totals_invoice")
+    items = InvoiceItem.__table__
+
+    stmt = (
+        select(
+            invoice.c.invoice_number,
+            func.coalesce(func.sum(items.c.total_price), 0).label("invoice_amount"),
+        )
+        .select_from(
+            invoice.outerjoin(items, items.c.invoice_number == invoice.c.invoice_number)
+        )
+        .group_by(invoice.c.invoice_number)
+    )
+    if invoice_numbers is not None:
+        stmt = stmt.where(invoice.c.invoice_number.in_(invoice_numbers))
+    return stmt.subquery("invoice_totals")
+
+
+class InvoiceTotalsService:
+    """
+    Keeps Invoice.invoice_amount (and the amount of the invoice's Transaction) equal to
+    the sum of its invoice items.
+
+    Item and invoice writes only record the affected invoice numbers on the session;
+    one set-based UPDATE ... FROM per flush then recomputes all of them, however many
+    items the flush wrote.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls, *args, **kwargs)
+        return cls._instance
+
+    def recompute(
+        self,
+        connection: Connection,
+        session: Optional[Session] = None,
+        invoice_numbers: Optional[Iterable[str]] = None,
+    ) -> int:
+        """
+        Recomputes the given invoices (all invoices when None) and their transactions,
+        returns the number of invoices whose amount changed.
+        """
+        if invoice_numbers is None:
+            return self._recompute_chunk(connection, session, None)
+
+        invoice_numbers = sorted({number for number in invoice_numbers if number})
+        return sum(
+            self._recompute_chunk(
+                connection, session, invoice_numbers[start : start + CHUNK_SIZE]
+            )
+            for start in range(0, len(invoice_numbers), CHUNK_SIZE)
+        )
+
+    def _recompute_chunk(
+        self,
+        connection: Connection,
+        session: Optional[Session],
+        invoice_numbers: Optional[List[str]],
+    ) -> int:
+        invoice = Invoice.__table__
+        transaction = Transaction.__table__
+        totals = invoice_totals_clause(invoice_numbers)
+
+        changed = invoice.c.invoice_amount.is_distinct_from(totals.c.invoice_amount)
+        rows = connection.execute(
+            select(
+                invoice.c.due_date,
+                invoice.c.status,
+                invoice.c.invoice_type,
+                invoice.c.invoice_amount,
+                totals.c.invoice_amount,
+            ).where(invoice.c.invoice_number == totals.c.invoice_number, changed)
+        ).all()
+
+        if rows:
+            connection.execute(
+                update(invoice)
+                .where(invoice.c.invoice_number == totals.c.invoice_number, changed)
+                .values(invoice_amount=totals.c.invoice_amount)
+            )
+
+            # move the amount difference into the monthly rollups
+            invoice_rollup_service.apply(
+                connection,
+                [
+                    change
+                    for due_date, status, invoice_type, old, new in rows
+                    for change in (
+                        ((due_date, status, invoice_type, old), -1),
+                        ((due_date, status, invoice_type, new), 1),
+                    )
+                ],
+            )
+
+        stmt = update(transaction).where(
+            transaction.c.invoice_number == invoice.c.invoice_number,
+            transaction.c.transaction_amount.is_distinct_from(invoice.c.invoice_amount),
+        )
+        if invoice_numbers is not None:
+            stmt = stmt.where(invoice.c.invoice_number.in_(invoice_numbers))
+        connection.execute(stmt.values(transaction_amount=invoice.c.invoice_amount))
+
+        if session is not None and invoice_numbers is not None:
+            self._sync_loaded(connection, session, invoice_numbers)
+
+        return len(rows)
+
+    def _sync_loaded(
+        self, connection: Connection, session: Session, invoice_numbers: List[str]
+    ):
+        """Keeps already loaded invoices/transactions in step with the rows."""
+        numbers = set(invoice_numbers)
+        # read from __dict__, expired objects are left to their next load
+        loaded = [
+            obj
+            for obj in session.identity_map.values()
+            if isinstance(obj, (Invoice, Transaction))
+            and obj.__dict__.get("invoice_number") in numbers
+        ]
+        if not loaded:
+            return
+
+        invoice = Invoice.__table__
+        amounts = dict(
+            connection.execute(
+                select(invoice.c.invoice_number, invoice.c.invoice_amount).where(
+                    invoice.c.invoice_number.in_(invoice_numbers)
+                )
+            ).all()
+        )
+        for obj in loaded:
+            if obj.invoice_number in amounts:
+                key = (
+                    "invoice_amount"
+                    if isinstance(obj, Invoice)
+                    else "transaction_amount"
+                )
+                set_committed_value(obj, key, amounts[obj.invoice_number])
+
+
+invoice_totals_service = InvoiceTotalsService()
@@ -0,0 +1,216 @@
+import asyncio
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, Optional
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logger import AppLogger
+
+# cache
+from app.cache.cacheManager import CacheManager
+
+# models
+from app.modules.communication.models.message import Message
+from app.modules.communication.models.message_inbox import MessageInbox
+
+logger = AppLogger().get_logger()
+
+FOLDERS = ("inbox", "notifications", "drafts", "scheduled")
+
+# increments only counters that are cached, a missing hash is rebuilt from the db
+INCREMENT_IF_CACHED = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    for i = 1, #ARGV, 2 do
+        redis.call('HINCRBY', KEYS[1], ARGV[i], ARGV[i + 1])
+    end
+end
+return 0
+"""
+
+# caches counts from the db unless a concurrent read cached (and incremented) them
+CACHE_IF_MISSING = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return 0
+"""
+
+
+def counters_key(user_id) -> str:
+    return f"message_counters:{user_id}"
+
+
+def sender_folder(is_draft, is_scheduled, is_notification, is_enquiry) -> Optional[str]:
+    """drafts / scheduled folder, same rules as MessageDAO.get_user_messages."""
+    if is_notification is not False or is_enquiry is not False:
+        return None
+    if is_draft is True and is_scheduled is False:
+        return "drafts"
+    if is_scheduled is True and is_draft is False:
+        return "scheduled"
+    return None
+
+
+class CounterChanges:
+    """Counter deltas of one transaction, applied to redis once it commits."""
+
+    def __init__(self):
+        self.deltas: Dict = defaultdict(int)
+        self.invalidated = set()
+
+    def add(self, user_id, folder: Optional[str], delta: int = 1):
+        if user_id is not None and folder is not None:
+            self.deltas[(user_id, folder)] += delta
+
+    def add_rows(self, rows: Iterable, delta: int):
+        """(user_id, folder, is_read, ...) inbox rows, unread ones count."""
+        for user_id, folder, is_read, *_ in rows:
+            if not is_read:
+                self.add(user_id, folder, delta)
+
+    def invalidate(self, user_ids: Iterable):
+        self.invalidated.update(user_id for user_id in user_ids if user_id is not None)
+
+    def __bool__(self):
+        return bool(self.invalidated) or any(self.deltas.values())
+
+
+def counter_changes(session: Session) -> CounterChanges:
+    return session.info.setdefault("message_counters", CounterChanges())
+
+
+class MessageCounterService:
+    """
+    Unread inbox / notifications and drafts / scheduled counts per user, kept in a
+    `message_counters:<user_id>` redis hash.
+
+    A missing hash is counted from the db (message_inbox index, message.sender_id)
+    and cached for MESSAGE_COUNTERS_TTL_SECONDS, only if still missing, so a slow
+    count never overwrites a hash that is already being incremented. Committed
+    writes then adjust the cached fields with HINCRBY in a script, so concurrent
+    updates never lose an increment and never recreate a partial hash. A write
+    committed between a count and its caching is missed until the hash expires.
+    If redis is unavailable the counts are served from the db.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls, *args, **kwargs)
+                    cls._instance._loop = None
+                    cls._instance._increment = None
+                    cls._instance._cache_if_missing = None
+        return cls._instance
+
+    async def count(self, db_session: AsyncSession, user_id) -> Dict[str, int]:
+        """Counts from the db."""
+        counts = dict.fromkeys(FOLDERS, 0)
+
+        unread = await db_session.execute(
+            select(MessageInbox.folder, func.count())
+            .where(MessageInbox.user_id == user_id, MessageInbox.is_read.is_(False))
+            .group_by(MessageInbox.folder)
+        )
+        counts.update(dict(unread.all()))
+
+        sent = (
+            await db_session.execute(
+                select(
+                    func.count().filter(
+                        Message.is_draft.is_(True), Message.is_scheduled.is_(False)
+                    ),
+                    func.count().filter(
+                        Message.is_scheduled.is_(True), Message.is_draft.is_(False)
+                    ),
+                ).where(
+                    Message.sender_id == user_id,
+                    Message.is_notification.is_(False),
+                    Message.is_enquiry.is_(False),
+                )
+            )
+        ).one()
+        counts["drafts"], counts["scheduled"] = sent
+        return counts
+
+    async def get(self, db_session: AsyncSession, user_id) -> Dict[str, int]:
+        """Cached counts, counted (and cached) on a miss."""
+        key = counters_key(user_id)
+        try:
+            cache = await CacheManager().cache_module
+            cached = await cache.hgetall(key)
+            if cached and all(folder in cached for folder in FOLDERS):
+                return {folder: max(int(cached[folder]), 0) for folder in FOLDERS}
+        except Exception as e:
+            logger.error(f"Message counters read failed: {e}")
+            return await self.count(db_session, user_id)
+
+        counts = await self.count(db_session, user_id)
+        try:
+            if self._cache_if_missing is None:
+                self._cache_if_missing = cache.register_script(CACHE_IF_MISSING)
+
+            args = [settings.MESSAGE_COUNTERS_TTL_SECONDS]
+            for folder, count in counts.items():
+                args += [folder, count]
+            await self._cache_if_missing(keys=[key], args=args)
+        except Exception as e:
+            logger.error(f"Message counters write failed: {e}")
+        return counts
+
+    async def apply(self, changes: CounterChanges):
+        """Adds committed changes to the cached counters."""
+        fields: Dict = defaultdict(list)
+        for (user_id, folder), delta in changes.deltas.items():
+            if delta and user_id not in changes.invalidated:
+                fields[user_id] += [folder, delta]
+
+        try:
+            cache = await CacheManager().cache_module
+            if self._increment is None:
+                self._increment = cache.register_script(INCREMENT_IF_CACHED)
+
+            async with cache.pipeline(transaction=False) as pipe:
+                for user_id, args in fields.items():
+                    await self._increment(
+                        keys=[counters_key(user_id)], args=args, client=pipe
+                    )
+                for user_id in changes.invalidated:
+                    pipe.delete(counters_key(user_id))
+                await pipe.execute()
+        except Exception as e:
+            # cached counters are recounted once they expire
+            logger.error(f"Message counters update failed: {e}")
+
+    def schedule(self, changes: CounterChanges):
+        """Queues apply() on the service loop, safe from any thread."""
+        if self._loop is not None and changes:
+            self._loop.call_soon_threadsafe(asyncio.create_task, self.apply(changes))
+
+    def start(self):
+        self._loop = asyncio.get_running_loop()
+
+    def stop(self):
+        self._loop = None
+
+
+message_counter_service = MessageCounterService()
+
+
+@event.listens_for(Session, "after_commit")
+def apply_message_counters(session: Session):
+    changes = session.info.pop("message_counters", None)
+    if changes:
+        message_counter_service.schedule(changes)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_message_counters(session: Session, previous_transaction):
+    session.info.pop("message_counters", None)
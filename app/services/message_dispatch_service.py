@@ -0,0 +1,449 @@
+import math
+import time
+import uuid
+import pytz
+import asyncio
+import threading
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Tuple
+from sqlalchemy import (
+    Connection,
+    and_,
+    bindparam,
+    event,
+    false,
+    insert,
+    select,
+    true,
+    union,
+    update,
+)
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.logger import AppLogger
+
+# models
+from app.modules.communication.models.message import Message
+from app.modules.communication.models.message_recipient import MessageRecipient
+from app.modules.communication.models.reminder_frequency import ReminderFrequency
+
+# services
+from app.services.message_counter_service import (
+    CounterChanges,
+    message_counter_service,
+    sender_folder,
+)
+from app.services.message_inbox_service import message_inbox_service
+from app.services.message_push_service import MessageEvents, message_push_service
+
+logger = AppLogger().get_logger()
+
+
+def scheduled_due_clause(until: datetime):
+    """Scheduled messages due by `until` (ix_message_scheduled_date)."""
+    message = Message.__table__
+    return and_(
+        message.c.is_scheduled == true(),
+        message.c.is_draft == false(),
+        message.c.scheduled_date <= until,
+    )
+
+
+def reminder_due_clause(until: datetime):
+    """Reminders of sent messages due by `until` (ix_message_next_remind_date)."""
+    message = Message.__table__
+    return and_(
+        message.c.is_reminder == true(),
+        message.c.is_draft == false(),
+        message.c.is_scheduled == false(),
+        message.c.next_remind_date.is_not(None),
+        message.c.next_remind_date <= until,
+    )
+
+
+def next_remind_date(due: datetime, frequency: Optional[int], now: datetime):
+    """
+    First occurrence after `now` of a reminder due at `due` repeating every
+    `frequency` days (occurrences missed while nothing ran are skipped); None for a
+    one-off reminder.
+    """
+    if not frequency or frequency <= 0:
+        return None
+    if due.tzinfo is None:
+        due = due.replace(tzinfo=pytz.utc)
+
+    step = timedelta(days=frequency)
+    return due + ((now - due) // step + 1) * step
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel of one second slots covering the next `size` seconds, counts
+    the message deadlines due in each. Adding and expiring deadlines is O(1) each,
+    however many there are; deadlines further out are added when they come in range.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.slots = [0] * size
+        # last second expired
+        self.tick = int(time.time())
+
+    def add(self, deadline: float) -> bool:
+        """Counts a deadline (epoch seconds), False if beyond the wheel."""
+        # overdue deadlines fire on the next tick
+        second = max(math.ceil(deadline), self.tick + 1)
+        if second > self.tick + self.size:
+            return False
+        self.slots[second % self.size] += 1
+        return True
+
+    def expire(self, now: float) -> int:
+        """Advances to `now`, returns the number of deadlines passed."""
+        second = int(now)
+        if second - self.tick >= self.size:
+            expired = sum(self.slots)
+            self.slots = [0] * self.size
+            self.tick = second
+            return expired
+
+        expired = 0
+        while self.tick < second:
+            self.tick += 1
+            slot = self.tick % self.size
+            expired += self.slots[slot]
+            self.slots[slot] = 0
+        return expired
+
+    def next_deadline(self) -> Optional[int]:
+        for second in range(self.tick + 1, self.tick + self.size + 1):
+            if self.slots[second % self.size]:
+                return second
+        return None
+
+
+class MessageDispatchService:
+    """
+    Sends scheduled messages and fires reminders when they come due.
+
+    Each worker keeps the deadlines of the next MESSAGE_DISPATCH_HORIZON_SECONDS in
+    a timer wheel, loaded from the db once per horizon and fed by the messages it
+    commits itself, and sleeps until the next one. Due messages are then claimed
+    MESSAGE_DISPATCH_BATCH_SIZE at a time with FOR UPDATE SKIP LOCKED, so every
+    worker can run the job and each message is dispatched once.
+
+    A scheduled message is sent as of now (date_created, recipients' send date) and
+    delivered to the inbox. A reminder sends a notification copy of the message to
+    its recipients and moves next_remind_date on by its ReminderFrequency
+    (`frequency` days), or clears it for a one-off reminder.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls, *args, **kwargs)
+                    cls._instance._task = None
+                    cls._instance._loop = None
+                    cls._instance._wakeup = None
+                    cls._instance._wheel = None
+        return cls._instance
+
+    # dispatch
+
+    def send_scheduled(
+        self,
+        connection: Connection,
+        now: datetime,
+        changes: CounterChanges,
+        events: MessageEvents,
+    ) -> Tuple[int, bool]:
+        """Sends a batch of due scheduled messages, returns how many and whether
+        groups were left to the inbox fan-out job."""
+        message = Message.__table__
+        recipient = MessageRecipient.__table__
+
+        message_ids = (
+            connection.execute(
+                select(message.c.message_id)
+                .where(scheduled_due_clause(now))
+                .order_by(message.c.scheduled_date)
+                .limit(settings.MESSAGE_DISPATCH_BATCH_SIZE)
+                .with_for_update(skip_locked=True)
+            )
+            .scalars()
+            .all()
+        )
+        if not message_ids:
+            return 0, False
+
+        sent = connection.execute(
+            update(message)
+            .where(message.c.message_id.in_(message_ids))
+            .values(is_scheduled=False, date_created=now)
+            .returning(
+                message.c.sender_id, message.c.is_notification, message.c.is_enquiry
+            )
+        )
+        for sender_id, is_notification, is_enquiry in sent:
+            changes.add(
+                sender_id, sender_folder(False, True, is_notification, is_enquiry), -1
+            )
+
+        # groups reach the clients under contract when it is sent
+        connection.execute(
+            update(recipient)
+            .where(recipient.c.message_id.in_(message_ids))
+            .values(msg_send_date=now)
+        )
+
+        pending = message_inbox_service.deliver(
+            connection, message_ids, changes, events
+        )
+        return len(message_ids), pending
+
+    def fire_reminders(
+        self,
+        connection: Connection,
+        now: datetime,
+        changes: CounterChanges,
+        events: MessageEvents,
+    ) -> Tuple[int, bool]:
+        """Fires a batch of due reminders, same return as send_scheduled()."""
+        message = Message.__table__
+        recipient = MessageRecipient.__table__
+        frequency = ReminderFrequency.__table__
+
+        reminders = connection.execute(
+            select(
+                message.c.message_id,
+                message.c.subject,
+                message.c.message_body,
+                message.c.sender_id,
+                message.c.thread_id,
+                message.c.next_remind_date,
+                frequency.c.frequency,
+            )
+            .select_from(
+                message.outerjoin(
+                    frequency,
+                    and_(
+                        frequency.c.reminder_frequency_id
+                        == message.c.reminder_frequency_id,
+                        frequency.c.is_active.is_(True),
+                    ),
+                )
+            )
+            .where(reminder_due_clause(now))
+            .order_by(message.c.next_remind_date)
+            .limit(settings.MESSAGE_DISPATCH_BATCH_SIZE)
+            .with_for_update(of=message, skip_locked=True)
+        ).all()
+        if not reminders:
+            return 0, False
+
+        copies = {reminder.message_id: uuid.uuid4() for reminder in reminders}
+        connection.execute(
+            insert(message),
+            [
+                {
+                    "message_id": copies[reminder.message_id],
+                    "subject": reminder.subject,
+                    "message_body": reminder.message_body,
+                    "sender_id": reminder.sender_id,
+                    "parent_message_id": reminder.message_id,
+                    "thread_id": reminder.thread_id or reminder.message_id,
+                    "is_draft": False,
+                    "is_notification": True,
+                    "is_enquiry": False,
+                    "is_reminder": True,
+                    "is_scheduled": False,
+                    "is_read": False,
+                    "date_created": now,
+                    "scheduled_date": now,
+                }
+                for reminder in reminders
+            ],
+        )
+
+        recipients = connection.execute(
+            select(
+                recipient.c.message_id,
+                recipient.c.recipient_id,
+                recipient.c.recipient_group_id,
+            ).where(recipient.c.message_id.in_(copies))
+        ).all()
+        if recipients:
+            connection.execute(
+                insert(recipient),
+                [
+                    {
+                        "id": uuid.uuid4(),
+                        "message_id": copies[message_id],
+                        "recipient_id": recipient_id,
+                        "recipient_group_id": group_id,
+                        "is_read": False,
+                        "msg_send_date": now,
+                    }
+                    for message_id, recipient_id, group_id in recipients
+                ],
+            )
+
+        # every next date of the batch in one executemany
+        connection.execute(
+            update(message)
+            .where(message.c.message_id == bindparam("reminder_id"))
+            .values(next_remind_date=bindparam("next_date")),
+            [
+                {
+                    "reminder_id": reminder.message_id,
+                    "next_date": next_remind_date(
+                        reminder.next_remind_date, reminder.frequency, now
+                    ),
+                }
+                for reminder in reminders
+            ],
+        )
+
+        pending = message_inbox_service.deliver(
+            connection, list(copies.values()), changes, events
+        )
+        return len(reminders), pending
+
+    async def dispatch_due(self, engine: AsyncEngine) -> List[int]:
+        """Dispatches everything due, one batch per transaction; returns the
+        scheduled messages sent and the reminders fired."""
+        totals = [0, 0]
+
+        for index, dispatch in enumerate((self.send_scheduled, self.fire_reminders)):
+            while True:
+                changes = CounterChanges()
+                events = MessageEvents()
+                async with engine.begin() as conn:
+                    count, pending = await conn.run_sync(
+                        dispatch, datetime.now(pytz.utc), changes, events
+                    )
+                totals[index] += count
+
+                # committed, move the counters and tell the readers
+                if changes:
+                    await message_counter_service.apply(changes)
+                if events:
+                    await message_push_service.publish(events)
+                if pending:
+                    message_inbox_service.notify()
+
+                if count < settings.MESSAGE_DISPATCH_BATCH_SIZE:
+                    break
+        return totals
+
+    async def load(self, engine: AsyncEngine, until: datetime) -> int:
+        """Adds the deadlines up to `until` to the wheel, returns how many."""
+        message = Message.__table__
+        due = union(
+            select(message.c.scheduled_date).where(scheduled_due_clause(until)),
+            select(message.c.next_remind_date).where(reminder_due_clause(until)),
+        )
+        async with engine.connect() as conn:
+            deadlines = (await conn.execute(due)).scalars().all()
+
+        self.add(deadlines)
+        return len(deadlines)
+
+    def add(self, deadlines: Iterable[datetime]):
+        for deadline in deadlines:
+            if deadline.tzinfo is None:
+                deadline = deadline.replace(tzinfo=pytz.utc)
+            self._wheel.add(deadline.timestamp())
+
+    # background job
+
+    async def run(self, engine: AsyncEngine):
+        horizon = settings.MESSAGE_DISPATCH_HORIZON_SECONDS
+        next_load = 0.0
+
+        while True:
+            self._wakeup.clear()
+            now = time.time()
+
+            try:
+                if now >= next_load:
+                    # a slot of margin, deadlines on the edge are loaded twice at worst
+                    await self.load(
+                        engine, datetime.now(pytz.utc) + timedelta(seconds=horizon)
+                    )
+                    next_load = now + horizon - 1
+                if self._wheel.expire(now):
+                    sent, fired = await self.dispatch_due(engine)
+                    if sent or fired:
+                        logger.info(
+                            f"Message dispatch sent {sent} scheduled messages, "
+                            f"fired {fired} reminders"
+                        )
+            except Exception as e:
+                logger.error(f"Message dispatch failed: {e}")
+                self._wheel.add(time.time() + 5)
+
+            wake = min(self._wheel.next_deadline() or next_load, next_load)
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=max(wake - time.time(), 0)
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self, engine: AsyncEngine):
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self._wheel = TimerWheel(settings.MESSAGE_DISPATCH_HORIZON_SECONDS + 1)
+            self._task = asyncio.create_task(self.run(engine))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._loop = None
+
+    def schedule(self, deadlines: Iterable[datetime]):
+        """Adds committed deadlines to the wheel and wakes the job (any thread)."""
+        if self._loop is None:
+            return
+
+        def add():
+            self.add(deadlines)
+            self._wakeup.set()
+
+        self._loop.call_soon_threadsafe(add)
+
+
+message_dispatch_service = MessageDispatchService()
+
+
+def mark_message_dispatch(session: Optional[Session], deadlines: Iterable):
+    """Queues the deadlines of a written message for the wheel once it commits."""
+    if session is not None:
+        session.info.setdefault("message_dispatch", []).extend(
+            deadline for deadline in deadlines if deadline is not None
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def schedule_message_dispatch(session: Session):
+    deadlines = session.info.pop("message_dispatch", None)
+    if deadlines:
+        message_dispatch_service.schedule(deadlines)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_message_dispatch(session: Session, previous_transaction):
+    session.info.pop("message_dispatch", None)
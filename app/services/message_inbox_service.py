@@ -0,0 +1,589 @@
+import pytz
+import asyncio
+import threading
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
+from sqlalchemy import (
+    Connection,
+    and_,
+    case,
+    delete,
+    exists,
+    false,
+    func,
+    insert,
+    literal,
+    not_,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.engine import Row
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.logger import AppLogger
+
+# models
+from app.modules.communication.models.message import Message
+from app.modules.communication.models.message_inbox import (
+    MessageInbox,
+    MessageInboxFanout,
+)
+from app.modules.communication.models.message_recipient import MessageRecipient
+from app.modules.contract.models.under_contract import UnderContract
+
+# services
+from app.services.message_counter_service import (
+    CounterChanges,
+    message_counter_service,
+)
+from app.services.message_push_service import MessageEvents, message_push_service
+
+logger = AppLogger().get_logger()
+
+# keys per statement, keeps the IN lists within driver limits
+CHUNK_SIZE = 1000
+# a failing group's retry delay stops doubling after this many failures
+# (~17 hours with the default INBOX_FANOUT_RETRY_SECONDS)
+MAX_RETRY_DOUBLINGS = 10
+
+COLUMNS = [
+    "user_id",
+    "message_id",
+    "folder",
+    "is_read",
+    "sent_at",
+    "created_at",
+    "updated_at",
+]
+
+# returned by inbox writes for the unread counters
+COUNTED = [
+    MessageInbox.__table__.c.user_id,
+    MessageInbox.__table__.c.folder,
+    MessageInbox.__table__.c.is_read,
+]
+# returned by inserts, also pushed to the readers
+DELIVERED = [*COUNTED, MessageInbox.__table__.c.message_id]
+OTHER_FOLDER = {"inbox": "notifications", "notifications": "inbox"}
+
+
+def deliverable_clause():
+    """Sent messages: neither drafts, scheduled nor enquiries."""
+    message = Message.__table__
+    return and_(
+        message.c.is_draft.is_(False),
+        message.c.is_scheduled.is_(False),
+        message.c.is_enquiry.is_(False),
+    )
+
+
+def folder_clause():
+    message = Message.__table__
+    return case(
+        (message.c.is_notification.is_(True), literal("notifications")),
+        else_=literal("inbox"),
+    )
+
+
+def audience_clause(group_id, msg_send_date):
+    """Clients of the group (property/unit) whose contract covers msg_send_date."""
+    under_contract = UnderContract.__table__
+    return and_(
+        under_contract.c.property_unit_assoc_id == group_id,
+        under_contract.c.start_date <= msg_send_date,
+        under_contract.c.end_date >= msg_send_date,
+        under_contract.c.client_id.is_not(None),
+    )
+
+
+def missing_clause(user_id, message_id):
+    inbox = MessageInbox.__table__
+    return not_(
+        exists().where(inbox.c.user_id == user_id, inbox.c.message_id == message_id)
+    )
+
+
+def direct_recipients_clause(message_ids: Optional[List] = None):
+    """Inbox rows of the direct recipients not delivered yet."""
+    message = Message.__table__
+    recipient = MessageRecipient.__table__
+
+    stmt = (
+        select(
+            recipient.c.recipient_id,
+            message.c.message_id,
+            folder_clause(),
+            # read state of the recipient rows (duplicates of the same recipient)
+            func.max(case((recipient.c.is_read.is_(True), 1), else_=0)) == 1,
+            message.c.date_created,
+            func.now(),
+            func.now(),
+        )
+        .select_from(
+            recipient.join(message, message.c.message_id == recipient.c.message_id)
+        )
+        .where(
+            deliverable_clause(),
+            recipient.c.recipient_id.is_not(None),
+            missing_clause(recipient.c.recipient_id, message.c.message_id),
+        )
+        .group_by(
+            recipient.c.recipient_id,
+            message.c.message_id,
+            message.c.is_notification,
+            message.c.date_created,
+        )
+    )
+    if message_ids is not None:
+        stmt = stmt.where(message.c.message_id.in_(message_ids))
+    return stmt
+
+
+def group_recipients_clause(message_ids: Optional[List] = None):
+    """Inbox rows of every recipient group's clients not delivered yet."""
+    message = Message.__table__
+    recipient = MessageRecipient.__table__
+    under_contract = UnderContract.__table__
+
+    stmt = (
+        select(
+            under_contract.c.client_id,
+            message.c.message_id,
+            folder_clause(),
+            false(),
+            message.c.date_created,
+            func.now(),
+            func.now(),
+        )
+        .select_from(
+            recipient.join(
+                message, message.c.message_id == recipient.c.message_id
+            ).join(
+                under_contract,
+                audience_clause(
+                    recipient.c.recipient_group_id, recipient.c.msg_send_date
+                ),
+            )
+        )
+        .where(
+            deliverable_clause(),
+            missing_clause(under_contract.c.client_id, message.c.message_id),
+        )
+        .distinct()
+    )
+    if message_ids is not None:
+        stmt = stmt.where(message.c.message_id.in_(message_ids))
+    return stmt
+
+
+class MessageInboxService:
+    """
+    Fans sent messages out into message_inbox, one row per reader.
+
+    Writes only record the affected message ids on the session; once per flush the
+    direct recipients are inserted, rows of messages that are no longer sent (or
+    lost their recipient) are removed, and every recipient group is queued in
+    message_inbox_fanout. Groups up to INBOX_FANOUT_INLINE_LIMIT clients are
+    written in the same transaction, larger ones by the background job in
+    INBOX_FANOUT_BATCH_SIZE batches, one transaction each. A group whose batch
+    fails is skipped until its retry delay (INBOX_FANOUT_RETRY_SECONDS, doubled on
+    every further failure) is over, the other groups go on meanwhile.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls, *args, **kwargs)
+                    cls._instance._task = None
+                    cls._instance._loop = None
+                    cls._instance._wakeup = None
+        return cls._instance
+
+    # delivery
+
+    def deliver(
+        self,
+        connection: Connection,
+        message_ids: Iterable,
+        changes: Optional[CounterChanges] = None,
+        events: Optional[MessageEvents] = None,
+    ) -> bool:
+        """Delivers the given messages, True if groups were left to the background job."""
+        message_ids = sorted(set(message_ids))
+        changes = changes if changes is not None else CounterChanges()
+        events = events if events is not None else MessageEvents()
+        pending = False
+
+        for start in range(0, len(message_ids), CHUNK_SIZE):
+            pending |= self._deliver_chunk(
+                connection, message_ids[start : start + CHUNK_SIZE], changes, events
+            )
+        return pending
+
+    def _deliver_chunk(
+        self,
+        connection: Connection,
+        message_ids: List,
+        changes: CounterChanges,
+        events: MessageEvents,
+    ) -> bool:
+        inbox = MessageInbox.__table__
+        fanout = MessageInboxFanout.__table__
+        message = Message.__table__
+        recipient = MessageRecipient.__table__
+        under_contract = UnderContract.__table__
+
+        # rows whose message is gone, unsent again or no longer addressed to the user
+        sent = (
+            select(message.c.message_id)
+            .where(message.c.message_id == inbox.c.message_id, deliverable_clause())
+            .exists()
+        )
+        addressed = (
+            select(recipient.c.id)
+            .where(
+                recipient.c.message_id == inbox.c.message_id,
+                or_(
+                    recipient.c.recipient_id == inbox.c.user_id,
+                    select(under_contract.c.under_contract_id)
+                    .where(
+                        audience_clause(
+                            recipient.c.recipient_group_id, recipient.c.msg_send_date
+                        ),
+                        under_contract.c.client_id == inbox.c.user_id,
+                    )
+                    .exists(),
+                ),
+            )
+            .exists()
+        )
+        removed = connection.execute(
+            delete(inbox)
+            .where(inbox.c.message_id.in_(message_ids), not_(and_(sent, addressed)))
+            .returning(*COUNTED)
+        )
+        changes.add_rows(removed, -1)
+
+        # folder / sort key of messages changed in place
+        folder = (
+            select(folder_clause())
+            .where(message.c.message_id == inbox.c.message_id)
+            .scalar_subquery()
+        )
+        moved = connection.execute(
+            update(inbox)
+            .where(inbox.c.message_id.in_(message_ids), inbox.c.folder != folder)
+            .values(folder=folder)
+            .returning(*COUNTED)
+        )
+        for user_id, new_folder, is_read in moved:
+            if not is_read:
+                changes.add(user_id, new_folder, 1)
+                changes.add(user_id, OTHER_FOLDER[new_folder], -1)
+        connection.execute(
+            update(inbox)
+            .where(inbox.c.message_id.in_(message_ids))
+            .values(
+                sent_at=select(message.c.date_created)
+                .where(message.c.message_id == inbox.c.message_id)
+                .scalar_subquery(),
+            )
+        )
+
+        added = connection.execute(
+            insert(inbox)
+            .from_select(COLUMNS, direct_recipients_clause(message_ids))
+            .returning(*DELIVERED)
+        ).all()
+        changes.add_rows(added, 1)
+        events.add_rows(added)
+
+        # queue the groups, unsent messages drop theirs
+        connection.execute(
+            delete(fanout).where(
+                fanout.c.message_id.in_(message_ids),
+                not_(
+                    select(message.c.message_id)
+                    .where(
+                        message.c.message_id == fanout.c.message_id,
+                        deliverable_clause(),
+                    )
+                    .exists()
+                ),
+            )
+        )
+        groups = connection.execute(
+            select(
+                recipient.c.message_id,
+                recipient.c.recipient_group_id,
+                func.min(recipient.c.msg_send_date),
+            )
+            .join(message, message.c.message_id == recipient.c.message_id)
+            .where(
+                recipient.c.message_id.in_(message_ids),
+                recipient.c.recipient_group_id.is_not(None),
+                deliverable_clause(),
+                not_(
+                    select(fanout.c.message_id)
+                    .where(
+                        fanout.c.message_id == recipient.c.message_id,
+                        fanout.c.recipient_group_id == recipient.c.recipient_group_id,
+                    )
+                    .exists()
+                ),
+            )
+            .group_by(recipient.c.message_id, recipient.c.recipient_group_id)
+        ).all()
+        if not groups:
+            return False
+
+        connection.execute(
+            insert(fanout),
+            [
+                {
+                    "message_id": message_id,
+                    "recipient_group_id": group_id,
+                    "msg_send_date": msg_send_date,
+                    "after_id": None,
+                }
+                for message_id, group_id, msg_send_date in groups
+            ],
+        )
+
+        # small groups go out with the message
+        pending = False
+        for message_id, group_id, msg_send_date in groups:
+            pending |= not self.fan_out(
+                connection,
+                message_id,
+                group_id,
+                msg_send_date,
+                None,
+                settings.INBOX_FANOUT_INLINE_LIMIT,
+                changes,
+                events,
+            )
+        return pending
+
+    def fan_out(
+        self,
+        connection: Connection,
+        message_id,
+        group_id,
+        msg_send_date,
+        after_id,
+        limit: int,
+        changes: Optional[CounterChanges] = None,
+        events: Optional[MessageEvents] = None,
+    ) -> bool:
+        """Writes the next `limit` contracts of a queued group, True once it is done."""
+        inbox = MessageInbox.__table__
+        fanout = MessageInboxFanout.__table__
+        message = Message.__table__
+        under_contract = UnderContract.__table__
+
+        batch = select(under_contract.c.under_contract_id).where(
+            audience_clause(group_id, msg_send_date)
+        )
+        if after_id is not None:
+            batch = batch.where(under_contract.c.under_contract_id > after_id)
+        contract_ids = (
+            connection.execute(
+                batch.order_by(under_contract.c.under_contract_id).limit(limit)
+            )
+            .scalars()
+            .all()
+        )
+
+        if contract_ids:
+            rows = (
+                select(
+                    under_contract.c.client_id,
+                    message.c.message_id,
+                    folder_clause(),
+                    false(),
+                    message.c.date_created,
+                    func.now(),
+                    func.now(),
+                )
+                .select_from(
+                    under_contract.join(message, message.c.message_id == message_id)
+                )
+                .where(
+                    under_contract.c.under_contract_id.in_(contract_ids),
+                    under_contract.c.client_id.is_not(None),
+                    missing_clause(under_contract.c.client_id, message.c.message_id),
+                )
+                .distinct()
+            )
+            if connection.dialect.name == "postgresql":
+                # a concurrent delivery of the same message may insert the row first
+                stmt = (
+                    postgresql.insert(inbox)
+                    .from_select(COLUMNS, rows)
+                    .on_conflict_do_nothing()
+                )
+            else:
+                stmt = insert(inbox).from_select(COLUMNS, rows)
+            added = connection.execute(stmt.returning(*DELIVERED)).all()
+            if changes is not None:
+                changes.add_rows(added, 1)
+            if events is not None:
+                events.add_rows(added)
+
+        job = and_(
+            fanout.c.message_id == message_id,
+            fanout.c.recipient_group_id == group_id,
+        )
+        if len(contract_ids) < limit:
+            connection.execute(delete(fanout).where(job))
+            return True
+
+        connection.execute(
+            update(fanout)
+            .where(job)
+            .values(after_id=contract_ids[-1], attempts=0, next_attempt_at=None)
+        )
+        return False
+
+    async def fan_out_pending(self, engine: AsyncEngine) -> int:
+        """Works through the queued groups one batch per transaction, returns the batches."""
+        fanout = MessageInboxFanout.__table__
+        batches = 0
+
+        while True:
+            changes = CounterChanges()
+            events = MessageEvents()
+            job = None
+            try:
+                async with engine.begin() as conn:
+                    # other workers take the other groups, failed ones wait out
+                    # their retry delay
+                    job = (
+                        await conn.execute(
+                            select(fanout)
+                            .where(
+                                or_(
+                                    fanout.c.next_attempt_at.is_(None),
+                                    fanout.c.next_attempt_at <= datetime.now(pytz.utc),
+                                )
+                            )
+                            .order_by(fanout.c.created_at)
+                            .limit(1)
+                            .with_for_update(skip_locked=True)
+                        )
+                    ).first()
+                    if job is None:
+                        return batches
+
+                    await conn.run_sync(
+                        self.fan_out,
+                        job.message_id,
+                        job.recipient_group_id,
+                        job.msg_send_date,
+                        job.after_id,
+                        settings.INBOX_FANOUT_BATCH_SIZE,
+                        changes,
+                        events,
+                    )
+            except Exception as e:
+                if job is None:
+                    raise
+                logger.error(
+                    f"Message inbox fan-out of message {job.message_id} to group "
+                    f"{job.recipient_group_id} failed: {e}"
+                )
+                await self.postpone(engine, job)
+                continue
+            batches += 1
+
+            # committed, the readers' unread counters can move and clients be told
+            if changes:
+                await message_counter_service.apply(changes)
+            if events:
+                await message_push_service.publish(events)
+
+    async def postpone(self, engine: AsyncEngine, job: Row):
+        """Counts a failed batch of the group and schedules its retry."""
+        fanout = MessageInboxFanout.__table__
+        delay = settings.INBOX_FANOUT_RETRY_SECONDS * 2 ** min(
+            job.attempts, MAX_RETRY_DOUBLINGS
+        )
+
+        async with engine.begin() as conn:
+            await conn.execute(
+                update(fanout)
+                .where(
+                    fanout.c.message_id == job.message_id,
+                    fanout.c.recipient_group_id == job.recipient_group_id,
+                )
+                .values(
+                    attempts=fanout.c.attempts + 1,
+                    next_attempt_at=datetime.now(pytz.utc) + timedelta(seconds=delay),
+                )
+            )
+
+    def rebuild(self, connection: Connection) -> int:
+        """Recomputes the whole table, returns the row count."""
+        inbox = MessageInbox.__table__
+        connection.execute(delete(inbox))
+        connection.execute(delete(MessageInboxFanout.__table__))
+        connection.execute(
+            insert(inbox).from_select(COLUMNS, direct_recipients_clause())
+        )
+        connection.execute(
+            insert(inbox).from_select(COLUMNS, group_recipients_clause())
+        )
+        return connection.execute(select(func.count()).select_from(inbox)).scalar()
+
+    # background job
+
+    async def run(self, engine: AsyncEngine):
+        while True:
+            self._wakeup.clear()
+
+            try:
+                batches = await self.fan_out_pending(engine)
+                if batches:
+                    logger.info(f"Message inbox fan-out wrote {batches} batches")
+            except Exception as e:
+                logger.error(f"Message inbox fan-out failed: {e}")
+
+            # queued by other workers, or due for a retry after a failed batch
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=settings.INBOX_FANOUT_POLL_SECONDS
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self, engine: AsyncEngine):
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self.run(engine))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._loop = None
+
+    def notify(self):
+        """Wakes the job for newly queued groups (safe from any thread)."""
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+
+message_inbox_service = MessageInboxService()
@@ -0,0 +1,220 @@
+import json
+import asyncio
+import threading
+from typing import Dict, Iterable, List, Optional, Set
+from fastapi import WebSocket, WebSocketDisconnect
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.logger import AppLogger
+
+# cache
+from app.cache.cacheManager import CacheManager
+
+logger = AppLogger().get_logger()
+
+# events buffered per connection, a client that falls further behind misses events
+QUEUE_SIZE = 100
+
+
+def events_channel(user_id) -> str:
+    return f"message_events:{user_id}"
+
+
+class MessageEvents:
+    """Messages delivered by one transaction, published once it commits."""
+
+    def __init__(self):
+        self.delivered: List[Dict] = []
+
+    def add_rows(self, rows: Iterable):
+        """(user_id, folder, is_read, message_id) inbox rows written."""
+        for user_id, folder, _, message_id in rows:
+            self.delivered.append(
+                {
+                    "user_id": str(user_id),
+                    "message_id": str(message_id),
+                    "folder": folder,
+                }
+            )
+
+    def __bool__(self):
+        return bool(self.delivered)
+
+
+def message_events(session: Session) -> MessageEvents:
+    return session.info.setdefault("message_events", MessageEvents())
+
+
+class MessagePushService:
+    """
+    Pushes message deliveries to the readers' open WebSockets.
+
+    Committed inbox rows are published on the reader's `message_events:<user_id>`
+    channel, so the connection may be held by any worker. Each worker keeps one
+    pubsub connection, subscribed to the channels of its connected users, and
+    hands the events to their sockets.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls, *args, **kwargs)
+                    cls._instance._queues = {}
+                    cls._instance._pubsub = None
+                    cls._instance._listening = None
+                    cls._instance._task = None
+                    cls._instance._loop = None
+        return cls._instance
+
+    # publishing
+
+    async def publish(self, events: MessageEvents):
+        try:
+            cache = await CacheManager().cache_module
+            async with cache.pipeline(transaction=False) as pipe:
+                for delivered in events.delivered:
+                    pipe.publish(
+                        events_channel(delivered["user_id"]),
+                        json.dumps({"event": "message", **delivered}),
+                    )
+                await pipe.execute()
+        except Exception as e:
+            # clients resync from the inbox when they reconnect
+            logger.error(f"Message events publish failed: {e}")
+
+    def schedule(self, events: MessageEvents):
+        """Queues publish() on the service loop, safe from any thread."""
+        if self._loop is not None and events:
+            self._loop.call_soon_threadsafe(asyncio.create_task, self.publish(events))
+
+    # connections
+
+    async def subscribe(self, user_id) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        queues: Set[asyncio.Queue] = self._queues.setdefault(str(user_id), set())
+        queues.add(queue)
+
+        if len(queues) == 1 and self._pubsub is not None:
+            try:
+                await self._pubsub.subscribe(events_channel(user_id))
+                self._listening.set()
+            except Exception as e:
+                # resubscribed with the others once run() reconnects
+                logger.error(f"Message events subscribe failed: {e}")
+        return queue
+
+    async def unsubscribe(self, user_id, queue: asyncio.Queue):
+        queues = self._queues.get(str(user_id))
+        if queues is None:
+            return
+
+        queues.discard(queue)
+        if not queues:
+            del self._queues[str(user_id)]
+            if self._pubsub is not None:
+                try:
+                    await self._pubsub.unsubscribe(events_channel(user_id))
+                except Exception as e:
+                    logger.error(f"Message events unsubscribe failed: {e}")
+
+    def dispatch(self, channel: str, data: str):
+        user_id = channel.split(":", 1)[1]
+        for queue in self._queues.get(user_id, ()):
+            try:
+                queue.put_nowait(data)
+            except asyncio.QueueFull:
+                pass
+
+    async def stream(self, websocket: WebSocket, user_id):
+        """Sends the user's events to an accepted socket until either side closes it."""
+        queue = await self.subscribe(user_id)
+        # incoming frames are ignored, reading only notices the disconnect
+        receive = asyncio.create_task(websocket.receive())
+        data = asyncio.create_task(queue.get())
+        try:
+            while True:
+                done, _ = await asyncio.wait(
+                    {receive, data}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if receive in done:
+                    if receive.result()["type"] == "websocket.disconnect":
+                        return
+                    receive = asyncio.create_task(websocket.receive())
+                if data in done:
+                    await websocket.send_text(data.result())
+                    data = asyncio.create_task(queue.get())
+        except WebSocketDisconnect:
+            pass
+        finally:
+            receive.cancel()
+            data.cancel()
+            await self.unsubscribe(user_id, queue)
+
+    # background job
+
+    async def run(self):
+        while True:
+            pubsub = None
+            try:
+                cache = await CacheManager().cache_module
+                pubsub = cache.pubsub()
+                channels = [events_channel(user_id) for user_id in self._queues]
+                if channels:
+                    await pubsub.subscribe(*channels)
+                self._pubsub = pubsub
+
+                while True:
+                    if not pubsub.subscribed:
+                        # nobody connected to this worker
+                        self._listening.clear()
+                        await self._listening.wait()
+                        continue
+
+                    message = await pubsub.get_message(timeout=1.0)
+                    if message is not None and message["type"] == "message":
+                        self.dispatch(message["channel"], message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Message events subscription failed: {e}")
+                await asyncio.sleep(5)
+            finally:
+                self._pubsub = None
+                if pubsub is not None:
+                    await pubsub.aclose()
+
+    def start(self):
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._listening = asyncio.Event()
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._loop = None
+
+
+message_push_service = MessagePushService()
+
+
+@event.listens_for(Session, "after_commit")
+def publish_message_events(session: Session):
+    events: Optional[MessageEvents] = session.info.pop("message_events", None)
+    if events:
+        message_push_service.schedule(events)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_message_events(session: Session, previous_transaction):
+    session.info.pop("message_events", None)
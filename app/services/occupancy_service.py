@@ -0,0 +1,157 @@
+import pytz
+import asyncio
+import threading
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+from sqlalchemy import Connection, func, or_, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.logger import AppLogger
+
+# models
+from app.modules.contract.models.under_contract import UnderContract
+from app.modules.properties.models.property_unit_association import PropertyUnitAssoc
+
+logger = AppLogger().get_logger()
+
+
+def contract_active_clause(property_unit_assoc_id, now: datetime):
+    """EXISTS clause: an under_contract row of the property/unit covers `now`."""
+    return (
+        select(UnderContract.under_contract_id)
+        .where(
+            UnderContract.property_unit_assoc_id == property_unit_assoc_id,
+            UnderContract.start_date <= now,
+            or_(UnderContract.end_date.is_(None), UnderContract.end_date >= now),
+        )
+        .exists()
+    )
+
+
+def next_boundary_clause(now: datetime):
+    """Earliest future start_date / end_date, i.e. when a flag can flip next."""
+    return select(
+        func.min(UnderContract.start_date).filter(UnderContract.start_date > now),
+        func.min(UnderContract.end_date).filter(UnderContract.end_date >= now),
+    )
+
+
+class OccupancyService:
+    """
+    Maintains the materialized PropertyUnitAssoc.is_contract_active flag.
+
+    UnderContract writes refresh the affected properties/units in the same
+    transaction (see sync_contract_flags). The background job re-evaluates every
+    flag at the next contract start/end boundary, at the latest every
+    OCCUPANCY_REFRESH_SECONDS, so flags follow the clock without any writes.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls, *args, **kwargs)
+                    cls._instance._task = None
+                    cls._instance._loop = None
+                    cls._instance._wakeup = None
+        return cls._instance
+
+    def sync_contract_flags(
+        self, connection: Connection, session: Optional[Session], ids: Iterable
+    ):
+        """Recomputes the flag of the given properties/units on the flush connection."""
+        assoc = PropertyUnitAssoc.__table__
+        now = datetime.now(pytz.utc)
+
+        for property_unit_assoc_id in {key for key in ids if key is not None}:
+            is_active = connection.execute(
+                select(contract_active_clause(property_unit_assoc_id, now))
+            ).scalar()
+            connection.execute(
+                update(assoc)
+                .where(assoc.c.property_unit_assoc_id == property_unit_assoc_id)
+                .values(is_contract_active=is_active)
+            )
+
+            # keep already loaded properties/units in step with the row
+            key = identity_key(PropertyUnitAssoc, property_unit_assoc_id)
+            loaded = session.identity_map.get(key) if session else None
+            if loaded is not None:
+                set_committed_value(loaded, "is_contract_active", is_active)
+
+        # a new contract may start/end before the job's next wakeup; the job is
+        # woken once the transaction commits (see notify_occupancy_refresh)
+        if session is not None:
+            session.info["occupancy_refresh"] = True
+
+    async def refresh(self, engine: AsyncEngine) -> Tuple[int, Optional[datetime]]:
+        """Flips every stale flag, returns the number of rows changed and the next boundary."""
+        assoc = PropertyUnitAssoc.__table__
+        now = datetime.now(pytz.utc)
+        is_active = contract_active_clause(assoc.c.property_unit_assoc_id, now)
+
+        async with engine.begin() as conn:
+            result = await conn.execute(
+                update(assoc)
+                .where(assoc.c.is_contract_active != is_active)
+                .values(is_contract_active=is_active)
+            )
+            boundaries = (await conn.execute(next_boundary_clause(now))).one()
+
+        boundaries = [boundary for boundary in boundaries if boundary is not None]
+        return result.rowcount, min(boundaries) if boundaries else None
+
+    async def run(self, engine: AsyncEngine):
+        while True:
+            delay = settings.OCCUPANCY_REFRESH_SECONDS
+            self._wakeup.clear()
+
+            try:
+                changed, boundary = await self.refresh(engine)
+                if changed:
+                    logger.info(f"Occupancy refresh updated {changed} properties/units")
+
+                if boundary is not None:
+                    if boundary.tzinfo is None:
+                        boundary = boundary.replace(tzinfo=pytz.utc)
+                    until = (boundary - datetime.now(pytz.utc)).total_seconds()
+                    # end_date is inclusive, wake just after the boundary
+                    delay = min(delay, max(until, 0) + 1)
+            except Exception as e:
+                logger.error(f"Occupancy refresh failed: {e}")
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self, engine: AsyncEngine):
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self.run(engine))
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._loop = None
+
+    def notify(self):
+        """Wakes the job so it picks up a changed boundary (safe from any thread)."""
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+
+occupancy_service = OccupancyService()
@@ -0,0 +1,154 @@
+import threading
+from typing import Iterable, List, Optional
+from sqlalchemy import Connection, delete, func, insert, or_, select
+
+# models
+from app.modules.billing.models.invoice import Invoice
+from app.modules.billing.models.receivable_due import ReceivableDue
+from app.modules.contract.models.contract import Contract
+from app.modules.contract.models.contract_invoice import ContractInvoice
+from app.modules.contract.models.under_contract import UnderContract
+
+# enums
+from app.modules.contract.enums.contract_enums import ContractStatusEnum
+
+# keys per statement, keeps the IN lists within driver limits
+CHUNK_SIZE = 1000
+
+COLUMNS = [
+    "invoice_number",
+    "under_contract_id",
+    "contract_number",
+    "contract_type_id",
+    "client_id",
+    "due_date",
+    "status",
+    "created_at",
+    "updated_at",
+]
+
+
+def receivables_due_clause(
+    invoice_numbers: Optional[List[str]] = None,
+    contract_numbers: Optional[List[str]] = None,
+):
+    """receivables_due rows of the given invoices/contracts (all when both are None)."""
+    invoice = Invoice.__table__
+    contract_invoice = ContractInvoice.__table__
+    contract = Contract.__table__
+    under_contract = UnderContract.__table__
+
+    stmt = (
+        select(
+            invoice.c.invoice_number,
+            under_contract.c.under_contract_id,
+            contract.c.contract_number,
+            contract.c.contract_type_id,
+            under_contract.c.client_id,
+            invoice.c.due_date,
+            invoice.c.status,
+            func.now(),
+            func.now(),
+        )
+        .select_from(
+            invoice.join(
+                contract_invoice,
+                contract_invoice.c.invoice_number == invoice.c.invoice_number,
+            )
+            .join(contract, contract.c.contract_id == contract_invoice.c.contract_id)
+            .join(
+                under_contract,
+                under_contract.c.contract_number == contract.c.contract_number,
+            )
+        )
+        .where(
+            contract.c.contract_status == ContractStatusEnum.active,
+            under_contract.c.contract_status == ContractStatusEnum.active,
+        )
+        .distinct()
+    )
+
+    keys = []
+    if invoice_numbers:
+        keys.append(invoice.c.invoice_number.in_(invoice_numbers))
+    if contract_numbers:
+        keys.append(contract.c.contract_number.in_(contract_numbers))
+    if keys:
+        stmt = stmt.where(or_(*keys))
+    return stmt
+
+
+class ReceivablesService:
+    """
+    Keeps the receivables_due table in step with invoices and the contracts they
+    bill.
+
+    Writes only record the affected invoice/contract numbers on the session; once per
+    flush their rows are deleted and re-selected from the invoice → contract_invoice →
+    contract → under_contract join, so a status change, a new invoice link or a
+    client reassignment all land in the same set-based refresh.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls, *args, **kwargs)
+        return cls._instance
+
+    def refresh(
+        self,
+        connection: Connection,
+        invoice_numbers: Iterable[str] = (),
+        contract_numbers: Iterable[str] = (),
+    ):
+        """Re-derives the rows of the given invoices and contracts."""
+        invoice_numbers = sorted(set(invoice_numbers))
+        contract_numbers = sorted(set(contract_numbers))
+
+        for start in range(0, len(invoice_numbers), CHUNK_SIZE):
+            self._refresh_chunk(
+                connection, invoice_numbers=invoice_numbers[start : start + CHUNK_SIZE]
+            )
+        for start in range(0, len(contract_numbers), CHUNK_SIZE):
+            self._refresh_chunk(
+                connection,
+                contract_numbers=contract_numbers[start : start + CHUNK_SIZE],
+            )
+
+    def _refresh_chunk(
+        self,
+        connection: Connection,
+        invoice_numbers: Optional[List[str]] = None,
+        contract_numbers: Optional[List[str]] = None,
+    ):
+        receivables = ReceivableDue.__table__
+        stmt = delete(receivables)
+        if invoice_numbers:
+            stmt = stmt.where(receivables.c.invoice_number.in_(invoice_numbers))
+        if contract_numbers:
+            stmt = stmt.where(receivables.c.contract_number.in_(contract_numbers))
+        connection.execute(stmt)
+
+        connection.execute(
+            insert(receivables).from_select(
+                COLUMNS, receivables_due_clause(invoice_numbers, contract_numbers)
+            )
+        )
+
+    def rebuild(self, connection: Connection) -> int:
+        """Recomputes the whole table, returns the row count."""
+        receivables = ReceivableDue.__table__
+        connection.execute(delete(receivables))
+        connection.execute(
+            insert(receivables).from_select(COLUMNS, receivables_due_clause())
+        )
+        return connection.execute(
+            select(func.count()).select_from(receivables)
+        ).scalar()
+
+
+receivables_service = ReceivablesService()
@@ -0,0 +1,211 @@
+import asyncio
+import threading
+from typing import Any, Iterable, List, Optional, Set
+from sqlalchemy import Row, event, select
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.logger import AppLogger
+
+# cache
+from app.cache.cacheManager import CacheManager
+
+# models
+from app.modules.billing.models.payment_type import PaymentType
+from app.modules.billing.models.transaction_type import TransactionType
+from app.modules.contract.models.contract_type import ContractType
+
+logger = AppLogger().get_logger()
+
+CHANNEL = "reference_data"
+
+# table: (model, key column)
+REFERENCE_TABLES = {
+    "contract_type": (ContractType, ContractType.contract_type_id),
+    "payment_type": (PaymentType, PaymentType.payment_type_id),
+    "transaction_type": (TransactionType, TransactionType.transaction_type_id),
+}
+
+REFERENCE_MODELS = {model: table for table, (model, _) in REFERENCE_TABLES.items()}
+
+
+class ReferenceDataService:
+    """
+    In-process copy of the small lookup tables (contract/payment/transaction types),
+    so names can be resolved without a query or a join. Roles and permissions are
+    not cached: authorization data is always read from the database.
+
+    Every worker loads the tables on startup. A committed write to any of them is
+    published on the `reference_data` channel and every worker (the writer
+    included) reloads the tables named in the message. Rows are immutable
+    sqlalchemy Rows, so they can be handed to pydantic `from_attributes` schemas.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls, *args, **kwargs)
+                    cls._instance._tables = {}
+                    cls._instance._engine = None
+                    cls._instance._loop = None
+                    cls._instance._task = None
+                    cls._instance._pending = set()
+        return cls._instance
+
+    # lookups
+
+    def get(self, table: str, key: Any) -> Optional[Row]:
+        """Row of `table` with the given primary key, None if unknown."""
+        if key is None:
+            return None
+
+        row = self._tables.get(table, {}).get(key)
+        if row is None:
+            # a row committed by a write we haven't heard of yet
+            self.schedule_reload([table])
+        return row
+
+    def all(self, table: str) -> List[Row]:
+        return list(self._tables.get(table, {}).values())
+
+    def contract_type_name(self, contract_type_id: Optional[int]):
+        row = self.get("contract_type", contract_type_id)
+        return row.contract_type_name if row else None
+
+    def payment_type_name(self, payment_type_id: Optional[int]):
+        row = self.get("payment_type", payment_type_id)
+        return row.payment_type_name if row else None
+
+    def transaction_type_name(self, transaction_type_id: Optional[int]):
+        row = self.get("transaction_type", transaction_type_id)
+        return row.transaction_type_name if row else None
+
+    # loading
+
+    async def load(self, engine: AsyncEngine, tables: Optional[Iterable[str]] = None):
+        """(Re)loads the given tables, all of them by default."""
+        tables = set(tables or REFERENCE_TABLES) & set(REFERENCE_TABLES)
+
+        async with engine.connect() as conn:
+            for table in tables:
+                model, key = REFERENCE_TABLES[table]
+                rows = (await conn.execute(select(model.__table__))).all()
+
+                # swap the whole mapping, readers never see a partial table
+                self._tables[table] = {getattr(row, key.key): row for row in rows}
+
+        logger.info(f"Reference data loaded: {', '.join(sorted(tables))}")
+
+    async def reload(self, tables: Iterable[str]):
+        try:
+            await self.load(self._engine, tables)
+        except Exception as e:
+            logger.error(f"Reference data reload failed: {e}")
+
+    async def publish(self, tables: Iterable[str]):
+        """Tells every worker to reload `tables`, reloads locally if redis is unavailable."""
+        tables = sorted(tables)
+        try:
+            cache = await CacheManager().cache_module
+            await cache.publish(CHANNEL, ",".join(tables))
+        except Exception as e:
+            logger.error(f"Reference data publish failed: {e}")
+            await self.reload(tables)
+
+    def schedule_reload(self, tables: Iterable[str], publish: bool = False):
+        """Queues a publish (or a local reload) on the service loop, safe from any thread."""
+        tables = set(tables)
+        if self._loop is None:
+            return
+        if not publish:
+            # misses of the same table share one reload
+            tables -= self._pending
+            self._pending |= tables
+        if not tables:
+            return
+
+        async def run():
+            try:
+                await (self.publish(tables) if publish else self.reload(tables))
+            finally:
+                if not publish:
+                    self._pending -= tables
+
+        self._loop.call_soon_threadsafe(asyncio.create_task, run())
+
+    async def run(self):
+        """Reloads on published writes and every REFERENCE_DATA_REFRESH_SECONDS."""
+        while True:
+            pubsub = None
+            try:
+                cache = await CacheManager().cache_module
+                pubsub = cache.pubsub()
+                await pubsub.subscribe(CHANNEL)
+                # writes may have been missed while unsubscribed
+                await self.reload(REFERENCE_TABLES)
+
+                loop = asyncio.get_running_loop()
+                deadline = loop.time() + settings.REFERENCE_DATA_REFRESH_SECONDS
+                while True:
+                    message = await pubsub.get_message(
+                        timeout=max(deadline - loop.time(), 0)
+                    )
+                    if message is not None and message["type"] == "message":
+                        await self.reload(message["data"].split(","))
+                    elif loop.time() >= deadline:
+                        await self.reload(REFERENCE_TABLES)
+                        deadline = loop.time() + settings.REFERENCE_DATA_REFRESH_SECONDS
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Reference data subscription failed: {e}")
+                await asyncio.sleep(5)
+            finally:
+                if pubsub is not None:
+                    await pubsub.aclose()
+
+    async def start(self, engine: AsyncEngine):
+        if self._task is None:
+            self._engine = engine
+            self._loop = asyncio.get_running_loop()
+            await self.load(engine)
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._loop = None
+
+
+reference_data = ReferenceDataService()
+
+
+@event.listens_for(Session, "after_flush")
+def collect_reference_writes(session: Session, flush_context):
+    tables: Set[str] = session.info.setdefault("reference_data", set())
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        table = REFERENCE_MODELS.get(type(instance))
+        if table:
+            tables.add(table)
+
+
+@event.listens_for(Session, "after_commit")
+def publish_reference_writes(session: Session):
+    tables = session.info.pop("reference_data", None)
+    if tables:
+        reference_data.schedule_reload(tables, publish=True)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_reference_writes(session: Session, previous_transaction):
+    session.info.pop("reference_data", None)
@@ -0,0 +1,251 @@
+import os
+import re
+import uuid
+import hashlib
+import tempfile
+import cloudinary
+import cloudinary.api
+import cloudinary.utils
+import cloudinary.uploader
+import cloudinary.exceptions
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from urllib.request import urlopen
+from typing import BinaryIO, Optional, Union
+
+from app.core.config import settings
+
+# keys of content-addressed files: <sha256[:2]>/<sha256[2:4]>/<sha256><.ext>
+LOCAL_KEY = re.compile(r"^[0-9a-f]{2}/[0-9a-f]{2}/[0-9a-f]{64}(\.[a-z0-9]{1,10})?$")
+
+
+class HashingReader:
+    """
+    Read-through wrapper of an uploaded file: the bytes are hashed (SHA-256) and
+    counted as the storage backend reads them, and closing it leaves the file open.
+    """
+
+    def __init__(self, file_io: BinaryIO, name: str):
+        self.file_io = file_io
+        self.name = name
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.file_io.read(size)
+        self.sha256.update(chunk)
+        self.size += len(chunk)
+        return chunk
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self.file_io.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self.file_io.tell()
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def file_digest(file_io: BinaryIO) -> str:
+    """SHA-256 of the file, read in MEDIA_UPLOAD_CHUNK_SIZE parts from the start."""
+    sha256 = hashlib.sha256()
+    file_io.seek(0)
+    while chunk := file_io.read(settings.MEDIA_UPLOAD_CHUNK_SIZE):
+        sha256.update(chunk)
+    file_io.seek(0)
+    return sha256.hexdigest()
+
+
+@dataclass
+class StoredObject:
+    key: str
+    url: str
+    size: Optional[int] = None
+    sha256: Optional[str] = None
+
+
+class StorageBackend(ABC):
+    """
+    Where media files are kept. Backends are synchronous, MediaUploadPool runs
+    them on its threads; put() reads the file in MEDIA_UPLOAD_CHUNK_SIZE parts.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def put(
+        self,
+        file_io: Union[BinaryIO, str],
+        file_name: str,
+        folder: str,
+        sha256: Optional[str] = None,
+    ) -> StoredObject:
+        """`sha256` is the content's hash when the caller already computed it."""
+
+    @abstractmethod
+    def get(self, key: str) -> BinaryIO: ...
+
+    @abstractmethod
+    def delete(self, key: str): ...
+
+    @abstractmethod
+    def stat(self, key: str) -> Optional[StoredObject]: ...
+
+    @abstractmethod
+    def url(self, key: str) -> str: ...
+
+
+class CloudinaryStorage(StorageBackend):
+    """
+    Cloudinary assets, keyed `<resource_type>/<type>/<public_id>` like the path of
+    their delivery urls.
+    """
+
+    name = "cloudinary"
+
+    @staticmethod
+    def split(key: str):
+        resource_type, delivery_type, public_id = key.split("/", 2)
+        return public_id, {"resource_type": resource_type, "type": delivery_type}
+
+    def put(
+        self,
+        file_io: Union[BinaryIO, str],
+        file_name: str,
+        folder: str,
+        sha256: Optional[str] = None,
+    ) -> StoredObject:
+        """`file_io` may also be a remote url, fetched by Cloudinary."""
+        # names derived from the content never clash with another upload's asset
+        public_id = f"{file_name}_{sha256[:16] if sha256 else uuid.uuid4().hex}"
+
+        options = dict(resource_type="auto", public_id=public_id, folder=folder)
+        if isinstance(file_io, str):
+            result = cloudinary.uploader.upload(file_io, **options)
+            return self.stored(result)
+
+        reader = HashingReader(file_io, file_name)
+        result = cloudinary.uploader.upload_large(
+            reader, chunk_size=settings.MEDIA_UPLOAD_CHUNK_SIZE, **options
+        )
+        stored = self.stored(result)
+        stored.size, stored.sha256 = reader.size, reader.sha256.hexdigest()
+        return stored
+
+    def stored(self, result: dict) -> StoredObject:
+        return StoredObject(
+            key=f"{result['resource_type']}/{result['type']}/{result['public_id']}",
+            url=result["secure_url"],
+            size=result.get("bytes"),
+        )
+
+    def get(self, key: str) -> BinaryIO:
+        return urlopen(self.url(key))
+
+    def delete(self, key: str):
+        public_id, options = self.split(key)
+        cloudinary.uploader.destroy(public_id, invalidate=True, **options)
+
+    def stat(self, key: str) -> Optional[StoredObject]:
+        public_id, options = self.split(key)
+        try:
+            return self.stored(cloudinary.api.resource(public_id, **options))
+        except cloudinary.exceptions.NotFound:
+            return None
+
+    def url(self, key: str) -> str:
+        public_id, options = self.split(key)
+        return cloudinary.utils.cloudinary_url(public_id, secure=True, **options)[0]
+
+
+class LocalStorage(StorageBackend):
+    """
+    Files under MEDIA_ROOT, content-addressed: a file is stored once under its
+    SHA-256, whatever its name or folder, and served from MEDIA_URL by
+    MediaRouter with a file response.
+    """
+
+    name = "local"
+
+    def __init__(self, root: str = None, base_url: str = None):
+        self.root = os.path.abspath(root or settings.MEDIA_ROOT)
+        self.base_url = (base_url or settings.MEDIA_URL).rstrip("/")
+
+    def path(self, key: str) -> str:
+        if not LOCAL_KEY.match(key):
+            raise ValueError(f"Invalid media key: {key}")
+        return os.path.join(self.root, key)
+
+    def put(
+        self,
+        file_io: Union[BinaryIO, str],
+        file_name: str,
+        folder: str,
+        sha256: Optional[str] = None,
+    ) -> StoredObject:
+        if isinstance(file_io, str):
+            raise ValueError("Local storage only stores uploaded files")
+
+        reader = HashingReader(file_io, file_name)
+        incoming = os.path.join(self.root, "incoming")
+        os.makedirs(incoming, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile(dir=incoming, delete=False) as temp:
+            try:
+                while chunk := reader.read(settings.MEDIA_UPLOAD_CHUNK_SIZE):
+                    temp.write(chunk)
+            except BaseException:
+                os.unlink(temp.name)
+                raise
+
+        sha256 = reader.sha256.hexdigest()
+        extension = os.path.splitext(file_name)[1].lower()
+        if not re.fullmatch(r"\.[a-z0-9]{1,10}", extension):
+            extension = ""
+        key = f"{sha256[:2]}/{sha256[2:4]}/{sha256}{extension}"
+
+        path = self.path(key)
+        if os.path.exists(path):
+            # same content already stored
+            os.unlink(temp.name)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(temp.name, path)
+
+        return StoredObject(key=key, url=self.url(key), size=reader.size, sha256=sha256)
+
+    def get(self, key: str) -> BinaryIO:
+        return open(self.path(key), "rb")
+
+    def delete(self, key: str):
+        try:
+            os.unlink(self.path(key))
+        except FileNotFoundError:
+            pass
+
+    def stat(self, key: str) -> Optional[StoredObject]:
+        try:
+            size = os.stat(self.path(key)).st_size
+        except (FileNotFoundError, ValueError):
+            return None
+        return StoredObject(
+            key=key, url=self.url(key), size=size, sha256=key.split("/")[2][:64]
+        )
+
+    def url(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+
+STORAGE_BACKENDS = {
+    CloudinaryStorage.name: CloudinaryStorage,
+    LocalStorage.name: LocalStorage,
+}
+
+media_storage: StorageBackend = STORAGE_BACKENDS[settings.MEDIA_STORAGE]()
@@ -0,0 +1,70 @@
+import os
+import asyncio
+import threading
+from typing import Iterable, Optional
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+from app.core.config import settings, template_path
+from app.core.logger import AppLogger
+
+logger = AppLogger().get_logger()
+
+EMAIL_TEMPLATES = ("confirmEmail.html", "welcome.html", "passwordReset.html")
+
+
+class TemplateService:
+    """
+    One Jinja environment per process for the email templates.
+
+    Templates are compiled once (precompile() at startup) and kept in the
+    environment's template cache; the compiled bytecode is also written to the
+    `{CACHE_PATH}jinja` directory (CACHE_PATH is a file name prefix, as for the
+    dogpile cachefile.dbm), so other workers and restarts skip the parsing as well.
+    Sources are only checked for changes in DEBUG_MODE. Rendering is thread-safe
+    and can be moved off the event loop with render_async().
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls, *args, **kwargs)
+                    cls._instance.env = Environment(
+                        loader=FileSystemLoader(template_path),
+                        bytecode_cache=cls._bytecode_cache(),
+                        auto_reload=settings.DEBUG_MODE,
+                        # keep every template compiled
+                        cache_size=-1,
+                    )
+        return cls._instance
+
+    @staticmethod
+    def _bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+        directory = f"{settings.CACHE_PATH}jinja"
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError as e:
+            logger.error(f"Template bytecode cache disabled: {e}")
+            return None
+        return FileSystemBytecodeCache(directory)
+
+    def precompile(self, names: Iterable[str] = EMAIL_TEMPLATES):
+        for name in names:
+            self.env.get_template(name)
+        logger.info(f"Templates compiled: {', '.join(names)}")
+
+    def get(self, name: str) -> Template:
+        return self.env.get_template(name)
+
+    def render(self, name: str, **context) -> str:
+        return self.get(name).render(context)
+
+    async def render_async(self, name: str, **context) -> str:
+        """Renders on the default thread pool, keeps bulk renders off the loop."""
+        return await asyncio.to_thread(self.render, name, **context)
+
+
+template_service = TemplateService()
@@ -1,13 +1,23 @@
+import io
 import re
-import uuid
-import cloudinary
-import cloudinary.api
-import cloudinary.uploader
+import time
+import base64
+import asyncio
+import threading
+from typing import BinaryIO, List, Optional
+from fastapi import UploadFile
+from concurrent.futures import ThreadPoolExecutor
 
 # utils
 from app.core.config import settings
+from app.core.logger import AppLogger
 from app.core.response import DAOResponse
 
+# services
+from app.services.storage_service import file_digest, media_storage
+
+logger = AppLogger().get_logger()
+
 
 class MediaUploaderService:
     def __init__(self, base64_image, file_name, media_type="general"):
@@ -31,43 +41,152 @@ class MediaUploaderService:
             return match.group("type")
         return None
 
-    def check_filename_exists(self):
-        try:
-            result = cloudinary.api.resources(type="upload", prefix=self.file_name)
-            resources = result.get("resources", [])
-
-            # check if the filename exists
-            for resource in resources:
-                if resource["public_id"] == self.file_name:
-                    return True
-            return False
-        except Exception as e:
-            print(f"Error checking file_name: {e}")
-            return False
+    def source(self):
+        """The data URI decoded to a file, any other string (a url) as is."""
+        match = re.match(r"data:[^;,]*;base64,", self.base64_image)
+        if match:
+            return io.BytesIO(base64.b64decode(self.base64_image[match.end() :]))
+        return self.base64_image
 
-    def upload(self):
+    def upload(self, file_io: Optional[BinaryIO] = None, sha256: Optional[str] = None):
+        """
+        Stores the base64 data URI, or streams `file_io` when given, through the
+        configured storage backend (MEDIA_STORAGE). `sha256` is the content's hash
+        when already computed, backends name the stored object after it.
+        """
         # specify folder name
-        folder_name = str(settings.APP_NAME + "/" + self.media_type + "/").lower()
+        folder_name = str(settings.APP_NAME + "/" + self.media_type).lower()
 
         # replace spaces with underscore
         file_name = re.sub(r"\s+", "_", self.file_name)
 
-        # TODO: Implement searching image information and returning it if already exists
-        if self.check_filename_exists():
-            file_name = file_name + "_" + str(uuid.uuid4())
-
         try:
-            # upload an image
-            upload_result = cloudinary.uploader.upload(
-                self.base64_image,
-                resource_type="auto",
-                public_id=self.file_name,
-                folder=folder_name,
+            stored = media_storage.put(
+                self.source() if file_io is None else file_io,
+                file_name,
+                folder_name,
+                sha256=sha256,
             )
 
-            # return upload_result['secure_url']
             return DAOResponse(
-                success=True, data={"content_url": upload_result["secure_url"]}
+                success=True,
+                data={
+                    "content_url": stored.url,
+                    "storage_key": stored.key,
+                    "size": stored.size,
+                    "sha256": stored.sha256,
+                },
             )
         except Exception as e:
             return DAOResponse(success=False, error=f"{str(e)}")
+
+
+class MediaUploadPool:
+    """
+    Runs MediaUploaderService uploads on a bounded thread pool.
+
+    Storage backends (the Cloudinary SDK, file writes) are synchronous, so every
+    upload is moved off the event loop onto one of MEDIA_UPLOAD_WORKERS threads; a
+    request's files are uploaded concurrently, at most MEDIA_UPLOAD_WORKERS at a
+    time. Uploaded files are streamed from their spooled temp files and hashed on
+    the way. Each upload is timed, logged and its duration returned as `upload_ms`.
+
+    Files can be hashed (digest_files) before they are uploaded, so callers skip
+    the ones whose content is already stored (see MediaDAO.upload_files).
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls, *args, **kwargs)
+                    cls._instance._executor = None
+        return cls._instance
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=settings.MEDIA_UPLOAD_WORKERS,
+                        thread_name_prefix="upload",
+                    )
+        return self._executor
+
+    async def upload(
+        self,
+        data: Optional[str],
+        file_name: str,
+        media_type: str,
+        file_io: Optional[BinaryIO] = None,
+        sha256: Optional[str] = None,
+    ) -> DAOResponse:
+        """Uploads a base64 data URI, or the file `file_io` when given."""
+        uploader = MediaUploaderService(data, file_name, media_type)
+
+        started = time.perf_counter()
+        response: DAOResponse = await asyncio.get_running_loop().run_in_executor(
+            self.executor, uploader.upload, file_io, sha256
+        )
+        elapsed = (time.perf_counter() - started) * 1000
+
+        if response.success:
+            response.data["upload_ms"] = round(elapsed, 1)
+            logger.info(f"Uploaded {media_type}/{file_name} in {elapsed:.0f} ms")
+        else:
+            logger.error(
+                f"Upload of {media_type}/{file_name} failed after {elapsed:.0f} ms: "
+                f"{response.error}"
+            )
+        return response
+
+    async def digest(self, file_io: BinaryIO) -> str:
+        """SHA-256 (hex) of the file, read on a pool thread."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, file_digest, file_io
+        )
+
+    async def digest_files(self, files: List[UploadFile]) -> List[str]:
+        """Hashes the files concurrently, digests are in the order of `files`."""
+        return list(await asyncio.gather(*(self.digest(file.file) for file in files)))
+
+    async def upload_files(
+        self,
+        files: List[UploadFile],
+        media_type: str,
+        digests: Optional[List[str]] = None,
+    ) -> List[DAOResponse]:
+        """
+        Uploads the files concurrently, responses are in the order of `files`; a
+        failed upload does not stop the others, its response is unsuccessful.
+        `digests` are the files' SHA-256 when already computed (digest_files).
+        """
+        for file in files:
+            await file.seek(0)
+
+        return list(
+            await asyncio.gather(
+                *(
+                    self.upload(
+                        None,
+                        file.filename,
+                        media_type,
+                        file_io=file.file,
+                        sha256=digests[idx] if digests else None,
+                    )
+                    for idx, file in enumerate(files)
+                )
+            )
+        )
+
+    def stop(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+media_upload_pool = MediaUploadPool()
@@ -0,0 +1,39 @@
+import ast
+from types import SimpleNamespace
+
+from app.core.security import SecureAccessTokens
+
+
+def make_user(*role_permissions):
+    roles = [
+        SimpleNamespace(permissions=[SimpleNamespace(name=name) for name in names])
+        for names in role_permissions
+    ]
+    user = SimpleNamespace(
+        user_id="b0d1e0b4-5c6a-4d6b-9a53-1b2c3d4e5f60",
+        first_name="Ama",
+        last_name="Mensah",
+        email="ama@example.com",
+        roles=roles,
+    )
+    user.to_dict = lambda exclude=None: {
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "email": user.email,
+    }
+    return user
+
+
+class TestAccessToken:
+    def test_scopes_come_from_the_loaded_roles(self):
+        user = make_user(["read_property", "write_property"], ["read_property"])
+
+        token = SecureAccessTokens.create_access_token(user)
+        payload = ast.literal_eval(token["sub"])
+
+        assert payload["scope"] == "read_property,write_property"
+
+    def test_user_without_roles_has_no_scopes(self):
+        token = SecureAccessTokens.create_access_token(make_user())
+
+        assert ast.literal_eval(token["sub"])["scope"] == ""
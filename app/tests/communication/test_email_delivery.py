@@ -0,0 +1,102 @@
+import smtplib
+import asyncio
+import pytest
+
+from app.core.config import settings
+from app.services.email_delivery_service import (
+    EmailDeliveryError,
+    EmailJob,
+    email_delivery,
+)
+
+
+class FakeSMTP:
+    """Stands in for smtplib.SMTP: records connections and answers per recipient."""
+
+    connections = []
+    refuse_connections = 0
+    busy = set()
+
+    def __init__(self, host, port, timeout=None):
+        if FakeSMTP.refuse_connections:
+            FakeSMTP.refuse_connections -= 1
+            raise ConnectionRefusedError("connection refused")
+        self.sent = []
+        FakeSMTP.connections.append(self)
+
+    def ehlo(self):
+        return 250, b"ok"
+
+    def has_extn(self, name):
+        return False
+
+    def sendmail(self, from_addr, to_addr, message):
+        if to_addr in self.busy:
+            # greylisted once, accepted on the next attempt
+            self.busy.discard(to_addr)
+            raise smtplib.SMTPRecipientsRefused({to_addr: (450, b"try again later")})
+        if to_addr.startswith("unknown"):
+            raise smtplib.SMTPRecipientsRefused({to_addr: (550, b"no such user")})
+        self.sent.append(to_addr)
+        return {}
+
+    def quit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def smtp(monkeypatch):
+    FakeSMTP.connections = []
+    FakeSMTP.refuse_connections = 0
+    FakeSMTP.busy = {"busy@example.com"}
+    monkeypatch.setattr(smtplib, "SMTP", FakeSMTP)
+    monkeypatch.setattr(settings, "EMAIL_USE_SSL", False)
+    monkeypatch.setattr(settings, "EMAIL_POOL_SIZE", 1)
+    monkeypatch.setattr(settings, "EMAIL_RETRY_BACKOFF_SECONDS", 0)
+    return FakeSMTP
+
+
+class TestEmailDelivery:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_connection_is_reused_and_4xx_retried(self, smtp):
+        email_delivery.start()
+        try:
+            futures = [
+                await email_delivery.submit(to, "Subject: test\n\nbody")
+                for to in ("one@example.com", "busy@example.com", "two@example.com")
+            ]
+            failed = await email_delivery.submit("unknown@example.com", "body")
+
+            assert await asyncio.wait_for(asyncio.gather(*futures), 5) == [True] * 3
+            with pytest.raises(EmailDeliveryError, match="no such user"):
+                await asyncio.wait_for(failed, 5)
+        finally:
+            await email_delivery.stop()
+
+        # one login for the whole run, the refusals kept the connection
+        assert len(smtp.connections) == 1
+        assert smtp.connections[0].sent == [
+            "one@example.com",
+            "two@example.com",
+            "busy@example.com",
+        ]
+
+    def test_failed_connect_fails_the_rest_of_the_batch(self, smtp):
+        smtp.refuse_connections = 1
+        jobs = [EmailJob(to=f"{idx}@example.com", message="body") for idx in range(3)]
+
+        connection = {}
+        results = email_delivery.deliver(connection, jobs)
+
+        # one connection attempt, every message gets its (transient) error
+        assert len(results) == 3
+        assert all(isinstance(error, ConnectionRefusedError) for error in results)
+        assert results[0] is results[2]
+        assert "server" not in connection and smtp.connections == []
+
+        # the retried batch goes out on a fresh connection
+        assert email_delivery.deliver(connection, jobs) == [None] * 3
+        assert len(smtp.connections) == 1
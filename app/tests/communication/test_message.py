@@ -244,6 +244,76 @@ class TestMessages:
         messages = response.json()["data"]
         assert any(m["message_id"] == self.default_notification["data"]["message_id"] for m in messages), "Notification message not found"
 
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.dependency(depends=["TestMessages::reply_to_message"], name="TestMessages::get_thread")
+    async def test_get_thread(self, client: AsyncClient):
+        message_id = self.default_message["data"]["message_id"]
+        response = await client.get(f"/message/threads/{message_id}", params={"limit": 1})
+        assert response.status_code == 200, f"Failed to get thread: {response.text}"
+        first_page = response.json()
+        assert [m["message_id"] for m in first_page["data"]] == [message_id]
+        assert first_page["data"][0]["depth"] == 0
+        assert first_page["meta"]["next_cursor"], "Thread page has no next cursor"
+
+        # the reply continues after the cursor of the first page
+        response = await client.get(
+            f"/message/threads/{message_id}",
+            params={"limit": 1, "cursor": first_page["meta"]["next_cursor"]},
+        )
+        assert response.status_code == 200, f"Failed to get next thread page: {response.text}"
+        second_page = response.json()
+        assert [m["message_id"] for m in second_page["data"]] == [self.default_reply["message_id"]]
+        assert second_page["data"][0]["depth"] == 1
+        assert second_page["data"][0]["parent_message_id"] == message_id
+
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.dependency(depends=["TestMessages::create_message"], name="TestMessages::get_thread_invalid_cursor")
+    async def test_get_thread_invalid_cursor(self, client: AsyncClient):
+        message_id = self.default_message["data"]["message_id"]
+        response = await client.get(f"/message/threads/{message_id}", params={"cursor": "not-a-cursor"})
+        assert response.status_code == 400, f"Invalid cursor was accepted: {response.text}"
+        assert response.json()["success"] is False
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_get_thread_not_found(self, client: AsyncClient):
+        response = await client.get(f"/message/threads/{self.faker.uuid4()}")
+        assert response.status_code == 404, f"Unknown thread was found: {response.text}"
+
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.dependency(
+        depends=["TestMessages::create_message", "TestMessages::create_notification_message"],
+        name="TestMessages::get_user_counters",
+    )
+    async def test_get_user_counters(self, client: AsyncClient):
+        user_id = TestMessages.recipient_user.get("user_id")
+        response = await client.get(f"/message/users/{user_id}/counters")
+        assert response.status_code == 200, f"Failed to get user counters: {response.text}"
+        counters = response.json()["data"]
+        assert set(counters) == {"inbox", "notifications", "drafts", "scheduled"}
+        assert counters["inbox"] >= 1, "Unread message not counted"
+        assert counters["notifications"] >= 1, "Unread notification not counted"
+
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.dependency(depends=["TestMessages::get_user_counters"], name="TestMessages::mark_message_read")
+    async def test_mark_message_read(self, client: AsyncClient):
+        user_id = TestMessages.recipient_user.get("user_id")
+        message_id = self.default_message["data"]["message_id"]
+        response = await client.get(f"/message/users/{user_id}/counters")
+        unread = response.json()["data"]["inbox"]
+
+        response = await client.put(f"/message/users/{user_id}/messages/{message_id}/read")
+        assert response.status_code == 200, f"Failed to mark message read: {response.text}"
+        assert response.json()["data"] == {"message_id": message_id, "is_read": True}
+
+        response = await client.get(f"/message/users/{user_id}/counters")
+        assert response.json()["data"]["inbox"] == unread - 1
+
+        # already read, the counter doesn't move again
+        response = await client.put(f"/message/users/{user_id}/messages/{message_id}/read")
+        assert response.status_code == 200, f"Failed to mark message read again: {response.text}"
+        response = await client.get(f"/message/users/{user_id}/counters")
+        assert response.json()["data"]["inbox"] == unread - 1
+
     @pytest.mark.asyncio(loop_scope="session")
     @pytest.mark.dependency(depends=["TestMessages::create_message"], name="TestMessages::update_message_by_id")
     async def test_update_message(self, client: AsyncClient):
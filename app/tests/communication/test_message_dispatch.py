@@ -0,0 +1,267 @@
+import pytz
+import uuid
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.dbDeclarative import Base
+from app.services.message_counter_service import CounterChanges
+from app.services.message_push_service import MessageEvents
+from app.services.message_dispatch_service import (
+    TimerWheel,
+    message_dispatch_service,
+    next_remind_date,
+)
+from app.modules.communication.models.message import Message
+from app.modules.communication.models.message_inbox import MessageInbox
+from app.modules.communication.models.message_recipient import MessageRecipient
+from app.modules.communication.models.reminder_frequency import ReminderFrequency
+
+NOW = datetime(2024, 6, 15, 12, 0, tzinfo=pytz.utc)
+
+
+def utc(value: datetime) -> datetime:
+    # SQLite hands the dates back without their timezone
+    return value.replace(tzinfo=pytz.utc) if value.tzinfo is None else value
+
+
+class TestNextRemindDate:
+    def test_one_off_reminder_has_no_next_date(self):
+        assert next_remind_date(NOW, None, NOW) is None
+        assert next_remind_date(NOW, 0, NOW) is None
+
+    def test_next_occurrence_after_now(self):
+        assert next_remind_date(NOW, 7, NOW) == NOW + timedelta(days=7)
+        assert next_remind_date(NOW - timedelta(hours=1), 1, NOW) == NOW + timedelta(
+            hours=23
+        )
+
+    def test_missed_occurrences_are_skipped(self):
+        # due 10 days ago every 3 days: the ones 7, 4 and 1 days ago were missed
+        due = NOW - timedelta(days=10)
+        assert next_remind_date(due, 3, NOW) == NOW + timedelta(days=2)
+
+    def test_naive_due_date_is_utc(self):
+        due = (NOW - timedelta(days=1)).replace(tzinfo=None)
+        assert next_remind_date(due, 7, NOW) == NOW + timedelta(days=6)
+
+
+class TestTimerWheel:
+    def wheel(self, size: int = 10, tick: int = 1_000) -> TimerWheel:
+        wheel = TimerWheel(size)
+        wheel.tick = tick
+        return wheel
+
+    def test_deadlines_expire_in_their_second(self):
+        wheel = self.wheel()
+        assert wheel.add(1_003.2) and wheel.add(1_004) and wheel.add(1_004)
+
+        assert wheel.next_deadline() == 1_004
+        assert wheel.expire(1_003.9) == 0
+        assert wheel.expire(1_004) == 3
+        assert wheel.next_deadline() is None
+
+    def test_overdue_deadline_fires_on_the_next_tick(self):
+        wheel = self.wheel()
+        assert wheel.add(900)
+
+        assert wheel.next_deadline() == 1_001
+        assert wheel.expire(1_001) == 1
+
+    def test_deadline_beyond_the_wheel_is_refused(self):
+        wheel = self.wheel()
+        assert wheel.add(1_010)
+        assert not wheel.add(1_011)
+
+    def test_slots_are_reused_after_wraparound(self):
+        wheel = self.wheel()
+        assert wheel.add(1_008)
+        assert wheel.expire(1_005) == 0
+
+        # same slot as 1_002, which has already passed
+        assert wheel.add(1_012)
+        assert wheel.next_deadline() == 1_008
+        assert wheel.expire(1_009) == 1
+        assert wheel.next_deadline() == 1_012
+        assert wheel.expire(1_012) == 1
+
+    def test_jump_past_the_whole_wheel_expires_everything(self):
+        wheel = self.wheel()
+        wheel.add(1_002)
+        wheel.add(1_009)
+
+        assert wheel.expire(1_050) == 2
+        assert wheel.tick == 1_050
+        assert wheel.next_deadline() is None
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'dispatch.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+async def add_message(conn, recipient_id: uuid.UUID, **values) -> uuid.UUID:
+    message_id = uuid.uuid4()
+    await conn.execute(
+        insert(Message.__table__).values(
+            message_id=message_id,
+            subject="Rent due",
+            message_body="Rent is due on Friday",
+            sender_id=uuid.uuid4(),
+            **{
+                "is_draft": False,
+                "is_notification": False,
+                "is_enquiry": False,
+                "is_reminder": False,
+                "is_scheduled": False,
+                "date_created": NOW - timedelta(days=30),
+                "scheduled_date": NOW - timedelta(days=30),
+                **values,
+            },
+        )
+    )
+    await conn.execute(
+        insert(MessageRecipient.__table__).values(
+            id=uuid.uuid4(),
+            recipient_id=recipient_id,
+            message_id=message_id,
+            msg_send_date=NOW - timedelta(days=30),
+        )
+    )
+    return message_id
+
+
+class TestDispatch:
+    message = Message.__table__
+    recipient = MessageRecipient.__table__
+    inbox = MessageInbox.__table__
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_due_reminder_sends_a_copy(self, engine):
+        recipient_id = uuid.uuid4()
+        due = NOW - timedelta(days=1)
+
+        async with engine.begin() as conn:
+            await conn.execute(
+                insert(ReminderFrequency.__table__).values(
+                    reminder_frequency_id=1, title="Weekly", frequency=7, is_active=True
+                )
+            )
+            reminder = {
+                "is_reminder": True,
+                "next_remind_date": due,
+                "reminder_frequency_id": 1,
+            }
+            reminder_id = await add_message(conn, recipient_id, **reminder)
+            # drafts and scheduled messages don't remind yet
+            draft_id = await add_message(conn, recipient_id, is_draft=True, **reminder)
+            scheduled_id = await add_message(
+                conn, recipient_id, is_scheduled=True, **reminder
+            )
+
+            fired = await conn.run_sync(
+                message_dispatch_service.fire_reminders,
+                NOW,
+                CounterChanges(),
+                MessageEvents(),
+            )
+        assert fired == (1, False)
+
+        async with engine.connect() as conn:
+            copy = (
+                await conn.execute(
+                    select(self.message).where(
+                        self.message.c.parent_message_id == reminder_id
+                    )
+                )
+            ).one()
+            copy_recipients = (
+                await conn.execute(
+                    select(self.recipient.c.recipient_id).where(
+                        self.recipient.c.message_id == copy.message_id
+                    )
+                )
+            ).all()
+            next_dates = dict(
+                (
+                    await conn.execute(
+                        select(
+                            self.message.c.message_id, self.message.c.next_remind_date
+                        ).where(
+                            self.message.c.message_id.in_(
+                                [reminder_id, draft_id, scheduled_id]
+                            )
+                        )
+                    )
+                ).all()
+            )
+            delivered = (
+                await conn.execute(
+                    select(self.inbox.c.user_id, self.inbox.c.folder).where(
+                        self.inbox.c.message_id == copy.message_id
+                    )
+                )
+            ).all()
+
+        assert (copy.subject, copy.thread_id) == ("Rent due", reminder_id)
+        assert copy.is_notification and not copy.is_draft and not copy.is_scheduled
+        assert utc(copy.date_created) == NOW
+        assert copy_recipients == [(recipient_id,)]
+        assert delivered == [(recipient_id, "notifications")]
+
+        assert utc(next_dates[reminder_id]) == due + timedelta(days=7)
+        assert utc(next_dates[draft_id]) == due
+        assert utc(next_dates[scheduled_id]) == due
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_due_scheduled_message_is_sent(self, engine):
+        recipient_id = uuid.uuid4()
+        scheduled = {"is_scheduled": True, "scheduled_date": NOW - timedelta(hours=1)}
+
+        async with engine.begin() as conn:
+            message_id = await add_message(conn, recipient_id, **scheduled)
+            later_id = await add_message(
+                conn,
+                recipient_id,
+                is_scheduled=True,
+                scheduled_date=NOW + timedelta(hours=1),
+            )
+            draft_id = await add_message(conn, recipient_id, is_draft=True, **scheduled)
+
+            sent = await conn.run_sync(
+                message_dispatch_service.send_scheduled,
+                NOW,
+                CounterChanges(),
+                MessageEvents(),
+            )
+        assert sent == (1, False)
+
+        async with engine.connect() as conn:
+            messages = {
+                row.message_id: row for row in await conn.execute(select(self.message))
+            }
+            send_date = (
+                await conn.execute(
+                    select(self.recipient.c.msg_send_date).where(
+                        self.recipient.c.message_id == message_id
+                    )
+                )
+            ).scalar()
+            delivered = (
+                await conn.execute(
+                    select(self.inbox.c.user_id, self.inbox.c.message_id)
+                )
+            ).all()
+
+        assert not messages[message_id].is_scheduled
+        assert utc(messages[message_id].date_created) == NOW
+        assert utc(send_date) == NOW
+        assert delivered == [(recipient_id, message_id)]
+
+        assert messages[later_id].is_scheduled
+        assert messages[draft_id].is_scheduled
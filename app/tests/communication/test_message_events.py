@@ -0,0 +1,82 @@
+import jwt
+import uuid
+import pytest
+from datetime import datetime, timedelta
+from fastapi import WebSocket, status
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+# local imports
+from main import app
+from app.core.config import settings
+from app.core.security import JWT_ALGORITHM, SecureAccessTokens
+from app.services.message_push_service import message_push_service
+
+
+def access_token(user_id: str, token_type: str = "access") -> str:
+    return jwt.encode(
+        payload={
+            "exp": datetime.now() + timedelta(minutes=5),
+            "sub": "{}",
+            "type": token_type,
+            "user_id": user_id,
+        },
+        key=settings.ENCRYPT_KEY,
+        algorithm=JWT_ALGORITHM,
+    )
+
+
+class TestMessageEvents:
+    # httpx's ASGI transport has no websockets
+    client = TestClient(app)
+    user_id = str(uuid.uuid4())
+
+    def assert_rejected(self, url: str):
+        with pytest.raises(WebSocketDisconnect) as disconnect:
+            with self.client.websocket_connect(url) as websocket:
+                websocket.receive_json()
+        assert disconnect.value.code == status.WS_1008_POLICY_VIOLATION
+
+    def test_events_without_token(self):
+        self.assert_rejected(f"/message/users/{self.user_id}/events")
+
+    def test_events_with_invalid_token(self):
+        self.assert_rejected(f"/message/users/{self.user_id}/events?token=not-a-jwt")
+
+    def test_events_with_expired_token(self):
+        token = jwt.encode(
+            payload={
+                "exp": datetime.now() - timedelta(minutes=5),
+                "type": "access",
+                "user_id": self.user_id,
+            },
+            key=settings.ENCRYPT_KEY,
+            algorithm=JWT_ALGORITHM,
+        )
+        self.assert_rejected(f"/message/users/{self.user_id}/events?token={token}")
+
+    def test_events_with_refresh_token(self):
+        token = SecureAccessTokens.create_refresh_token(
+            self.user_id, expires_delta=timedelta(minutes=5)
+        )
+        self.assert_rejected(f"/message/users/{self.user_id}/events?token={token}")
+
+    def test_events_with_token_of_another_user(self):
+        token = access_token(str(uuid.uuid4()))
+        self.assert_rejected(f"/message/users/{self.user_id}/events?token={token}")
+
+    def test_events_with_token_of_the_user(self, monkeypatch):
+        streamed = []
+
+        async def stream(websocket: WebSocket, user_id):
+            streamed.append(str(user_id))
+            await websocket.send_json({"event": "connected"})
+
+        # the stream itself needs redis, only the handshake is checked here
+        monkeypatch.setattr(message_push_service, "stream", stream)
+
+        token = access_token(self.user_id)
+        url = f"/message/users/{self.user_id}/events?token={token}"
+        with self.client.websocket_connect(url) as websocket:
+            assert websocket.receive_json() == {"event": "connected"}
+        assert streamed == [self.user_id]
@@ -0,0 +1,159 @@
+import pytz
+import uuid
+import pytest
+from datetime import datetime, timedelta
+from typing import Tuple
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.db.dbDeclarative import Base
+from app.services.message_counter_service import message_counter_service
+from app.services.message_push_service import message_push_service
+from app.services.message_inbox_service import message_inbox_service
+from app.modules.communication.models.message import Message
+from app.modules.communication.models.message_inbox import (
+    MessageInbox,
+    MessageInboxFanout,
+)
+from app.modules.communication.models.message_recipient import MessageRecipient
+from app.modules.contract.models.under_contract import UnderContract
+from app.modules.contract.enums.contract_enums import ContractStatusEnum
+
+SENT_AT = datetime(2024, 6, 1, tzinfo=pytz.utc)
+
+
+@pytest.fixture
+async def engine(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'inbox.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async def skip(*args):
+        pass
+
+    # counters and push events live in redis
+    monkeypatch.setattr(message_counter_service, "apply", skip)
+    monkeypatch.setattr(message_push_service, "publish", skip)
+    monkeypatch.setattr(settings, "INBOX_FANOUT_INLINE_LIMIT", 5)
+    monkeypatch.setattr(settings, "INBOX_FANOUT_BATCH_SIZE", 2)
+
+    yield engine
+    await engine.dispose()
+
+
+async def send_to_group(engine, clients: int) -> Tuple[uuid.UUID, bool]:
+    """Sends a message to a group of `clients` contracted clients, returns the
+    message id and whether clients were left to the background job."""
+    message_id, group_id = uuid.uuid4(), uuid.uuid4()
+
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(Message.__table__).values(
+                message_id=message_id,
+                subject="Water outage",
+                is_draft=False,
+                is_notification=False,
+                is_enquiry=False,
+                is_reminder=False,
+                is_scheduled=False,
+                date_created=SENT_AT,
+                scheduled_date=SENT_AT,
+            )
+        )
+        await conn.execute(
+            insert(MessageRecipient.__table__).values(
+                id=uuid.uuid4(),
+                recipient_group_id=group_id,
+                message_id=message_id,
+                msg_send_date=SENT_AT,
+            )
+        )
+        await conn.execute(
+            insert(UnderContract.__table__),
+            [
+                {
+                    "under_contract_id": uuid.uuid4(),
+                    "property_unit_assoc_id": group_id,
+                    "contract_status": ContractStatusEnum.active,
+                    "contract_number": f"CTR-{idx}",
+                    "client_id": uuid.uuid4(),
+                    "start_date": SENT_AT - timedelta(days=30),
+                    "end_date": SENT_AT + timedelta(days=30),
+                    "next_payment_due": SENT_AT,
+                }
+                for idx in range(clients)
+            ],
+        )
+
+        pending = await conn.run_sync(message_inbox_service.deliver, [message_id])
+    return message_id, pending
+
+
+async def count(engine, table, **filters) -> int:
+    async with engine.connect() as conn:
+        stmt = select(func.count()).select_from(table)
+        for column, value in filters.items():
+            stmt = stmt.where(table.c[column] == value)
+        return (await conn.execute(stmt)).scalar()
+
+
+class TestMessageInboxFanOut:
+    inbox = MessageInbox.__table__
+    fanout = MessageInboxFanout.__table__
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_small_group_is_written_with_the_message(self, engine):
+        message_id, pending = await send_to_group(engine, clients=3)
+
+        assert pending is False
+        assert await count(engine, self.inbox, message_id=message_id) == 3
+        assert await count(engine, self.fanout) == 0
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_large_group_is_left_to_the_background_batches(self, engine):
+        message_id, pending = await send_to_group(engine, clients=7)
+
+        # the first INBOX_FANOUT_INLINE_LIMIT clients went out with the message
+        assert pending is True
+        assert await count(engine, self.inbox, message_id=message_id) == 5
+        assert await count(engine, self.fanout, message_id=message_id) == 1
+
+        # a full batch of the remaining two, then an empty one closes the group
+        assert await message_inbox_service.fan_out_pending(engine) == 2
+        assert await count(engine, self.inbox, message_id=message_id) == 7
+        assert await count(engine, self.fanout) == 0
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_failing_group_does_not_block_the_others(self, engine, monkeypatch):
+        failing_id, _ = await send_to_group(engine, clients=6)
+        other_id, _ = await send_to_group(engine, clients=6)
+
+        fan_out = message_inbox_service.fan_out
+
+        def broken_fan_out(connection, message_id, *args):
+            if message_id == failing_id:
+                raise RuntimeError("broken batch")
+            return fan_out(connection, message_id, *args)
+
+        monkeypatch.setattr(message_inbox_service, "fan_out", broken_fan_out)
+
+        # the older group fails, the newer one is still written
+        assert await message_inbox_service.fan_out_pending(engine) == 1
+        assert await count(engine, self.inbox, message_id=other_id) == 6
+
+        async with engine.connect() as conn:
+            job = (
+                await conn.execute(
+                    select(self.fanout).where(self.fanout.c.message_id == failing_id)
+                )
+            ).one()
+        assert job.attempts == 1
+        next_attempt_at = job.next_attempt_at.replace(tzinfo=pytz.utc)
+        assert next_attempt_at > datetime.now(pytz.utc) + timedelta(
+            seconds=settings.INBOX_FANOUT_RETRY_SECONDS - 5
+        )
+
+        # skipped until its retry is due
+        assert await message_inbox_service.fan_out_pending(engine) == 0
+        assert await count(engine, self.inbox, message_id=failing_id) == 5
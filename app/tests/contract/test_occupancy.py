@@ -0,0 +1,90 @@
+import pytz
+import uuid
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.db.dbDeclarative import Base
+from app.services.occupancy_service import occupancy_service
+from app.modules.contract.models.under_contract import UnderContract
+from app.modules.contract.enums.contract_enums import ContractStatusEnum
+from app.modules.properties.models.property_unit_association import PropertyUnitAssoc
+
+
+class TestOccupancyRefresh:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_contract_starting_soon_flips_the_flag(self, tmp_path, monkeypatch):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'occupancy.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        assoc = PropertyUnitAssoc.__table__
+        property_unit_assoc_id = uuid.uuid4()
+        async with engine.begin() as conn:
+            await conn.execute(
+                insert(assoc).values(
+                    property_unit_assoc_id=property_unit_assoc_id,
+                    property_unit_type="Property",
+                    is_contract_active=False,
+                )
+            )
+
+        async def is_contract_active() -> bool:
+            async with engine.connect() as conn:
+                return (
+                    await conn.execute(
+                        select(assoc.c.is_contract_active).where(
+                            assoc.c.property_unit_assoc_id == property_unit_assoc_id
+                        )
+                    )
+                ).scalar()
+
+        notify = occupancy_service.notify
+        notified = []
+
+        def spy_notify():
+            notified.append(datetime.now(pytz.utc))
+            notify()
+
+        monkeypatch.setattr(occupancy_service, "notify", spy_notify)
+
+        # no contracts yet: the job goes to sleep for OCCUPANCY_REFRESH_SECONDS
+        occupancy_service.start(engine)
+        try:
+            await asyncio.sleep(0.2)
+
+            start_date = datetime.now(pytz.utc) + timedelta(seconds=2)
+            async with AsyncSession(engine) as session:
+                session.add(
+                    UnderContract(
+                        property_unit_assoc_id=property_unit_assoc_id,
+                        contract_status=ContractStatusEnum.active,
+                        contract_number="CTR-OCCUPANCY",
+                        start_date=start_date,
+                        end_date=start_date + timedelta(days=30),
+                        next_payment_due=start_date,
+                    )
+                )
+                await session.flush()
+                # not before the contract is visible to the job
+                assert notified == []
+
+                await session.commit()
+                assert len(notified) == 1
+                assert "occupancy_refresh" not in session.info
+
+            assert await is_contract_active() is False
+
+            # woken by the commit, the job sleeps until the new start date
+            for _ in range(50):
+                if await is_contract_active():
+                    break
+                await asyncio.sleep(0.1)
+
+            assert await is_contract_active() is True
+            assert datetime.now(pytz.utc) >= start_date
+        finally:
+            await occupancy_service.stop()
+            await engine.dispose()
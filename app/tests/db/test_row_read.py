@@ -0,0 +1,84 @@
+import uuid
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.errors import CustomException
+from app.db.dbCrud import get_rows_adapter
+from app.db.dbDeclarative import Base
+from app.modules.resources.dao.media_dao import MediaDAO
+from app.modules.resources.models.media import Media
+from app.modules.resources.enums.resource_enums import MediaType
+from app.modules.resources.schema.media_schema import MediaResponse
+
+
+@pytest.fixture
+async def db_session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'rows.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        await session.execute(
+            Media.__table__.insert(),
+            [
+                {
+                    "media_id": uuid.uuid4(),
+                    "media_name": f"media_{idx}",
+                    "media_type": MediaType.image,
+                    "content_url": f"https://example.com/media/{idx}.png",
+                    "is_thumbnail": idx % 2 == 0,
+                    "caption": f"caption {idx}" if idx % 3 else None,
+                    "description": f"description {idx}",
+                }
+                for idx in range(5)
+            ],
+        )
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+class TestRowRead:
+    media_dao = MediaDAO()
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_rows_match_the_orm_path(self, db_session: AsyncSession):
+        orm = [
+            MediaResponse.model_validate(media)
+            for media in await self.media_dao.get_all(db_session=db_session)
+        ]
+        rows = await self.media_dao.get_all_rows(
+            db_session=db_session, schema=MediaResponse
+        )
+
+        assert all(isinstance(row, MediaResponse) for row in rows)
+        assert sorted(rows, key=lambda row: row.media_name) == sorted(
+            orm, key=lambda media: media.media_name
+        )
+
+        # same rows validated through the cached adapter directly
+        mappings = await self.media_dao.query_rows(
+            db_session=db_session, schema=MediaResponse
+        )
+        assert get_rows_adapter(MediaResponse).validate_python(mappings) == rows
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_unknown_column_is_refused(self, db_session: AsyncSession):
+        with pytest.raises(CustomException, match="media_title"):
+            await self.media_dao.get_all_rows(
+                db_session=db_session, columns=["media_name", "media_title"]
+            )
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_unknown_filter_is_refused(self, db_session: AsyncSession):
+        with pytest.raises(CustomException, match="title"):
+            await self.media_dao.get_all_rows(
+                db_session=db_session, filters={"title": "media_0"}
+            )
+
+        rows = await self.media_dao.get_all_rows(
+            db_session=db_session,
+            columns=["media_name"],
+            filters={"media_name": "media_0"},
+        )
+        assert [dict(row) for row in rows] == [{"media_name": "media_0"}]
@@ -0,0 +1,92 @@
+import pytest
+from pathlib import Path
+from alembic import command
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from alembic.autogenerate import compare_metadata
+from sqlalchemy import create_engine, inspect, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.dbModule import DBModule
+from app.db.dbDeclarative import Base
+from app.core.errors import DatabaseSchemaException
+from app.db.dbMigration import SCHEMA_HEAD, version_table
+
+
+def sqlite_module(path) -> DBModule:
+    db_module = DBModule(engine="sqlite")
+    url = f"sqlite+aiosqlite:///{path}"
+    db_module.engine = {
+        "write": create_async_engine(url),
+        "read": create_async_engine(url),
+    }
+    return db_module
+
+
+class TestPrepareSchema:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_empty_database_is_built_and_stamped(self, tmp_path):
+        db_module = sqlite_module(tmp_path / "empty.db")
+
+        assert await db_module.prepare_schema("auto") == "created"
+        assert await db_module.get_schema_revision() == SCHEMA_HEAD
+        assert await db_module.prepare_schema("auto") == "current"
+
+        async with db_module.engine["write"].connect() as conn:
+            versions = (await conn.execute(select(version_table))).all()
+        assert len(versions) == 1
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_unversioned_database_with_tables_is_refused(self, tmp_path):
+        db_module = sqlite_module(tmp_path / "legacy.db")
+
+        # a database created by create_all before migrations were tracked
+        async with db_module.engine["write"].begin() as conn:
+            await conn.execute(
+                text("CREATE TABLE media (media_id VARCHAR PRIMARY KEY)")
+            )
+
+        with pytest.raises(DatabaseSchemaException) as error:
+            await db_module.prepare_schema("auto")
+        assert "alembic stamp 0001_initial_schema" in error.value.msg
+
+        # nothing was created or stamped
+        assert await db_module.get_schema_revision() is None
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_check_mode_never_builds(self, tmp_path):
+        db_module = sqlite_module(tmp_path / "check.db")
+
+        with pytest.raises(DatabaseSchemaException):
+            await db_module.prepare_schema("check")
+        assert await db_module.get_schema_revision() is None
+
+
+class TestMigrations:
+    def test_revisions_build_the_models(self, tmp_path):
+        url = f"sqlite:///{tmp_path / 'migrated.db'}"
+        # no ini file: env.py would reconfigure the app's logging
+        config = Config()
+        config.set_main_option(
+            "script_location", str(Path(__file__).parents[3] / "alembic")
+        )
+        config.set_main_option("sqlalchemy.url", url)
+
+        command.upgrade(config, "head")
+
+        engine = create_engine(url)
+        with engine.connect() as conn:
+            revision = MigrationContext.configure(conn).get_current_revision()
+            diffs = compare_metadata(
+                # SQLite reflects UUID columns without a type
+                MigrationContext.configure(conn, opts={"compare_type": False}),
+                Base.metadata,
+            )
+        assert revision == SCHEMA_HEAD
+        # 0013 leaves SQLite's entity_media.media_id foreign key as it was
+        assert [diff[0] for diff in diffs] == ["remove_fk", "add_fk"]
+        assert {diff[1].parent.name for diff in diffs} == {"entity_media"}
+
+        command.downgrade(config, "base")
+        assert inspect(engine).get_table_names() == [version_table.name]
+        engine.dispose()
@@ -0,0 +1,215 @@
+import uuid
+from datetime import date, datetime, timezone
+from sqlalchemy import create_engine, func, insert, select
+
+from app.db.dbDeclarative import Base
+from app.services.billing_run_service import (
+    add_months,
+    billing_run_service,
+    installments,
+)
+
+# models
+from app.modules.billing.models.billing_period import ContractBillingPeriod
+from app.modules.billing.models.invoice import Invoice
+from app.modules.billing.models.invoice_item import InvoiceItem
+from app.modules.billing.models.payment_type import PaymentType
+from app.modules.contract.models.contract import Contract
+from app.modules.contract.models.contract_invoice import ContractInvoice
+from app.modules.contract.models.under_contract import UnderContract
+
+# enums
+from app.modules.billing.enums.billing_enums import PaymentTypeEnum
+from app.modules.contract.enums.contract_enums import ContractStatusEnum
+
+
+def utc(*args) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class TestAddMonths:
+    def test_clamps_to_the_end_of_shorter_months(self):
+        assert add_months(utc(2024, 1, 31), 1) == utc(2024, 2, 29)
+        assert add_months(utc(2023, 1, 31), 1) == utc(2023, 2, 28)
+        assert add_months(utc(2024, 8, 31), 1) == utc(2024, 9, 30)
+
+    def test_crosses_years(self):
+        assert add_months(utc(2024, 11, 15), 3) == utc(2025, 2, 15)
+        assert add_months(utc(2024, 2, 29), 12) == utc(2025, 2, 28)
+
+
+class TestInstallments:
+    def test_monthly_keeps_the_day_of_month_after_a_short_month(self):
+        start = utc(2024, 1, 31)
+        february = installments(
+            start, None, "monthly", None, None, utc(2024, 2, 1), utc(2024, 3, 1)
+        )
+        march = installments(
+            start, None, "monthly", None, None, utc(2024, 3, 1), utc(2024, 4, 1)
+        )
+
+        assert february == [utc(2024, 2, 29)]
+        # from `start` again, not from the clamped February date
+        assert march == [utc(2024, 3, 31)]
+
+    def test_weekly_dates_in_the_period(self):
+        dates = installments(
+            utc(2024, 1, 1),
+            None,
+            PaymentTypeEnum.weekly,
+            None,
+            None,
+            utc(2024, 1, 10),
+            utc(2024, 1, 25),
+        )
+
+        assert dates == [utc(2024, 1, 15), utc(2024, 1, 22)]
+
+    def test_custom_splits_the_contract_into_partitions(self):
+        start, end = utc(2024, 1, 1), utc(2024, 1, 31)
+        dates = installments(
+            start, end, "custom", 3, None, utc(2024, 1, 1), utc(2024, 2, 1)
+        )
+
+        assert dates == [utc(2024, 1, 1), utc(2024, 1, 11), utc(2024, 1, 21)]
+
+    def test_custom_is_limited_to_num_invoices(self):
+        start, end = utc(2024, 1, 1), utc(2024, 1, 31)
+        dates = installments(
+            start, end, "custom", 3, 2, utc(2024, 1, 1), utc(2024, 2, 1)
+        )
+
+        assert dates == [utc(2024, 1, 1), utc(2024, 1, 11)]
+
+    def test_custom_without_partitions_is_a_single_payment(self):
+        start = utc(2024, 1, 5)
+        dates = installments(
+            start,
+            utc(2024, 6, 5),
+            "custom",
+            None,
+            None,
+            utc(2024, 1, 1),
+            utc(2024, 2, 1),
+        )
+
+        assert dates == [start]
+
+    def test_num_invoices_stops_the_schedule(self):
+        start = utc(2024, 1, 10)
+        in_limit = installments(
+            start, None, "monthly", None, 3, utc(2024, 3, 1), utc(2024, 4, 1)
+        )
+        past_limit = installments(
+            start, None, "monthly", None, 3, utc(2024, 4, 1), utc(2024, 5, 1)
+        )
+
+        assert in_limit == [utc(2024, 3, 10)]
+        assert past_limit == []
+
+    def test_no_dates_on_or_after_the_contract_end(self):
+        dates = installments(
+            utc(2024, 1, 15),
+            utc(2024, 3, 15),
+            "monthly",
+            None,
+            None,
+            utc(2024, 3, 1),
+            utc(2024, 4, 1),
+        )
+
+        assert dates == []
+
+    def test_one_time_is_due_on_the_start_date_only(self):
+        start = utc(2024, 1, 20)
+
+        assert installments(
+            start, None, "one_time", None, None, utc(2024, 1, 1), utc(2024, 2, 1)
+        ) == [start]
+        assert (
+            installments(
+                start, None, "one_time", None, None, utc(2024, 2, 1), utc(2024, 3, 1)
+            )
+            == []
+        )
+
+
+class TestBillBatch:
+    def test_rerun_bills_each_contract_once(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'billing.db'}")
+        Base.metadata.create_all(engine)
+
+        contract_id = uuid.uuid4()
+        with engine.begin() as conn:
+            conn.execute(
+                insert(PaymentType.__table__).values(
+                    payment_type_id=1,
+                    payment_type_name=PaymentTypeEnum.monthly,
+                    payment_type_description="Monthly",
+                    payment_partitions=1,
+                )
+            )
+            conn.execute(
+                insert(Contract.__table__).values(
+                    contract_id=contract_id,
+                    contract_number="CTR-BILLING-RUN",
+                    contract_type_id=1,
+                    payment_type_id=1,
+                    contract_status=ContractStatusEnum.active,
+                    contract_details="Billing run",
+                    payment_amount=1000,
+                    fee_percentage=0,
+                    fee_amount=0,
+                    num_invoices=0,
+                    start_date=utc(2024, 1, 31),
+                    end_date=utc(2024, 12, 31),
+                )
+            )
+            conn.execute(
+                insert(UnderContract.__table__).values(
+                    under_contract_id=uuid.uuid4(),
+                    property_unit_assoc_id=uuid.uuid4(),
+                    contract_status=ContractStatusEnum.active,
+                    contract_number="CTR-BILLING-RUN",
+                    client_id=uuid.uuid4(),
+                    employee_id=uuid.uuid4(),
+                    start_date=utc(2024, 1, 31),
+                    end_date=utc(2024, 12, 31),
+                    next_payment_due=utc(2024, 2, 29),
+                )
+            )
+
+        period = (date(2024, 2, 1), date(2024, 3, 1))
+        billed = []
+        for _ in range(2):
+            with engine.begin() as conn:
+                billed.append(
+                    billing_run_service.bill_batch(conn, [contract_id], *period)
+                )
+
+        # the first run billed the contract, the rerun found it claimed
+        assert billed == [1, 0]
+
+        with engine.connect() as conn:
+            assert (
+                conn.execute(
+                    select(billing_run_service.candidates(*period).exists())
+                ).scalar()
+                is False
+            )
+            invoices = conn.execute(select(Invoice.__table__)).all()
+            items = conn.execute(select(InvoiceItem.__table__)).all()
+            links = conn.execute(
+                select(func.count()).select_from(ContractInvoice.__table__)
+            ).scalar()
+            claims = conn.execute(select(ContractBillingPeriod.__table__)).all()
+
+        assert len(invoices) == 1
+        assert invoices[0].due_date.day == 29
+        assert [(item.quantity, item.total_price) for item in items] == [(1, 1000)]
+        assert links == 1
+        assert [(claim.contract_id, claim.invoice_number) for claim in claims] == [
+            (contract_id, invoices[0].invoice_number)
+        ]
+
+        engine.dispose()
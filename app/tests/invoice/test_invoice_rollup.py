@@ -0,0 +1,44 @@
+from decimal import Decimal
+from datetime import datetime, timezone
+
+from app.services.invoice_rollup_service import invoice_rollup_service
+from app.modules.billing.enums.billing_enums import PaymentStatusEnum, InvoiceTypeEnum
+
+DUE = datetime(2024, 1, 15, tzinfo=timezone.utc)
+BUCKET = (DUE.date().replace(day=1), PaymentStatusEnum.pending, InvoiceTypeEnum.lease)
+
+
+class TestInvoiceRollupDeltas:
+    def test_amount_update_mixes_decimal_and_float(self):
+        # stored state from the Numeric column, new state from the request schema
+        deltas = invoice_rollup_service.deltas(
+            [
+                ((DUE, "pending", "lease", Decimal("100.00")), -1),
+                ((DUE, "pending", "lease", 123.45), 1),
+            ]
+        )
+
+        assert deltas[BUCKET] == [Decimal("23.45"), 0]
+
+    def test_insert_and_delete_cancel_out(self):
+        deltas = invoice_rollup_service.deltas(
+            [
+                ((DUE, PaymentStatusEnum.pending, InvoiceTypeEnum.lease, 0.1), 1),
+                ((DUE, PaymentStatusEnum.pending, InvoiceTypeEnum.lease, 0.2), 1),
+                ((DUE, PaymentStatusEnum.pending, InvoiceTypeEnum.lease, 0.3), -1),
+            ]
+        )
+
+        assert deltas[BUCKET] == [Decimal("0"), 1]
+
+    def test_invoices_without_a_bucket_are_skipped(self):
+        deltas = invoice_rollup_service.deltas(
+            [
+                ((None, "pending", "lease", 10), 1),
+                ((DUE, None, "lease", 10), 1),
+                ((DUE, "pending", None, 10), 1),
+                ((DUE, "pending", "lease", None), 1),
+            ]
+        )
+
+        assert dict(deltas) == {BUCKET: [Decimal("0"), 1]}
@@ -1,6 +1,12 @@
+import io
+import os
 import pytest
 from typing import Any, Dict
 from httpx import AsyncClient
+from pydantic import ValidationError
+
+from app.core.config import Settings
+from app.services.storage_service import STORAGE_BACKENDS, LocalStorage
 
 
 class TestMedia:
@@ -68,3 +74,68 @@ class TestMedia:
         # Verify the media is deleted
         response = await client.get(f"/media/{media_id}")
         assert response.status_code == 404
+
+
+class TestMediaFiles:
+    @pytest.fixture
+    def storage(self, tmp_path, monkeypatch) -> LocalStorage:
+        storage = LocalStorage(root=str(tmp_path), base_url="/media/files")
+        monkeypatch.setattr(
+            "app.modules.resources.router.media_router.media_storage", storage
+        )
+        return storage
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_get_media_file(self, client: AsyncClient, storage: LocalStorage):
+        stored = storage.put(io.BytesIO(b"floor plan"), "plan.PDF", "properties")
+
+        response = await client.get(f"/media/files/{stored.key}")
+        assert response.status_code == 200
+        assert response.content == b"floor plan"
+        assert "immutable" in response.headers["cache-control"]
+        assert stored.key.endswith(".pdf")
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_get_missing_media_file(
+        self, client: AsyncClient, storage: LocalStorage
+    ):
+        key = f"ab/cd/abcd{'0' * 60}.png"
+
+        response = await client.get(f"/media/files/{key}")
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize(
+        "key",
+        [
+            "plan.pdf",
+            "incoming/tmpfile",
+            f"AB/CD/{'A' * 64}.png",
+            f"ab/cd/{'g' * 64}.png",
+            f"ab/cd/{'0' * 63}.png",
+            f"ab/cd/{'0' * 64}.tar.gz",
+            f"ab/cd/{'0' * 64}.png/..",
+            "..%2F..%2Fetc%2Fpasswd",
+        ],
+    )
+    async def test_get_media_file_invalid_key(
+        self, client: AsyncClient, storage: LocalStorage, key: str
+    ):
+        # files outside the content-addressed layout are never served
+        os.makedirs(os.path.join(storage.root, "incoming"))
+        for name in ("plan.pdf", "incoming/tmpfile"):
+            with open(os.path.join(storage.root, name), "wb") as file:
+                file.write(b"private")
+
+        response = await client.get(f"/media/files/{key}")
+        assert response.status_code == 404
+
+
+class TestMediaStorageSetting:
+    def test_unknown_media_storage_is_refused(self):
+        with pytest.raises(ValidationError) as error:
+            Settings(MEDIA_STORAGE="s3")
+        assert "MEDIA_STORAGE" in str(error.value)
+
+    def test_media_storage_selects_the_backend(self):
+        assert Settings(MEDIA_STORAGE="local").MEDIA_STORAGE in STORAGE_BACKENDS
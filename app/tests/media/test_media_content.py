@@ -0,0 +1,163 @@
+import io
+import os
+import uuid
+import pytest
+from fastapi import UploadFile
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.errors import CustomException, IntegrityError
+from app.db.dbDeclarative import Base
+from app.modules.resources.dao.media_dao import MediaDAO
+from app.modules.resources.models.media import Media
+from app.modules.resources.models.media_content import MediaContent
+from app.modules.associations.models.entity_media import EntityMedia
+from app.modules.associations.enums.entity_type_enums import EntityTypeEnum
+from app.services.storage_service import LocalStorage
+
+CONTENT_HASH = "0" * 64
+CONTENT_URL = "/media/files/00/00/" + CONTENT_HASH + ".png"
+
+
+@pytest.fixture
+async def db_session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'media.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    await engine.dispose()
+
+
+class FailingStorage(LocalStorage):
+    """Local storage that fails to store the files named in `broken`."""
+
+    def __init__(self, root: str):
+        super().__init__(root=root, base_url="/media/files")
+        self.broken = set()
+        self.stored = []
+
+    def put(self, file_io, file_name, folder, sha256=None):
+        if file_name in self.broken:
+            raise OSError("disk full")
+        self.stored.append(file_name)
+        return super().put(file_io, file_name, folder, sha256=sha256)
+
+
+class TestMediaContent:
+    media_dao = MediaDAO()
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_same_content_keeps_attachment_fields(self, db_session: AsyncSession):
+        await self.media_dao.add_contents(db_session, {CONTENT_HASH: CONTENT_URL})
+        # recorded again by a concurrent upload, the first url stays
+        await self.media_dao.add_contents(db_session, {CONTENT_HASH: "/other/url"})
+
+        stored = await self.media_dao.get_by_content_hashes(
+            db_session, [CONTENT_HASH, "f" * 64]
+        )
+        assert stored == {CONTENT_HASH: CONTENT_URL}
+
+        for caption, is_thumbnail in (("Front", True), ("Kitchen", False)):
+            db_session.add(
+                Media(
+                    media_name=f"{caption.lower()}.png",
+                    content_url=stored[CONTENT_HASH],
+                    content_hash=CONTENT_HASH,
+                    caption=caption,
+                    is_thumbnail=is_thumbnail,
+                )
+            )
+        await db_session.commit()
+
+        media = (
+            await db_session.execute(
+                select(Media.caption, Media.is_thumbnail, Media.content_url)
+                .where(Media.content_hash == CONTENT_HASH)
+                .order_by(Media.caption)
+            )
+        ).all()
+        assert media == [("Front", True, CONTENT_URL), ("Kitchen", False, CONTENT_URL)]
+        assert (
+            await db_session.execute(select(func.count()).select_from(MediaContent))
+        ).scalar() == 1
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_linked_media_is_not_deleted(self, db_session: AsyncSession):
+        media = Media(media_name="plan.pdf", content_url=CONTENT_URL)
+        db_session.add(media)
+        await db_session.flush()
+
+        entity_media_id = uuid.uuid4()
+        await db_session.execute(
+            insert(EntityMedia.__table__).values(
+                entity_media_id=entity_media_id,
+                media_id=media.media_id,
+                entity_id=uuid.uuid4(),
+                entity_type=EntityTypeEnum.property,
+            )
+        )
+        await db_session.commit()
+
+        with pytest.raises(IntegrityError):
+            await self.media_dao.delete(db_session=db_session, db_obj=media)
+        assert await db_session.get(Media, media.media_id) is not None
+
+        # unlinked, it can go
+        await db_session.execute(
+            EntityMedia.__table__.delete().where(
+                EntityMedia.__table__.c.entity_media_id == entity_media_id
+            )
+        )
+        await db_session.commit()
+
+        await self.media_dao.delete(db_session=db_session, db_obj=media)
+        assert (
+            await db_session.execute(
+                select(Media).where(Media.media_id == media.media_id)
+            )
+        ).scalar_one_or_none() is None
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_failed_upload_keeps_the_stored_files(
+        self, db_session: AsyncSession, tmp_path, monkeypatch
+    ):
+        storage = FailingStorage(str(tmp_path / "files"))
+        storage.broken.add("broken.png")
+        monkeypatch.setattr("app.services.upload_service.media_storage", storage)
+
+        files = [
+            UploadFile(file=io.BytesIO(content), filename=name)
+            for name, content in (
+                ("front.png", b"front"),
+                ("broken.png", b"broken"),
+                ("kitchen.png", b"kitchen"),
+            )
+        ]
+
+        with pytest.raises(CustomException, match="broken.png: disk full"):
+            await self.media_dao.upload_files(db_session, files, "property")
+        await db_session.rollback()
+
+        # the siblings were stored and recorded despite the failure
+        urls = dict(
+            (
+                await db_session.execute(
+                    select(MediaContent.content_hash, MediaContent.content_url)
+                )
+            ).all()
+        )
+        assert len(urls) == 2
+        for url in urls.values():
+            key = url.removeprefix("/media/files/")
+            assert os.path.exists(storage.path(key))
+
+        # the retry only uploads the file that failed
+        storage.broken.clear()
+        storage.stored.clear()
+        uploaded = await self.media_dao.upload_files(db_session, files, "property")
+
+        assert storage.stored == ["broken.png"]
+        for upload in (uploaded[0], uploaded[2]):
+            assert upload["content_url"] == urls[upload["content_hash"]]
@@ -2,6 +2,18 @@ import pytest
 from typing import Any, Dict
 from httpx import AsyncClient
 from app.tests.billable.test_utilities import TestUtilities
+from app.modules.properties.dao.property_dao import PropertyDAO
+
+
+def document_shape(value: Any) -> Any:
+    """Keys of the nested document, with lists reduced to the shape of their items."""
+    if isinstance(value, dict):
+        return {key: document_shape(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return sorted(
+            (document_shape(item) for item in value), key=lambda item: str(item)
+        )
+    return None
 
 
 # TODO:
@@ -109,6 +121,35 @@ class TestProperties:
         assert response.status_code == 200
         assert response.json()["data"]["property_unit_assoc_id"] == property_id
 
+        # nested collections are present on both the JSON document and ORM paths
+        for key in ["address", "units", "amenities", "media", "utilities"]:
+            assert isinstance(response.json()["data"][key], list)
+
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.dependency(depends=["TestProperties::get_property_by_id"])
+    async def test_get_property_document_matches_fallback(
+        self, client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        property_id = self.default_property["property_unit_assoc_id"]
+
+        response = await client.get(f"/property/{property_id}")
+        assert response.status_code == 200
+
+        # force the ORM path
+        async def no_document(*args, **kwargs):
+            return None
+
+        monkeypatch.setattr(PropertyDAO, "get_property_document", no_document)
+        fallback = await client.get(f"/property/{property_id}")
+        assert fallback.status_code == 200
+
+        document, orm = response.json(), fallback.json()
+        assert list(document.keys()) == list(orm.keys())
+        assert document_shape(document["data"]) == document_shape(orm["data"])
+        assert [utility["name"] for utility in document["data"]["utilities"]] == [
+            utility["name"] for utility in orm["data"]["utilities"]
+        ]
+
     @pytest.mark.asyncio(loop_scope="session")
     @pytest.mark.dependency(
         depends=["TestProperties::get_property_by_id"], name="TestProperties::update_property_by_id"